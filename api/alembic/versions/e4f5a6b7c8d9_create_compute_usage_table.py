@@ -0,0 +1,57 @@
+"""create compute_usage table
+
+Revision ID: e4f5a6b7c8d9
+Revises: 598bc2e555d4
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4f5a6b7c8d9"
+down_revision: Union[str, Sequence[str], None] = "598bc2e555d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "compute_usage",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("team_id", sa.String(), nullable=False),
+        sa.Column("job_id", sa.String(), nullable=False),
+        sa.Column("experiment_id", sa.String(), nullable=True),
+        sa.Column("status", sa.String(), nullable=True),
+        sa.Column("user_email", sa.String(), nullable=False),
+        sa.Column("user_name", sa.String(), nullable=True),
+        sa.Column("provider_key", sa.String(), nullable=False),
+        sa.Column("provider_id", sa.String(), nullable=True),
+        sa.Column("provider_name", sa.String(), nullable=False),
+        sa.Column("provider_type", sa.String(), nullable=True),
+        sa.Column("usage_date", sa.Date(), nullable=False),
+        sa.Column("start_time", sa.String(), nullable=False),
+        sa.Column("end_time", sa.String(), nullable=False),
+        sa.Column("duration_seconds", sa.Float(), nullable=False),
+        sa.Column("details", sa.JSON(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("(CURRENT_TIMESTAMP)"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("idx_compute_usage_team_job", "compute_usage", ["team_id", "job_id"], unique=True)
+    op.create_index("idx_compute_usage_team_date", "compute_usage", ["team_id", "usage_date"], unique=False)
+    op.create_index("idx_compute_usage_team_user", "compute_usage", ["team_id", "user_email"], unique=False)
+    op.create_index("idx_compute_usage_team_provider", "compute_usage", ["team_id", "provider_key"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_compute_usage_team_provider", table_name="compute_usage", if_exists=True)
+    op.drop_index("idx_compute_usage_team_user", table_name="compute_usage", if_exists=True)
+    op.drop_index("idx_compute_usage_team_date", table_name="compute_usage", if_exists=True)
+    op.drop_index("idx_compute_usage_team_job", table_name="compute_usage", if_exists=True)
+    op.drop_table("compute_usage")
@@ -149,8 +149,12 @@ async def lifespan(app: FastAPI):
             stop_notification_worker,
         )
 
+        from transformerlab.services.job_event_service import start_job_event_feed, stop_job_event_feed
+
         await start_remote_job_status_worker()
         await start_notification_worker()
+        # Replays job catalogue changes written outside this process onto the job event bus.
+        await start_job_event_feed()
         # Start background remote job queue worker (dispatches PENDING remote launch jobs).
         from transformerlab.services.remote_provider_queue import (
             start_remote_job_queue_worker,
@@ -174,6 +178,7 @@ async def lifespan(app: FastAPI):
         await stop_sweep_status_worker()
         await stop_remote_job_status_worker()
         await stop_notification_worker()
+        await stop_job_event_feed()
         await stop_remote_job_queue_worker()
         await stop_tasks_migration_worker()
         await stop_jobs_migration_worker()
@@ -181,6 +186,15 @@ async def lifespan(app: FastAPI):
 
     get_registry().kill_all()
     stop_juicefs_gateway()
+    from transformerlab.shared import ssh_pool
+
+    ssh_pool.close_all()
+    # Write API key last_used_at timestamps still batched in memory.
+    from transformerlab.db.session import async_session
+    from transformerlab.services.api_key_auth import flush_last_used
+
+    async with async_session() as session:
+        await flush_last_used(session)
     await db.close()
     # Run the clean up function
     cleanup_at_exit()
@@ -0,0 +1,36 @@
+from transformerlab.services import api_key_auth
+
+
+def _jwt_headers(client):
+    return {"Authorization": f"Bearer {client._get_token()}", "X-Team-Id": client._team_id}
+
+
+def test_verified_api_key_is_cached_until_revoked(client, monkeypatch):
+    created = client.post("/auth/api-keys", json={"name": "cache-test"}, headers=_jwt_headers(client))
+    assert created.status_code == 200
+    key_id = created.json()["id"]
+    api_key_headers = {"Authorization": f"Bearer {created.json()['api_key']}"}
+
+    verifications = []
+    real_verify = api_key_auth.verify_api_key
+
+    def counting_verify(api_key, hashed_key):
+        verifications.append(hashed_key)
+        return real_verify(api_key, hashed_key)
+
+    monkeypatch.setattr(api_key_auth, "verify_api_key", counting_verify)
+    api_key_auth.clear_api_key_cache()
+
+    for _ in range(3):
+        assert client.get("/auth/api-keys", headers=api_key_headers).status_code == 200
+    assert len(verifications) == 1
+
+    # Batched last_used_at is written before keys are listed.
+    listed = client.get("/auth/api-keys", headers=_jwt_headers(client)).json()
+    assert next(k for k in listed if k["id"] == key_id)["last_used_at"] is not None
+
+    revoked = client.patch(f"/auth/api-keys/{key_id}", json={"is_active": False}, headers=_jwt_headers(client))
+    assert revoked.status_code == 200
+    assert client.get("/auth/api-keys", headers=api_key_headers).status_code == 401
+
+    client.delete(f"/auth/api-keys/{key_id}", headers=_jwt_headers(client))
@@ -1,6 +1,7 @@
 import pytest
 import os
 import json
+import shutil
 import asyncio
 from io import BytesIO
 from lab import dirs
@@ -29,6 +30,25 @@ def test_data_list(client):
     assert isinstance(resp.json(), list) or isinstance(resp.json(), dict)
 
 
+def test_data_list_etag_changes_with_datasets(client):
+    client.get("/data/list")
+    etag = client.get("/data/list").headers.get("ETag")
+    assert etag
+    assert client.get("/data/list", headers={"If-None-Match": etag}).status_code == 304
+    # The generated filter is part of the ETag.
+    assert client.get("/data/list?generated=false", headers={"If-None-Match": etag}).status_code == 200
+
+    assert client.get("/data/new?dataset_id=etag-dataset").json()["status"] == "success"
+    changed = client.get("/data/list", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert "etag-dataset" in [d["dataset_id"] for d in changed.json()]
+
+    client.get("/data/delete?dataset_id=etag-dataset")
+    after_delete = client.get("/data/list", headers={"If-None-Match": changed.headers["ETag"]})
+    assert after_delete.status_code == 200
+    assert "etag-dataset" not in [d["dataset_id"] for d in after_delete.json()]
+
+
 def test_data_preview(client):
     resp = client.get("/data/preview?dataset_id=dummy_dataset")
     assert resp.status_code in (200, 400, 404)
@@ -44,6 +64,87 @@ def test_data_preview_trelis_touch_rugby_rules(client):
         assert "columns" in data or "rows" in data
 
 
+def test_data_preview_serves_pages_from_arrow_cache(client, tmp_path, monkeypatch):
+    from transformerlab.services import dataset_preview_service, dataset_service
+
+    monkeypatch.setattr(dataset_preview_service, "PREVIEW_CACHE_ROOT", str(tmp_path / "previews"))
+    loads = []
+    real_load = dataset_service.load_local_dataset
+
+    async def counting_load(*args, **kwargs):
+        loads.append(args)
+        return await real_load(*args, **kwargs)
+
+    monkeypatch.setattr(dataset_service, "load_local_dataset", counting_load)
+
+    dataset_id = "preview-cache-dataset"
+    assert client.get(f"/data/new?dataset_id={dataset_id}").json()["status"] == "success"
+
+    def _upload(count):
+        body = "".join(json.dumps({"idx": i, "text": f"row {i}"}) + "\n" for i in range(count))
+        files = {"files": ("rows.jsonl", BytesIO(body.encode()), "application/jsonl")}
+        assert client.post(f"/data/fileupload?dataset_id={dataset_id}&force=true", files=files).status_code == 200
+
+    _upload(3000)
+
+    try:
+        resp = client.get("/data/preview", params={"dataset_id": dataset_id, "offset": 2046, "limit": 5})
+        data = resp.json()["data"]
+        assert data["len"] == 3000
+        assert data["splits"] == ["train"]
+        assert data["columns"]["idx"] == [2046, 2047, 2048, 2049, 2050]
+
+        tail = client.get("/data/preview", params={"dataset_id": dataset_id, "offset": 2998, "limit": 10}).json()
+        assert tail["data"]["columns"]["text"] == ["row 2998", "row 2999"]
+        streamed = client.get(
+            "/data/preview", params={"dataset_id": dataset_id, "offset": 10, "limit": 2, "streaming": True}
+        ).json()
+        assert streamed["data"]["rows"] == [{"idx": 10, "text": "row 10"}, {"idx": 11, "text": "row 11"}]
+        assert len(loads) == 1
+
+        missing = client.get("/data/preview", params={"dataset_id": dataset_id, "split": "nope"}).json()
+        assert missing["status"] == "error"
+
+        # Changing the files produces a new version.
+        _upload(3001)
+        resp = client.get("/data/preview", params={"dataset_id": dataset_id, "offset": 3000, "limit": 1})
+        assert resp.json()["data"]["columns"]["idx"] == [3000]
+        assert len(loads) == 2
+
+        # A version evicted underneath a reader is rebuilt.
+        real_read = dataset_preview_service._read_page_sync
+
+        def read_after_eviction(version_dir, *args):
+            shutil.rmtree(version_dir)
+            dataset_preview_service._read_page_sync = real_read
+            return real_read(version_dir, *args)
+
+        monkeypatch.setattr(dataset_preview_service, "_read_page_sync", read_after_eviction)
+        resp = client.get("/data/preview", params={"dataset_id": dataset_id, "offset": 3000, "limit": 1})
+        assert resp.json()["data"]["columns"]["idx"] == [3000]
+        assert len(loads) == 3
+    finally:
+        cleanup_dataset(dataset_id, client)
+
+
+def test_data_preview_cache_evicts_least_recently_read(tmp_path):
+    from transformerlab.services import dataset_preview_service
+
+    root = tmp_path / "previews"
+    for name, last_read in [("old", 1000), ("kept", 500), ("new", 3000)]:
+        version = root / name / "v1"
+        version.mkdir(parents=True)
+        (version / "train.arrow").write_bytes(b"x" * 100)
+        (version / dataset_preview_service.META_NAME).write_text("{}")
+        os.utime(version / dataset_preview_service.META_NAME, (last_read, last_read))
+
+    dataset_preview_service._evict_sync(str(root), str(root / "kept" / "v1"), max_bytes=250)
+
+    assert not (root / "old").exists()
+    assert (root / "kept" / "v1").exists()
+    assert (root / "new" / "v1").exists()
+
+
 def test_data_info(client):
     resp = client.get("/data/info?dataset_id=dummy_dataset")
     assert resp.status_code in (200, 400, 404)
@@ -19,6 +19,28 @@ def test_jobs_list_all_endpoints(client):
     assert resp.status_code in (200, 404)
 
 
+def test_jobs_list_reads_catalogue_and_pages(client):
+    """Jobs created through the API show up in the listing, newest first, with paging."""
+    created = []
+    for _ in range(3):
+        resp = client.get("/experiment/catalogue-exp/jobs/create?type=TRAIN&status=QUEUED")
+        assert resp.status_code == 200
+        created.append(resp.json())
+
+    resp = client.get("/experiment/catalogue-exp/jobs/list?type=TRAIN")
+    assert resp.status_code == 200
+    listed = [job["id"] for job in resp.json()]
+    assert set(created) <= set(listed)
+
+    resp = client.get(f"/experiment/catalogue-exp/jobs/update/{created[0]}?status=COMPLETE")
+    assert resp.status_code == 200
+    resp = client.get("/experiment/catalogue-exp/jobs/list?status=COMPLETE")
+    assert [job["id"] for job in resp.json()] == [created[0]]
+
+    resp = client.get("/experiment/catalogue-exp/jobs/list?type=TRAIN&limit=1&offset=1")
+    assert [job["id"] for job in resp.json()] == listed[1:2]
+
+
 def test_slim_job_drops_heavy_keys_only():
     """_slim_job should remove the denylisted keys but preserve everything else."""
     from transformerlab.routers.experiment.jobs import _slim_job, _SLIM_JOB_DATA_DROPPED_KEYS
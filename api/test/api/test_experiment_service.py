@@ -113,3 +113,27 @@ async def test_update_and_delete_flow_real(tmp_experiments_dir):
     # delete and confirm gone
     await experiment_service.experiment_delete(name)
     assert await experiment_service.experiment_get(name) is None
+
+
+@pytest.mark.asyncio
+async def test_experiment_list_follows_catalogue_writes(tmp_experiments_dir):
+    _ = tmp_experiments_dir
+    name = f"listed_exp_{uuid.uuid4().hex[:8]}"
+    await experiment_service.experiment_get_all()
+    before = await experiment_service.experiment_list_etag()
+
+    await experiment_service.experiment_create(name, {"a": 1})
+    after_create = await experiment_service.experiment_list_etag()
+    assert after_create and after_create != before
+    listed = {e["id"]: e for e in await experiment_service.experiment_get_all()}
+    assert listed[name]["config"]["a"] == 1
+
+    # Reads leave the ETag alone; tag changes and deletes move it.
+    assert await experiment_service.experiment_list_etag() == after_create
+    await experiment_service.experiment_add_tags(name, ["x"])
+    assert await experiment_service.experiment_list_etag() != after_create
+    listed = {e["id"]: e for e in await experiment_service.experiment_get_all()}
+    assert listed[name]["config"]["tags"] == ["x"]
+
+    await experiment_service.experiment_delete(name)
+    assert name not in {e["id"] for e in await experiment_service.experiment_get_all()}
@@ -82,4 +82,112 @@ def test_get_job_metrics_no_file(client, tmp_workspace):
 
     resp = client.get(f"/experiment/alpha/jobs/{job_id}/metrics")
     assert resp.status_code == 200
-    assert resp.json() == {"count": 0, "rows": []}
+    assert resp.json() == {"count": 0, "rows": [], "total_rows": 0}
+
+
+def _rows(count: int) -> list[dict]:
+    return [
+        {
+            "t": "2026-05-11T00:00:00Z",
+            "progress": i * 100 // count,
+            "step": i,
+            "metrics": {"loss": 1.0 / (i + 1), "lr": 0.001},
+        }
+        for i in range(count)
+    ]
+
+
+def test_get_job_metrics_last_and_step_range(client, tmp_workspace):
+    job_id = "metrics-job-query"
+    _seed_metrics(tmp_workspace, job_id, _rows(20))
+
+    data = client.get(f"/experiment/alpha/jobs/{job_id}/metrics?last=3").json()
+    assert [row["step"] for row in data["rows"]] == [17, 18, 19]
+    assert data["total_rows"] == 20
+
+    data = client.get(f"/experiment/alpha/jobs/{job_id}/metrics?step_min=5&step_max=7&metrics=loss").json()
+    assert [row["step"] for row in data["rows"]] == [5, 6, 7]
+    assert all(set(row["metrics"]) == {"loss"} for row in data["rows"])
+
+
+def test_get_job_metrics_picks_up_appended_rows(client, tmp_workspace, monkeypatch):
+    import transformerlab.services.job_metrics_service as job_metrics_service
+
+    # Small chunks so the index seals several immutable chunk files.
+    monkeypatch.setattr(job_metrics_service, "CHUNK_ROWS", 4)
+    job_id = "metrics-job-append"
+    metrics_path = _seed_metrics(tmp_workspace, job_id, _rows(10))
+
+    data = client.get(f"/experiment/alpha/jobs/{job_id}/metrics").json()
+    assert data["count"] == 10
+    sidecar = tmp_workspace["jobs_dir"] / job_id / job_metrics_service.SIDECAR_DIRNAME
+    assert (sidecar / "chunk-000001.npz").exists()
+
+    with open(metrics_path, "a", encoding="utf-8") as f:
+        f.write("not json\n")
+        f.write(json.dumps({"t": "2026-05-11T00:00:00Z", "progress": 100, "step": 10}) + "\n")
+
+    data = client.get(f"/experiment/alpha/jobs/{job_id}/metrics?since=10").json()
+    assert data["total_rows"] == 12
+    assert [row["step"] for row in data["rows"]] == [10]
+
+    data = client.get(f"/experiment/alpha/jobs/{job_id}/metrics?since=2&step_max=5").json()
+    assert [row["step"] for row in data["rows"]] == [2, 3, 4, 5]
+    # Locks do not outlive the queries that used them.
+    assert job_metrics_service._locks == {}
+
+
+def test_get_job_metrics_downsampled(client, tmp_workspace):
+    job_id = "metrics-job-downsample"
+    _seed_metrics(tmp_workspace, job_id, _rows(500))
+
+    for method in ("lttb", "minmax"):
+        data = client.get(
+            f"/experiment/alpha/jobs/{job_id}/metrics?max_points=50&metrics=loss&downsample={method}"
+        ).json()
+        steps = [row["step"] for row in data["rows"]]
+        assert 2 < data["count"] <= 50
+        assert steps[0] == 0 and steps[-1] == 499
+        assert steps == sorted(steps)
+        assert all(set(row["metrics"]) == {"loss"} for row in data["rows"])
+
+    resp = client.get(f"/experiment/alpha/jobs/{job_id}/metrics?max_points=50&downsample=bogus")
+    assert resp.status_code == 400
+
+
+async def test_metrics_path_lock_is_shared_while_contended():
+    import asyncio
+
+    import transformerlab.services.job_metrics_service as job_metrics_service
+
+    entered = []
+
+    async def query(name):
+        async with job_metrics_service._path_lock("jobs/x/metrics.jsonl"):
+            entered.append(name)
+            await asyncio.sleep(0.01)
+            entered.append(name)
+
+    await asyncio.gather(query("a"), query("b"))
+    # The second query waits for the first instead of getting a fresh lock.
+    assert entered == ["a", "a", "b", "b"]
+    assert job_metrics_service._locks == {}
+
+
+def test_metrics_chunk_cache_is_safe_across_threads(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    import transformerlab.services.job_metrics_service as job_metrics_service
+
+    monkeypatch.setattr(job_metrics_service, "_chunk_cache", job_metrics_service.OrderedDict())
+    monkeypatch.setattr(job_metrics_service, "_MAX_CACHED_CHUNKS", 8)
+
+    def churn(worker):
+        for i in range(2000):
+            job_metrics_service._cache_chunk((f"sidecar-{worker}", i), {})
+            with job_metrics_service._cache_lock:
+                list(job_metrics_service._chunk_cache)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(churn, range(8)))
+    assert len(job_metrics_service._chunk_cache) == 8
@@ -26,3 +26,53 @@ async def test_install_peft_mock(client):
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "error"  # As install_peft now returns 'started' after starting the async task
+
+
+def test_model_list_etag_revalidates_until_models_change(client):
+    # The first listing builds the catalogues; from then on every response carries an ETag.
+    client.get("/model/list")
+    first = client.get("/model/list")
+    assert first.status_code == 200
+    etag = first.headers.get("ETag")
+    assert etag
+
+    unchanged = client.get("/model/list", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert unchanged.headers["ETag"] == etag
+
+    created = client.get("/model/create", params={"id": "etag-model", "name": "etag-model"})
+    assert created.status_code == 200
+    changed = client.get("/model/list", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert "etag-model" in [m["model_id"] for m in changed.json()]
+
+    assert client.get("/model/delete", params={"model_id": "etag-model"}).status_code == 200
+    after_delete = client.get("/model/list", headers={"If-None-Match": changed.headers["ETag"]})
+    assert after_delete.status_code == 200
+    assert "etag-model" not in [m["model_id"] for m in after_delete.json()]
+
+
+def test_model_list_etag_changes_with_the_models_directory(client, monkeypatch):
+    import os
+
+    from transformerlab.services import model_service
+
+    # Record the request's (organization-scoped) models directory.
+    models_dirs = []
+    real_get_models_dir = model_service.get_models_dir
+
+    async def recording_get_models_dir():
+        models_dirs.append(await real_get_models_dir())
+        return models_dirs[-1]
+
+    monkeypatch.setattr(model_service, "get_models_dir", recording_get_models_dir)
+    client.get("/model/list")
+    etag = client.get("/model/list").headers["ETag"]
+
+    # A model directory copied in by hand changes the filesystem fields of the listing.
+    os.makedirs(os.path.join(models_dirs[-1], "etag-copied-model"), exist_ok=True)
+    changed = client.get("/model/list", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    os.rmdir(os.path.join(models_dirs[-1], "etag-copied-model"))
@@ -61,3 +61,42 @@ def test_model_file_traversal_rejected(client):
 def test_model_files_missing_model(client):
     r = client.get("/model/files?model_id=does-not-exist")
     assert r.status_code == 404
+
+
+def test_model_file_multiple_ranges(client):
+    body = b"abcdefghij" * 10  # 100 bytes
+    _seed_model(client, "test-dl-5", {"weights.bin": body})
+    r = client.get(
+        "/model/file?model_id=test-dl-5&relpath=weights.bin",
+        headers={"Range": "bytes=90-,0-9,5-14"},
+    )
+    assert r.status_code == 206
+    content_type = r.headers["content-type"]
+    assert content_type.startswith("multipart/byteranges; boundary=")
+    boundary = content_type.split("boundary=")[1]
+    assert int(r.headers["content-length"]) == len(r.content)
+
+    parts = r.content.split(f"--{boundary}".encode())
+    assert parts[-1] == b"--\r\n"
+    ranges = {}
+    for part in parts[1:-1]:
+        head, _, data = part.partition(b"\r\n\r\n")
+        content_range = next(line for line in head.decode().split("\r\n") if line.startswith("Content-Range"))
+        ranges[content_range.split(" ", 1)[1]] = data[:-2]
+    # Overlapping ranges are merged and parts come back in file order.
+    assert ranges == {"bytes 0-14/100": body[0:15], "bytes 90-99/100": body[90:]}
+
+
+def test_model_file_suffix_and_unsatisfiable_ranges(client):
+    body = b"0123456789"
+    _seed_model(client, "test-dl-6", {"weights.bin": body})
+    url = "/model/file?model_id=test-dl-6&relpath=weights.bin"
+
+    r = client.get(url, headers={"Range": "bytes=-3"})
+    assert r.status_code == 206
+    assert r.content == b"789"
+    assert r.headers["content-range"] == "bytes 7-9/10"
+
+    r = client.get(url, headers={"Range": "bytes=20-30"})
+    assert r.status_code == 416
+    assert r.headers["content-range"] == "bytes */10"
@@ -328,3 +328,52 @@ async def test_cycle_uses_org_id_as_team_id(monkeypatch: pytest.MonkeyPatch) ->
     await process_pending_notifications_once()
 
     assert captured_org_ids == ["my-org"]
+
+
+@pytest.mark.asyncio
+async def test_job_events_notify_terminal_jobs_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Terminal job events are handled without listing experiments; repeats per job collapse."""
+    from lab.job_events import JobEvent
+
+    def _event(status: str) -> JobEvent:
+        return JobEvent("org-1", "exp-1", "job-1", status, "RUNNING", "TRAIN", {"status": status})
+
+    list_mock = AsyncMock()
+    monkeypatch.setattr(notification_service.job_service, "jobs_get_all", list_mock)
+    monkeypatch.setattr(
+        notification_service.job_service,
+        "job_get",
+        AsyncMock(return_value=_make_job(notification_sent=False)),
+    )
+    process_mock = AsyncMock()
+    monkeypatch.setattr(notification_service, "_process_notification", process_mock)
+
+    stats = await notification_service.process_job_events([_event("RUNNING"), _event("COMPLETE"), _event("COMPLETE")])
+
+    list_mock.assert_not_called()
+    process_mock.assert_called_once()
+    assert process_mock.call_args.args[1:] == ("exp-1", "org-1")
+    assert stats["jobs_notified"] == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_subscription_receives_published_terminal_status(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The worker's subscription matches events published with real JobStatus values."""
+    import asyncio
+
+    from lab import job_events
+    from lab.job_status import JobStatus
+
+    bus = job_events.JobEventBus()
+    monkeypatch.setattr(job_events, "bus", bus)
+
+    subscription = job_events.subscribe(statuses=notification_service.TERMINAL_STATUSES)
+    try:
+        bus.publish_job_json("exp-1", "job-1", {"status": JobStatus.RUNNING}, org_id="org-1")
+        bus.publish_job_json("exp-1", "job-1", {"status": JobStatus.COMPLETE}, org_id="org-1")
+        await asyncio.sleep(0)
+
+        events = subscription.drain()
+        assert [(e.job_id, e.status) for e in events] == [("job-1", "COMPLETE")]
+    finally:
+        subscription.close()
@@ -1,8 +1,9 @@
-"""Unit tests for permission_service.check_permission()."""
+"""Unit tests for permission_service.check_permission() and PermissionMatcher."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
-from transformerlab.services.permission_service import check_permission
+from transformerlab.services.permission_service import check_permission, get_permission_matcher
 from transformerlab.shared.models.models import UserTeam, TeamRole, ResourcePermission
 
 
@@ -128,3 +129,56 @@ async def test_exact_match_takes_precedence_over_type_wildcard():
     assert await check_permission(session, "u1", "t1", "experiment", "exp1", "delete") is False
     session1 = _make_session(_member(), type_rule)
     assert await check_permission(session1, "u1", "t1", "experiment", "exp1", "delete") is True
+
+
+# --- bulk matcher ---
+
+
+async def test_matcher_filters_with_same_precedence_in_one_query():
+    rules = [
+        _rule("experiment", "exp1", ["write"]),
+        _rule("experiment", "*", ["read"]),
+        _rule("*", "*", []),
+    ]
+    session = _make_session(_member(), *rules)
+    matcher = await get_permission_matcher(session, "u1", "t1")
+    experiments = [{"id": "exp1"}, {"id": "exp2"}, {"id": ""}]
+
+    assert matcher.filter(experiments, "experiment", "read") == [{"id": "exp2"}]
+    assert matcher.allows("experiment", "exp1", "write") is True
+    assert matcher.allows("model", "m1", "read") is False
+    assert matcher.allows("experiment", "exp2", "bogus") is False
+    assert session.execute.await_count == 2
+
+
+async def test_matcher_is_cached_per_request():
+    session = _make_session(_member(), _rule("experiment", "exp1", []))
+    request = SimpleNamespace(state=SimpleNamespace())
+
+    first = await get_permission_matcher(session, "u1", "t1", request=request)
+    second = await get_permission_matcher(session, "u1", "t1", request=request)
+
+    assert first is second
+    assert session.execute.await_count == 2
+    assert first.filter([{"id": "exp1"}, {"id": "exp2"}], "experiment", "read") == [{"id": "exp2"}]
+
+
+async def test_matcher_owner_and_non_member():
+    owner = await get_permission_matcher(_make_session(_owner()), "u1", "t1")
+    assert owner.filter([{"id": "exp1"}], "experiment", "delete") == [{"id": "exp1"}]
+
+    stranger = await get_permission_matcher(_make_session(None), "u1", "t1")
+    assert stranger.is_member is False
+    assert stranger.filter([{"id": "exp1"}], "experiment", "read") == []
+
+
+async def test_matcher_fingerprint_tracks_role_and_rules():
+    rules = [_rule("experiment", "exp1", ["read", "write"]), _rule("*", "*", [])]
+    first = await get_permission_matcher(_make_session(_member(), *rules), "u1", "t1")
+    same = await get_permission_matcher(_make_session(_member(), *reversed(rules)), "u1", "t1")
+    owner = await get_permission_matcher(_make_session(_owner(), *rules), "u1", "t1")
+    fewer = await get_permission_matcher(_make_session(_member(), rules[0]), "u1", "t1")
+
+    assert first.fingerprint() == same.fingerprint()
+    assert first.fingerprint() != owner.fingerprint()
+    assert first.fingerprint() != fewer.fingerprint()
@@ -1149,3 +1149,139 @@ async def test_refresh_once_connection_error_trips_circuit_breaker(monkeypatch):
 
     # Cleanup
     remote_job_status_service._provider_failures.pop(provider_id, None)
+
+
+@pytest.mark.asyncio
+async def test_refresh_once_makes_one_bulk_status_call_per_provider(monkeypatch):
+    """Cluster-state providers are asked about all their active clusters in one call per cycle."""
+    from transformerlab.compute_providers.models import ClusterState, ClusterStatus
+
+    jobs_by_experiment = {
+        "exp-1": [_make_job("j1", cluster_name="c1"), _make_job("j2", cluster_name="c2")],
+        "exp-2": [_make_job("j3", cluster_name="c3"), _make_job("j4", provider_id="prov-2", cluster_name="c4")],
+    }
+    monkeypatch.setattr(remote_job_status_service, "_list_all_org_ids", AsyncMock(return_value=["org-1"]))
+    monkeypatch.setattr(
+        remote_job_status_service, "_list_experiment_ids_for_current_org", AsyncMock(return_value=["exp-1", "exp-2"])
+    )
+
+    async def fake_jobs_get_all(experiment_id, type, status):
+        return jobs_by_experiment[experiment_id]
+
+    monkeypatch.setattr(remote_job_status_service.job_service, "jobs_get_all", fake_jobs_get_all)
+    monkeypatch.setattr(remote_job_status_service, "_handle_live_status", AsyncMock(return_value=False))
+    monkeypatch.setattr(remote_job_status_service, "_set_org_context", MagicMock())
+    monkeypatch.setattr(remote_job_status_service, "_clear_org_context", MagicMock())
+    for provider_id in ("prov-1", "prov-2"):
+        remote_job_status_service._provider_failures.pop(provider_id, None)
+
+    instances = {}
+
+    def _instance():
+        instance = MagicMock()
+        instance.get_cluster_statuses = MagicMock(
+            side_effect=lambda names: {n: ClusterStatus(cluster_name=n, state=ClusterState.UP) for n in names}
+        )
+        instance.get_cluster_status = MagicMock(side_effect=AssertionError("per-job lookup not expected"))
+        return instance
+
+    async def fake_get_provider_by_id(session, pid):
+        return _make_provider_record("runpod", pid)
+
+    async def fake_get_provider_instance(record):
+        return instances.setdefault(record.id, _instance())
+
+    with (
+        patch("transformerlab.db.session.async_session") as mock_session_ctx,
+        patch("transformerlab.services.provider_service.get_provider_by_id", new=fake_get_provider_by_id),
+        patch("transformerlab.services.provider_service.get_provider_instance", new=fake_get_provider_instance),
+    ):
+        mock_session_ctx.return_value.__aenter__ = AsyncMock(return_value=MagicMock())
+        mock_session_ctx.return_value.__aexit__ = AsyncMock(return_value=False)
+        stats = await refresh_launching_remote_jobs_once()
+
+    assert stats["jobs_seen"] == 4
+    assert stats["errors"] == 0
+    instances["prov-1"].get_cluster_statuses.assert_called_once_with(["c1", "c2", "c3"])
+    instances["prov-2"].get_cluster_statuses.assert_called_once_with(["c4"])
+
+
+@pytest.mark.asyncio
+async def test_refresh_once_looks_up_slurm_job_states_in_one_call_per_provider(monkeypatch):
+    """SLURM jobs of one provider share a single get_job_states call (one sacct for those off the queue)."""
+    from transformerlab.compute_providers.models import JobState
+
+    jobs = []
+    for job_id, slurm_id in (("j1", "101"), ("j2", "102"), ("j3", "103")):
+        job = _make_job(job_id, status="RUNNING", cluster_name=f"c-{job_id}")
+        job["job_data"]["provider_launch_result"] = {"job_id": slurm_id}
+        jobs.append(job)
+    monkeypatch.setattr(remote_job_status_service, "_list_all_org_ids", AsyncMock(return_value=["org-1"]))
+    monkeypatch.setattr(
+        remote_job_status_service, "_list_experiment_ids_for_current_org", AsyncMock(return_value=["exp-1"])
+    )
+    monkeypatch.setattr(remote_job_status_service.job_service, "jobs_get_all", AsyncMock(return_value=jobs))
+    monkeypatch.setattr(remote_job_status_service.job_service, "job_update_job_data_insert_key_value", AsyncMock())
+    update_status = AsyncMock()
+    monkeypatch.setattr(remote_job_status_service.job_service, "job_update_status", update_status)
+    monkeypatch.setattr(remote_job_status_service, "_handle_live_status", AsyncMock(return_value=False))
+    monkeypatch.setattr(remote_job_status_service, "_set_org_context", MagicMock())
+    monkeypatch.setattr(remote_job_status_service, "_clear_org_context", MagicMock())
+    remote_job_status_service._provider_failures.pop("prov-1", None)
+
+    instance = MagicMock()
+    instance.get_job_states = MagicMock(
+        return_value={"101": JobState.RUNNING, "102": JobState.COMPLETED, "103": JobState.FAILED}
+    )
+
+    async def fake_get_provider_by_id(session, pid):
+        return _make_provider_record("slurm", pid)
+
+    with (
+        patch("transformerlab.db.session.async_session") as mock_session_ctx,
+        patch("transformerlab.services.provider_service.get_provider_by_id", new=fake_get_provider_by_id),
+        patch("transformerlab.services.provider_service.get_provider_instance", new=AsyncMock(return_value=instance)),
+    ):
+        mock_session_ctx.return_value.__aenter__ = AsyncMock(return_value=MagicMock())
+        mock_session_ctx.return_value.__aexit__ = AsyncMock(return_value=False)
+        stats = await refresh_launching_remote_jobs_once()
+
+    assert stats["errors"] == 0
+    instance.get_job_states.assert_called_once_with(["101", "102", "103"])
+    assert {call.args[0]: call.args[1] for call in update_status.call_args_list} == {
+        "j2": "COMPLETE",
+        "j3": "FAILED",
+    }
+
+
+# ---------------------------------------------------------------------------
+# Job event handling
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_job_events_track_active_jobs_and_run_live_status(monkeypatch):
+    from lab.job_events import JobEvent
+
+    monkeypatch.setattr(remote_job_status_service, "_tracked_jobs", {})
+    live_mock = AsyncMock(return_value=True)
+    monkeypatch.setattr(remote_job_status_service, "_handle_live_status", live_mock)
+
+    running = _make_job(job_id="job-1", status="RUNNING")
+    finished = _make_job(job_id="job-2", status="RUNNING", live_status="finished")
+    events = [
+        JobEvent("org-1", "exp-1", "job-1", "RUNNING", "LAUNCHING", "REMOTE", running),
+        JobEvent("org-1", "exp-1", "job-2", "RUNNING", "RUNNING", "REMOTE", finished),
+    ]
+    stats = await remote_job_status_service.handle_remote_job_events(events)
+
+    live_mock.assert_called_once()
+    assert live_mock.call_args.args[1] == "exp-1"
+    assert stats["jobs_updated"] == 1
+    assert set(remote_job_status_service._tracked_jobs) == {("org-1", "exp-1", "job-1"), ("org-1", "exp-1", "job-2")}
+
+    done = _make_job(job_id="job-1", status="COMPLETE")
+    await remote_job_status_service.handle_remote_job_events(
+        [JobEvent("org-1", "exp-1", "job-1", "COMPLETE", "RUNNING", "REMOTE", done)]
+    )
+    assert set(remote_job_status_service._tracked_jobs) == {("org-1", "exp-1", "job-2")}
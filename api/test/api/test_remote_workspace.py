@@ -1,5 +1,4 @@
 import asyncio
-import io
 import sys
 from unittest.mock import Mock, patch
 
@@ -25,18 +24,16 @@ def test_download_all_artifacts_endpoint():
 
     mock_job_service.get_all_artifact_paths = mock_get_all_artifact_paths
 
-    mock_zip_buffer = io.BytesIO(b"fake zip content")
-
-    # Track calls to create_zip
+    # Track calls to the zip producer
     create_zip_calls = []
 
-    async def mock_create_zip(file_paths, storage):
+    async def mock_stream_zip(file_paths, storage):
         create_zip_calls.append((file_paths, storage))
-        return mock_zip_buffer
+        yield b"fake zip content"
 
     with (
         patch("transformerlab.routers.experiment.jobs.job_service", mock_job_service),
-        patch("transformerlab.routers.experiment.jobs.zip_utils.create_zip_from_storage", mock_create_zip),
+        patch("transformerlab.routers.experiment.jobs.zip_utils.stream_zip_from_storage", mock_stream_zip),
         patch("transformerlab.routers.experiment.jobs.storage", Mock()),
     ):
         from transformerlab.routers.experiment.jobs import download_all_artifacts
@@ -52,7 +49,11 @@ def test_download_all_artifacts_endpoint():
         assert "Content-Disposition" in response.headers
         assert response.headers["Content-Disposition"].startswith("attachment; filename=")
 
-        # Verify the async function was called
+        # The producer is handed to the response and runs as the body is sent
+        async def _body():
+            return b"".join([chunk async for chunk in response.body_iterator])
+
+        assert asyncio.run(_body()) == b"fake zip content"
         assert len(create_zip_calls) == 1
 
         # Test 2: No artifacts found
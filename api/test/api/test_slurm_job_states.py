@@ -0,0 +1,53 @@
+from transformerlab.compute_providers import slurm
+from transformerlab.compute_providers.models import JobState
+from transformerlab.compute_providers.slurm import SLURMProvider
+
+
+def _provider(commands, squeue_output, sacct_output=""):
+    provider = SLURMProvider(mode="ssh", ssh_host="slurm.example.com", ssh_user="tester")
+
+    def fake_ssh_execute(command: str) -> str:
+        commands.append(command)
+        if command.startswith("squeue"):
+            return squeue_output
+        if command.startswith("sacct"):
+            return sacct_output
+        raise AssertionError(f"unexpected command: {command}")
+
+    provider._ssh_execute = fake_ssh_execute  # type: ignore[method-assign]
+    return provider
+
+
+def test_job_states_share_one_squeue_and_batch_sacct(monkeypatch):
+    monkeypatch.setattr(slurm, "_active_state_snapshots", {})
+    monkeypatch.setattr(slurm, "_terminal_states", slurm.OrderedDict())
+    commands = []
+    provider = _provider(
+        commands,
+        squeue_output="101 RUNNING\n102 PENDING\n",
+        sacct_output="103|COMPLETED\n104|CANCELLED by 1000\n",
+    )
+
+    states = provider.get_job_states(["101", "102", "103", "104", "105"])
+    assert states == {
+        "101": JobState.RUNNING,
+        "102": JobState.PENDING,
+        "103": JobState.COMPLETED,
+        "104": JobState.CANCELLED,
+        "105": JobState.UNKNOWN,
+    }
+    assert [c.split()[0] for c in commands] == ["squeue", "sacct"]
+    assert "-j 103,104,105" in commands[1]
+
+    # Another instance for the same account reuses the snapshot and the remembered terminal states.
+    other = _provider(commands, squeue_output="")
+    assert other.get_job_states([101, 103]) == {"101": JobState.RUNNING, "103": JobState.COMPLETED}
+    assert len(commands) == 2
+
+
+def test_job_states_ignore_unsafe_job_ids(monkeypatch):
+    monkeypatch.setattr(slurm, "_active_state_snapshots", {})
+    commands = []
+    provider = _provider(commands, squeue_output="")
+    assert provider.get_job_states(["1; rm -rf /"]) == {}
+    assert commands == []
@@ -75,3 +75,37 @@ def test_delete_upload(client):
 
     status = client.get(f"/upload/{uid}/status")
     assert status.status_code == 404
+
+
+def test_grid_chunks_are_written_in_place(client, monkeypatch):
+    from transformerlab.services import upload_service
+
+    monkeypatch.setattr(upload_service, "CHUNK_SIZE", 4)
+    init = client.post("/upload/init", json={"filename": "data.bin", "total_size": 10}).json()
+    uid = init["upload_id"]
+    assert init["chunk_size"] == 4
+
+    # Out of order, as concurrent clients send them.
+    for index, content in ((2, b"IJ"), (0, b"ABCD"), (1, b"EFGH")):
+        resp = client.put(
+            f"/upload/{uid}/chunk?chunk_index={index}",
+            content=content,
+            headers={"Content-Type": "application/octet-stream"},
+        )
+        assert resp.status_code == 200
+    assert client.get(f"/upload/{uid}/status").json()["received"] == [0, 1, 2]
+
+    staging = upload_service._staging_dir(uid)
+    assert not any(name.isdigit() for name in os.listdir(staging))
+
+    resp = client.post(f"/upload/{uid}/complete", json={"total_chunks": 3})
+    assert resp.status_code == 200
+    with open(resp.json()["temp_path"], "rb") as f:
+        assert f.read() == b"ABCDEFGHIJ"
+    assert not os.path.exists(os.path.join(staging, "data"))
+    client.delete(f"/upload/{uid}")
+
+
+def test_init_rejects_negative_size(client):
+    resp = client.post("/upload/init", json={"filename": "model.zip", "total_size": -1})
+    assert resp.status_code == 400
@@ -1,5 +1,7 @@
 import json
 import os
+import shutil
+
 import pytest
 
 
@@ -194,3 +196,36 @@ def test_sweep_removes_old_uploads(tmp_path, monkeypatch):
 
     assert count == 1
     assert not os.path.isdir(os.path.join(svc.STAGING_ROOT, uid))
+
+
+def test_init_rejects_oversized_upload(monkeypatch):
+    import asyncio
+    from transformerlab.services import upload_service as svc
+
+    monkeypatch.setattr(svc, "MAX_UPLOAD_SIZE", 100)
+    with pytest.raises(ValueError):
+        asyncio.run(svc.init_upload("big.bin", 101))
+    with pytest.raises(ValueError):
+        asyncio.run(svc.init_upload("negative.bin", -1))
+    assert not os.path.isdir(svc.STAGING_ROOT) or os.listdir(svc.STAGING_ROOT) == []
+
+
+def test_abandoned_uploads_are_dropped_from_the_cache():
+    import asyncio
+    from datetime import datetime, timedelta, timezone
+    from transformerlab.services import upload_service as svc
+
+    old = asyncio.run(svc.init_upload("old.bin", 4))["upload_id"]
+    removed = asyncio.run(svc.init_upload("removed.bin", 4))["upload_id"]
+    asyncio.run(svc.save_chunk(old, 0, b"abcd"))
+    asyncio.run(svc.save_chunk(removed, 0, b"abcd"))
+    svc._metas[old]["created_at"] = (datetime.now(timezone.utc) - timedelta(hours=25)).isoformat()
+    # Swept by another worker.
+    shutil.rmtree(svc._staging_dir(removed))
+
+    fresh = asyncio.run(svc.init_upload("new.bin", 4))["upload_id"]
+    asyncio.run(svc.save_chunk(fresh, 0, b"abcd"))
+
+    assert old not in svc._metas and old not in svc._received
+    assert removed not in svc._metas and removed not in svc._received
+    assert fresh in svc._metas
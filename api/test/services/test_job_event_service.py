@@ -0,0 +1,46 @@
+import asyncio
+import shutil
+import uuid
+
+from lab import job_catalogue, job_events, storage
+from lab.dirs import get_experiments_dir
+
+from transformerlab.services import job_event_service
+
+
+async def test_first_change_in_an_empty_catalogue_is_published(monkeypatch):
+    experiment_id = f"job-events-{uuid.uuid4().hex[:8]}"
+    saved = {}
+
+    async def load_cursors():
+        return dict(saved)
+
+    async def save_cursors(cursors):
+        saved.clear()
+        saved.update(cursors)
+
+    bus = job_events.JobEventBus()
+    monkeypatch.setattr(job_events, "bus", bus)
+    monkeypatch.setattr(job_catalogue, "CHANGE_GRACE_SECONDS", 0)
+    monkeypatch.setattr(job_event_service, "_load_cursors", load_cursors)
+    monkeypatch.setattr(job_event_service, "_save_cursors", save_cursors)
+
+    async def list_experiment_ids():
+        return [experiment_id]
+
+    monkeypatch.setattr(job_event_service, "_list_experiment_ids", list_experiment_ids)
+
+    subscription = job_events.subscribe()
+    try:
+        # First sight of an experiment whose change log is still empty.
+        assert (await job_event_service.poll_org_changes_once("org-1"))["events"] == 0
+        assert saved[experiment_id] == job_catalogue.START_CURSOR
+
+        # A job written outside this process (only a change object lands in the log).
+        await job_catalogue.record_job(experiment_id, "job-1", {"id": "job-1", "status": "RUNNING"})
+        assert (await job_event_service.poll_org_changes_once("org-1"))["events"] == 1
+        await asyncio.sleep(0)
+        assert [(e.job_id, e.status) for e in subscription.drain()] == [("job-1", "RUNNING")]
+    finally:
+        subscription.close()
+        shutil.rmtree(storage.join(await get_experiments_dir(), experiment_id), ignore_errors=True)
@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from transformerlab.services import provider_service
+
+
+def _record(provider_type="runpod", config=None, provider_id="prov-1"):
+    return SimpleNamespace(
+        id=provider_id,
+        team_id="team-1",
+        name="pool-test",
+        type=provider_type,
+        config=config if config is not None else {"api_key": "k1"},
+    )
+
+
+@pytest.fixture(autouse=True)
+def _empty_registry():
+    provider_service.invalidate_provider_instances()
+    yield
+    provider_service.invalidate_provider_instances()
+
+
+@pytest.mark.asyncio
+async def test_provider_instances_are_reused_until_config_changes():
+    record = _record()
+    first = await provider_service.get_provider_instance(record)
+    assert await provider_service.get_provider_instance(record) is first
+
+    record.config = {"api_key": "k2"}
+    changed = await provider_service.get_provider_instance(record)
+    assert changed is not first
+    assert changed.api_key == "k2"
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_invalidate_cached_instances():
+    record = _record()
+    first = await provider_service.get_provider_instance(record)
+
+    session = SimpleNamespace(commit=AsyncMock(), refresh=AsyncMock(), delete=AsyncMock())
+    await provider_service.update_team_provider(session, record, name="pool-test")
+    second = await provider_service.get_provider_instance(record)
+    assert second is not first
+
+    await provider_service.delete_team_provider(session, record)
+    assert await provider_service.get_provider_instance(record) is not second
+
+
+@pytest.mark.asyncio
+async def test_local_provider_instances_are_not_shared():
+    record = _record(provider_type="local", config={})
+    first = await provider_service.get_provider_instance(record)
+    assert await provider_service.get_provider_instance(record) is not first
+
+
+@pytest.mark.asyncio
+async def test_user_settings_writes_invalidate_but_reads_do_not(monkeypatch):
+    from transformerlab.services.compute_provider import user_provider_settings_service as settings_service
+
+    record = _record(provider_type="slurm", config={"mode": "ssh", "ssh_host": "login", "ssh_user": "u"})
+    first = await provider_service.get_provider_instance(record)
+
+    monkeypatch.setattr(settings_service, "get_team_provider", AsyncMock(return_value=record))
+    monkeypatch.setattr(settings_service, "user_slurm_key_exists", AsyncMock(return_value=False))
+    monkeypatch.setattr(settings_service.db, "config_get", AsyncMock(return_value=None))
+    monkeypatch.setattr(settings_service.db, "config_set", AsyncMock())
+
+    await settings_service.get_user_provider_settings(None, "team-1", "user-1", record.id)
+    assert await provider_service.get_provider_instance(record) is first
+
+    await settings_service.set_user_provider_settings(None, "team-1", "user-1", record.id, {"slurm_user": "alice"})
+    assert await provider_service.get_provider_instance(record) is not first
@@ -0,0 +1,150 @@
+import os
+
+import pytest
+from fsspec.implementations.local import LocalFileSystem
+
+from transformerlab.services import trackio_service
+
+
+class _CountingFS(LocalFileSystem):
+    """Local filesystem that records which files were opened for reading."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.opened = []
+
+    def _open(self, path, mode="rb", *args, **kwargs):
+        if "r" in mode:
+            self.opened.append(os.path.basename(path))
+        return super()._open(path, mode, *args, **kwargs)
+
+
+def test_mirror_downloads_only_changed_files(tmp_path):
+    src = tmp_path / "project"
+    src.mkdir()
+    (src / "project.db").write_bytes(b"v1")
+    (src / "media").mkdir()
+    (src / "media" / "image.png").write_bytes(b"png")
+    mirror = str(tmp_path / "mirrors" / "org_exp_project")
+    fs = _CountingFS(skip_instance_cache=True)
+
+    assert trackio_service._sync_mirror_sync(fs, str(src), mirror) == 2
+    assert open(os.path.join(mirror, "media", "image.png"), "rb").read() == b"png"
+
+    # Nothing changed: nothing is downloaded.
+    fs.opened.clear()
+    assert trackio_service._sync_mirror_sync(fs, str(src), mirror) == 0
+    assert fs.opened == []
+
+    # A dashboard's WAL for the old database is dropped when the database is replaced.
+    open(os.path.join(mirror, "project.db-wal"), "wb").close()
+    (src / "project.db").write_bytes(b"version 2")
+    os.remove(src / "media" / "image.png")
+    assert trackio_service._sync_mirror_sync(fs, str(src), mirror) == 1
+    assert fs.opened == ["project.db"]
+    assert open(os.path.join(mirror, "project.db"), "rb").read() == b"version 2"
+    assert not os.path.exists(os.path.join(mirror, "project.db-wal"))
+    assert not os.path.exists(os.path.join(mirror, "media", "image.png"))
+    # The manifest lives beside the mirror, not inside TRACKIO_DIR.
+    assert os.path.exists(mirror + ".json")
+    assert not os.path.exists(os.path.join(mirror, ".json"))
+
+
+def test_evict_mirrors_removes_least_recently_used(tmp_path):
+    root = tmp_path / "mirrors"
+    root.mkdir()
+    for name, last_used in [("old", 1.0), ("in_use", 0.5), ("new", 3.0)]:
+        mirror = root / name
+        mirror.mkdir()
+        (mirror / "project.db").write_bytes(b"x" * 100)
+        trackio_service._write_manifest(str(mirror), {"files": {}, "last_used": last_used})
+
+    keep = {os.path.realpath(str(root / "in_use"))}
+    trackio_service._evict_mirrors_sync(str(root), keep, max_bytes=200)
+
+    assert not (root / "old").exists()
+    assert not (root / "old.json").exists()
+    assert (root / "in_use").exists()
+    assert (root / "new").exists()
+
+
+@pytest.mark.parametrize("stale", [False, True])
+async def test_jobs_sharing_a_mirror_share_one_current_dashboard(monkeypatch, stale):
+    import io
+    import shutil
+    import uuid
+    from unittest.mock import MagicMock
+
+    source = os.path.join(trackio_service.HOME_DIR, f"trackio-test-{uuid.uuid4().hex}")
+    os.makedirs(source)
+    open(os.path.join(source, "project.db"), "wb").close()
+
+    class _FakeJob:
+        async def get_job_data(self):
+            return {"trackio_db_artifact_path": source, "trackio_project": "shared"}
+
+    async def fake_job_get_cached(job_id, experiment_id=None):
+        return {"id": job_id}
+
+    async def fake_job_get(job_id, experiment_id):
+        return _FakeJob()
+
+    refreshes = []
+
+    async def fake_refresh(src_fs, source_path, mirror_root, mirror_dir):
+        refreshes.append(mirror_dir)
+
+    launches = []
+
+    def fake_popen(*args, **kwargs):
+        launches.append(args)
+        proc = MagicMock()
+        proc.stdout = io.StringIO(f"Trackio UI launched at: http://127.0.0.1:{7860 + len(launches)}\n")
+        return proc
+
+    registry = MagicMock()
+    monkeypatch.setattr(trackio_service, "job_get_cached", fake_job_get_cached)
+    monkeypatch.setattr(trackio_service.Job, "get", staticmethod(fake_job_get))
+    monkeypatch.setattr(trackio_service, "_refresh_mirror", fake_refresh)
+    monkeypatch.setattr(trackio_service, "_mirror_is_stale_sync", lambda *args: stale)
+    monkeypatch.setattr(trackio_service.subprocess, "Popen", fake_popen)
+    monkeypatch.setattr(trackio_service, "get_registry", lambda: registry)
+    monkeypatch.setattr(trackio_service, "_TRACKIO_META", {})
+    try:
+        first = await trackio_service.start_trackio_for_job("job-a", "org", "exp")
+        second = await trackio_service.start_trackio_for_job("job-b", "org", "exp")
+        assert trackio_service._mirror_locks == {}
+
+        if stale:
+            # The old dashboard is stopped before the mirror is refreshed, and both jobs move to the new one.
+            assert first != second
+            assert len(refreshes) == 2
+            assert registry.kill.call_count == 1
+            assert trackio_service._TRACKIO_META["job-a"] == trackio_service._TRACKIO_META["job-b"]
+            registry.kill.reset_mock()
+        else:
+            # The second job reuses the dashboard instead of refreshing the mirror it is serving.
+            assert first == second
+            assert len(refreshes) == 1
+            registry.register.assert_called_once()
+
+        await trackio_service.stop_trackio_for_job("job-a")
+        registry.kill.assert_not_called()
+        await trackio_service.stop_trackio_for_job("job-b")
+        registry.kill.assert_called_once()
+    finally:
+        shutil.rmtree(source, ignore_errors=True)
+
+
+def test_mirror_is_stale_when_the_source_changes(tmp_path):
+    src = tmp_path / "project"
+    src.mkdir()
+    (src / "project.db").write_bytes(b"v1")
+    mirror = str(tmp_path / "mirrors" / "org_exp_project")
+    fs = LocalFileSystem(skip_instance_cache=True)
+
+    assert trackio_service._mirror_is_stale_sync(fs, str(src), mirror)
+    trackio_service._sync_mirror_sync(fs, str(src), mirror)
+    assert not trackio_service._mirror_is_stale_sync(fs, str(src), mirror)
+    (src / "project.db").write_bytes(b"version 2")
+    assert trackio_service._mirror_is_stale_sync(fs, str(src), mirror)
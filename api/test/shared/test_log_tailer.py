@@ -0,0 +1,77 @@
+"""Tests for the shared incremental log tailer behind remote SSE log streams."""
+
+import asyncio
+
+from lab.segmented_log import SegmentedLogWriter
+from transformerlab.shared import log_tailer
+
+
+async def _next(stream, timeout: float = 2.0):
+    return await asyncio.wait_for(stream.__anext__(), timeout)
+
+
+def test_tailers_share_one_poller_and_read_only_new_bytes(tmp_path) -> None:
+    log = tmp_path / "output.txt"
+    log.write_text("old line\n" * 1000)
+
+    async def _run():
+        first = log_tailer.follow_lines(str(log), start_from_beginning=True, poll_interval_ms=10)
+        second = log_tailer.follow_lines(str(log), poll_interval_ms=10)
+        backlog = await _next(first)
+        assert len(backlog) == 1000
+        tailer = log_tailer.get_tailer(str(log))
+        # Start the second subscriber, then append.
+        pending = asyncio.ensure_future(_next(second))
+        await asyncio.sleep(0.05)
+        assert tailer.subscriber_count == 2
+        read_before = tailer.bytes_read
+
+        with open(log, "a") as f:
+            f.write("new line 1\nnew line 2\n")
+
+        assert await _next(first) == ["new line 1\n", "new line 2\n"]
+        assert await pending == ["new line 1\n", "new line 2\n"]
+        assert tailer.bytes_read - read_before == len("new line 1\nnew line 2\n")
+
+        await first.aclose()
+        await second.aclose()
+        assert str(log) not in log_tailer._tailers
+
+    asyncio.run(_run())
+
+
+def test_tailer_resends_rewritten_file_and_backs_off_when_idle(tmp_path) -> None:
+    log = tmp_path / "output.txt"
+    log.write_text("line 1\nline 2\n")
+
+    async def _run():
+        stream = log_tailer.follow_lines(str(log), poll_interval_ms=10)
+        pending = asyncio.ensure_future(_next(stream))
+        await asyncio.sleep(0.3)
+        tailer = log_tailer.get_tailer(str(log))
+        assert tailer.interval_ms > 10
+
+        log.write_text("restart\n")
+        assert await pending == ["restart\n"]
+        assert tailer.interval_ms == 10
+        await stream.aclose()
+
+    asyncio.run(_run())
+
+
+def test_tailer_follows_segmented_logs(tmp_path) -> None:
+    log = tmp_path / "output.txt"
+    log.write_text("base\n")
+    writer = SegmentedLogWriter(str(log), flush_interval=3600)
+    writer.write("segment 1\n")
+    writer.flush()
+
+    async def _run():
+        stream = log_tailer.follow_lines(str(log), start_from_beginning=True, poll_interval_ms=10)
+        assert await _next(stream) == ["base\n", "segment 1\n"]
+        writer.write("segment 2\n")
+        writer.flush()
+        assert await _next(stream) == ["segment 2\n"]
+        await stream.aclose()
+
+    asyncio.run(_run())
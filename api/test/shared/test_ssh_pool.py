@@ -0,0 +1,63 @@
+import io
+from unittest.mock import MagicMock
+
+from transformerlab.shared import ssh_pool
+
+
+def _fake_client():
+    client = MagicMock()
+    client.get_transport.return_value.is_active.return_value = True
+    client.exec_command.side_effect = lambda command: (None, io.BytesIO(command.encode()), io.BytesIO(b""))
+    return client
+
+
+def test_commands_reuse_one_connection(monkeypatch):
+    ssh_pool.close_all()
+    clients = []
+
+    def fake_connect(key):
+        clients.append(_fake_client())
+        return ssh_pool._PooledConnection(clients[-1])
+
+    monkeypatch.setattr(ssh_pool, "_connect", fake_connect)
+
+    assert ssh_pool.execute("host", 22, "user", None, "squeue") == ("squeue", "")
+    assert ssh_pool.execute("host", 22, "user", None, "sacct") == ("sacct", "")
+    assert len(clients) == 1
+
+    # A dead transport is replaced on the next checkout.
+    clients[0].get_transport.return_value.is_active.return_value = False
+    ssh_pool.execute("host", 22, "user", None, "sinfo")
+    assert len(clients) == 2
+
+    # Failing to open a channel drops the connection and retries once.
+    clients[1].exec_command.side_effect = EOFError("gone")
+    assert ssh_pool.execute("host", 22, "user", None, "echo") == ("echo", "")
+    assert len(clients) == 3
+    ssh_pool.close_all()
+
+
+def test_sftp_session_keeps_connection_checked_out(monkeypatch):
+    ssh_pool.close_all()
+    clients = []
+
+    def fake_connect(key):
+        clients.append(_fake_client())
+        return ssh_pool._PooledConnection(clients[-1])
+
+    monkeypatch.setattr(ssh_pool, "_connect", fake_connect)
+    monkeypatch.setattr(ssh_pool, "SSH_IDLE_TIMEOUT_SECONDS", 0)
+
+    with ssh_pool.open_sftp("host", 22, "user", None) as sftp:
+        conn = next(iter(ssh_pool._connections.values()))
+        assert conn.in_use == 1
+        # An idle sweep triggered by another caller leaves the busy connection alone.
+        ssh_pool.execute("host", 22, "user", None, "squeue")
+        assert not clients[0].close.called
+        # The session holds one channel slot for its whole lifetime.
+        assert conn.channels._value == ssh_pool.SSH_MAX_CHANNELS - 1
+    sftp.close.assert_called_once()
+    assert conn.in_use == 0
+    assert conn.channels._value == ssh_pool.SSH_MAX_CHANNELS
+    assert len(clients) == 1
+    ssh_pool.close_all()
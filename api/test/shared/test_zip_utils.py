@@ -0,0 +1,59 @@
+"""Tests for the streaming zip producer used by artifact downloads."""
+
+import asyncio
+import io
+import zipfile
+
+from lab import storage
+from transformerlab.shared import zip_utils
+
+
+def _collect(stream) -> bytes:
+    async def _run():
+        return b"".join([chunk async for chunk in stream])
+
+    return asyncio.run(_run())
+
+
+def test_stream_zip_from_storage_streams_files_and_directories(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(zip_utils, "ZIP_READ_CHUNK_SIZE", 1024)
+    monkeypatch.setattr(zip_utils, "ZIP_PREFETCH_CHUNKS", 1)
+    big = bytes(range(256)) * 64  # spans several read chunks
+    (tmp_path / "metrics.csv").write_bytes(big)
+    (tmp_path / "sample.png").write_bytes(b"\x89PNG not really")
+    (tmp_path / "empty.txt").write_bytes(b"")
+    nested = tmp_path / "outputs" / "eval"
+    nested.mkdir(parents=True)
+    (nested / "result.json").write_text('{"score": 1}')
+
+    paths = [str(tmp_path / name) for name in ("metrics.csv", "sample.png", "empty.txt", "outputs", "missing.bin")]
+    chunks = []
+
+    async def _run():
+        async for chunk in zip_utils.stream_zip_from_storage(paths, storage):
+            chunks.append(chunk)
+
+    asyncio.run(_run())
+    assert len(chunks) > 3
+
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zf:
+        assert zf.testzip() is None
+        assert sorted(zf.namelist()) == ["empty.txt", "metrics.csv", "outputs/eval/result.json", "sample.png"]
+        assert zf.read("metrics.csv") == big
+        assert zf.read("empty.txt") == b""
+        assert zf.read("outputs/eval/result.json") == b'{"score": 1}'
+        assert zf.getinfo("metrics.csv").compress_type == zipfile.ZIP_DEFLATED
+        # Already-compressed formats are stored as-is.
+        assert zf.getinfo("sample.png").compress_type == zipfile.ZIP_STORED
+
+
+def test_stream_zip_from_directory_store_only(tmp_path) -> None:
+    (tmp_path / "ckpt").mkdir()
+    (tmp_path / "ckpt" / "weights.bin").write_bytes(b"\x00" * 4096)
+
+    data = _collect(zip_utils.stream_zip_from_directory(str(tmp_path / "ckpt"), storage, store_only=True))
+
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        info = zf.getinfo("ckpt/weights.bin")
+        assert info.compress_type == zipfile.ZIP_STORED
+        assert zf.read(info) == b"\x00" * 4096
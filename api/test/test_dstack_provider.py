@@ -33,7 +33,7 @@ def _mock_response(json_data, status_code=200):
 
 
 class TestCheck:
-    @patch("transformerlab.compute_providers.dstack.requests.request")
+    @patch("transformerlab.compute_providers.dstack.requests.Session.request")
     def test_returns_true_on_success(self, mock_request, provider):
         mock_request.return_value = _mock_response([])
         status, reason = provider.check()
@@ -43,7 +43,7 @@ class TestCheck:
         assert call_kwargs[1]["url"] == "http://localhost:3000/api/runs/list"
         assert call_kwargs[1]["json"] == {"project_name": "test-project", "only_active": False, "limit": 1}
 
-    @patch("transformerlab.compute_providers.dstack.requests.request")
+    @patch("transformerlab.compute_providers.dstack.requests.Session.request")
     def test_returns_false_on_connection_error(self, mock_request, provider, caplog):
         import logging
         import requests as req_lib
@@ -192,7 +192,7 @@ class TestMapStatus:
 
 
 class TestLaunchCluster:
-    @patch("transformerlab.compute_providers.dstack.requests.request")
+    @patch("transformerlab.compute_providers.dstack.requests.Session.request")
     def test_posts_to_apply_endpoint(self, mock_request, provider):
         mock_request.return_value = _mock_response({"run_spec": {"run_name": "my-job"}, "status": "SUBMITTED"})
         config = ClusterConfig(run="python train.py")
@@ -204,7 +204,7 @@ class TestLaunchCluster:
         assert call_kwargs[1]["json"]["force"] is False
         assert result["run_name"] == "my-job"
 
-    @patch("transformerlab.compute_providers.dstack.requests.request")
+    @patch("transformerlab.compute_providers.dstack.requests.Session.request")
     def test_includes_auth_header(self, mock_request, provider):
         mock_request.return_value = _mock_response({"run_name": "x", "status": "SUBMITTED"})
         provider.launch_cluster("x", ClusterConfig(run="echo hi"))
@@ -216,7 +216,7 @@ class TestLaunchCluster:
 
 
 class TestStopCluster:
-    @patch("transformerlab.compute_providers.dstack.requests.request")
+    @patch("transformerlab.compute_providers.dstack.requests.Session.request")
     def test_posts_to_stop_endpoint(self, mock_request, provider):
         mock_request.return_value = _mock_response({})
         provider.stop_cluster("my-job")
@@ -231,7 +231,7 @@ class TestStopCluster:
 
 
 class TestListClusters:
-    @patch("transformerlab.compute_providers.dstack.requests.request")
+    @patch("transformerlab.compute_providers.dstack.requests.Session.request")
     def test_posts_to_legacy_list_endpoint(self, mock_request, provider):
         mock_request.return_value = _mock_response([])
         provider.list_clusters()
@@ -249,14 +249,14 @@ class TestListClusters:
 
 
 class TestGetClusterStatus:
-    @patch("transformerlab.compute_providers.dstack.requests.request")
+    @patch("transformerlab.compute_providers.dstack.requests.Session.request")
     def test_maps_running_status(self, mock_request, provider):
         mock_request.return_value = _mock_response({"run_name": "j", "status": "RUNNING", "status_message": None})
         status = provider.get_cluster_status("j")
         assert status.state == ClusterState.UP
         assert status.cluster_name == "j"
 
-    @patch("transformerlab.compute_providers.dstack.requests.request")
+    @patch("transformerlab.compute_providers.dstack.requests.Session.request")
     def test_maps_done_status(self, mock_request, provider):
         mock_request.return_value = _mock_response({"run_name": "j", "status": "DONE", "status_message": None})
         status = provider.get_cluster_status("j")
@@ -267,7 +267,7 @@ class TestGetClusterStatus:
 
 
 class TestGetJobLogs:
-    @patch("transformerlab.compute_providers.dstack.requests.request")
+    @patch("transformerlab.compute_providers.dstack.requests.Session.request")
     def test_returns_waiting_when_no_submission_id(self, mock_request, provider):
         mock_request.return_value = _mock_response(
             {"run_name": "j", "status": "PROVISIONING", "latest_job_submission": None}
@@ -275,7 +275,7 @@ class TestGetJobLogs:
         logs = provider.get_job_logs("j", "j")
         assert "Waiting" in logs
 
-    @patch("transformerlab.compute_providers.dstack.requests.request")
+    @patch("transformerlab.compute_providers.dstack.requests.Session.request")
     def test_decodes_base64_log_messages(self, mock_request, provider):
         import base64
 
@@ -294,7 +294,7 @@ class TestGetJobLogs:
         logs = provider.get_job_logs("j", "j")
         assert "Hello from training" in logs
 
-    @patch("transformerlab.compute_providers.dstack.requests.request")
+    @patch("transformerlab.compute_providers.dstack.requests.Session.request")
     def test_returns_waiting_when_log_list_empty(self, mock_request, provider):
         mock_request.side_effect = [
             _mock_response(
@@ -333,7 +333,7 @@ class TestBuildRunSpecEmptyGuard:
 
 
 class TestSubmitJob:
-    @patch("transformerlab.compute_providers.dstack.requests.request")
+    @patch("transformerlab.compute_providers.dstack.requests.Session.request")
     def test_forwards_num_nodes_and_provider_config(self, mock_request, provider):
         mock_request.return_value = _mock_response({"run_name": "j", "status": "SUBMITTED"})
         job_config = JobConfig(
@@ -352,7 +352,7 @@ class TestSubmitJob:
 
 
 class TestCancelJob:
-    @patch("transformerlab.compute_providers.dstack.requests.request")
+    @patch("transformerlab.compute_providers.dstack.requests.Session.request")
     def test_delegates_to_stop_cluster(self, mock_request, provider):
         mock_request.return_value = _mock_response({})
         result = provider.cancel_job("my-job", "my-job")
@@ -365,7 +365,7 @@ class TestCancelJob:
 
 
 class TestListJobs:
-    @patch("transformerlab.compute_providers.dstack.requests.request")
+    @patch("transformerlab.compute_providers.dstack.requests.Session.request")
     def test_returns_single_job_matching_cluster_status(self, mock_request, provider):
         mock_request.return_value = _mock_response({"run_name": "j", "status": "RUNNING", "status_message": None})
         jobs = provider.list_jobs("j")
@@ -373,7 +373,7 @@ class TestListJobs:
         assert jobs[0].job_id == "j"
         assert jobs[0].state == JobState.RUNNING
 
-    @patch("transformerlab.compute_providers.dstack.requests.request")
+    @patch("transformerlab.compute_providers.dstack.requests.Session.request")
     def test_returns_empty_list_on_error(self, mock_request, provider):
         import requests as req_lib
 
@@ -386,7 +386,7 @@ class TestListJobs:
 
 
 class TestGetClusterResources:
-    @patch("transformerlab.compute_providers.dstack.requests.request")
+    @patch("transformerlab.compute_providers.dstack.requests.Session.request")
     def test_returns_resource_info_with_no_gpus_when_jobs_empty(self, mock_request, provider):
         mock_request.return_value = _mock_response({"run_name": "j", "status": "RUNNING", "jobs": []})
         resources = provider.get_cluster_resources("j")
@@ -63,9 +63,8 @@ def _mock_experiment(current_tags=None):
     return mock_exp
 
 
-@patch("transformerlab.services.experiment_service.cache.invalidate", new_callable=AsyncMock)
 @patch("transformerlab.services.experiment_service.Experiment.get", new_callable=AsyncMock)
-async def test_experiment_add_tags_merges_with_existing(mock_get, _mock_cache):
+async def test_experiment_add_tags_merges_with_existing(mock_get):
     mock_exp = _mock_experiment(current_tags=["foo"])
     mock_get.return_value = mock_exp
 
@@ -75,9 +74,8 @@ async def test_experiment_add_tags_merges_with_existing(mock_get, _mock_cache):
     mock_exp.update_config_field.assert_awaited_once_with("tags", ["foo", "bar", "baz"])
 
 
-@patch("transformerlab.services.experiment_service.cache.invalidate", new_callable=AsyncMock)
 @patch("transformerlab.services.experiment_service.Experiment.get", new_callable=AsyncMock)
-async def test_experiment_add_tags_is_idempotent(mock_get, _mock_cache):
+async def test_experiment_add_tags_is_idempotent(mock_get):
     mock_exp = _mock_experiment(current_tags=["foo", "bar"])
     mock_get.return_value = mock_exp
 
@@ -87,9 +85,8 @@ async def test_experiment_add_tags_is_idempotent(mock_get, _mock_cache):
     mock_exp.update_config_field.assert_awaited_once_with("tags", ["foo", "bar"])
 
 
-@patch("transformerlab.services.experiment_service.cache.invalidate", new_callable=AsyncMock)
 @patch("transformerlab.services.experiment_service.Experiment.get", new_callable=AsyncMock)
-async def test_experiment_add_tags_handles_missing_tags_field(mock_get, _mock_cache):
+async def test_experiment_add_tags_handles_missing_tags_field(mock_get):
     mock_exp = MagicMock()
     mock_exp.get_json_data = AsyncMock(return_value={"config": {}})
     mock_exp.update_config_field = AsyncMock()
@@ -111,9 +108,8 @@ async def test_experiment_add_tags_enforces_max_cap(mock_get):
     mock_exp.update_config_field.assert_not_awaited()
 
 
-@patch("transformerlab.services.experiment_service.cache.invalidate", new_callable=AsyncMock)
 @patch("transformerlab.services.experiment_service.Experiment.get", new_callable=AsyncMock)
-async def test_experiment_remove_tags_removes_present(mock_get, _mock_cache):
+async def test_experiment_remove_tags_removes_present(mock_get):
     mock_exp = _mock_experiment(current_tags=["foo", "bar", "baz"])
     mock_get.return_value = mock_exp
 
@@ -123,9 +119,8 @@ async def test_experiment_remove_tags_removes_present(mock_get, _mock_cache):
     mock_exp.update_config_field.assert_awaited_once_with("tags", ["foo", "baz"])
 
 
-@patch("transformerlab.services.experiment_service.cache.invalidate", new_callable=AsyncMock)
 @patch("transformerlab.services.experiment_service.Experiment.get", new_callable=AsyncMock)
-async def test_experiment_remove_tags_absent_is_noop(mock_get, _mock_cache):
+async def test_experiment_remove_tags_absent_is_noop(mock_get):
     mock_exp = _mock_experiment(current_tags=["foo"])
     mock_get.return_value = mock_exp
 
@@ -5,8 +5,9 @@ from unittest.mock import MagicMock, patch
 import pytest
 import requests
 
+from transformerlab.compute_providers.base import ComputeProvider
 from transformerlab.compute_providers.runpod import RunpodProvider
-from transformerlab.compute_providers.models import ClusterConfig
+from transformerlab.compute_providers.models import ClusterConfig, ClusterState, ClusterStatus
 
 
 @pytest.fixture
@@ -104,3 +105,35 @@ class TestCreateRecovery:
             with pytest.raises(RuntimeError, match="Failed to create pod"):
                 provider.launch_cluster("my-cluster", ClusterConfig(run="train.py", accelerators="H100:8"))
         mock_find.assert_not_called()
+
+
+class TestBulkClusterStatus:
+    def test_one_listing_for_all_pods(self, provider):
+        pods = [
+            {"id": "pod-a", "name": "cluster-a", "status": "RUNNING"},
+            {"id": "pod-b", "name": "cluster-b", "status": "EXITED"},
+        ]
+        with patch.object(provider, "_make_request", return_value=_mock_response(pods)) as mock_req:
+            statuses = provider.get_cluster_statuses(["cluster-a", "cluster-b", "cluster-gone"])
+
+        mock_req.assert_called_once_with("GET", "/pods")
+        assert statuses["cluster-a"].state == ClusterState.UP
+        assert statuses["cluster-b"].status_message == "EXITED"
+        assert statuses["cluster-gone"].status_message == "Pod not found"
+        assert provider._cluster_name_to_pod_id["cluster-b"] == "pod-b"
+
+    def test_listing_failure_raises(self, provider):
+        with patch.object(provider, "_make_request", side_effect=_http_error(500)):
+            with pytest.raises(requests.exceptions.HTTPError):
+                provider.get_cluster_statuses(["cluster-a"])
+
+    def test_default_fans_out_to_get_cluster_status(self, provider):
+        def fake_status(name):
+            return ClusterStatus(cluster_name=name, state=ClusterState.UP)
+
+        with patch.object(provider, "get_cluster_status", side_effect=fake_status) as mock_status:
+            statuses = ComputeProvider.get_cluster_statuses(provider, ["a", "b", "a", "c"])
+
+        assert sorted(statuses) == ["a", "b", "c"]
+        assert mock_status.call_count == 3
+        assert statuses["b"].cluster_name == "b"
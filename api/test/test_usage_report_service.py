@@ -0,0 +1,172 @@
+import uuid
+
+import pytest
+
+from transformerlab.db.db import config_set
+from transformerlab.db.session import get_async_session
+from transformerlab.services.compute_provider import usage_report_service as svc
+
+
+async def _session():
+    async for s in get_async_session():
+        return s
+
+
+def _job(job_id, email, provider, start, end, status="COMPLETE"):
+    return {
+        "id": job_id,
+        "type": "REMOTE",
+        "status": status,
+        "job_data": {
+            "provider_id": provider,
+            "provider_name": provider,
+            "start_time": start,
+            "end_time": end,
+            "user_info": {"email": email, "name": email.split("@")[0]},
+            "num_nodes": 2,
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_report_aggregates_recorded_usage():
+    session = await _session()
+    team_id = f"team-{uuid.uuid4().hex}"
+    await config_set(svc.BACKFILL_CONFIG_KEY, "1", team_id=team_id)
+
+    jobs = [
+        _job("1", "a@x.com", "p1", "2026-01-01 10:00:00", "2026-01-01 10:10:00"),
+        _job("2", "a@x.com", "p2", "2026-01-02 10:00:00", "2026-01-02 11:00:00"),
+        _job("3", "b@x.com", "p1", "2026-01-02 09:00:00", "2026-01-02 09:30:00"),
+        _job("4", "b@x.com", "p1", "2026-01-03 09:00:00", "2026-01-03 09:30:00", status="DELETED"),
+        # No end time yet: not counted.
+        _job("5", "b@x.com", "p1", "2026-01-03 09:00:00", None),
+    ]
+    for job in jobs:
+        await svc.record_job_usage(session, job, "exp", team_id)
+    # Re-recording a job replaces its row instead of adding another.
+    jobs[0]["job_data"]["end_time"] = "2026-01-01 10:20:00"
+    assert await svc.record_job_usage(session, jobs[0], "exp", team_id)
+
+    report = await svc.build_usage_report(session, team_id)
+
+    assert report["summary"] == {"total_jobs": 3, "total_users": 2, "total_providers": 2}
+    by_user = {u["user_email"]: u for u in report["by_user"]}
+    assert by_user["a@x.com"]["total_jobs"] == 2
+    assert by_user["a@x.com"]["total_duration_seconds"] == 1200 + 3600
+    assert [j["job_id"] for j in by_user["b@x.com"]["jobs"]] == ["3"]
+    assert report["by_user"][0]["user_email"] == "a@x.com"
+    by_provider = {p["provider_name"]: p for p in report["by_provider"]}
+    assert by_provider["p1"]["total_duration_seconds"] == 1200 + 1800
+    assert report["by_day"] == [
+        {"date": "2026-01-01", "total_jobs": 1, "total_duration_seconds": 1200},
+        {"date": "2026-01-02", "total_jobs": 2, "total_duration_seconds": 5400},
+    ]
+    assert report["all_jobs"][0]["resources"]["num_nodes"] == 2
+
+
+@pytest.mark.asyncio
+async def test_report_backfills_existing_jobs_once(monkeypatch):
+    session = await _session()
+    team_id = f"team-{uuid.uuid4().hex}"
+    calls = []
+
+    async def fake_get_all():
+        return [{"id": "exp1"}]
+
+    async def fake_jobs_get_all(experiment_id, type=""):
+        calls.append(experiment_id)
+        return [_job("b1", "c@x.com", "p9", "2026-02-01T08:00:00", "2026-02-01T08:01:00")]
+
+    import lab
+
+    monkeypatch.setattr(lab.Experiment, "get_all", staticmethod(fake_get_all))
+    monkeypatch.setattr(svc.job_service, "jobs_get_all", fake_jobs_get_all)
+
+    first = await svc.build_usage_report(session, team_id)
+    second = await svc.build_usage_report(session, team_id)
+
+    assert calls == ["exp1"]
+    assert first["summary"]["total_jobs"] == 1
+    assert second["all_jobs"][0]["experiment_id"] == "exp1"
+    assert second["by_user"][0]["total_duration_seconds"] == 60
+
+
+@pytest.mark.asyncio
+async def test_deleted_jobs_drop_out_of_report(monkeypatch):
+    session = await _session()
+    team_id = f"team-{uuid.uuid4().hex}"
+    await config_set(svc.BACKFILL_CONFIG_KEY, "1", team_id=team_id)
+    for job_id in ("d1", "d2"):
+        job = _job(job_id, "d@x.com", "p1", "2026-03-01 10:00:00", "2026-03-01 10:10:00")
+        await svc.record_job_usage(session, job, "exp", team_id)
+    await session.commit()
+
+    class _FakeJob:
+        async def delete(self):
+            pass
+
+    async def fake_get(job_id, experiment_id):
+        return _FakeJob()
+
+    import lab.dirs
+
+    from transformerlab.services import job_service
+
+    monkeypatch.setattr(job_service.Job, "get", staticmethod(fake_get))
+    monkeypatch.setattr(lab.dirs, "get_organization_id", lambda: team_id)
+    await job_service.job_delete("d1", "exp")
+
+    report = await svc.build_usage_report(session, team_id)
+    assert [j["job_id"] for j in report["all_jobs"]] == ["d2"]
+
+
+@pytest.mark.asyncio
+async def test_failed_usage_write_keeps_callers_pending_work(monkeypatch):
+    session = await _session()
+    team_id = f"team-{uuid.uuid4().hex}"
+    await config_set(svc.BACKFILL_CONFIG_KEY, "1", team_id=team_id)
+    ok = _job("k1", "k@x.com", "p1", "2026-04-01 10:00:00", "2026-04-01 10:05:00")
+    assert await svc.record_job_usage(session, ok, "exp", team_id)
+
+    async def broken_upsert(session, row):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(svc, "_upsert_row", broken_upsert)
+    bad = _job("k2", "k@x.com", "p1", "2026-04-01 11:00:00", "2026-04-01 11:05:00")
+    assert not await svc.record_job_usage(session, bad, "exp", team_id)
+
+    # Only the failed write's savepoint was rolled back.
+    report = await svc.build_usage_report(session, team_id)
+    assert [j["job_id"] for j in report["all_jobs"]] == ["k1"]
+
+
+@pytest.mark.asyncio
+async def test_backfill_skips_rows_that_fail(monkeypatch):
+    session = await _session()
+    team_id = f"team-{uuid.uuid4().hex}"
+
+    async def fake_get_all():
+        return [{"id": "exp1"}]
+
+    async def fake_jobs_get_all(experiment_id, type=""):
+        return [
+            _job("bad", "e@x.com", "p1", "2026-05-01 08:00:00", "2026-05-01 08:01:00"),
+            _job("good", "e@x.com", "p1", "2026-05-01 09:00:00", "2026-05-01 09:01:00"),
+        ]
+
+    real_upsert = svc._upsert_row
+
+    async def flaky_upsert(session, row):
+        if row["job_id"] == "bad":
+            raise ValueError("unwritable row")
+        await real_upsert(session, row)
+
+    import lab
+
+    monkeypatch.setattr(lab.Experiment, "get_all", staticmethod(fake_get_all))
+    monkeypatch.setattr(svc.job_service, "jobs_get_all", fake_jobs_get_all)
+    monkeypatch.setattr(svc, "_upsert_row", flaky_upsert)
+
+    report = await svc.build_usage_report(session, team_id)
+    assert [j["job_id"] for j in report["all_jobs"]] == ["good"]
@@ -1,8 +1,14 @@
 """Abstract base class for provider implementations."""
 
+import os
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Dict, List, Optional, Union
 
+import requests
+from requests.adapters import HTTPAdapter
+
 from transformerlab.shared.models.models import ProviderType
 
 from .models import (
@@ -69,9 +75,51 @@ def gpu_catalog_from_map_keys(keys: Any) -> List[GpuInfo]:
     return [GpuInfo(gpu=gpu_type, count=count) for gpu_type, count in sorted(max_count_by_type.items())]
 
 
+# Keep-alive connections and in-flight request cap per provider instance (see ComputeProvider.http_request).
+PROVIDER_HTTP_POOL_SIZE = int(os.getenv("TFL_PROVIDER_HTTP_POOL_SIZE", "10"))
+PROVIDER_MAX_CONCURRENT_REQUESTS = int(os.getenv("TFL_PROVIDER_MAX_CONCURRENT_REQUESTS", "8"))
+# Parallel get_cluster_status calls in the default get_cluster_statuses.
+PROVIDER_STATUS_CONCURRENCY = int(os.getenv("TFL_PROVIDER_STATUS_CONCURRENCY", "8"))
+
+_http_init_lock = threading.Lock()
+
+
 class ComputeProvider(ABC):
     """Abstract base class for all compute provider implementations."""
 
+    _http_session: Optional[requests.Session] = None
+    _http_slots: Optional[threading.BoundedSemaphore] = None
+
+    def http_request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send an HTTP request on this provider's pooled keep-alive session.
+
+        Provider instances are reused across requests (provider_service keeps them
+        in a registry), so status polls and log fetches reuse warm TCP/TLS
+        connections instead of opening a new one per call. At most
+        PROVIDER_MAX_CONCURRENT_REQUESTS requests per instance are in flight at once.
+        """
+        session = self._http_session
+        if session is None:
+            with _http_init_lock:
+                if self._http_slots is None:
+                    self._http_slots = threading.BoundedSemaphore(max(1, PROVIDER_MAX_CONCURRENT_REQUESTS))
+                if self._http_session is None:
+                    new_session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=PROVIDER_HTTP_POOL_SIZE)
+                    new_session.mount("https://", adapter)
+                    new_session.mount("http://", adapter)
+                    self._http_session = new_session
+                session = self._http_session
+        with self._http_slots:
+            return session.request(method, url=url, **kwargs)
+
+    def close(self) -> None:
+        """Release pooled connections. Called when the provider registry drops this instance."""
+        session, self._http_session = self._http_session, None
+        if session is not None:
+            session.close()
+
     @abstractmethod
     def launch_cluster(self, cluster_name: str, config: ClusterConfig) -> Dict[str, Any]:
         """
@@ -117,6 +165,27 @@ class ComputeProvider(ABC):
         """
         raise NotImplementedError
 
+    def get_cluster_statuses(self, cluster_names: List[str]) -> Dict[str, ClusterStatus]:
+        """
+        Get the status of several clusters at once.
+
+        Providers that can list every cluster in one call override this. The
+        default calls get_cluster_status for each name, at most
+        PROVIDER_STATUS_CONCURRENCY at a time. Errors are raised, not folded into
+        UNKNOWN statuses, so callers can fall back to per-cluster lookups.
+
+        Args:
+            cluster_names: Names of the clusters
+
+        Returns:
+            Dict mapping each requested cluster name to its ClusterStatus
+        """
+        names = list(dict.fromkeys(cluster_names))
+        if len(names) <= 1:
+            return {name: self.get_cluster_status(name) for name in names}
+        with ThreadPoolExecutor(max_workers=max(1, min(PROVIDER_STATUS_CONCURRENCY, len(names)))) as pool:
+            return dict(zip(names, pool.map(self.get_cluster_status, names)))
+
     def list_clusters(self) -> List[ClusterStatus]:
         """
         List all clusters managed by this provider.
@@ -54,7 +54,7 @@ class DstackProvider(ComputeProvider):
             "Content-Type": "application/json",
         }
         try:
-            response = requests.request(
+            response = self.http_request(
                 method,
                 url=url,
                 json=json_data,
@@ -276,24 +276,40 @@ class DstackProvider(ComputeProvider):
             f"/api/project/{self.project_name}/runs/get",
             json_data={"run_name": cluster_name},
         )
-        data = response.json()
+        return self._cluster_status_from_run(cluster_name, response.json())
+
+    def get_cluster_statuses(self, cluster_names: List[str]) -> Dict[str, ClusterStatus]:
+        """Get the status of several runs from one run listing.
+
+        The listing only covers the most recent runs; older ones are fetched one by one.
+        """
+        runs = self._list_runs(limit=100).json()
+        runs_by_name = {
+            run.get("run_name"): run for run in (runs if isinstance(runs, list) else []) if run.get("run_name")
+        }
+        statuses = {
+            name: self._cluster_status_from_run(name, runs_by_name[name])
+            for name in cluster_names
+            if name in runs_by_name
+        }
+        missing = [name for name in cluster_names if name not in statuses]
+        if missing:
+            statuses.update(super().get_cluster_statuses(missing))
+        return statuses
+
+    def _cluster_status_from_run(self, cluster_name: str, run: Dict[str, Any]) -> ClusterStatus:
         return ClusterStatus(
             cluster_name=cluster_name,
-            state=self._map_status(data.get("status", "")),
-            status_message=data.get("status_message"),
-            provider_data=data,
+            state=self._map_status(run.get("status", "")),
+            status_message=run.get("status_message"),
+            provider_data=run,
         )
 
     def list_clusters(self) -> List[ClusterStatus]:
         response = self._list_runs(limit=100)
         runs = response.json()
         return [
-            ClusterStatus(
-                cluster_name=run.get("run_name", ""),
-                state=self._map_status(run.get("status", "")),
-                status_message=run.get("status_message"),
-                provider_data=run,
-            )
+            self._cluster_status_from_run(run.get("run_name", ""), run)
             for run in (runs if isinstance(runs, list) else [])
         ]
 
@@ -69,6 +69,12 @@ async def _main():
             data = fh.read()
     except Exception:
         data = ""
+    # Replaces anything tfl-remote-trap streamed, which is a subset of this capture.
+    try:
+        from lab import segmented_log
+        await segmented_log.reset_log(dst)
+    except Exception:
+        pass
     async with await storage.open(dst, "w", encoding="utf-8") as out:
         await out.write(data)
 
@@ -208,7 +214,7 @@ class LambdaProvider(ComputeProvider):
     ) -> requests.Response:
         """Make an authenticated request against the Lambda Cloud API."""
         url = f"{self.api_base_url}{endpoint}"
-        response = requests.request(
+        response = self.http_request(
             method=method,
             url=url,
             json=json_data,
@@ -620,7 +626,23 @@ exit $?
             }
 
     def get_cluster_status(self, cluster_name: str) -> ClusterStatus:
-        instance = self._find_instance_by_name(cluster_name)
+        return self._cluster_status_from_instance(cluster_name, self._find_instance_by_name(cluster_name))
+
+    def get_cluster_statuses(self, cluster_names: List[str]) -> Dict[str, ClusterStatus]:
+        """Get the status of several instances with a single instance listing."""
+        response = self._make_request("GET", "/instances")
+        instances = self._unwrap(response.json()) or []
+        by_name: Dict[str, Dict[str, Any]] = {}
+        for inst in instances if isinstance(instances, list) else []:
+            name = inst.get("name")
+            if not name:
+                continue
+            by_name[name] = inst
+            if inst.get("id"):
+                self._cluster_name_to_instance_id[name] = inst["id"]
+        return {name: self._cluster_status_from_instance(name, by_name.get(name)) for name in cluster_names}
+
+    def _cluster_status_from_instance(self, cluster_name: str, instance: Optional[Dict[str, Any]]) -> ClusterStatus:
         if not instance:
             return ClusterStatus(
                 cluster_name=cluster_name,
@@ -657,7 +657,23 @@ class LocalProvider(ComputeProvider):
 
     def get_cluster_status(self, cluster_name: str) -> ClusterStatus:
         """Return UP if the process is still running, DOWN otherwise."""
-        job_dir = self.extra_config.get("workspace_dir")
+        return self._cluster_status_from_job_dir(cluster_name, self.extra_config.get("workspace_dir"))
+
+    def get_cluster_statuses(self, cluster_names: List[str]) -> Dict[str, ClusterStatus]:
+        """
+        Check several local jobs in one pass.
+
+        Each local "cluster" is a job directory, so the caller supplies them in
+        ``extra_config["workspace_dirs"]`` (cluster name -> job dir); names without
+        an entry use ``extra_config["workspace_dir"]`` like get_cluster_status.
+        """
+        job_dirs = self.extra_config.get("workspace_dirs") or {}
+        default_dir = self.extra_config.get("workspace_dir")
+        return {
+            name: self._cluster_status_from_job_dir(name, job_dirs.get(name, default_dir)) for name in cluster_names
+        }
+
+    def _cluster_status_from_job_dir(self, cluster_name: str, job_dir: Optional[str]) -> ClusterStatus:
         if not job_dir:
             return ClusterStatus(
                 cluster_name=cluster_name,
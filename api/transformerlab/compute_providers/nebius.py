@@ -602,7 +602,22 @@ runcmd:
             return {"status": "error", "message": str(exc), "cluster_name": cluster_name, "instance_id": instance_id}
 
     def get_cluster_status(self, cluster_name: str) -> ClusterStatus:
-        instance = self._find_instance_by_cluster_name(cluster_name)
+        return self._cluster_status_from_instance(cluster_name, self._find_instance_by_cluster_name(cluster_name))
+
+    def get_cluster_statuses(self, cluster_names: List[str]) -> Dict[str, ClusterStatus]:
+        """Get the status of several instances with a single `nebius compute instance list`."""
+        args = ["compute", "instance", "list", "--format", "json"]
+        if self.parent_id:
+            args.extend(["--parent-id", self.parent_id])
+        instances = self._extract_list_response(self._run_nebius(args, timeout=60))
+        by_name: Dict[str, Dict[str, Any]] = {}
+        for instance in instances:
+            name = _nested_get(instance, ["metadata", "name"]) or instance.get("name")
+            if name:
+                by_name.setdefault(name, instance)
+        return {name: self._cluster_status_from_instance(name, by_name.get(name)) for name in cluster_names}
+
+    def _cluster_status_from_instance(self, cluster_name: str, instance: Optional[Dict[str, Any]]) -> ClusterStatus:
         if not instance:
             return ClusterStatus(
                 cluster_name=cluster_name, state=ClusterState.UNKNOWN, status_message="Instance not found"
@@ -246,7 +246,7 @@ class RunpodProvider(ComputeProvider):
             "Authorization": f"Bearer {self.api_key}",
         }
 
-        response = requests.request(method=method, url=url, json=json_data, headers=headers, timeout=timeout)
+        response = self.http_request(method=method, url=url, json=json_data, headers=headers, timeout=timeout)
         response.raise_for_status()
         return response
 
@@ -639,7 +639,22 @@ class RunpodProvider(ComputeProvider):
 
     def get_cluster_status(self, cluster_name: str) -> ClusterStatus:
         """Get pod status."""
-        pod = self._find_pod_by_name(cluster_name)
+        return self._cluster_status_from_pod(cluster_name, self._find_pod_by_name(cluster_name))
+
+    def get_cluster_statuses(self, cluster_names: List[str]) -> Dict[str, ClusterStatus]:
+        """Get the status of several pods with a single pod listing."""
+        response = self._make_request("GET", "/pods")
+        pods_data = response.json()
+        pods = pods_data if isinstance(pods_data, list) else (pods_data or {}).get("data", [])
+        pods_by_name: Dict[str, Dict[str, Any]] = {}
+        for pod in pods:
+            pod_name = pod.get("name", "")
+            pods_by_name[pod_name] = pod
+            if pod.get("id"):
+                self._cluster_name_to_pod_id[pod_name] = pod["id"]
+        return {name: self._cluster_status_from_pod(name, pods_by_name.get(name)) for name in cluster_names}
+
+    def _cluster_status_from_pod(self, cluster_name: str, pod: Optional[Dict[str, Any]]) -> ClusterStatus:
         if not pod:
             return ClusterStatus(
                 cluster_name=cluster_name,
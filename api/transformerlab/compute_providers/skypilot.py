@@ -208,7 +208,7 @@ class SkyPilotProvider(ComputeProvider):
             headers["Authorization"] = f"Bearer {self.api_token}"
 
         try:
-            response = requests.request(
+            response = self.http_request(
                 method=method, url=url, json=json_data, headers=headers, timeout=timeout, stream=stream
             )
             response.raise_for_status()
@@ -721,39 +721,15 @@ class SkyPilotProvider(ComputeProvider):
                 status_message="Cluster not found",
             )
 
-        # Parse SkyPilot status response
-        # The status field is a sky.ClusterStatus enum, convert to string
-        status_value = cluster_data.get("status")
-        if hasattr(status_value, "value"):
-            state_str = status_value.value.upper()
-        elif isinstance(status_value, str):
-            state_str = status_value.upper()
-        else:
-            state_str = "UNKNOWN"
+        return self._cluster_status_from_record(cluster_name, cluster_data)
 
-        # Map SkyPilot's FAILED_SETUP directly to our FAILED state
-        if state_str == "FAILED_SETUP":
-            state = ClusterState.FAILED
-        else:
-            try:
-                state = ClusterState[state_str]
-            except KeyError:
-                state = ClusterState.UNKNOWN
-
-        return ClusterStatus(
-            cluster_name=cluster_name,
-            state=state,
-            status_message=str(status_value) if status_value else "",
-            launched_at=str(cluster_data.get("launched_at")) if cluster_data.get("launched_at") else None,
-            last_use=cluster_data.get("last_use"),
-            autostop=cluster_data.get("autostop"),
-            num_nodes=cluster_data.get("num_nodes"),
-            resources_str=cluster_data.get("resources_str_full"),
-            provider_data=cluster_data,
-        )
+    def _fetch_status_records(self, cluster_names: Optional[List[str]]) -> List[Dict[str, Any]]:
+        """
+        Fetch raw cluster records from the SkyPilot API server's /status endpoint.
 
-    def list_clusters(self) -> List[ClusterStatus]:
-        """List all clusters."""
+        ``cluster_names=None`` returns every cluster. Raises ConnectionError when the
+        server is unreachable and RuntimeError when it answers with an error.
+        """
         # Get StatusRefreshMode from SkyPilot
         if sky_common and hasattr(sky_common, "StatusRefreshMode"):
             refresh_mode = sky_common.StatusRefreshMode.NONE
@@ -762,9 +738,8 @@ class SkyPilotProvider(ComputeProvider):
             refresh_mode = "NONE"
 
         # Build StatusBody using SkyPilot's payload class
-        # Set cluster_names to None or empty to get all clusters
         body = payloads.StatusBody(
-            cluster_names=None,  # None means get all clusters
+            cluster_names=cluster_names,  # None means get all clusters
             refresh=refresh_mode,
             all_users=False,
             include_credentials=False,
@@ -783,16 +758,12 @@ class SkyPilotProvider(ComputeProvider):
         body_json.setdefault("override_skypilot_config", {})
 
         # Use SkyPilot's make_authenticated_request (matches SDK exactly)
-        try:
-            response = self._make_authenticated_request("POST", "/status", json_data=body_json, timeout=10)
-        except ConnectionError as e:
-            print(f"Failed to list clusters: {e}")
-            return []
+        response = self._make_authenticated_request("POST", "/status", json_data=body_json, timeout=10)
 
         # Check response status
         if hasattr(response, "status_code"):
             if response.status_code != 200:
-                return []
+                raise RuntimeError(f"API returned status code {response.status_code}")
 
         # Parse response content
         response_content = None
@@ -873,44 +844,75 @@ class SkyPilotProvider(ComputeProvider):
         # Handle empty or invalid responses
         if not clusters or not isinstance(clusters, list):
             return []
+        return clusters
 
-        # Parse cluster data into ClusterStatus objects
-        cluster_statuses = []
-        for cluster_data in clusters:
-            # Parse SkyPilot status response
-            # The status field is a sky.ClusterStatus enum, convert to string
-            status_value = cluster_data.get("status")
-            if hasattr(status_value, "value"):
-                state_str = status_value.value.upper()
-            elif isinstance(status_value, str):
-                state_str = status_value.upper()
-            else:
-                state_str = "UNKNOWN"
+    @staticmethod
+    def _cluster_status_from_record(cluster_name: str, cluster_data: Dict[str, Any]) -> ClusterStatus:
+        # Parse SkyPilot status response
+        # The status field is a sky.ClusterStatus enum, convert to string
+        status_value = cluster_data.get("status")
+        if hasattr(status_value, "value"):
+            state_str = status_value.value.upper()
+        elif isinstance(status_value, str):
+            state_str = status_value.upper()
+        else:
+            state_str = "UNKNOWN"
 
-            # Map SkyPilot's FAILED_SETUP directly to our FAILED state
-            if state_str == "FAILED_SETUP":
-                state = ClusterState.FAILED
-            else:
-                try:
-                    state = ClusterState[state_str]
-                except KeyError:
-                    state = ClusterState.UNKNOWN
+        # Map SkyPilot's FAILED_SETUP directly to our FAILED state
+        if state_str == "FAILED_SETUP":
+            state = ClusterState.FAILED
+        else:
+            try:
+                state = ClusterState[state_str]
+            except KeyError:
+                state = ClusterState.UNKNOWN
 
-            cluster_statuses.append(
-                ClusterStatus(
-                    cluster_name=cluster_data.get("name", "unknown"),
-                    state=state,
-                    status_message=str(status_value) if status_value else "",
-                    launched_at=str(cluster_data.get("launched_at")) if cluster_data.get("launched_at") else None,
-                    last_use=cluster_data.get("last_use"),
-                    autostop=cluster_data.get("autostop"),
-                    num_nodes=cluster_data.get("num_nodes"),
-                    resources_str=cluster_data.get("resources_str_full"),
-                    provider_data=cluster_data,
+        return ClusterStatus(
+            cluster_name=cluster_name,
+            state=state,
+            status_message=str(status_value) if status_value else "",
+            launched_at=str(cluster_data.get("launched_at")) if cluster_data.get("launched_at") else None,
+            last_use=cluster_data.get("last_use"),
+            autostop=cluster_data.get("autostop"),
+            num_nodes=cluster_data.get("num_nodes"),
+            resources_str=cluster_data.get("resources_str_full"),
+            provider_data=cluster_data,
+        )
+
+    def get_cluster_statuses(self, cluster_names: List[str]) -> Dict[str, ClusterStatus]:
+        """Get the status of several clusters with one /status request naming all of them."""
+        names = list(dict.fromkeys(cluster_names))
+        if not names:
+            return {}
+        records = {
+            cluster.get("name"): cluster for cluster in self._fetch_status_records(names) if isinstance(cluster, dict)
+        }
+        statuses: Dict[str, ClusterStatus] = {}
+        for name in names:
+            if name in records:
+                statuses[name] = self._cluster_status_from_record(name, records[name])
+            else:
+                statuses[name] = ClusterStatus(
+                    cluster_name=name,
+                    state=ClusterState.UNKNOWN,
+                    status_message="Cluster not found",
                 )
-            )
+        return statuses
+
+    def list_clusters(self) -> List[ClusterStatus]:
+        """List all clusters."""
+        try:
+            clusters = self._fetch_status_records(None)
+        except ConnectionError as e:
+            print(f"Failed to list clusters: {e}")
+            return []
+        except RuntimeError:
+            return []
 
-        return cluster_statuses
+        return [
+            self._cluster_status_from_record(cluster_data.get("name", "unknown"), cluster_data)
+            for cluster_data in clusters
+        ]
 
     def show_gpus(self) -> List[GpuInfo]:
         """List GPUs offered by SkyPilot's catalog across its enabled clouds.
@@ -2,10 +2,12 @@
 
 import asyncio
 import logging
-import requests
 import os
 import re
-from typing import Dict, Any, Optional, Union, List
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, Union, List
 from lab import storage
 from .base import ComputeProvider
 from .models import (
@@ -18,10 +20,52 @@ from .models import (
     ClusterState,
     JobState,
 )
-from transformerlab.shared.ssh_policy import get_add_if_verified_policy
+from transformerlab.shared import ssh_pool
 
 logger = logging.getLogger(__name__)
 
+# Job states are fetched for all of a user's jobs at once (one squeue per account per window) and
+# shared by every provider instance pointing at the same scheduler account.
+SLURM_STATUS_CACHE_SECONDS = float(os.getenv("TFL_SLURM_STATUS_CACHE_SECONDS", "10"))
+_TERMINAL_STATE_CACHE_MAX = 4096
+
+_SLURM_STATE_MAP = {
+    "PENDING": JobState.PENDING,
+    "CONFIGURING": JobState.PENDING,
+    "REQUEUED": JobState.PENDING,
+    "REQUEUE_HOLD": JobState.PENDING,
+    "RESV_DEL_HOLD": JobState.PENDING,
+    "SUSPENDED": JobState.PENDING,
+    "RUNNING": JobState.RUNNING,
+    "COMPLETING": JobState.RUNNING,
+    "STAGE_OUT": JobState.RUNNING,
+    "SIGNALING": JobState.RUNNING,
+    "RESIZING": JobState.RUNNING,
+    "COMPLETED": JobState.COMPLETED,
+    "CANCELLED": JobState.CANCELLED,
+    "PREEMPTED": JobState.CANCELLED,
+    "REVOKED": JobState.CANCELLED,
+    "FAILED": JobState.FAILED,
+    "TIMEOUT": JobState.FAILED,
+    "NODE_FAIL": JobState.FAILED,
+    "OUT_OF_MEMORY": JobState.FAILED,
+    "BOOT_FAIL": JobState.FAILED,
+    "DEADLINE": JobState.FAILED,
+}
+_TERMINAL_JOB_STATES = {JobState.COMPLETED, JobState.FAILED, JobState.CANCELLED}
+
+_status_lock = threading.Lock()
+_active_state_snapshots: Dict[tuple, Tuple[float, Dict[str, JobState]]] = {}
+_terminal_states: "OrderedDict[Tuple[tuple, str], JobState]" = OrderedDict()
+
+
+def _slurm_job_state(raw: Any) -> JobState:
+    """Map a squeue/sacct/REST state (e.g. "CANCELLED by 1000", ["RUNNING"]) to a JobState."""
+    if isinstance(raw, list):
+        raw = raw[0] if raw else ""
+    word = str(raw or "").strip().split(" ")[0].rstrip("+").upper()
+    return _SLURM_STATE_MAP.get(word, JobState.UNKNOWN)
+
 
 class SLURMProvider(ComputeProvider):
     """Provider implementation for SLURM (REST API or SSH)."""
@@ -93,33 +137,9 @@ class SLURMProvider(ComputeProvider):
         )
 
     def _ssh_execute(self, command: str) -> str:
-        """Execute command via SSH."""
+        """Execute command via SSH (pooled connection, see transformerlab.shared.ssh_pool)."""
         try:
-            import paramiko
-        except ImportError:
-            raise ImportError("paramiko is required for SSH mode. Install with: pip install paramiko")
-
-        ssh = paramiko.SSHClient()
-        ssh.set_missing_host_key_policy(get_add_if_verified_policy())
-
-        try:
-            # Build SSH connection parameters
-            connect_kwargs = {
-                "hostname": self.ssh_host,
-                "port": self.ssh_port,
-                "username": self.ssh_user,
-            }
-
-            if self.ssh_key_path:
-                key_path = os.path.expanduser(self.ssh_key_path)
-                if not os.path.exists(key_path):
-                    raise FileNotFoundError(f"SSH key file not found: {key_path}")
-                connect_kwargs["key_filename"] = key_path
-
-            ssh.connect(**connect_kwargs, timeout=30)
-            stdin, stdout, stderr = ssh.exec_command(command)
-            output = stdout.read().decode("utf-8")
-            error = stderr.read().decode("utf-8")
+            output, error = ssh_pool.execute(self.ssh_host, self.ssh_port, self.ssh_user, self.ssh_key_path, command)
 
             if error and "Permission denied" not in error:
                 # Some commands output to stderr but are successful
@@ -129,8 +149,6 @@ class SLURMProvider(ComputeProvider):
         except Exception as e:
             print(f"Error executing command: {e}")
             raise e
-        finally:
-            ssh.close()
 
     def _ssh_sftp_upload(self, local_path: str, remote_path: str) -> None:
         """Upload a file or directory to the remote host via SFTP.
@@ -141,11 +159,6 @@ class SLURMProvider(ComputeProvider):
         The local_path is interpreted using lab.storage first (workspace-aware),
         falling back to the OS filesystem if needed.
         """
-        try:
-            import paramiko
-        except ImportError:
-            raise ImportError("paramiko is required for SSH mode. Install with: pip install paramiko")
-
         # Normalize local path (may be a workspace path created via lab.storage)
         local_path = os.path.expanduser(local_path)
 
@@ -155,25 +168,7 @@ class SLURMProvider(ComputeProvider):
         else:
             raise FileNotFoundError(f"Local path for file_mounts does not exist: {local_path}")
 
-        ssh = paramiko.SSHClient()
-        ssh.set_missing_host_key_policy(get_add_if_verified_policy())
-
-        try:
-            # Build SSH connection parameters
-            connect_kwargs = {
-                "hostname": self.ssh_host,
-                "port": self.ssh_port,
-                "username": self.ssh_user,
-            }
-
-            if self.ssh_key_path:
-                key_path = os.path.expanduser(self.ssh_key_path)
-                if not os.path.exists(key_path):
-                    raise FileNotFoundError(f"SSH key file not found: {key_path}")
-                connect_kwargs["key_filename"] = key_path
-
-            ssh.connect(**connect_kwargs, timeout=10)
-            sftp = ssh.open_sftp()
+        with ssh_pool.open_sftp(self.ssh_host, self.ssh_port, self.ssh_user, self.ssh_key_path) as sftp:
 
             def _mkdir_p(remote_dir: str) -> None:
                 """Recursively create remote directories if they don't exist."""
@@ -217,14 +212,6 @@ class SLURMProvider(ComputeProvider):
                         _upload_file(local_f, remote_f)
             else:
                 _upload_file(local_path, remote_path)
-        finally:
-            try:
-                # sftp may not exist if open_sftp failed
-                if "sftp" in locals():
-                    sftp.close()
-            except Exception:
-                pass
-            ssh.close()
 
     def _rest_request(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make HTTP request to SLURM REST API."""
@@ -234,7 +221,7 @@ class SLURMProvider(ComputeProvider):
             headers["X-SLURM-USER-NAME"] = self.ssh_user
             headers["X-SLURM-USER-TOKEN"] = self.api_token
 
-        response = requests.request(method=method, url=url, json=data, headers=headers, timeout=30)
+        response = self.http_request(method=method, url=url, json=data, headers=headers, timeout=30)
         response.raise_for_status()
         return response.json() if response.content else {}
 
@@ -401,6 +388,14 @@ class SLURMProvider(ComputeProvider):
             status_message="SLURM cluster status",
         )
 
+    def get_cluster_statuses(self, cluster_names: List[str]) -> Dict[str, ClusterStatus]:
+        """Every cluster name maps to the same SLURM cluster, so one sinfo answers for all of them."""
+        names = list(dict.fromkeys(cluster_names))
+        if not names:
+            return {}
+        status = self.get_cluster_status(names[0])
+        return {name: status.model_copy(update={"cluster_name": name}) for name in names}
+
     def show_gpus(self) -> List[GpuInfo]:
         """List GPUs available across the SLURM cluster's nodes.
 
@@ -1025,6 +1020,83 @@ class SLURMProvider(ComputeProvider):
 
         return jobs
 
+    def _status_account_key(self) -> tuple:
+        if self.mode == "ssh":
+            return ("ssh", self.ssh_host, int(self.ssh_port or 22), self.ssh_user)
+        return ("rest", self.rest_url, self.ssh_user)
+
+    def _active_job_states(self) -> Dict[str, JobState]:
+        """States of every job the scheduler still lists for this account, refreshed at most every few seconds."""
+        key = self._status_account_key()
+        with _status_lock:
+            cached = _active_state_snapshots.get(key)
+            if cached is not None and time.monotonic() - cached[0] <= SLURM_STATUS_CACHE_SECONDS:
+                return cached[1]
+
+        states: Dict[str, JobState] = {}
+        if self.mode == "ssh":
+            output = self._ssh_execute(f'squeue -u {self.ssh_user} -h -o "%i %T"')
+            for line in output.splitlines():
+                parts = line.split()
+                if len(parts) >= 2:
+                    states[parts[0]] = _slurm_job_state(parts[1])
+        else:
+            result = self._rest_request("GET", "/slurm/v0.0.39/jobs")
+            for job_data in result.get("jobs", []):
+                states[str(job_data.get("job_id"))] = _slurm_job_state(job_data.get("job_state"))
+
+        with _status_lock:
+            _active_state_snapshots[key] = (time.monotonic(), states)
+        return states
+
+    def get_job_states(self, job_ids: List[Union[str, int]]) -> Dict[str, JobState]:
+        """
+        Look up many SLURM jobs at once.
+
+        Jobs still in the queue come from one shared squeue snapshot (REST: one
+        jobs listing) per SLURM_STATUS_CACHE_SECONDS; jobs that have left it are
+        resolved with a single sacct call for all of them, and terminal states are
+        remembered. Jobs the scheduler no longer knows about (e.g. accounting
+        disabled) map to JobState.UNKNOWN.
+        """
+        ids = [str(job_id) for job_id in job_ids if job_id is not None and re.fullmatch(r"[0-9_]+", str(job_id))]
+        if not ids:
+            return {}
+        key = self._status_account_key()
+        active = self._active_job_states()
+
+        states: Dict[str, JobState] = {}
+        missing: List[str] = []
+        with _status_lock:
+            for job_id in ids:
+                if job_id in active:
+                    states[job_id] = active[job_id]
+                elif (key, job_id) in _terminal_states:
+                    states[job_id] = _terminal_states[(key, job_id)]
+                else:
+                    missing.append(job_id)
+
+        if missing and self.mode == "ssh":
+            try:
+                output = self._ssh_execute(f"sacct -n -X -P -o JobID,State -j {','.join(missing)}")
+            except Exception as e:
+                logger.debug(f"SLURM sacct lookup failed: {e}")
+                output = ""
+            for line in output.splitlines():
+                job_id, _, raw_state = line.partition("|")
+                job_id = job_id.strip()
+                if job_id in missing:
+                    states[job_id] = _slurm_job_state(raw_state)
+
+        with _status_lock:
+            for job_id in missing:
+                state = states.setdefault(job_id, JobState.UNKNOWN)
+                if state in _TERMINAL_JOB_STATES:
+                    _terminal_states[(key, job_id)] = state
+            while len(_terminal_states) > _TERMINAL_STATE_CACHE_MAX:
+                _terminal_states.popitem(last=False)
+        return states
+
     def check(self) -> tuple[bool, str | None]:
         """Check if the SLURM provider is active and accessible."""
         try:
@@ -46,7 +46,7 @@ class VastAIProvider(ComputeProvider):
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}",
         }
-        response = requests.request(method=method, url=url, json=json_data, headers=headers, timeout=timeout)
+        response = self.http_request(method=method, url=url, json=json_data, headers=headers, timeout=timeout)
         response.raise_for_status()
         return response
 
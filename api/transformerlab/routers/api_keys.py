@@ -11,6 +11,7 @@ from transformerlab.db import team as db_team
 from transformerlab.db.session import get_async_session
 from transformerlab.shared.models.models import ApiKey, User
 from transformerlab.models.users import current_active_user
+from transformerlab.services import api_key_auth
 from transformerlab.utils.api_key_utils import (
     generate_api_key,
     hash_api_key,
@@ -139,6 +140,8 @@ async def list_api_keys(
 ):
     """List all API keys for the authenticated user."""
     user_id = str(user.id)
+    # Show up-to-date last_used_at values.
+    await api_key_auth.flush_last_used(session)
 
     stmt = select(ApiKey).where(ApiKey.user_id == user_id).order_by(ApiKey.created_at.desc())
     result = await session.execute(stmt)
@@ -175,6 +178,7 @@ async def get_api_key(
 ):
     """Get a specific API key by ID. User can only access their own keys."""
     user_id = str(user.id)
+    await api_key_auth.flush_last_used(session)
 
     stmt = select(ApiKey).where(ApiKey.id == key_id, ApiKey.user_id == user_id)
     result = await session.execute(stmt)
@@ -231,6 +235,7 @@ async def update_api_key(
         stmt = update(ApiKey).where(ApiKey.id == key_id).values(**update_data)
         await session.execute(stmt)
         await session.commit()
+        api_key_auth.invalidate_api_key(key_id)
         await session.refresh(api_key)
 
     # Get team name if team_id exists
@@ -272,5 +277,6 @@ async def delete_api_key(
     stmt = delete(ApiKey).where(ApiKey.id == key_id)
     await session.execute(stmt)
     await session.commit()
+    api_key_auth.invalidate_api_key(key_id)
 
     return {"message": "API key deleted"}
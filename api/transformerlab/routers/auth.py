@@ -32,6 +32,7 @@ import re
 
 from transformerlab.services.api_key_auth import (
     extract_api_key_from_request,
+    get_team_role,
     get_user_personal_team_id,
     validate_api_key_and_get_user,
 )
@@ -285,13 +286,17 @@ async def get_user_and_team(
     if lab_set_org_id is not None:
         lab_set_org_id(team_id)
 
-    # Verify user is associated with the provided team id
-    user_team = await db_team.get_user_team_membership(session, str(user.id), team_id)
+    # Verify user is associated with the provided team id (cached for API keys, which poll the most)
+    if auth_method == "api_key":
+        role = await get_team_role(session, str(user.id), team_id)
+    else:
+        user_team = await db_team.get_user_team_membership(session, str(user.id), team_id)
+        role = user_team.role if user_team is not None else None
 
-    if user_team is None:
+    if role is None:
         raise HTTPException(status_code=403, detail="User is not a member of the specified team")
 
-    return {"user": user, "team_id": team_id, "role": user_team.role}
+    return {"user": user, "team_id": team_id, "role": role}
 
 
 async def require_team_owner(
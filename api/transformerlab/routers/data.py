@@ -3,18 +3,20 @@ import json
 import logging
 from PIL import Image as PILImage
 from datasets import load_dataset, load_dataset_builder
-from fastapi import APIRouter, HTTPException, UploadFile, Query, Depends
+from fastapi import APIRouter, HTTPException, UploadFile, Query, Depends, Response
+from fastapi.responses import JSONResponse
 import csv
 import os
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
 from io import BytesIO
 import base64
+from lab import asset_catalogue
 from lab import dirs
 from lab import storage
 from lab.dataset import Dataset as dataset_service
 from datasets.data_files import EmptyDatasetError
-from transformerlab.shared.shared import slugify
+from transformerlab.shared.shared import catalogue_etag, etag_matches, slugify
 from datasets.exceptions import DatasetNotFoundError
 import numpy as np
 import wave
@@ -26,6 +28,7 @@ from werkzeug.utils import secure_filename
 from fastapi import Header
 
 from transformerlab.services import asset_download_service, asset_upload_service, asset_version_service
+from transformerlab.services import dataset_preview_service
 from transformerlab.services import dataset_service as dataset_service_module
 from transformerlab.services.permission_service import require_permission
 from transformerlab.services.upload_service import get_assembled_path, get_filename, delete_upload
@@ -162,53 +165,21 @@ async def dataset_preview(
         d = await d_obj.get_metadata()
     except FileNotFoundError:
         d = None
-    dataset_len = 0
-    result = {}
+    if d is None:
+        return {"status": "error", "message": "An internal error has occurred."}
 
     try:
-        if d.get("location") == "local":
-            dataset_dir = await dirs.dataset_dir_by_id(dataset_id)
-            dataset = await dataset_service_module.load_local_dataset(dataset_dir, streaming=streaming)
-        else:
-            dataset_config = (d.get("json_data") or {}).get("dataset_config", None)
-            config_name = (d.get("json_data") or {}).get("config_name", None)
-            if dataset_config is not None:
-                dataset = load_dataset(dataset_id, dataset_config, trust_remote_code=True, streaming=streaming)
-            elif config_name is not None:
-                dataset = load_dataset(path=dataset_id, name=config_name, trust_remote_code=True, streaming=streaming)
-            else:
-                dataset = load_dataset(dataset_id, trust_remote_code=True, streaming=streaming)
+        page = await dataset_preview_service.read_page(
+            dataset_id, d, split=split, offset=offset, limit=limit, streaming=streaming, serialize=serialize_row
+        )
+    except dataset_preview_service.PreviewError as e:
+        return {"status": "error", "message": str(e)}
     except Exception as e:
         print(f"Exception occurred: {type(e).__name__}: {e}")
         return {"status": "error", "message": "An internal error has occurred."}
 
-    if split is None or split == "":
-        splits = list(dataset.keys())
-        if len(splits) == 0:
-            return {"status": "error", "message": "No splits available in the dataset."}
-        split = splits[0]
-
-    if streaming:
-        dataset_len = -1
-        dataset = dataset[split].skip(offset)
-        rows = list(dataset.take(limit))
-        # Serialize rows
-        result["rows"] = [serialize_row(row) for row in rows]
-        result["splits"] = None
-    else:
-        if d["location"] != "local" and split not in dataset.keys():
-            return {"status": "error", "message": f"Split '{split}' does not exist in the dataset."}
-        dataset_len = len(dataset[split])
-        columns = dataset[split][offset : min(offset + limit, dataset_len)]
-        # Serialize each value in the columns dict, preserving the columnar format
-        if isinstance(columns, dict):
-            result["columns"] = {k: [serialize_row(v) for v in vals] for k, vals in columns.items()}
-        else:
-            result["columns"] = columns
-        result["splits"] = list(dataset.keys())
-
-    result["len"] = dataset_len
-    return {"status": "success", "data": result}
+    page.pop("split", None)
+    return {"status": "success", "data": page}
 
 
 def serialize_row(row):
@@ -315,31 +286,13 @@ async def load_and_slice_dataset(dataset_id: str, offset: int, limit: int):
         d = await d_obj.get_metadata()
     except FileNotFoundError:
         d = None
-    dataset_len = 0
-    result = {}
-    # This means it is a custom dataset the user uploaded
-    if d and d.get("location") == "local":
-        try:
-            dataset_dir = await dirs.dataset_dir_by_id(dataset_id)
-            dataset = await dataset_service_module.load_local_dataset(dataset_dir)
-        except Exception as e:
-            print(f"Error loading dataset: {type(e).__name__}: {e}")
-            return {"status": "error", "message": "An internal error has occurred."}
-        dataset_len = len(dataset["train"])
-        result["columns"] = dataset["train"][offset : min(offset + limit, dataset_len)]
-    else:
-        dataset_config = (d.get("json_data") or {}).get("dataset_config", None) if d else None
-        config_name = (d.get("json_data") or {}).get("config_name", None) if d else None
-        if dataset_config is not None:
-            dataset = load_dataset(dataset_id, dataset_config, trust_remote_code=True)
-        elif config_name is not None:
-            dataset = load_dataset(path=dataset_id, name=config_name, trust_remote_code=True)
-        else:
-            dataset = load_dataset(dataset_id, trust_remote_code=True)
-        dataset_len = len(dataset["train"])
-        result["columns"] = dataset["train"][offset : min(offset + limit, dataset_len)]
-    result["len"] = dataset_len
-    return result, dataset_len
+    try:
+        page = await dataset_preview_service.read_page(dataset_id, d or {}, split="train", offset=offset, limit=limit)
+    except Exception as e:
+        print(f"Error loading dataset: {type(e).__name__}: {e}")
+        return {"status": "error", "message": "An internal error has occurred."}
+    result = {"columns": page["columns"], "len": page["len"]}
+    return result, page["len"]
 
 
 @router.post(
@@ -604,8 +557,17 @@ async def dataset_download(dataset_id: str, config_name: str = None):
 
 
 @router.get("/list", summary="List available datasets.")
-async def dataset_list(generated: bool = True):
-    # Filesystem-only list
+async def dataset_list(generated: bool = True, if_none_match: Optional[str] = Header(default=None)):
+    # Served from the workspace dataset and dataset-group catalogues; their head tokens
+    # are read first so an unchanged list is answered with 304.
+    etag = catalogue_etag(
+        await asset_catalogue.etag(asset_catalogue.DATASETS),
+        await asset_version_service.group_map_etag("dataset"),
+        "g1" if generated else "g0",
+    )
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
     try:
         merged_list = await dataset_service.list_all()
     except Exception:
@@ -613,8 +575,6 @@ async def dataset_list(generated: bool = True):
 
     # Augment each dataset with version group info if any
     try:
-        from transformerlab.services import asset_version_service
-
         group_map = await asset_version_service.get_all_asset_group_map("dataset")
         for entry in merged_list:
             dataset_id = entry.get("dataset_id", "")
@@ -626,7 +586,7 @@ async def dataset_list(generated: bool = True):
         print(f"Warning: could not fetch dataset version groups: {e}")
 
     if generated:
-        return merged_list
+        return JSONResponse(merged_list, headers={"ETag": etag}) if etag else merged_list
 
     final_list = []
     for entry in merged_list:
@@ -641,7 +601,7 @@ async def dataset_list(generated: bool = True):
         if not generated and not json_data.get("generated", False):
             final_list.append(entry)
 
-    return final_list
+    return JSONResponse(final_list, headers={"ETag": etag}) if etag else final_list
 
 
 @router.get("/generated_datasets_list", summary="List available generated datasets.")
@@ -702,6 +662,7 @@ async def dataset_delete(
     # delete directory and contents. ignore_errors because we don't care if the directory doesn't exist
     dataset_dir = await dirs.dataset_dir_by_id(dataset_id)
     await storage.rm_tree(dataset_dir)
+    await asset_catalogue.record_entry(asset_catalogue.DATASETS, dataset_id, None)
     return {"status": "success"}
 
 
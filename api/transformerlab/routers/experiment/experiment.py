@@ -1,8 +1,11 @@
+import hashlib
+import json
 import os
 
 from typing import Annotated
 
-from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Request, Response
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import transformerlab.services.experiment_service as experiment_service
@@ -17,9 +20,9 @@ from transformerlab.routers.experiment import (
     task as task_router,
 )
 from transformerlab.routers.auth import get_user_and_team
-from transformerlab.services.permission_service import check_permission, get_user_team, require_permission
+from transformerlab.services.permission_service import get_permission_matcher, require_permission
 from sqlalchemy import select
-from transformerlab.shared.models.models import TeamRole, UserExperimentAccess
+from transformerlab.shared.models.models import UserExperimentAccess
 from transformerlab.db.session import get_async_session
 
 from werkzeug.utils import secure_filename
@@ -59,40 +62,21 @@ router.include_router(
 
 @router.get("/", summary="Get all Experiments", tags=["experiment"])
 async def experiments_get_all(
+    request: Request,
+    if_none_match: str | None = Header(default=None),
     session: AsyncSession = Depends(get_async_session),
     user_and_team: dict = Depends(get_user_and_team),
 ):
     """Get a list of all experiments, filtered by role, with per-user last_opened_at."""
-    experiments = await experiment_service.experiment_get_all()
     user = user_and_team["user"]
     team_id = user_and_team["team_id"]
     user_id = str(user.id)
 
-    user_team = await get_user_team(session, user_id, team_id)
-    if user_team is None:
+    # One ACL query for the whole list, shared with the rest of this request.
+    matcher = await get_permission_matcher(session, user_id, team_id, request=request)
+    if not matcher.is_member:
         return []
 
-    # Role-based filtering (existing logic)
-    if user_team.role == TeamRole.OWNER.value:
-        filtered = experiments
-    else:
-        filtered = []
-        for experiment in experiments:
-            experiment_id = str(experiment.get("id"))
-            if not experiment_id:
-                continue
-            allowed = await check_permission(
-                session=session,
-                user_id=user_id,
-                team_id=team_id,
-                resource_type="experiment",
-                resource_id=experiment_id,
-                action="read",
-                user_team=user_team,
-            )
-            if allowed:
-                filtered.append(experiment)
-
     # Attach per-user last_opened_at
     access_records = await session.execute(
         select(UserExperimentAccess).where(
@@ -102,10 +86,29 @@ async def experiments_get_all(
     )
     access_map = {row.experiment_id: row.last_opened_at.isoformat() for row in access_records.scalars().all()}
 
+    # The response depends on the experiment catalogue and on this user's ACL rows and access
+    # records. The catalogue head is read before the list, so an unchanged ETag is answered with 304.
+    view = json.dumps([user_id, str(team_id), matcher.fingerprint(), sorted(access_map.items())])
+    etag = shared.catalogue_etag(
+        await experiment_service.experiment_list_etag(), hashlib.sha256(view.encode("utf-8")).hexdigest()[:16]
+    )
+    if shared.etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    experiments = await experiment_service.experiment_get_all()
+
+    # Role-based filtering (existing logic)
+    if matcher.is_owner:
+        filtered = experiments
+    else:
+        filtered = matcher.filter(experiments, "experiment", "read")
+
     for exp in filtered:
         exp_id = str(exp.get("id", ""))
         exp["last_opened_at"] = access_map.get(exp_id)
 
+    if etag:
+        return JSONResponse(filtered, headers={"ETag": etag})
     return filtered
 
 
@@ -124,6 +127,7 @@ async def experiment_touch(
 
 @router.get("/recent", summary="Get recently opened experiments", tags=["experiment"])
 async def experiments_get_recent(
+    request: Request,
     session: AsyncSession = Depends(get_async_session),
     user_and_team: dict = Depends(get_user_and_team),
 ):
@@ -133,12 +137,12 @@ async def experiments_get_recent(
     team_id = str(user_and_team["team_id"])
     user_id = str(user.id)
 
-    user_team = await get_user_team(session, user_id, team_id)
-    if user_team is None:
+    matcher = await get_permission_matcher(session, user_id, team_id, request=request)
+    if not matcher.is_member:
         return []
 
     recent_ids = await access_service.get_recent_experiment_ids(session, user_id, team_id, limit=3)
-    permitted_experiments = await experiments_get_all(session=session, user_and_team=user_and_team)
+    permitted_experiments = await experiments_get_all(request=request, session=session, user_and_team=user_and_team)
     if not recent_ids:
         return permitted_experiments[:3]
 
@@ -169,10 +173,11 @@ async def experiments_create(
 
 @router.get("/tags", summary="List all distinct tags across permitted experiments", tags=["experiment"])
 async def experiments_list_all_tags(
+    request: Request,
     session: AsyncSession = Depends(get_async_session),
     user_and_team: dict = Depends(get_user_and_team),
 ):
-    permitted = await experiments_get_all(session=session, user_and_team=user_and_team)
+    permitted = await experiments_get_all(request=request, session=session, user_and_team=user_and_team)
     return {"tags": experiment_service.aggregate_tags(permitted)}
 
 
@@ -11,7 +11,9 @@ import pandas as pd
 from fastapi import APIRouter, Body, Response, Request, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse, FileResponse
 from json import JSONDecodeError
-from lab import Job, storage
+from lab import Job, segmented_log, storage
+from lab.dataset import Dataset
+from lab.model import Model
 from lab.job_status import JobStatus
 from sqlalchemy.ext.asyncio import AsyncSession
 from werkzeug.utils import secure_filename
@@ -22,6 +24,7 @@ from transformerlab.routers.auth import get_user_and_team
 from transformerlab.routers.serverinfo import watch_file
 from transformerlab.services.job_service import get_artifacts_from_directory, job_update_status
 import transformerlab.services.job_chart_service as job_chart_service
+import transformerlab.services.job_metrics_service as job_metrics_service
 import transformerlab.services.job_service as job_service
 from transformerlab.services.permission_service import require_permission
 from transformerlab.services.provider_service import get_team_provider, get_provider_instance
@@ -140,15 +143,24 @@ async def jobs_get_all(
     status: str = "",
     subtype: str = "",
     slim: bool = False,
+    limit: Optional[int] = Query(None, ge=1),
+    offset: int = Query(0, ge=0),
 ):
     """
     Return the list of jobs for an experiment, optionally filtered by type/status/subtype.
 
     When ``slim=true``, heavy provisioning/config fields are stripped from each
     job's ``job_data`` to keep polling payloads small. The set of stripped keys
-    is defined by ``_SLIM_JOB_DATA_DROPPED_KEYS``.
+    is defined by ``_SLIM_JOB_DATA_DROPPED_KEYS``. ``limit``/``offset`` page
+    through the newest-first listing.
     """
-    jobs = await job_service.jobs_get_all(type=type, status=status, experiment_id=experimentId)
+    if subtype:
+        # Subtype lives in job_data, so page after filtering on it below.
+        jobs = await job_service.jobs_get_all(type=type, status=status, experiment_id=experimentId)
+    else:
+        jobs = await job_service.jobs_get_all(
+            type=type, status=status, experiment_id=experimentId, limit=limit, offset=offset
+        )
 
     # Optional filter by job_data.subtype
     if subtype:
@@ -162,7 +174,9 @@ async def jobs_get_all(
                     job_data = {}
             if job_data.get("subtype") == subtype:
                 filtered.append(job)
-        jobs = filtered
+        jobs = filtered[offset:]
+        if limit is not None:
+            jobs = jobs[:limit]
 
     if slim:
         jobs = [_slim_job(job) for job in jobs]
@@ -308,40 +322,51 @@ async def get_training_job(job_id: str, experimentId: str):
 
 
 @router.get("/{job_id}/metrics")
-async def get_job_metrics(job_id: str, experimentId: str, since: int = 0):
+async def get_job_metrics(
+    job_id: str,
+    experimentId: str,
+    since: int = Query(0, ge=0),
+    last: Optional[int] = Query(None, ge=1),
+    step_min: Optional[float] = None,
+    step_max: Optional[float] = None,
+    metrics: Optional[str] = None,
+    max_points: Optional[int] = Query(None, ge=4),
+    downsample: str = "lttb",
+):
     """
-    Return the contents of <job_dir>/metrics.jsonl as JSON.
+    Return rows of <job_dir>/metrics.jsonl as JSON.
+
+    `since` is a zero-based row index — useful for polling: pass the
+    `total_rows` you already have to receive only newer rows. `last` limits
+    the response to the newest N rows, `step_min`/`step_max` filter by step
+    and `metrics` (comma separated) keeps only the named metrics.
 
-    `since` is a zero-based row index — useful for polling: pass the count
-    you already have to receive only newer rows. Returns
-    {"count": N, "rows": [...]} where N is the number of rows after the
-    `since` filter.
+    With `max_points` the series is downsampled server-side (`downsample`
+    is "lttb" or "minmax") so large runs can be charted without shipping
+    every row. Returns {"count": N, "rows": [...], "total_rows": T}.
     """
     from lab.dirs import get_job_dir
 
+    if downsample not in job_metrics_service.DOWNSAMPLE_METHODS:
+        raise HTTPException(status_code=400, detail=f"Unsupported downsample method '{downsample}'")
+
     job_dir = await get_job_dir(job_id, experimentId)
     metrics_path = storage.join(job_dir, "metrics.jsonl")
 
     if not await storage.exists(metrics_path):
-        return {"count": 0, "rows": []}
-
-    rows: list[dict] = []
-    line_idx = 0
-    async with await storage.open(metrics_path, "r", encoding="utf-8") as f:
-        while True:
-            line = await f.readline()
-            if not line:
-                break
-            if line_idx >= since:
-                stripped = line.strip()
-                if stripped:
-                    try:
-                        rows.append(json.loads(stripped))
-                    except json.JSONDecodeError:
-                        pass
-            line_idx += 1
-
-    return {"count": len(rows), "rows": rows}
+        return job_metrics_service.empty_result()
+
+    metric_names = [name.strip() for name in metrics.split(",") if name.strip()] if metrics else None
+    return await job_metrics_service.query_metrics(
+        metrics_path,
+        since=since,
+        last=last,
+        step_min=step_min,
+        step_max=step_max,
+        metrics=metric_names,
+        max_points=max_points,
+        method=downsample,
+    )
 
 
 @router.get("/{job_id}/tasks_output")
@@ -379,8 +404,7 @@ async def get_tasks_job_output(job_id: str, experimentId: str, sweeps: bool = Fa
 
         # Read and return the file content as JSON array of lines
         if await storage.exists(output_file_name):
-            async with await storage.open(output_file_name, "r") as f:
-                content = await f.read()
+            content = await segmented_log.read_log(output_file_name)
             return content.splitlines()
         else:
             return ["Output file not found"]
@@ -394,8 +418,7 @@ async def get_tasks_job_output(job_id: str, experimentId: str, sweeps: bool = Fa
             try:
                 output_file_name = await shared.get_job_output_file_name(job_id, experiment_name=experimentId)
                 if await storage.exists(output_file_name):
-                    async with await storage.open(output_file_name, "r") as f:
-                        content = await f.read()
+                    content = await segmented_log.read_log(output_file_name)
                     return content.splitlines()
                 else:
                     return ["Output file not found after retry"]
@@ -476,9 +499,9 @@ async def get_provider_job_logs(
         )
 
     # 1) If live=False (default) and the provider is NOT local, try provider_logs.txt
-    #    from the SDK job directory.  This file is written by tfl-remote-trap at the
-    #    END of a remote command, so for local providers it may be empty or stale
-    #    while stdout.log (the real log) is available via get_job_logs().
+    #    from the SDK job directory.  tfl-remote-trap streams it as a segmented log
+    #    (lab.segmented_log) while the command runs; for local providers it may be
+    #    empty or stale while stdout.log (the real log) is available via get_job_logs().
     is_local_provider = (
         job_data.get("provider_type") == "local" or (job_data.get("provider_name") or "").lower() == "local"
     )
@@ -489,11 +512,10 @@ async def get_provider_job_logs(
             job_dir = await get_job_dir(job_id, experimentId)
             provider_logs_path = storage.join(job_dir, "provider_logs.txt")
             if await storage.exists(provider_logs_path):
-                async with await storage.open(provider_logs_path, "r", encoding="utf-8") as f:
-                    logs_text = await f.read()
                 if tail_lines is not None:
-                    lines = logs_text.splitlines()
-                    logs_text = "\n".join(lines[-tail_lines:])
+                    logs_text = await segmented_log.read_log_tail(provider_logs_path, tail_lines)
+                else:
+                    logs_text = await segmented_log.read_log(provider_logs_path)
 
                 return {
                     "cluster_name": cluster_name,
@@ -937,8 +959,7 @@ async def get_job_task_logs(
             )
         return {"logs": "", "tail_lines": tail_lines}
 
-    async with await storage.open(output_file_name, "r") as f:
-        logs_text = await f.read()
+    logs_text = await segmented_log.read_log(output_file_name)
 
     if tail_lines is not None:
         lines = logs_text.splitlines()
@@ -1539,9 +1560,9 @@ async def download_all_artifacts(job_id: str, experimentId: str):
     if not all_file_paths:
         return Response("No artifacts found for this job", status_code=404)
 
-    # 2. Create Zip File in memory
+    # 2. Stream the zip as it is built
     try:
-        zip_buffer = await zip_utils.create_zip_from_storage(all_file_paths, storage)
+        zip_stream = zip_utils.stream_zip_from_storage(all_file_paths, storage)
 
         filename = f"artifacts_{job_id}.zip"
         headers = {
@@ -1549,7 +1570,7 @@ async def download_all_artifacts(job_id: str, experimentId: str):
             "Cache-Control": "no-cache",
         }
 
-        return StreamingResponse(iter([zip_buffer.getvalue()]), media_type="application/zip", headers=headers)
+        return StreamingResponse(zip_stream, media_type="application/zip", headers=headers)
 
     except Exception as e:
         print(f"Error creating zip file: {e}")
@@ -1618,7 +1639,7 @@ async def get_artifact(job_id: str, experimentId: str, filename: str, task: str
         if task != "download":
             return Response("Directory artifacts can only be downloaded", status_code=400)
         dir_name = posixpath.basename(str(artifact_file_path).rstrip("/")) or secure_filename(filename)
-        zip_buffer = await zip_utils.create_zip_from_directory(artifact_file_path, storage, root_prefix=dir_name)
+        zip_stream = zip_utils.stream_zip_from_directory(artifact_file_path, storage, root_prefix=dir_name)
         zip_filename = f"{dir_name}.zip"
         headers = {
             "Content-Disposition": f'attachment; filename="{zip_filename}"',
@@ -1626,7 +1647,7 @@ async def get_artifact(job_id: str, experimentId: str, filename: str, task: str
             "Pragma": "no-cache",
             "Expires": "0",
         }
-        return StreamingResponse(iter([zip_buffer.getvalue()]), media_type="application/zip", headers=headers)
+        return StreamingResponse(zip_stream, media_type="application/zip", headers=headers)
 
     # Determine media type based on file extension
     _, ext = os.path.splitext(filename.lower())
@@ -1742,9 +1763,7 @@ async def get_training_job_output_jobpath(job_id: str, experimentId: str, sweeps
             output_file_name = await shared.get_job_output_file_name(job_id, experiment_name=experiment_id)
 
         if await storage.exists(output_file_name):
-            async with await storage.open(output_file_name, "r") as f:
-                output = await f.read()
-            return output
+            return await segmented_log.read_log(output_file_name)
         else:
             return "Output file not found"
     except ValueError as e:
@@ -1955,6 +1974,8 @@ async def _save_dataset_to_registry(
 ):
     """Coroutine that performs the copy and creates the version entry."""
     await storage.copy_dir(source_path, dest_path)
+    # The datasets catalogue is keyed by top-level folder, which for a registry copy is the group.
+    await Dataset(group_name).refresh_catalogue_entry()
 
     version_description = description if description else f"Created from job {job_id}"
     await asset_version_service.create_version(
@@ -2074,6 +2095,7 @@ async def _save_model_to_registry(
 ):
     """Coroutine that performs the copy and creates the version entry."""
     await storage.copy_dir(source_path, dest_path)
+    await Model(asset_id).refresh_catalogue_entry()
 
     version_description = description if description else f"Created from job {job_id}"
     await asset_version_service.create_version(
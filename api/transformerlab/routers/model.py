@@ -1,5 +1,6 @@
 from typing import Annotated
-from fastapi import APIRouter, Body, Depends, Header, HTTPException
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Response
+from fastapi.responses import JSONResponse
 from huggingface_hub import HfApi
 
 from transformerlab.services import model_service, asset_upload_service, asset_download_service
@@ -9,9 +10,10 @@ from transformerlab.services.upload_service import (
     get_assembled_path,
     delete_upload,
 )
+from transformerlab.shared.shared import catalogue_etag, etag_matches
 from lab.dirs import get_workspace_dir
 from lab.model import Model
-from lab import storage
+from lab import asset_catalogue, storage
 
 from werkzeug.utils import secure_filename
 
@@ -20,8 +22,21 @@ router = APIRouter(tags=["model"])
 
 
 @router.get("/model/list")
-@cached(key="models:list", ttl="7d", tags=["models", "models:list"])
-async def model_local_list():
+async def model_local_list(if_none_match: str | None = Header(default=None)):
+    # The list is built from the workspace model and model-group catalogues. Their head
+    # tokens are read first (one small read each) so an unchanged list is answered with 304.
+    # The local paths attached to each model come from the models directory, so its
+    # listing is part of the ETag too. Until the catalogues exist there is no ETag.
+    from transformerlab.services import asset_version_service
+
+    etag = catalogue_etag(
+        await asset_catalogue.etag(asset_catalogue.MODELS),
+        await asset_version_service.group_map_etag("model"),
+        await model_service.filesystem_etag(),
+    )
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
     # the model list is a combination of downloaded hugging face models and locally generated models
     models = await model_service.list_installed_models()
 
@@ -39,6 +54,8 @@ async def model_local_list():
     except Exception as e:
         print(f"Warning: could not fetch model version groups: {e}")
 
+    if etag:
+        return JSONResponse(models, headers={"ETag": etag})
     return models
 
 
@@ -105,10 +122,8 @@ async def model_local_delete(
     try:
         model_obj = await Model.get(model_id)
         # Delete the entire directory
-        model_dir = await model_obj.get_dir()
-        if await storage.exists(model_dir):
-            await storage.rm_tree(model_dir)
-            print(f"Deleted filesystem model: {model_id}")
+        await model_obj.delete()
+        print(f"Deleted filesystem model: {model_id}")
     except FileNotFoundError:
         # Model not found in filesystem, continue with other deletion methods
         pass
@@ -137,6 +152,7 @@ async def model_local_delete(
             print("ERROR: Invalid directory structure")
         print(f"Deleteing {model_path}")
         await storage.rm_tree(model_path)
+        await asset_catalogue.record_entry(asset_catalogue.MODELS, model_dir, None)
 
     else:
         if delete_from_cache:
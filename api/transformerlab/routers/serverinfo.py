@@ -1,7 +1,6 @@
 from watchfiles import awatch
 import json
 import os
-import asyncio
 import subprocess
 import zipfile
 import tempfile
@@ -13,7 +12,7 @@ from fastapi.responses import StreamingResponse, FileResponse
 from lab.dirs import get_global_log_path
 from lab import HOME_DIR
 from lab import storage
-from transformerlab.shared import galleries
+from transformerlab.shared import galleries, log_tailer
 
 
 def is_wsl():
@@ -38,6 +37,10 @@ async def watch_remote_file(
     """
     Watch an S3 file by polling it periodically.
     This is used for remote filesystems like S3 that don't support file watching.
+
+    Every stream on the same file shares one poller (transformerlab.shared.log_tailer)
+    that fetches only the bytes appended since its last poll, or tails the part
+    objects of a segmented log (lab.segmented_log), and backs off while the file is idle.
     """
     print(f"👀 Watching S3 file: {filename}")
 
@@ -46,50 +49,10 @@ async def watch_remote_file(
         async with await storage.open(filename, "w") as f:
             await f.write("")
 
-    last_content = ""
-    if start_from_beginning:
-        try:
-            async with await storage.open(filename, "r") as f:
-                last_content = await f.read()
-                if last_content:
-                    lines = last_content.splitlines(keepends=True)
-                    yield (f"data: {json.dumps(lines)}\n\n")
-        except Exception as e:
-            print(f"Error reading S3 file from beginning: {e}")
-            last_content = ""
-    else:
-        # Start from current end of file
-        try:
-            async with await storage.open(filename, "r") as f:
-                last_content = await f.read()
-        except Exception as e:
-            print(f"Error reading S3 file: {e}")
-            last_content = ""
-
-    # Poll the file periodically
-    while True:
-        await asyncio.sleep(poll_interval_ms / 1000.0)
-        try:
-            async with await storage.open(filename, "r") as f:
-                current_content = await f.read()
-
-            # Check if file has grown
-            if len(current_content) > len(last_content):
-                # Extract new content
-                new_content = current_content[len(last_content) :]
-                new_lines = new_content.splitlines(keepends=True)
-                if new_lines:
-                    yield (f"data: {json.dumps(new_lines)}\n\n")
-                last_content = current_content
-            elif len(current_content) < len(last_content):
-                # File was truncated or rewritten, send all current content
-                if current_content:
-                    lines = current_content.splitlines(keepends=True)
-                    yield (f"data: {json.dumps(lines)}\n\n")
-                last_content = current_content
-        except Exception as e:
-            print(f"Error polling S3 file: {e}")
-            await asyncio.sleep(poll_interval_ms / 1000.0)
+    async for lines in log_tailer.follow_lines(
+        filename, start_from_beginning=start_from_beginning, poll_interval_ms=poll_interval_ms
+    ):
+        yield (f"data: {json.dumps(lines)}\n\n")
 
 
 async def watch_file(filename: str, start_from_beginning=False, force_polling=True) -> AsyncGenerator[str, None]:
@@ -21,7 +21,10 @@ class CompleteRequest(BaseModel):
 async def init_upload(
     body: InitRequest,
 ):
-    return await upload_service.init_upload(body.filename, body.total_size)
+    try:
+        return await upload_service.init_upload(body.filename, body.total_size)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
 
 
 @router.put("/{upload_id}/chunk")
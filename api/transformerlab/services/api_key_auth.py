@@ -1,11 +1,35 @@
-"""API Key authentication helpers (service layer)."""
-
+"""API Key authentication helpers (service layer).
+
+Verifying a key means an Argon2 check against every stored hash with the same
+prefix, so successful verifications are cached for API_KEY_CACHE_TTL_SECONDS,
+keyed by an HMAC of the presented key (the key itself is never stored). The
+middleware and the auth dependency both authenticate each request, and polling
+clients repeat the same key constantly; after the first request they only pay
+for loading the user row. Team roles resolved for API-key requests are cached
+the same way. Revoking or deleting a key and changing team membership
+invalidate the affected entries; other workers see the change once their TTL
+expires.
+
+``last_used_at`` is recorded in memory and written in one batch every
+API_KEY_LAST_USED_FLUSH_SECONDS instead of committing on every request.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import logging
+import os
+import secrets
+import time
 import uuid
-from typing import Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
 
 from fastapi import HTTPException, Request
 from fastapi.security import HTTPBearer
-from sqlalchemy import select
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from transformerlab.shared.models.models import ApiKey, User
@@ -19,8 +43,121 @@ from transformerlab.utils.api_key_utils import (
 )
 from transformerlab.utils.datetime_utils import utc_now_naive
 
+logger = logging.getLogger(__name__)
+
 security = HTTPBearer(auto_error=False)
 
+API_KEY_CACHE_TTL_SECONDS = float(os.getenv("TFL_API_KEY_CACHE_TTL_SECONDS", "60"))
+API_KEY_CACHE_MAX_ENTRIES = int(os.getenv("TFL_API_KEY_CACHE_MAX_ENTRIES", "1024"))
+API_KEY_LAST_USED_FLUSH_SECONDS = float(os.getenv("TFL_API_KEY_LAST_USED_FLUSH_SECONDS", "60"))
+
+
+@dataclass
+class _VerifiedKey:
+    api_key_id: str
+    user_id: str
+    team_id: Optional[str]
+    expires_at: Optional[datetime]
+    verified_at: float
+
+
+# Per-process secret so cache keys are useless outside this process.
+_cache_secret = secrets.token_bytes(32)
+_verified_keys: "OrderedDict[str, _VerifiedKey]" = OrderedDict()
+_team_roles: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+_personal_teams: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+_pending_last_used: Dict[str, datetime] = {}
+_last_flush = time.monotonic()
+
+
+def _key_digest(api_key: str) -> str:
+    return hmac.new(_cache_secret, api_key.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def _cache_put(cache: OrderedDict, key, value) -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > API_KEY_CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+
+
+def _cache_get_fresh(cache: OrderedDict, key, cached_at):
+    if API_KEY_CACHE_TTL_SECONDS <= 0:
+        return None
+    value = cache.get(key)
+    if value is None:
+        return None
+    if time.monotonic() - cached_at(value) > API_KEY_CACHE_TTL_SECONDS:
+        cache.pop(key, None)
+        return None
+    cache.move_to_end(key)
+    return value
+
+
+def invalidate_api_key(api_key_id: str) -> None:
+    """Drop cached verifications of an API key (call after revoking, updating or deleting it)."""
+    for digest, entry in list(_verified_keys.items()):
+        if entry.api_key_id == api_key_id:
+            _verified_keys.pop(digest, None)
+
+
+def invalidate_team_memberships(team_id: str, user_id: Optional[str] = None) -> None:
+    """Drop cached roles for a team (or one member of it) after membership changes."""
+    for key in list(_team_roles):
+        if key[1] == team_id and (user_id is None or key[0] == user_id):
+            _team_roles.pop(key, None)
+    for member_id, (personal_team_id, _) in list(_personal_teams.items()):
+        if personal_team_id == team_id or member_id == user_id:
+            _personal_teams.pop(member_id, None)
+
+
+def clear_api_key_cache() -> None:
+    """Forget every cached verification and role."""
+    _verified_keys.clear()
+    _team_roles.clear()
+    _personal_teams.clear()
+
+
+async def get_team_role(session: AsyncSession, user_id: str, team_id: str) -> Optional[str]:
+    """Role of ``user_id`` in ``team_id``, or None if not a member. Memberships are cached; non-membership is not."""
+    cached = _cache_get_fresh(_team_roles, (user_id, team_id), lambda value: value[1])
+    if cached is not None:
+        return cached[0]
+    user_team = await db_team.get_user_team_membership(session, user_id, team_id)
+    if user_team is None:
+        return None
+    if API_KEY_CACHE_TTL_SECONDS > 0:
+        _cache_put(_team_roles, (user_id, team_id), (user_team.role, time.monotonic()))
+    return user_team.role
+
+
+async def flush_last_used(session: AsyncSession) -> int:
+    """Write pending ``last_used_at`` timestamps in one statement. Returns the number of keys updated."""
+    global _pending_last_used, _last_flush
+    _last_flush = time.monotonic()
+    if not _pending_last_used:
+        return 0
+    pending, _pending_last_used = _pending_last_used, {}
+    table = ApiKey.__table__
+    stmt = update(table).where(table.c.id == bindparam("key_id")).values(last_used_at=bindparam("used_at"))
+    try:
+        await session.execute(stmt, [{"key_id": key_id, "used_at": used_at} for key_id, used_at in pending.items()])
+        await session.commit()
+    except Exception as e:
+        # last_used_at is informational; never fail a request over it. Retry on the next flush.
+        logger.warning(f"Failed to record API key last_used_at: {e}")
+        await session.rollback()
+        for key_id, used_at in pending.items():
+            _pending_last_used.setdefault(key_id, used_at)
+        return 0
+    return len(pending)
+
+
+async def _record_last_used(session: AsyncSession, api_key_id: str) -> None:
+    _pending_last_used[api_key_id] = utc_now_naive()
+    if time.monotonic() - _last_flush >= API_KEY_LAST_USED_FLUSH_SECONDS:
+        await flush_last_used(session)
+
 
 def extract_api_key_from_request(request: Request) -> Optional[str]:
     """
@@ -50,6 +187,38 @@ async def validate_api_key_and_get_user(
     Returns:
         tuple: (user, team_id, role) where team_id and role may be None
     """
+    digest = _key_digest(api_key)
+    entry = _cache_get_fresh(_verified_keys, digest, lambda value: value.verified_at)
+    if entry is None:
+        entry = await _verify_api_key(api_key, session)
+        if API_KEY_CACHE_TTL_SECONDS > 0:
+            _cache_put(_verified_keys, digest, entry)
+    elif is_key_expired(entry.expires_at):
+        _verified_keys.pop(digest, None)
+        raise HTTPException(status_code=401, detail="API key has expired")
+
+    # The user row is always loaded so deactivated accounts are rejected immediately.
+    try:
+        user_uuid = uuid.UUID(entry.user_id)
+    except (ValueError, AttributeError):
+        raise HTTPException(status_code=401, detail="Invalid API key")
+    user = await db_user.get_user_by_id(session, user_uuid)
+
+    if not user:
+        raise HTTPException(status_code=401, detail="User associated with API key not found")
+
+    # Check if user is active
+    if not user.is_active:
+        raise HTTPException(status_code=401, detail="User account is inactive")
+
+    await _record_last_used(session, entry.api_key_id)
+
+    # Return user and team_id (if scoped to a team)
+    return user, entry.team_id, None  # role will be determined later
+
+
+async def _verify_api_key(api_key: str, session: AsyncSession) -> _VerifiedKey:
+    """Find the stored key matching ``api_key`` (Argon2) and check that it is usable."""
     # Since Argon2 hashes are salted (non-deterministic), we can't do direct hash lookup
     # We need to verify against stored hashes. Use key_prefix to narrow down candidates for performance.
     from transformerlab.utils.api_key_utils import get_key_prefix
@@ -67,11 +236,11 @@ async def validate_api_key_and_get_user(
         result = await session.execute(stmt)
         candidate_keys = result.scalars().all()
 
-    # Find the matching API key by verifying against each candidate hash
+    # Find the matching API key by verifying against each candidate hash (off the event loop: Argon2 is slow)
     api_key_obj = None
     for key_obj in candidate_keys:
         try:
-            if verify_api_key(api_key, key_obj.key_hash):
+            if await asyncio.to_thread(verify_api_key, api_key, key_obj.key_hash):
                 api_key_obj = key_obj
                 break
         except Exception:
@@ -89,44 +258,38 @@ async def validate_api_key_and_get_user(
     if is_key_expired(api_key_obj.expires_at):
         raise HTTPException(status_code=401, detail="API key has expired")
 
-    # Get the user
-    try:
-        user_uuid = uuid.UUID(api_key_obj.user_id)
-    except (ValueError, AttributeError):
-        raise HTTPException(status_code=401, detail="Invalid API key")
-    user = await db_user.get_user_by_id(session, user_uuid)
-
-    if not user:
-        raise HTTPException(status_code=401, detail="User associated with API key not found")
-
-    # Check if user is active
-    if not user.is_active:
-        raise HTTPException(status_code=401, detail="User account is inactive")
-
-    # Update last_used_at
-    api_key_obj.last_used_at = utc_now_naive()
-    session.add(api_key_obj)
-    await session.commit()
-
-    # Return user and team_id (if scoped to a team)
-    return user, api_key_obj.team_id, None  # role will be determined later
+    return _VerifiedKey(
+        api_key_id=api_key_obj.id,
+        user_id=api_key_obj.user_id,
+        team_id=api_key_obj.team_id,
+        expires_at=api_key_obj.expires_at,
+        verified_at=time.monotonic(),
+    )
 
 
 async def get_user_personal_team_id(session: AsyncSession, user: User) -> str:
     """
     Get the user's personal team ID. Creates one if it doesn't exist.
     """
+    user_id = str(user.id)
+    cached = _cache_get_fresh(_personal_teams, user_id, lambda value: value[1])
+    if cached is not None:
+        return cached[0]
+
     # Check if user has any team associations
-    user_teams = await db_team.get_user_teams(session, str(user.id))
+    user_teams = await db_team.get_user_teams(session, user_id)
 
     if not user_teams:
         # Create personal team
         personal_team = await create_personal_team(session, user)
-        await db_team.add_user_to_team(session, str(user.id), personal_team.id, "owner")
-        return personal_team.id
-
-    # Return the first team (typically the personal team)
-    return user_teams[0].team_id
+        await db_team.add_user_to_team(session, user_id, personal_team.id, "owner")
+        team_id = personal_team.id
+    else:
+        # Return the first team (typically the personal team)
+        team_id = user_teams[0].team_id
+    if API_KEY_CACHE_TTL_SECONDS > 0:
+        _cache_put(_personal_teams, user_id, (team_id, time.monotonic()))
+    return team_id
 
 
 async def determine_team_id_from_request(request: Request, session: AsyncSession) -> Optional[str]:
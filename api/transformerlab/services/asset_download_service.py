@@ -1,12 +1,15 @@
 """Shared download/listing logic for model and dataset routers.
 
 `list_files` walks an asset directory and returns relpath+size dicts.
-`stream_file` returns a StreamingResponse honoring HTTP Range for resume.
+`stream_file` returns a StreamingResponse honoring HTTP Range for resume and for
+parallel range downloads: a single range gets a 206 with Content-Range, several
+ranges get one multipart/byteranges response read through a single file handle.
 """
 
 import os
 import re
-from typing import Optional
+import uuid
+from typing import List, Optional, Tuple
 
 from fastapi import Response
 from fastapi.responses import StreamingResponse
@@ -19,7 +22,9 @@ class InvalidRelpathError(ValueError):
     """Raised when a relpath would escape its asset directory."""
 
 
-_RANGE_RE = re.compile(r"^bytes=(\d+)-(\d*)$")
+_RANGE_SPEC_RE = re.compile(r"^(\d*)-(\d*)$")
+# Requests asking for more (merged) ranges than this get the whole file instead.
+MAX_RANGES_PER_REQUEST = 64
 
 
 def _sanitize_relpath(relpath: str) -> str:
@@ -95,29 +100,99 @@ async def list_files(asset_dir: str) -> list[dict]:
     return results
 
 
+async def _seek_forward(f, position: int, target: int, chunk: int) -> None:
+    """Move `f` from `position` to `target`, discarding bytes if seek isn't supported."""
+    if target == position:
+        return
+    try:
+        await f.seek(target)
+    except Exception:
+        discarded = position
+        while discarded < target:
+            blk = await f.read(min(chunk, target - discarded))
+            if not blk:
+                break
+            discarded += len(blk)
+
+
+async def _read_span(f, length: int, chunk: int):
+    remaining = length
+    while remaining > 0:
+        blk = await f.read(min(chunk, remaining))
+        if not blk:
+            break
+        remaining -= len(blk)
+        yield blk
+
+
 async def _open_stream(full_path: str, start: int, length: int, chunk: int = 1024 * 1024):
     """Async generator yielding up to `length` bytes from `full_path` starting at `start`."""
-    remaining = length
     async with await storage.open(full_path, "rb") as f:
-        if start:
-            try:
-                await f.seek(start)
-            except Exception:
-                # Fallback: discard start bytes if seek isn't supported.
-                discarded = 0
-                while discarded < start:
-                    blk = await f.read(min(chunk, start - discarded))
-                    if not blk:
-                        break
-                    discarded += len(blk)
-        while remaining > 0:
-            blk = await f.read(min(chunk, remaining))
-            if not blk:
-                break
-            remaining -= len(blk)
+        await _seek_forward(f, 0, start, chunk)
+        async for blk in _read_span(f, length, chunk):
             yield blk
 
 
+def _part_header(boundary: str, start: int, end: int, total: int) -> bytes:
+    return (
+        f"--{boundary}\r\nContent-Type: application/octet-stream\r\nContent-Range: bytes {start}-{end}/{total}\r\n\r\n"
+    ).encode("ascii")
+
+
+async def _open_multirange_stream(
+    full_path: str, ranges: List[Tuple[int, int]], total: int, boundary: str, chunk: int = 1024 * 1024
+):
+    """Async generator for a multipart/byteranges body; `ranges` are sorted and disjoint."""
+    position = 0
+    async with await storage.open(full_path, "rb") as f:
+        for start, end in ranges:
+            yield _part_header(boundary, start, end, total)
+            await _seek_forward(f, position, start, chunk)
+            async for blk in _read_span(f, end - start + 1, chunk):
+                yield blk
+            position = end + 1
+            yield b"\r\n"
+    yield f"--{boundary}--\r\n".encode("ascii")
+
+
+def _parse_ranges(range_header: str, total: int) -> Optional[List[Tuple[int, int]]]:
+    """Parse `bytes=a-b,c-,-n` into sorted, merged (start, end) pairs clamped to the file.
+
+    Returns None when the header is malformed, and an empty list when no range
+    overlaps the file (both answer 416).
+    """
+    unit, _, spec = range_header.strip().partition("=")
+    if unit.strip().lower() != "bytes" or not spec:
+        return None
+    ranges: List[Tuple[int, int]] = []
+    for part in spec.split(","):
+        m = _RANGE_SPEC_RE.match(part.strip())
+        if not m or (not m.group(1) and not m.group(2)):
+            return None
+        if not m.group(1):
+            # Suffix range: the last N bytes.
+            suffix = int(m.group(2))
+            if suffix == 0:
+                continue
+            start, end = max(0, total - suffix), total - 1
+        else:
+            start = int(m.group(1))
+            end = int(m.group(2)) if m.group(2) else total - 1
+            if start > end:
+                return None
+            end = min(end, total - 1)
+        if start < total:
+            ranges.append((start, end))
+
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
 async def _file_size(full_path: str) -> int:
     """Get the size of a single file via storage.ls(parent, detail=True)."""
     parent = "/".join(full_path.rstrip("/").split("/")[:-1]) or "/"
@@ -131,22 +206,31 @@ async def _file_size(full_path: str) -> int:
 
 
 async def stream_file(asset_dir: str, relpath: str, range_header: Optional[str]):
-    """Return a StreamingResponse for asset_dir/<relpath>. Honors Range: bytes=N-[M]."""
+    """Return a StreamingResponse for asset_dir/<relpath>. Honors Range: bytes=N-[M][, ...]."""
     safe = _sanitize_relpath(relpath)
     full = storage.join(asset_dir, *safe.split("/"))
     if not await storage.isfile(full):
         raise FileNotFoundError(full)
     total = await _file_size(full)
 
-    if range_header:
-        m = _RANGE_RE.match(range_header.strip())
-        if not m:
-            return Response(status_code=416, headers={"Content-Range": f"bytes */{total}"})
-        start = int(m.group(1))
-        end_str = m.group(2)
-        end = int(end_str) if end_str else total - 1
-        if start >= total or end >= total or start > end:
-            return Response(status_code=416, headers={"Content-Range": f"bytes */{total}"})
+    ranges = _parse_ranges(range_header, total) if range_header else None
+    if range_header and not ranges:
+        return Response(status_code=416, headers={"Content-Range": f"bytes */{total}"})
+
+    if ranges and 1 < len(ranges) <= MAX_RANGES_PER_REQUEST:
+        boundary = uuid.uuid4().hex
+        content_length = sum(
+            len(_part_header(boundary, start, end, total)) + (end - start + 1) + 2 for start, end in ranges
+        ) + len(f"--{boundary}--\r\n")
+        return StreamingResponse(
+            _open_multirange_stream(full, ranges, total, boundary),
+            status_code=206,
+            media_type=f"multipart/byteranges; boundary={boundary}",
+            headers={"Content-Length": str(content_length), "Accept-Ranges": "bytes"},
+        )
+
+    if ranges and len(ranges) == 1:
+        start, end = ranges[0]
         length = end - start + 1
         return StreamingResponse(
             _open_stream(full, start, length),
@@ -20,9 +20,14 @@ asset_groups/
 The actual model / dataset files stay in their original locations.  Version
 entries only store *references* (``asset_id``) pointing to those assets.
 
+Every version-list write is also recorded in a workspace catalogue
+(``lab.asset_catalogue``, one per asset type), which is what
+``get_all_asset_group_map`` reads instead of every group's list.
+
 Group directories are keyed by UUID so the display name is freely editable.
 """
 
+import asyncio
 import json
 import logging
 import re
@@ -30,6 +35,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import Optional
 
+from lab import asset_catalogue
 from lab import storage
 
 from transformerlab.shared.dirs import get_asset_groups_dir
@@ -62,6 +68,10 @@ def _validate_group_id(group_id: str) -> None:
         raise ValueError(f"Invalid group_id: '{group_id}' is not a valid UUID")
 
 
+def _catalogue_name(asset_type: str) -> str:
+    return f"{asset_type}_groups"
+
+
 async def _type_dir(asset_type: str) -> str:
     """Return the type-level directory, creating it if needed."""
     root = await get_asset_groups_dir()
@@ -136,6 +146,21 @@ async def _write_versions(asset_type: str, group_id: str, versions: list[dict])
     filename = _LIST_FILENAME[asset_type]
     path = storage.join(gdir, filename)
     await _write_json(path, {"versions": versions})
+    await asset_catalogue.record_entry(_catalogue_name(asset_type), group_id, {"versions": versions})
+
+
+async def _scan_group_versions(asset_type: str) -> dict[str, dict]:
+    """Read every group's version list; used to (re)build the group catalogue."""
+
+    async def _read(gid: str) -> tuple[str, list[dict] | None]:
+        try:
+            return gid, await _read_versions(asset_type, gid)
+        except (ValueError, OSError) as exc:
+            logger.warning("Skipping group %r (asset_type=%r): %s", gid, asset_type, exc)
+            return gid, None
+
+    results = await asyncio.gather(*(_read(gid) for gid in await _list_group_ids(asset_type)))
+    return {gid: {"versions": versions} for gid, versions in results if versions is not None}
 
 
 def _version_to_dict(v: dict, asset_type: str, group_id: str) -> dict:
@@ -578,6 +603,7 @@ async def _remove_group_dir(asset_type: str, group_id: str) -> None:
             await storage.rm(gdir, recursive=True)
     except Exception:
         pass
+    await asset_catalogue.record_entry(_catalogue_name(asset_type), group_id, None)
 
 
 async def get_groups_for_asset(asset_type: str, asset_id: str) -> list[dict]:
@@ -609,15 +635,17 @@ async def get_all_asset_group_map(asset_type: str) -> dict[str, list[dict]]:
     """
     _validate_asset_type(asset_type)
 
+    groups = await asset_catalogue.load_entries(_catalogue_name(asset_type), lambda: _scan_group_versions(asset_type))
     mapping: dict[str, list[dict]] = {}
-    for gid in await _list_group_ids(asset_type):
-        try:
-            versions = await _read_versions(asset_type, gid)
-        except (ValueError, OSError) as exc:
-            logger.warning("Skipping group %r (asset_type=%r): %s", gid, asset_type, exc)
-            continue
-        for v in versions:
+    for gid, entry in groups.items():
+        for v in entry.get("versions") or []:
             d = _version_to_dict(v, asset_type, gid)
             mapping.setdefault(d["asset_id"], []).append(d)
 
     return mapping
+
+
+async def group_map_etag(asset_type: str) -> Optional[str]:
+    """Return the catalogue head token behind ``get_all_asset_group_map`` (one small read)."""
+    _validate_asset_type(asset_type)
+    return await asset_catalogue.etag(_catalogue_name(asset_type))
@@ -22,7 +22,7 @@ from transformerlab.services.provider_service import get_team_provider, get_prov
 from transformerlab.shared.disk_space_utils import parse_disk_space_gb
 from transformerlab.shared.github_utils import generate_github_clone_setup, read_github_pat_from_workspace
 from transformerlab.shared.models.models import ProviderType
-from lab import storage
+from lab import checkpoint_store, storage
 from lab.dirs import get_job_checkpoints_dir, get_workspace_dir, set_organization_id
 from lab.job_status import JobStatus
 from lab.storage import STORAGE_PROVIDER
@@ -127,7 +127,7 @@ async def resume_remote_job_from_checkpoint(
 
     checkpoints_dir = await get_job_checkpoints_dir(job_id, experiment_id)
     checkpoint_path = storage.join(checkpoints_dir, request.checkpoint)
-    if not await storage.exists(checkpoint_path):
+    if not await checkpoint_store.checkpoint_exists(checkpoint_path):
         raise HTTPException(status_code=404, detail=f"Checkpoint '{request.checkpoint}' not found")
 
     provider = await get_team_provider(session, team_id, provider_id)
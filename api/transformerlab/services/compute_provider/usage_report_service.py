@@ -1,169 +1,343 @@
-"""Aggregate REMOTE job usage for team owners."""
+"""
+Aggregate REMOTE job usage for team owners.
+
+Usage is kept in the compute_usage table, one row per job that ran on a
+provider. record_job_usage() writes a job's row when it reaches a terminal
+state (from job_service's quota hook), mark_jobs_deleted() flags the rows of
+deleted jobs, and backfill_usage() fills the table
+once per team from the experiments' job catalogues. build_usage_report() then
+answers from a handful of indexed queries grouped by user, provider and day
+instead of listing every experiment's jobs and parsing timestamps per request.
+"""
 
 import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as _pg_insert
+from sqlalchemy.dialects.sqlite import insert as _sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+
+from lab.job_status import JobStatus
+from transformerlab.db.constants import DATABASE_TYPE
 from transformerlab.services import job_service
 from transformerlab.services.provider_service import list_team_providers
+from transformerlab.shared.models.models import ComputeUsage
 
 logger = logging.getLogger(__name__)
 
+# Team-level config key set once the team's existing jobs have been backfilled.
+BACKFILL_CONFIG_KEY = "compute_usage_backfilled"
 
-async def build_usage_report(session: AsyncSession, team_id: str) -> Dict[str, Any]:
-    from lab import Experiment
+_dialect_insert = _pg_insert if DATABASE_TYPE == "postgresql" else _sqlite_insert
 
-    existing_provider_ids = set()
-    existing_provider_names = set()
+
+def _parse_time(value: Any) -> datetime:
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return value
+
+
+def usage_row_from_job(job: Dict[str, Any], experiment_id: Optional[str], team_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Build the compute_usage row for a job dict, or None if the job does not count:
+    it must be REMOTE, name a provider, and have start/end times a positive duration apart.
+    """
+    if job.get("type") != "REMOTE":
+        return None
+    job_data = job.get("job_data", {}) or {}
+    if isinstance(job_data, str):
+        try:
+            job_data = json.loads(job_data)
+        except (json.JSONDecodeError, TypeError):
+            job_data = {}
+    if not (job_data.get("provider_id") or job_data.get("provider_name")):
+        return None
+
+    start_time = job_data.get("start_time")
+    end_time = job_data.get("end_time")
+    if not (start_time and end_time):
+        return None
     try:
-        current_providers = await list_team_providers(session, team_id)
-        if current_providers:
-            existing_provider_ids = {str(provider.id) for provider in current_providers if provider.id}
-            existing_provider_names = {provider.name for provider in current_providers if provider.name}
+        start = _parse_time(start_time)
+        duration_seconds = (_parse_time(end_time) - start).total_seconds()
     except Exception as e:
-        logger.exception("Error getting current providers for team %s: %s", team_id, e)
+        logger.debug("Error calculating duration for job %s: %s", job.get("id"), e)
+        return None
+    if duration_seconds <= 0:
+        return None
+
+    user_info = job_data.get("user_info", {}) or {}
+    user_email = user_info.get("email") or "Unknown"
+    provider_id = job_data.get("provider_id")
+    provider_id_str = str(provider_id) if provider_id else None
+    provider_name = job_data.get("provider_name") or "Unknown"
+    return {
+        "team_id": str(team_id),
+        "job_id": str(job.get("id")),
+        "experiment_id": job.get("experiment_id") or experiment_id,
+        "status": job.get("status"),
+        "user_email": user_email,
+        "user_name": user_info.get("name") or user_email,
+        "provider_key": provider_id_str or provider_name,
+        "provider_id": provider_id_str,
+        "provider_name": provider_name,
+        "provider_type": job_data.get("provider_type"),
+        "usage_date": start.date(),
+        "start_time": str(start_time),
+        "end_time": str(end_time),
+        "duration_seconds": duration_seconds,
+        "details": {
+            "resources": {
+                "cpus": job_data.get("cpus"),
+                "memory": job_data.get("memory"),
+                "disk_space": job_data.get("disk_space"),
+                "accelerators": job_data.get("accelerators"),
+                "num_nodes": job_data.get("num_nodes", 1),
+            },
+            "cluster_name": job_data.get("cluster_name"),
+            "task_name": job_data.get("task_name"),
+        },
+    }
+
+
+async def _upsert_row(session: AsyncSession, row: Dict[str, Any]) -> None:
+    stmt = (
+        _dialect_insert(ComputeUsage)
+        .values(**row)
+        .on_conflict_do_update(
+            index_elements=["team_id", "job_id"],
+            set_={**{k: v for k, v in row.items() if k not in ("team_id", "job_id")}, "updated_at": func.now()},
+        )
+    )
+    await session.execute(stmt)
+
+
+async def record_job_usage(
+    session: AsyncSession, job: Dict[str, Any], experiment_id: Optional[str], team_id: Optional[str]
+) -> bool:
+    """
+    Write (or rewrite) a job's usage row. Returns True if a row was written.
+
+    The write runs in a savepoint and is committed with the caller's
+    transaction. Best-effort: a failure only rolls back the savepoint, so the
+    caller's pending work and quota accounting are left alone.
+    """
+    if not team_id:
+        return False
+    row = usage_row_from_job(job, experiment_id, team_id)
+    if row is None:
+        return False
+    try:
+        async with session.begin_nested():
+            await _upsert_row(session, row)
+        return True
+    except Exception:
+        logger.exception("Failed to record compute usage for job %s", job.get("id"))
+        return False
+
+
+async def mark_jobs_deleted(team_id: Optional[str], job_ids: List[str]) -> None:
+    """
+    Flag the usage rows of deleted jobs so they drop out of the report.
+
+    Job deletion does not go through job_update_status, so job_service calls
+    this directly. Uses its own session; best-effort like record_job_usage.
+    """
+    if not team_id or not job_ids:
+        return
+    from transformerlab.db.session import async_session
+
+    try:
+        async with async_session() as session:
+            await session.execute(
+                update(ComputeUsage)
+                .where(ComputeUsage.team_id == str(team_id), ComputeUsage.job_id.in_([str(j) for j in job_ids]))
+                .values(status=JobStatus.DELETED.value, updated_at=func.now())
+            )
+            await session.commit()
+    except Exception:
+        logger.exception("Failed to mark compute usage deleted for jobs %s", job_ids)
+
+
+async def backfill_usage(session: AsyncSession, team_id: str) -> int:
+    """
+    Write usage rows for every existing REMOTE job in the current workspace and
+    mark the team as backfilled. Returns the number of rows written.
+    """
+    from lab import Experiment
+
+    from transformerlab.db.db import config_set
 
     try:
         experiments_data = await Experiment.get_all()
         experiments = [exp.get("id") for exp in experiments_data if exp.get("id")]
     except Exception as e:
         logger.exception("Error getting experiments: %s", e)
-        experiments = []
-
-    remote_jobs: List[Dict[str, Any]] = []
+        return 0
 
+    written = 0
     for experiment_id in experiments:
         try:
             jobs = await job_service.jobs_get_all(experiment_id=experiment_id, type="REMOTE")
-            for job in jobs:
-                job_data = job.get("job_data", {}) or {}
-
-                if isinstance(job_data, str):
-                    try:
-                        job_data = json.loads(job_data)
-                    except (json.JSONDecodeError, TypeError):
-                        job_data = {}
-
-                if job_data.get("provider_id") or job_data.get("provider_name"):
-                    duration_seconds = None
-                    start_time = job_data.get("start_time")
-                    end_time = job_data.get("end_time")
-
-                    if start_time and end_time:
-                        try:
-                            if isinstance(start_time, str):
-                                start = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-                            else:
-                                start = start_time
-                            if isinstance(end_time, str):
-                                end = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
-                            else:
-                                end = end_time
-                            duration_seconds = (end - start).total_seconds()
-                        except Exception as e:
-                            logger.debug("Error calculating duration for job %s: %s", job.get("id"), e)
-
-                    if not (start_time and end_time and duration_seconds is not None and duration_seconds > 0):
-                        continue
-
-                    user_info = job_data.get("user_info", {}) or {}
-                    user_email = user_info.get("email") or "Unknown"
-                    user_name = user_info.get("name") or user_email
-
-                    provider_id = job_data.get("provider_id")
-                    provider_name = job_data.get("provider_name") or "Unknown"
-                    provider_exists = False
-
-                    provider_id_str = str(provider_id) if provider_id else None
-                    if existing_provider_ids or existing_provider_names:
-                        if provider_id_str and provider_id_str in existing_provider_ids:
-                            provider_exists = True
-                        elif provider_name and provider_name in existing_provider_names:
-                            provider_exists = True
-
-                    if not provider_exists and (existing_provider_ids or existing_provider_names):
-                        if provider_id_str or (provider_name and provider_name != "Unknown"):
-                            if provider_name and not provider_name.endswith("(Deleted)"):
-                                provider_name = f"{provider_name} (Deleted)"
-
-                    remote_jobs.append(
-                        {
-                            "job_id": job.get("id"),
-                            "experiment_id": job.get("experiment_id"),
-                            "status": job.get("status"),
-                            "provider_id": provider_id,
-                            "provider_name": provider_name,
-                            "provider_type": job_data.get("provider_type"),
-                            "provider_exists": provider_exists,
-                            "user_email": user_email,
-                            "user_name": user_name,
-                            "start_time": start_time,
-                            "end_time": end_time,
-                            "duration_seconds": duration_seconds,
-                            "resources": {
-                                "cpus": job_data.get("cpus"),
-                                "memory": job_data.get("memory"),
-                                "disk_space": job_data.get("disk_space"),
-                                "accelerators": job_data.get("accelerators"),
-                                "num_nodes": job_data.get("num_nodes", 1),
-                            },
-                            "cluster_name": job_data.get("cluster_name"),
-                            "task_name": job_data.get("task_name"),
-                        }
-                    )
         except Exception as e:
             logger.exception("Error processing jobs for experiment %s: %s", experiment_id, e)
             continue
+        for job in jobs:
+            if await record_job_usage(session, job, experiment_id, team_id):
+                written += 1
+        await session.commit()
 
-    usage_by_user: Dict[str, Dict[str, Any]] = {}
-    for job in remote_jobs:
-        user_email = job["user_email"]
-        if user_email not in usage_by_user:
-            usage_by_user[user_email] = {
-                "user_email": user_email,
-                "user_name": job["user_name"],
-                "total_jobs": 0,
-                "total_duration_seconds": 0,
-                "jobs": [],
-            }
+    await config_set(BACKFILL_CONFIG_KEY, "1", team_id=team_id)
+    logger.info("Backfilled %d compute usage rows for team %s", written, team_id)
+    return written
 
-        usage_by_user[user_email]["total_jobs"] += 1
-        if job["duration_seconds"]:
-            usage_by_user[user_email]["total_duration_seconds"] += job["duration_seconds"]
-        usage_by_user[user_email]["jobs"].append(job)
-
-    usage_by_provider: Dict[str, Dict[str, Any]] = {}
-    for job in remote_jobs:
-        provider_name = job["provider_name"]
-        provider_key = job.get("provider_id") or provider_name
-
-        if provider_key not in usage_by_provider:
-            usage_by_provider[provider_key] = {
-                "provider_name": provider_name,
-                "provider_type": job["provider_type"],
-                "provider_exists": job.get("provider_exists", True),
-                "total_jobs": 0,
-                "total_duration_seconds": 0,
-                "jobs": [],
-            }
 
-        usage_by_provider[provider_key]["total_jobs"] += 1
-        if job["duration_seconds"]:
-            usage_by_provider[provider_key]["total_duration_seconds"] += job["duration_seconds"]
-        usage_by_provider[provider_key]["jobs"].append(job)
+async def build_usage_report(session: AsyncSession, team_id: str) -> Dict[str, Any]:
+    from transformerlab.db.db import config_get
+
+    existing_provider_ids = set()
+    existing_provider_names = set()
+    try:
+        current_providers = await list_team_providers(session, team_id)
+        if current_providers:
+            existing_provider_ids = {str(provider.id) for provider in current_providers if provider.id}
+            existing_provider_names = {provider.name for provider in current_providers if provider.name}
+    except Exception as e:
+        logger.exception("Error getting current providers for team %s: %s", team_id, e)
+
+    if not await config_get(BACKFILL_CONFIG_KEY, team_id=team_id):
+        await backfill_usage(session, team_id)
+
+    def _display_provider(provider_id: Optional[str], provider_name: str) -> tuple[str, bool]:
+        """Return (name shown in the report, whether the provider still exists)."""
+        if not (existing_provider_ids or existing_provider_names):
+            return provider_name, False
+        if (provider_id and provider_id in existing_provider_ids) or (
+            provider_name and provider_name in existing_provider_names
+        ):
+            return provider_name, True
+        if provider_id or (provider_name and provider_name != "Unknown"):
+            if provider_name and not provider_name.endswith("(Deleted)"):
+                return f"{provider_name} (Deleted)", False
+        return provider_name, False
+
+    # Deleted jobs drop out of the report, as they drop out of job listings.
+    counted = (
+        ComputeUsage.team_id == team_id,
+        or_(ComputeUsage.status.is_(None), ComputeUsage.status != JobStatus.DELETED.value),
+    )
+    total_jobs = func.count(ComputeUsage.id).label("total_jobs")
+    total_duration = func.sum(ComputeUsage.duration_seconds).label("total_duration_seconds")
+
+    rows = (
+        (
+            await session.execute(
+                select(ComputeUsage)
+                .where(*counted)
+                .order_by(ComputeUsage.usage_date, ComputeUsage.start_time, ComputeUsage.job_id)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    user_totals = (
+        await session.execute(
+            select(ComputeUsage.user_email, func.max(ComputeUsage.user_name), total_jobs, total_duration)
+            .where(*counted)
+            .group_by(ComputeUsage.user_email)
+            .order_by(total_duration.desc())
+        )
+    ).all()
+    provider_totals = (
+        await session.execute(
+            select(
+                ComputeUsage.provider_key,
+                func.max(ComputeUsage.provider_id),
+                func.max(ComputeUsage.provider_name),
+                func.max(ComputeUsage.provider_type),
+                total_jobs,
+                total_duration,
+            )
+            .where(*counted)
+            .group_by(ComputeUsage.provider_key)
+            .order_by(total_duration.desc())
+        )
+    ).all()
+    day_totals = (
+        await session.execute(
+            select(ComputeUsage.usage_date, total_jobs, total_duration)
+            .where(*counted)
+            .group_by(ComputeUsage.usage_date)
+            .order_by(ComputeUsage.usage_date)
+        )
+    ).all()
 
-    sorted_users = sorted(usage_by_user.values(), key=lambda x: x["total_duration_seconds"], reverse=True)
-    sorted_providers = sorted(usage_by_provider.values(), key=lambda x: x["total_duration_seconds"], reverse=True)
+    remote_jobs: List[Dict[str, Any]] = []
+    jobs_by_user: Dict[str, List[Dict[str, Any]]] = {}
+    jobs_by_provider: Dict[str, List[Dict[str, Any]]] = {}
+    for row in rows:
+        provider_name, provider_exists = _display_provider(row.provider_id, row.provider_name)
+        details = row.details or {}
+        job = {
+            "job_id": row.job_id,
+            "experiment_id": row.experiment_id,
+            "status": row.status,
+            "provider_id": row.provider_id,
+            "provider_name": provider_name,
+            "provider_type": row.provider_type,
+            "provider_exists": provider_exists,
+            "user_email": row.user_email,
+            "user_name": row.user_name,
+            "start_time": row.start_time,
+            "end_time": row.end_time,
+            "duration_seconds": row.duration_seconds,
+            "resources": details.get("resources") or {},
+            "cluster_name": details.get("cluster_name"),
+            "task_name": details.get("task_name"),
+        }
+        remote_jobs.append(job)
+        jobs_by_user.setdefault(row.user_email, []).append(job)
+        jobs_by_provider.setdefault(row.provider_key, []).append(job)
+
+    by_user = [
+        {
+            "user_email": user_email,
+            "user_name": user_name or user_email,
+            "total_jobs": count,
+            "total_duration_seconds": duration or 0,
+            "jobs": jobs_by_user.get(user_email, []),
+        }
+        for user_email, user_name, count, duration in user_totals
+    ]
+    by_provider = []
+    for provider_key, provider_id, provider_name, provider_type, count, duration in provider_totals:
+        display_name, provider_exists = _display_provider(provider_id, provider_name)
+        by_provider.append(
+            {
+                "provider_name": display_name,
+                "provider_type": provider_type,
+                "provider_exists": provider_exists,
+                "total_jobs": count,
+                "total_duration_seconds": duration or 0,
+                "jobs": jobs_by_provider.get(provider_key, []),
+            }
+        )
+    by_day = [
+        {"date": usage_date.isoformat(), "total_jobs": count, "total_duration_seconds": duration or 0}
+        for usage_date, count, duration in day_totals
+    ]
 
     return {
         "summary": {
             "total_jobs": len(remote_jobs),
-            "total_users": len(usage_by_user),
-            "total_providers": len(usage_by_provider),
+            "total_users": len(by_user),
+            "total_providers": len(by_provider),
         },
-        "by_user": sorted_users,
-        "by_provider": sorted_providers,
+        "by_user": by_user,
+        "by_provider": by_provider,
+        "by_day": by_day,
         "all_jobs": remote_jobs,
     }
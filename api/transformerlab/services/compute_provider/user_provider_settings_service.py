@@ -5,7 +5,7 @@ from typing import Any, Dict, Optional
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 import transformerlab.db.db as db
-from transformerlab.services.provider_service import get_team_provider
+from transformerlab.services.provider_service import get_team_provider, invalidate_provider_instances
 from transformerlab.services.user_slurm_key_service import (
     delete_user_slurm_key,
     save_user_slurm_key,
@@ -104,6 +104,8 @@ async def set_user_provider_settings(
             user_id=user_id,
             team_id=team_id,
         )
+    # Cached provider instances carry the old slurm_user / sbatch flags.
+    invalidate_provider_instances(provider_id)
 
     has_ssh_key = False
     if provider.type == ProviderType.SLURM.value:
@@ -143,6 +145,7 @@ async def upload_user_slurm_ssh_key(
 
     try:
         await save_user_slurm_key(team_id, provider_id, user_id, private_key)
+        invalidate_provider_instances(provider_id)
         return {
             "status": "success",
             "provider_id": provider_id,
@@ -166,6 +169,7 @@ async def delete_user_slurm_ssh_key_service(
 
     try:
         await delete_user_slurm_key(team_id, provider_id, user_id)
+        invalidate_provider_instances(provider_id)
         return {
             "status": "success",
             "provider_id": provider_id,
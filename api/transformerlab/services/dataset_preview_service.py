@@ -0,0 +1,402 @@
+"""
+Dataset preview pages served from a local, row-indexed Arrow cache.
+
+``/data/preview`` used to call ``load_dataset`` inside the request handler for
+every page, re-resolving (and for local datasets re-parsing) the whole dataset
+to show a few rows. Instead, each dataset version is converted once, in a
+worker pool of PREVIEW_BUILD_WORKERS threads (TFL_DATASET_PREVIEW_BUILD_WORKERS,
+default 2), into one uncompressed Arrow IPC file per split under
+PREVIEW_CACHE_ROOT:
+
+    <root>/<dataset key>/<version key>/meta.json     splits, row counts, features,
+                                                      and each record batch's first row
+    <root>/<dataset key>/<version key>/<n>.arrow      record batches of BATCH_ROWS rows
+
+A page is read by memory-mapping the split file, picking the record batches that
+cover ``[offset, offset + limit)`` from the stored batch offsets and slicing
+them, so it costs the same at any offset. The last PREVIEW_OPEN_TABLES opened
+splits (TFL_DATASET_PREVIEW_OPEN_TABLES, default 16) are kept in an LRU.
+
+The version key covers the dataset's metadata and, for local datasets, the
+names, sizes and modification times of its top-level files. Editing a dataset
+therefore produces a new version, and older versions of the same dataset are
+removed once it is built. A version directory is only renamed into place after
+its meta.json is written, so concurrent workers never see a partial cache.
+
+Reading a page touches the version's meta.json. After each build, versions are
+evicted least recently read first until the whole cache fits
+PREVIEW_CACHE_MAX_BYTES (TFL_DATASET_PREVIEW_CACHE_MAX_BYTES, default 10 GiB).
+A read that finds its version removed underneath it rebuilds the version once.
+"""
+
+import asyncio
+import bisect
+import contextvars
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+import pyarrow as pa
+from datasets import Dataset as HFDataset, DatasetDict, Features, load_dataset
+
+from lab import dirs, storage
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_CACHE_ROOT = os.getenv(
+    "TFL_DATASET_PREVIEW_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".transformerlab", "cache", "dataset_previews"),
+)
+PREVIEW_BUILD_WORKERS = max(1, int(os.getenv("TFL_DATASET_PREVIEW_BUILD_WORKERS", "2")))
+PREVIEW_OPEN_TABLES = max(1, int(os.getenv("TFL_DATASET_PREVIEW_OPEN_TABLES", "16")))
+PREVIEW_CACHE_MAX_BYTES = max(0, int(os.getenv("TFL_DATASET_PREVIEW_CACHE_MAX_BYTES", str(10 * 1024**3))))
+BATCH_ROWS = 1024
+CACHE_VERSION = 1
+META_NAME = "meta.json"
+
+_build_pool = ThreadPoolExecutor(max_workers=PREVIEW_BUILD_WORKERS, thread_name_prefix="dataset-preview")
+# In-flight builds in this process, keyed by version directory.
+_builds: dict[str, asyncio.Future] = {}
+
+
+class PreviewError(Exception):
+    """A preview request that cannot be served; the message is safe to show to the user."""
+
+
+class _OpenSplit:
+    def __init__(self, reader, offsets: list[int], rows: int, features: Optional[Features]):
+        self.reader = reader
+        self.offsets = offsets
+        self.rows = rows
+        self.features = features
+
+
+_open: "OrderedDict[tuple[str, int], _OpenSplit]" = OrderedDict()
+_open_lock = threading.Lock()
+
+
+def _hash(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:32]
+
+
+def _is_local(metadata: dict) -> bool:
+    return metadata.get("location") == "local"
+
+
+def _hub_load_kwargs(dataset_id: str, metadata: dict) -> dict:
+    json_data = metadata.get("json_data") or {}
+    dataset_config = json_data.get("dataset_config")
+    config_name = json_data.get("config_name")
+    if dataset_config is not None:
+        return {"path": dataset_id, "name": dataset_config}
+    if config_name is not None:
+        return {"path": dataset_id, "name": config_name}
+    return {"path": dataset_id}
+
+
+async def _local_fingerprint(dataset_dir: str) -> list:
+    try:
+        entries = await storage.ls(dataset_dir, detail=True)
+    except Exception:
+        return []
+    fingerprint = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        name = str(entry.get("name", "")).rstrip("/").split("/")[-1]
+        if not name or name == "index.json" or name.startswith("."):
+            continue
+        stamp = entry.get("mtime") or entry.get("LastModified") or entry.get("ETag") or entry.get("etag")
+        fingerprint.append([name, entry.get("size"), entry.get("type"), stamp])
+    return sorted(fingerprint, key=lambda item: item[0])
+
+
+async def _resolve(dataset_id: str, metadata: dict) -> tuple[str, Callable[..., Any]]:
+    """Return (version directory, loader) for a dataset; the loader takes ``streaming``."""
+    from transformerlab.services import dataset_service
+
+    workspace = await dirs.get_workspace_dir()
+    dataset_key = _hash([workspace, dataset_id])
+    if _is_local(metadata):
+        dataset_dir = await dirs.dataset_dir_by_id(dataset_id)
+        if not storage.is_remote_path(dataset_dir):
+            # load_dataset resolves data files against the dataset path, which breaks for relative paths.
+            dataset_dir = os.path.abspath(dataset_dir)
+        version_key = _hash([CACHE_VERSION, metadata, await _local_fingerprint(dataset_dir)])
+
+        def load(streaming: bool = False):
+            # load_local_dataset lists files through lab.storage; run it on this thread's own loop.
+            return asyncio.run(dataset_service.load_local_dataset(dataset_dir, streaming=streaming))
+    else:
+        kwargs = _hub_load_kwargs(dataset_id, metadata)
+        version_key = _hash([CACHE_VERSION, metadata])
+
+        def load(streaming: bool = False):
+            return load_dataset(**kwargs, trust_remote_code=True, streaming=streaming)
+
+    return os.path.join(PREVIEW_CACHE_ROOT, dataset_key, version_key), load
+
+
+def _write_split_sync(dataset: HFDataset, path: str) -> tuple[int, list[int]]:
+    rows = 0
+    offsets: list[int] = []
+    writer = None
+    sink = pa.OSFile(path, "wb")
+    try:
+        for table in dataset.with_format("arrow").iter(batch_size=BATCH_ROWS):
+            for batch in table.to_batches():
+                if batch.num_rows == 0:
+                    continue
+                if writer is None:
+                    writer = pa.ipc.new_file(sink, batch.schema)
+                writer.write_batch(batch)
+                offsets.append(rows)
+                rows += batch.num_rows
+        if writer is None:
+            writer = pa.ipc.new_file(sink, dataset.features.arrow_schema)
+        writer.close()
+    finally:
+        sink.close()
+    return rows, offsets
+
+
+def _build_sync(version_dir: str, load: Callable[..., Any]) -> None:
+    if os.path.exists(os.path.join(version_dir, META_NAME)):
+        return
+    dataset = load()
+    if isinstance(dataset, HFDataset):
+        dataset = DatasetDict({"train": dataset})
+
+    tmp_dir = f"{version_dir}.tmp-{uuid.uuid4().hex}"
+    os.makedirs(tmp_dir)
+    try:
+        splits = {}
+        for index, (name, split) in enumerate(dataset.items()):
+            filename = f"{index}.arrow"
+            rows, offsets = _write_split_sync(split, os.path.join(tmp_dir, filename))
+            splits[name] = {
+                "file": filename,
+                "rows": rows,
+                "offsets": offsets,
+                "features": split.features.to_dict(),
+            }
+        with open(os.path.join(tmp_dir, META_NAME), "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "split_order": list(splits), "splits": splits}, f)
+        try:
+            os.replace(tmp_dir, version_dir)
+        except OSError:
+            # Another worker finished the same version first.
+            if not os.path.exists(os.path.join(version_dir, META_NAME)):
+                raise
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    # Drop older versions of this dataset, then whole versions over the cache budget.
+    parent = os.path.dirname(version_dir)
+    for entry in os.listdir(parent):
+        path = os.path.join(parent, entry)
+        if path != version_dir and ".tmp-" not in entry:
+            _remove_version(path)
+    try:
+        _evict_sync(os.path.dirname(parent), version_dir, PREVIEW_CACHE_MAX_BYTES)
+    except Exception:
+        # Eviction is housekeeping; never fail a preview over it.
+        logger.debug("Dataset preview cache eviction failed", exc_info=True)
+
+
+def _remove_version(version_dir: str) -> None:
+    with _open_lock:
+        for key in [k for k in _open if k[0] == version_dir]:
+            _open.pop(key, None)
+    shutil.rmtree(version_dir, ignore_errors=True)
+
+
+def _dir_size(path: str) -> int:
+    total = 0
+    for dirpath, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, name))
+            except OSError:
+                pass
+    return total
+
+
+def _evict_sync(root: str, keep: str, max_bytes: int) -> None:
+    """Remove least recently read versions, other than keep, until the cache under root fits max_bytes."""
+    versions = []
+    for dataset_key in os.listdir(root):
+        dataset_dir = os.path.join(root, dataset_key)
+        if not os.path.isdir(dataset_dir):
+            continue
+        for entry in os.listdir(dataset_dir):
+            path = os.path.join(dataset_dir, entry)
+            if ".tmp-" in entry or not os.path.isdir(path):
+                continue
+            try:
+                last_read = os.path.getmtime(os.path.join(path, META_NAME))
+            except OSError:
+                last_read = 0.0
+            versions.append((last_read, path, _dir_size(path)))
+    total = sum(size for _, _, size in versions)
+    for _, path, size in sorted(versions):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        _remove_version(path)
+        total -= size
+        try:
+            os.rmdir(os.path.dirname(path))
+        except OSError:
+            pass
+
+
+async def _ensure_built(version_dir: str, load: Callable[..., Any]) -> None:
+    if os.path.exists(os.path.join(version_dir, META_NAME)):
+        return
+    future = _builds.get(version_dir)
+    if future is None:
+        os.makedirs(os.path.dirname(version_dir), exist_ok=True)
+        context = contextvars.copy_context()
+        future = asyncio.get_running_loop().run_in_executor(_build_pool, context.run, _build_sync, version_dir, load)
+        _builds[version_dir] = future
+        future.add_done_callback(lambda _: _builds.pop(version_dir, None))
+    await asyncio.shield(future)
+
+
+def _read_meta_sync(version_dir: str) -> dict:
+    with open(os.path.join(version_dir, META_NAME), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _open_split_sync(version_dir: str, index: int, info: dict) -> _OpenSplit:
+    key = (version_dir, index)
+    with _open_lock:
+        opened = _open.get(key)
+        if opened is not None:
+            _open.move_to_end(key)
+            return opened
+    reader = pa.ipc.open_file(pa.memory_map(os.path.join(version_dir, info["file"]), "r"))
+    try:
+        features = Features.from_dict(info["features"]) if info.get("features") else None
+    except Exception:
+        features = None
+    opened = _OpenSplit(reader, list(info.get("offsets") or []), int(info.get("rows", 0)), features)
+    with _open_lock:
+        _open[key] = opened
+        _open.move_to_end(key)
+        while len(_open) > PREVIEW_OPEN_TABLES:
+            # Buffers already handed out keep their mapping alive; only the reference is dropped.
+            _open.popitem(last=False)
+    return opened
+
+
+def _read_columns_sync(opened: _OpenSplit, offset: int, limit: int) -> dict[str, list]:
+    start = min(offset, opened.rows)
+    end = min(offset + limit, opened.rows)
+    schema = opened.reader.schema
+    if start >= end:
+        return {name: [] for name in schema.names}
+    first = bisect.bisect_right(opened.offsets, start) - 1
+    batches = []
+    index = first
+    while index < len(opened.offsets) and opened.offsets[index] < end:
+        batches.append(opened.reader.get_batch(index))
+        index += 1
+    table = pa.Table.from_batches(batches, schema=schema).slice(start - opened.offsets[first], end - start)
+    columns = table.to_pydict()
+    if opened.features is not None:
+        try:
+            columns = opened.features.decode_batch(columns)
+        except Exception:
+            logger.debug("Could not decode preview features; returning raw values", exc_info=True)
+    return columns
+
+
+def _read_page_sync(
+    version_dir: str, split: Optional[str], offset: int, limit: int, serialize: Optional[Callable]
+) -> dict:
+    meta = _read_meta_sync(version_dir)
+    try:
+        # meta.json's mtime is the version's last read time for LRU eviction.
+        os.utime(os.path.join(version_dir, META_NAME))
+    except OSError:
+        pass
+    split_order = meta.get("split_order") or list(meta.get("splits") or {})
+    if not split_order:
+        raise PreviewError("No splits available in the dataset.")
+    if not split:
+        split = split_order[0]
+    if split not in meta["splits"]:
+        raise PreviewError(f"Split '{split}' does not exist in the dataset.")
+    opened = _open_split_sync(version_dir, split_order.index(split), meta["splits"][split])
+    columns = _read_columns_sync(opened, offset, limit)
+    if serialize is not None:
+        columns = {name: [serialize(value) for value in values] for name, values in columns.items()}
+    return {"split": split, "splits": split_order, "len": opened.rows, "columns": columns}
+
+
+def _stream_page_sync(
+    load: Callable[..., Any], split: Optional[str], offset: int, limit: int, serialize: Optional[Callable]
+) -> dict:
+    dataset = load(streaming=True)
+    splits = list(dataset.keys())
+    if not splits:
+        raise PreviewError("No splits available in the dataset.")
+    if not split:
+        split = splits[0]
+    if split not in splits:
+        raise PreviewError(f"Split '{split}' does not exist in the dataset.")
+    rows = list(dataset[split].skip(offset).take(limit))
+    if serialize is not None:
+        rows = [serialize(row) for row in rows]
+    return {"split": split, "splits": None, "len": -1, "rows": rows}
+
+
+async def read_page(
+    dataset_id: str,
+    metadata: dict,
+    *,
+    split: Optional[str] = None,
+    offset: int = 0,
+    limit: int = 10,
+    streaming: bool = False,
+    serialize: Optional[Callable] = None,
+) -> dict:
+    """
+    Return one page of a dataset split.
+
+    The result has ``split``, ``splits``, ``len`` and ``columns`` ({column: values},
+    features decoded as ``datasets`` would, then passed through ``serialize``).
+    With ``streaming=True`` and no cache built yet, the page is read from a
+    streaming load instead, without converting the dataset, and the result has
+    ``rows`` and ``len == -1`` as before. Raises PreviewError for a missing split;
+    loading errors propagate.
+    """
+    version_dir, load = await _resolve(dataset_id, metadata)
+    if streaming and not os.path.exists(os.path.join(version_dir, META_NAME)):
+        return await asyncio.to_thread(_stream_page_sync, load, split, offset, limit, serialize)
+    await _ensure_built(version_dir, load)
+    try:
+        page = await asyncio.to_thread(_read_page_sync, version_dir, split, offset, limit, serialize)
+    except FileNotFoundError:
+        # Evicted (or replaced by a newer version) between the build check and the read.
+        _remove_version(version_dir)
+        await _ensure_built(version_dir, load)
+        page = await asyncio.to_thread(_read_page_sync, version_dir, split, offset, limit, serialize)
+    if streaming:
+        columns = page.pop("columns")
+        names = list(columns)
+        count = len(columns[names[0]]) if names else 0
+        page["rows"] = [{name: columns[name][i] for name in names} for i in range(count)]
+        page["splits"] = None
+        page["len"] = -1
+    return page
@@ -0,0 +1,179 @@
+"""Background feed that turns job catalogue changes into job events.
+
+Jobs written inside the API process publish on ``lab.job_events`` directly.
+Jobs written elsewhere (remote machines running the SDK, ``tfl-remote-trap``)
+only leave a change object in their experiment's job catalogue. This worker
+tails those change logs from a persisted per-org cursor and republishes them
+on the same bus, so the remote-job-status, sweep-status and notification
+workers can subscribe to transitions instead of rescanning every job.
+
+Cursors live in ``{workspace}/job_events/cursors.json`` so changes written
+while the API was down are replayed on the next start. Each cycle costs one
+listing of the experiments directory plus one listing per experiment, and
+only change objects not read before are fetched. Cursors trail the log by
+``job_catalogue.CHANGE_GRACE_SECONDS`` so late-arriving changes are not
+skipped; the bus drops the repeats by change name.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Dict, List, Optional
+
+from lab import job_catalogue, job_events, storage
+from lab.dirs import get_experiments_dir, get_workspace_dir, set_organization_id as lab_set_org_id
+
+from transformerlab.services import team_service
+
+logger = logging.getLogger(__name__)
+
+JOB_EVENT_FEED_INTERVAL_SECONDS = float(os.getenv("TFL_JOB_EVENT_FEED_INTERVAL_SECONDS", "5"))
+# Subscribers still do a full rescan this often, as a safety net for dropped events.
+JOB_EVENT_RECONCILE_SECONDS = float(os.getenv("TFL_JOB_EVENT_RECONCILE_SECONDS", "600"))
+
+_job_event_feed_task: Optional[asyncio.Task] = None
+
+
+def _set_org_context(org_id: Optional[str]) -> None:
+    if lab_set_org_id is not None:
+        lab_set_org_id(org_id)
+
+
+def _clear_org_context() -> None:
+    _set_org_context(None)
+
+
+async def _cursor_path() -> str:
+    return storage.join(await get_workspace_dir(), "job_events", "cursors.json")
+
+
+async def _load_cursors() -> Dict[str, str]:
+    path = await _cursor_path()
+    try:
+        async with await storage.open(path, "r", encoding="utf-8", uncached=True) as f:
+            data = json.loads(await f.read())
+    except FileNotFoundError:
+        return {}
+    except Exception:
+        logger.warning("Job event feed: unreadable cursor file %s; starting from the end of each log", path)
+        return {}
+    return {str(k): str(v) for k, v in data.items()} if isinstance(data, dict) else {}
+
+
+async def _save_cursors(cursors: Dict[str, str]) -> None:
+    path = await _cursor_path()
+    await storage.makedirs(path.rsplit("/", 1)[0], exist_ok=True)
+    async with await storage.open(path, "w", encoding="utf-8") as f:
+        await f.write(json.dumps(cursors))
+
+
+async def _list_experiment_ids() -> List[str]:
+    experiments_dir = await get_experiments_dir()
+    try:
+        entries = await storage.ls(experiments_dir, detail=False)
+    except Exception:
+        return []
+    names = [str(e).rstrip("/").split("/")[-1] for e in entries]
+    return [n for n in names if n and not n.startswith(".")]
+
+
+async def poll_org_changes_once(org_id: str) -> Dict[str, int]:
+    """Publish catalogue changes for one org since its persisted cursors. Org context must be set."""
+    stats = {"experiments": 0, "events": 0, "errors": 0}
+    cursors = await _load_cursors()
+    updated = dict(cursors)
+
+    for experiment_id in await _list_experiment_ids():
+        stats["experiments"] += 1
+        try:
+            changes, cursor = await job_catalogue.changes_since(experiment_id, cursors.get(experiment_id))
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(f"Job event feed: failed reading changes for experiment {experiment_id}: {exc}")
+            stats["errors"] += 1
+            continue
+        for change_name, jobs in changes:
+            # Synthetic snapshot entries have no stable name to de-duplicate on.
+            synthetic = change_name.startswith("snapshot:")
+            for index, (job_id, job_json) in enumerate(jobs.items()):
+                if not isinstance(job_json, dict):
+                    continue
+                # Job writes record one job per change, published in-process under the change name.
+                event_cursor = None if synthetic else (change_name if index == 0 else f"{change_name}#{job_id}")
+                event = job_events.publish_job_json(experiment_id, job_id, job_json, cursor=event_cursor, org_id=org_id)
+                if event is not None:
+                    stats["events"] += 1
+        updated[experiment_id] = cursor
+
+    if updated != cursors:
+        try:
+            await _save_cursors(updated)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"Job event feed: failed saving cursors for org {org_id}: {exc}")
+            stats["errors"] += 1
+    return stats
+
+
+async def poll_job_changes_once() -> Dict[str, int]:
+    """Single feed cycle across every org."""
+    stats = {"orgs": 0, "experiments": 0, "events": 0, "errors": 0}
+    try:
+        org_ids = await team_service.get_all_team_ids()
+    except Exception as exc:  # noqa: BLE001
+        logger.warning(f"Job event feed: failed listing orgs: {exc}")
+        return stats
+
+    for org_id in org_ids:
+        _set_org_context(org_id)
+        try:
+            stats["orgs"] += 1
+            org_stats = await poll_org_changes_once(org_id)
+            for key, value in org_stats.items():
+                stats[key] += value
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"Job event feed: failed polling org {org_id}: {exc}")
+            stats["errors"] += 1
+        finally:
+            _clear_org_context()
+    return stats
+
+
+async def _job_event_feed_loop() -> None:
+    logger.info("Job event feed: started")
+    try:
+        while True:
+            try:
+                stats = await poll_job_changes_once()
+                if stats["events"] > 0 or stats["errors"] > 0:
+                    logger.debug(
+                        f"Job event feed: cycle done — orgs={stats['orgs']} experiments={stats['experiments']} "
+                        f"events={stats['events']} errors={stats['errors']}"
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(f"Job event feed: unhandled error in cycle, continuing: {exc}")
+            await asyncio.sleep(JOB_EVENT_FEED_INTERVAL_SECONDS)
+    except asyncio.CancelledError:
+        logger.info("Job event feed: stopping")
+        raise
+    finally:
+        _clear_org_context()
+
+
+async def start_job_event_feed() -> None:
+    global _job_event_feed_task
+    if _job_event_feed_task and not _job_event_feed_task.done():
+        return
+    _job_event_feed_task = asyncio.create_task(_job_event_feed_loop(), name="job-event-feed")
+
+
+async def stop_job_event_feed() -> None:
+    global _job_event_feed_task
+    if _job_event_feed_task and not _job_event_feed_task.done():
+        _job_event_feed_task.cancel()
+        try:
+            await _job_event_feed_task
+        except asyncio.CancelledError:
+            pass
+    _job_event_feed_task = None
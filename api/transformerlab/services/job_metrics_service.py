@@ -0,0 +1,583 @@
+"""Columnar sidecar index over a job's ``metrics.jsonl``.
+
+``metrics.jsonl`` is append-only (one JSON row per ``lab.update_progress``
+call), so instead of re-parsing it from the start on every poll we keep a
+compact numpy index next to it::
+
+    <job_dir>/metrics.idx/index.json         chunk list + bytes covered
+    <job_dir>/metrics.idx/chunk-000000.npz   CHUNK_ROWS rows, one array per column
+
+Every chunk stores, per row, the byte offset/length of the line in
+``metrics.jsonl`` (the row-offset index) plus ``step``, ``progress``, ``t``
+(epoch seconds) and one float column per metric. Sealed chunks are immutable
+and only written once; the rows after the last sealed chunk live in memory
+and are rebuilt from at most ``CHUNK_ROWS`` lines after a restart. Each
+refresh only parses bytes appended since the previous one.
+
+Queries:
+  * ``since`` / ``last`` / step ranges resolve row numbers from the index and
+    fetch exactly those lines with one ranged read.
+  * ``max_points`` downsamples server-side (LTTB or min/max buckets) from the
+    numeric columns without touching the JSON at all.
+"""
+
+import asyncio
+import io
+import json
+import logging
+import math
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from lab import storage
+
+logger = logging.getLogger(__name__)
+
+SIDECAR_DIRNAME = "metrics.idx"
+INDEX_FILENAME = "index.json"
+INDEX_VERSION = 1
+CHUNK_ROWS = 16384
+DOWNSAMPLE_METHODS = ("lttb", "minmax")
+
+_READ_BLOCK_BYTES = 8 * 1024 * 1024
+_MAX_CACHED_INDEXES = 64
+_MAX_CACHED_CHUNKS = 256
+
+_BASE_FLOAT_COLUMNS = ("step", "progress", "t")
+
+
+class _ColumnBuffer:
+    """Row-wise accumulator for rows that are not yet part of a sealed chunk."""
+
+    def __init__(self) -> None:
+        self.offset: List[int] = []
+        self.length: List[int] = []
+        self.valid: List[bool] = []
+        self.base: Dict[str, List[float]] = {name: [] for name in _BASE_FLOAT_COLUMNS}
+        self.metrics: Dict[str, List[float]] = {}
+
+    def __len__(self) -> int:
+        return len(self.offset)
+
+    def append(self, offset: int, length: int, row: Optional[dict]) -> None:
+        n = len(self.offset)
+        self.offset.append(offset)
+        self.length.append(length)
+        self.valid.append(row is not None)
+        row = row or {}
+        self.base["step"].append(_as_float(row.get("step")))
+        self.base["progress"].append(_as_float(row.get("progress")))
+        self.base["t"].append(_parse_time(row.get("t")))
+        metrics = row.get("metrics")
+        if isinstance(metrics, dict):
+            for name, value in metrics.items():
+                column = self.metrics.get(name)
+                if column is None:
+                    column = [math.nan] * n
+                    self.metrics[name] = column
+                column.append(_as_float(value))
+        for column in self.metrics.values():
+            if len(column) == n:
+                column.append(math.nan)
+
+    def to_arrays(self, start: int = 0, end: Optional[int] = None) -> Dict[str, Any]:
+        sl = slice(start, end)
+        arrays: Dict[str, Any] = {
+            "offset": np.asarray(self.offset[sl], dtype=np.int64),
+            "length": np.asarray(self.length[sl], dtype=np.int64),
+            "valid": np.asarray(self.valid[sl], dtype=bool),
+        }
+        for name in _BASE_FLOAT_COLUMNS:
+            arrays[name] = np.asarray(self.base[name][sl], dtype=np.float64)
+        arrays["metrics"] = {
+            name: np.asarray(values[sl], dtype=np.float64)
+            for name, values in self.metrics.items()
+            if any(not math.isnan(v) for v in values[sl])
+        }
+        return arrays
+
+    def drop_head(self, count: int) -> None:
+        del self.offset[:count]
+        del self.length[:count]
+        del self.valid[:count]
+        for values in self.base.values():
+            del values[:count]
+        for name in list(self.metrics):
+            del self.metrics[name][:count]
+            if not any(not math.isnan(v) for v in self.metrics[name]):
+                del self.metrics[name]
+
+
+class _MetricsIndex:
+    """In-memory view of one job's sidecar index."""
+
+    def __init__(self, metrics_path: str, chunk_rows: int) -> None:
+        self.metrics_path = metrics_path
+        self.sidecar_dir = storage.join(metrics_path.rsplit("/", 1)[0], SIDECAR_DIRNAME)
+        self.chunk_rows = chunk_rows
+        self.chunks: List[dict] = []
+        self.sealed_offset = 0
+        self.source_offset = 0
+        self.tail = _ColumnBuffer()
+        self.loaded = False
+
+    @property
+    def total_rows(self) -> int:
+        return len(self.chunks) * self.chunk_rows + len(self.tail)
+
+    def reset(self) -> None:
+        self.chunks = []
+        self.sealed_offset = 0
+        self.source_offset = 0
+        self.tail = _ColumnBuffer()
+
+    def chunk_path(self, index: int) -> str:
+        return storage.join(self.sidecar_dir, f"chunk-{index:06d}.npz")
+
+
+_indexes: "OrderedDict[str, _MetricsIndex]" = OrderedDict()
+_chunk_cache: "OrderedDict[Tuple[str, int], Dict[str, Any]]" = OrderedDict()
+# Guards _indexes and _chunk_cache, which worker threads of different queries share.
+_cache_lock = threading.Lock()
+# One lock per metrics path, kept only while a query holds or waits for it.
+_locks: Dict[str, Tuple[asyncio.Lock, int]] = {}
+
+
+def _as_float(value: Any) -> float:
+    if isinstance(value, bool) or value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _parse_time(value: Any) -> float:
+    if not isinstance(value, str) or not value:
+        return math.nan
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return math.nan
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _format_time(value: float) -> Optional[str]:
+    if math.isnan(value):
+        return None
+    return datetime.fromtimestamp(value, tz=timezone.utc).isoformat()
+
+
+def _json_number(value: float) -> Any:
+    if math.isnan(value) or math.isinf(value):
+        return None
+    if value.is_integer():
+        return int(value)
+    return value
+
+
+# ---------------------------------------------------------------------------
+# Index maintenance (sync; always called from a worker thread)
+# ---------------------------------------------------------------------------
+
+
+def _load_persisted(index: _MetricsIndex, fs) -> None:
+    index.loaded = True
+    try:
+        raw = fs.cat_file(storage.join(index.sidecar_dir, INDEX_FILENAME))
+        data = json.loads(raw)
+    except FileNotFoundError:
+        return
+    except Exception:
+        logger.warning("Ignoring unreadable metrics index in %s", index.sidecar_dir, exc_info=True)
+        return
+    if data.get("version") != INDEX_VERSION or data.get("chunk_rows") != index.chunk_rows:
+        return
+    index.chunks = list(data.get("chunks") or [])
+    index.sealed_offset = int(data.get("sealed_offset") or 0)
+    index.source_offset = index.sealed_offset
+
+
+def _persist_index(index: _MetricsIndex, fs) -> None:
+    payload = {
+        "version": INDEX_VERSION,
+        "chunk_rows": index.chunk_rows,
+        "sealed_offset": index.sealed_offset,
+        "chunks": index.chunks,
+    }
+    fs.pipe_file(storage.join(index.sidecar_dir, INDEX_FILENAME), json.dumps(payload).encode("utf-8"))
+
+
+def _seal_chunks(index: _MetricsIndex, fs) -> None:
+    """Move full CHUNK_ROWS blocks from the tail buffer into immutable chunk files."""
+    sealed_any = False
+    while len(index.tail) >= index.chunk_rows:
+        arrays = index.tail.to_arrays(0, index.chunk_rows)
+        metric_names = list(arrays["metrics"].keys())
+        payload = {name: arrays[name] for name in ("offset", "length", "valid", *_BASE_FLOAT_COLUMNS)}
+        for i, name in enumerate(metric_names):
+            payload[f"m{i}"] = arrays["metrics"][name]
+        steps = arrays["step"][~np.isnan(arrays["step"])]
+        chunk_index = len(index.chunks)
+        try:
+            if not storage.is_remote_path(index.sidecar_dir):
+                fs.makedirs(index.sidecar_dir, exist_ok=True)
+            buf = io.BytesIO()
+            np.savez(buf, **payload)
+            fs.pipe_file(index.chunk_path(chunk_index), buf.getvalue())
+        except Exception:
+            # Serving from memory still works; the chunk is re-derived on the next rebuild.
+            logger.warning("Failed to persist metrics chunk %s", index.chunk_path(chunk_index), exc_info=True)
+            return
+        last = index.chunk_rows - 1
+        index.chunks.append(
+            {
+                "rows": index.chunk_rows,
+                "metrics": metric_names,
+                "step_min": float(steps.min()) if steps.size else None,
+                "step_max": float(steps.max()) if steps.size else None,
+            }
+        )
+        index.sealed_offset = int(arrays["offset"][last] + arrays["length"][last])
+        _cache_chunk((index.sidecar_dir, chunk_index), arrays)
+        index.tail.drop_head(index.chunk_rows)
+        sealed_any = True
+    if sealed_any:
+        try:
+            _persist_index(index, fs)
+        except Exception:
+            logger.warning("Failed to persist metrics index in %s", index.sidecar_dir, exc_info=True)
+
+
+def _refresh_sync(index: _MetricsIndex, fs) -> None:
+    if not index.loaded:
+        _load_persisted(index, fs)
+
+    size = fs.size(index.metrics_path)
+    if size < index.source_offset:
+        # metrics.jsonl was truncated or rewritten: rebuild from scratch.
+        index.reset()
+        with _cache_lock:
+            for key in [k for k in _chunk_cache if k[0] == index.sidecar_dir]:
+                _chunk_cache.pop(key, None)
+
+    while index.source_offset < size:
+        block_end = min(size, index.source_offset + _READ_BLOCK_BYTES)
+        block = fs.cat_file(index.metrics_path, start=index.source_offset, end=block_end)
+        cut = block.rfind(b"\n")
+        while cut < 0 and block_end < size:
+            # A single line longer than the read block: keep reading until it ends.
+            block_end = min(size, block_end + _READ_BLOCK_BYTES)
+            block = fs.cat_file(index.metrics_path, start=index.source_offset, end=block_end)
+            cut = block.rfind(b"\n")
+        if cut < 0:
+            # Trailing partial line still being written; pick it up next time.
+            break
+        position = index.source_offset
+        for line in block[: cut + 1].splitlines(keepends=True):
+            stripped = line.strip()
+            row = None
+            if stripped:
+                try:
+                    parsed = json.loads(stripped)
+                    row = parsed if isinstance(parsed, dict) else None
+                except ValueError:
+                    row = None
+            index.tail.append(position, len(line), row)
+            position += len(line)
+        index.source_offset = position
+        _seal_chunks(index, fs)
+
+
+def _cache_chunk(key: Tuple[str, int], arrays: Dict[str, Any]) -> None:
+    with _cache_lock:
+        _chunk_cache[key] = arrays
+        _chunk_cache.move_to_end(key)
+        while len(_chunk_cache) > _MAX_CACHED_CHUNKS:
+            _chunk_cache.popitem(last=False)
+
+
+def _load_chunk(index: _MetricsIndex, fs, chunk_index: int) -> Dict[str, Any]:
+    key = (index.sidecar_dir, chunk_index)
+    with _cache_lock:
+        cached = _chunk_cache.get(key)
+        if cached is not None:
+            _chunk_cache.move_to_end(key)
+            return cached
+    meta = index.chunks[chunk_index]
+    with np.load(io.BytesIO(fs.cat_file(index.chunk_path(chunk_index)))) as npz:
+        arrays: Dict[str, Any] = {name: npz[name] for name in ("offset", "length", "valid", *_BASE_FLOAT_COLUMNS)}
+        arrays["metrics"] = {name: npz[f"m{i}"] for i, name in enumerate(meta.get("metrics") or [])}
+    _cache_chunk(key, arrays)
+    return arrays
+
+
+def _iter_segments(
+    index: _MetricsIndex,
+    fs,
+    start: int,
+    end: int,
+    step_min: Optional[float],
+    step_max: Optional[float],
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (first_row, arrays) for every chunk overlapping [start, end), sliced to that range."""
+    rows_per_chunk = index.chunk_rows
+    for chunk_index, meta in enumerate(index.chunks):
+        chunk_start = chunk_index * rows_per_chunk
+        chunk_end = chunk_start + rows_per_chunk
+        if chunk_end <= start or chunk_start >= end:
+            continue
+        # Skip whole chunks outside the requested step range using the chunk summary.
+        if step_min is not None and meta.get("step_max") is not None and meta["step_max"] < step_min:
+            continue
+        if step_max is not None and meta.get("step_min") is not None and meta["step_min"] > step_max:
+            continue
+        arrays = _load_chunk(index, fs, chunk_index)
+        lo, hi = max(start, chunk_start) - chunk_start, min(end, chunk_end) - chunk_start
+        yield chunk_start + lo, _slice_arrays(arrays, lo, hi)
+
+    tail_start = len(index.chunks) * rows_per_chunk
+    if len(index.tail) and end > tail_start:
+        lo = max(start, tail_start) - tail_start
+        hi = min(end, index.total_rows) - tail_start
+        yield tail_start + lo, index.tail.to_arrays(lo, hi)
+
+
+def _slice_arrays(arrays: Dict[str, Any], lo: int, hi: int) -> Dict[str, Any]:
+    sliced = {name: value[lo:hi] for name, value in arrays.items() if name != "metrics"}
+    sliced["metrics"] = {name: value[lo:hi] for name, value in arrays["metrics"].items()}
+    return sliced
+
+
+def _select(
+    index: _MetricsIndex,
+    fs,
+    start: int,
+    step_min: Optional[float],
+    step_max: Optional[float],
+    metric_names: Optional[List[str]],
+) -> Dict[str, Any]:
+    """Concatenate the columns of valid rows in [start, total) matching the step range."""
+    parts: List[Dict[str, Any]] = []
+    for first_row, arrays in _iter_segments(index, fs, start, index.total_rows, step_min, step_max):
+        mask = arrays["valid"].copy()
+        if step_min is not None:
+            mask &= arrays["step"] >= step_min
+        if step_max is not None:
+            mask &= arrays["step"] <= step_max
+        if not mask.any():
+            continue
+        n = len(mask)
+        selected = {name: value[mask] for name, value in arrays.items() if name != "metrics"}
+        selected["row"] = (np.arange(n, dtype=np.int64) + first_row)[mask]
+        selected["metrics"] = {
+            name: value[mask]
+            for name, value in arrays["metrics"].items()
+            if metric_names is None or name in metric_names
+        }
+        selected["n"] = int(mask.sum())
+        parts.append(selected)
+
+    total = sum(p["n"] for p in parts)
+    result: Dict[str, Any] = {"n": total}
+    for name in ("row", "offset", "length", *_BASE_FLOAT_COLUMNS):
+        result[name] = np.concatenate([p[name] for p in parts]) if parts else np.empty(0)
+    names: List[str] = []
+    for part in parts:
+        for name in part["metrics"]:
+            if name not in names:
+                names.append(name)
+    result["metrics"] = {
+        name: np.concatenate([p["metrics"].get(name, np.full(p["n"], np.nan)) for p in parts]) for name in names
+    }
+    return result
+
+
+def _read_rows(index: _MetricsIndex, fs, selected: Dict[str, Any], metric_names: Optional[List[str]]) -> List[dict]:
+    """Fetch the original JSON rows for the selected row offsets with a single ranged read."""
+    if selected["n"] == 0:
+        return []
+    offsets, lengths = selected["offset"], selected["length"]
+    span_start = int(offsets[0])
+    span_end = int(offsets[-1] + lengths[-1])
+    blob = fs.cat_file(index.metrics_path, start=span_start, end=span_end)
+    rows: List[dict] = []
+    for offset, length in zip(offsets.tolist(), lengths.tolist()):
+        rel = offset - span_start
+        try:
+            row = json.loads(blob[rel : rel + length])
+        except ValueError:
+            continue
+        if metric_names is not None and isinstance(row.get("metrics"), dict):
+            row["metrics"] = {k: v for k, v in row["metrics"].items() if k in metric_names}
+        rows.append(row)
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Downsampling
+# ---------------------------------------------------------------------------
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: indices of ``n_out`` points preserving the visual shape."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    every = (n - 2) / (n_out - 2)
+    selected = [0]
+    a = 0
+    for i in range(n_out - 2):
+        avg_start = int(math.floor((i + 1) * every)) + 1
+        avg_end = min(int(math.floor((i + 2) * every)) + 1, n)
+        if avg_start >= avg_end:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+        else:
+            avg_x, avg_y = x[avg_start:avg_end].mean(), y[avg_start:avg_end].mean()
+        range_start = int(math.floor(i * every)) + 1
+        range_end = int(math.floor((i + 1) * every)) + 1
+        bx, by = x[range_start:range_end], y[range_start:range_end]
+        area = np.abs((x[a] - avg_x) * (by - y[a]) - (x[a] - bx) * (avg_y - y[a]))
+        a = range_start + int(np.argmax(area))
+        selected.append(a)
+    selected.append(n - 1)
+    return np.asarray(selected, dtype=np.int64)
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Keep the min and max of each of ``n_out // 2`` equal-width buckets (plus the endpoints)."""
+    n = len(y)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+    edges = np.linspace(0, n, n_out // 2 + 1).astype(np.int64)
+    selected = {0, n - 1}
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        if hi <= lo:
+            continue
+        bucket = y[lo:hi]
+        selected.add(int(lo + np.argmin(bucket)))
+        selected.add(int(lo + np.argmax(bucket)))
+    return np.asarray(sorted(selected), dtype=np.int64)
+
+
+def _downsample(selected: Dict[str, Any], max_points: int, method: str) -> List[dict]:
+    n = selected["n"]
+    if n == 0:
+        return []
+    x = np.where(np.isnan(selected["step"]), selected["row"].astype(np.float64), selected["step"])
+    keep = np.zeros(n, dtype=bool)
+    series = selected["metrics"] or {"progress": selected["progress"]}
+    for values in series.values():
+        finite = np.flatnonzero(np.isfinite(values))
+        if finite.size == 0:
+            continue
+        if method == "minmax":
+            picked = minmax_indices(values[finite], max_points)
+        else:
+            picked = lttb_indices(x[finite], values[finite], max_points)
+        keep[finite[picked]] = True
+
+    rows: List[dict] = []
+    for i in np.flatnonzero(keep).tolist():
+        row: Dict[str, Any] = {"row": int(selected["row"][i]), "progress": _json_number(float(selected["progress"][i]))}
+        t = _format_time(float(selected["t"][i]))
+        if t is not None:
+            row["t"] = t
+        step = _json_number(float(selected["step"][i]))
+        if step is not None:
+            row["step"] = step
+        metrics = {}
+        for name, values in selected["metrics"].items():
+            value = _json_number(float(values[i]))
+            if value is not None:
+                metrics[name] = value
+        if metrics:
+            row["metrics"] = metrics
+        rows.append(row)
+    return rows
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+async def _get_index(metrics_path: str) -> Tuple[_MetricsIndex, Any]:
+    with _cache_lock:
+        index = _indexes.get(metrics_path)
+        if index is None or index.chunk_rows != CHUNK_ROWS:
+            index = _MetricsIndex(metrics_path, CHUNK_ROWS)
+            _indexes[metrics_path] = index
+        _indexes.move_to_end(metrics_path)
+        while len(_indexes) > _MAX_CACHED_INDEXES:
+            _indexes.popitem(last=False)
+    fs = await storage._get_uncached_filesystem(metrics_path)
+    return index, fs
+
+
+@asynccontextmanager
+async def _path_lock(metrics_path: str) -> AsyncIterator[None]:
+    lock, users = _locks.get(metrics_path, (None, 0))
+    if lock is None:
+        lock = asyncio.Lock()
+    _locks[metrics_path] = (lock, users + 1)
+    try:
+        async with lock:
+            yield
+    finally:
+        lock, users = _locks[metrics_path]
+        if users > 1:
+            _locks[metrics_path] = (lock, users - 1)
+        else:
+            del _locks[metrics_path]
+
+
+def empty_result() -> Dict[str, Any]:
+    """The ``query_metrics`` result for a job that has not written any metrics yet."""
+    return {"count": 0, "rows": [], "total_rows": 0}
+
+
+async def query_metrics(
+    metrics_path: str,
+    since: int = 0,
+    last: Optional[int] = None,
+    step_min: Optional[float] = None,
+    step_max: Optional[float] = None,
+    metrics: Optional[List[str]] = None,
+    max_points: Optional[int] = None,
+    method: str = "lttb",
+) -> Dict[str, Any]:
+    """
+    Query rows of ``metrics_path`` through its sidecar index.
+
+    Returns ``{"count": N, "rows": [...], "total_rows": T}`` where ``total_rows``
+    is the number of lines indexed so far (pass it back as ``since`` to poll).
+    Without ``max_points`` the rows are the original JSON objects; with it the
+    rows are rebuilt from the numeric columns and carry their ``row`` number.
+    """
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unknown downsample method '{method}'")
+
+    async with _path_lock(metrics_path):
+        index, fs = await _get_index(metrics_path)
+        await asyncio.to_thread(_refresh_sync, index, fs)
+
+        def _query() -> Dict[str, Any]:
+            total = index.total_rows
+            start = max(0, since)
+            if last is not None:
+                start = max(start, total - last)
+            selected = _select(index, fs, start, step_min, step_max, metrics)
+            if max_points is not None and selected["n"] > max_points:
+                rows = _downsample(selected, max_points, method)
+            else:
+                rows = _read_rows(index, fs, selected, metrics)
+            return {"count": len(rows), "rows": rows, "total_rows": total}
+
+        return await asyncio.to_thread(_query)
@@ -6,7 +6,7 @@ import time
 from typing import List, Dict, Optional, Any
 
 from lab import Experiment, Job
-from lab import storage
+from lab import job_catalogue, storage
 
 from lab.job_status import JobStatus, TERMINAL_STATUSES
 from transformerlab.services.cache_service import cache
@@ -109,7 +109,36 @@ async def job_create(type, status, experiment_id, job_data="{}"):
     return job.id
 
 
-async def jobs_get_all(experiment_id, type="", status=""):
+async def jobs_get_all(experiment_id, type="", status="", limit: Optional[int] = None, offset: int = 0):
+    """
+    List an experiment's jobs, newest first, optionally filtered by type/status and paged.
+
+    Jobs come from the experiment's job catalogue (lab.job_catalogue): one
+    snapshot read plus the recent change log instead of one index.json read
+    per job. If the catalogue cannot be loaded we fall back to hydrating each
+    job individually.
+    """
+    try:
+        catalogue = await job_catalogue.load_jobs(experiment_id)
+    except Exception:
+        logger.exception("jobs_get_all: job catalogue unavailable for experiment=%s; hydrating jobs", experiment_id)
+        jobs = await _jobs_get_all_hydrated(experiment_id, type, status)
+    else:
+        jobs = []
+        for job_id, job_data in catalogue.items():
+            listed = _filter_job_for_list(experiment_id, job_id, dict(job_data), type, status)
+            if listed is not None:
+                jobs.append(listed)
+
+    jobs.sort(key=_sort_key_job_recency, reverse=True)
+    if offset:
+        jobs = jobs[offset:]
+    if limit is not None:
+        jobs = jobs[:limit]
+    return jobs
+
+
+async def _jobs_get_all_hydrated(experiment_id, type="", status="") -> list[dict[str, Any]]:
     job_ids = await _list_experiment_job_ids(experiment_id)
     if not job_ids:
         return []
@@ -147,7 +176,6 @@ async def jobs_get_all(experiment_id, type="", status=""):
         )
         logger.debug("jobs_get_all failed job ids for experiment=%s: %s", experiment_id, failed_job_ids)
 
-    jobs.sort(key=_sort_key_job_recency, reverse=True)
     return jobs
 
 
@@ -241,6 +269,12 @@ async def _job_for_list(
     job_data = await job_get_cached(job_id=job_id, experiment_id=experiment_id, resolve_full_id=False)
     if not job_data:
         return None
+    return _filter_job_for_list(experiment_id, job_id, job_data, type_filter, status_filter)
+
+
+def _filter_job_for_list(
+    experiment_id: str, job_id: str, job_data: Dict[str, Any], type_filter: str, status_filter: str
+) -> Optional[Dict[str, Any]]:
     if type_filter and job_data.get("type") != type_filter:
         return None
     if status_filter and job_data.get("status") != status_filter:
@@ -348,6 +382,14 @@ async def job_count_running():
     return await Job.count_running_jobs()
 
 
+async def _mark_usage_deleted(job_ids: List[str]) -> None:
+    """Deletes bypass job_update_status, so drop the jobs from the usage report here."""
+    from lab.dirs import get_organization_id
+    from transformerlab.services.compute_provider import usage_report_service
+
+    await usage_report_service.mark_jobs_deleted(get_organization_id(), job_ids)
+
+
 async def job_delete_all(experiment_id) -> int:
     """Soft-delete all jobs in an experiment.
 
@@ -364,6 +406,7 @@ async def job_delete_all(experiment_id) -> int:
 
     experiment = Experiment(experiment_id)
     await experiment.delete_all_jobs()
+    await _mark_usage_deleted(job_ids)
 
     for job_id in job_ids:
         try:
@@ -386,6 +429,7 @@ async def job_delete(job_id, experiment_id):
 
     job = await Job.get(actual_id, experiment_id)
     await job.delete()
+    await _mark_usage_deleted([actual_id])
 
     # Invalidate cache so subsequent listings/reads see the DELETED status.
     try:
@@ -618,6 +662,8 @@ async def _track_quota_for_job_status_change(
             # Create a new session for quota tracking
             async with async_session() as new_session:
                 await _record_quota_usage_internal(new_session, job_id, job_dict, final_status, experiment_id)
+                # Commit the usage row even on paths where quota accounting returns early.
+                await new_session.commit()
     except Exception as e:
         print(f"Error in quota tracking background task for job {job_id}: {e}")
 
@@ -629,6 +675,8 @@ async def _record_quota_usage_internal(
     Internal helper to record quota usage. Assumes session is already provided.
     """
     from transformerlab.services import quota_service
+    from lab.dirs import get_organization_id
+    from transformerlab.services.compute_provider import usage_report_service
     from transformerlab.db import user as db_user
 
     job_type = job_dict.get("type")
@@ -636,6 +684,11 @@ async def _record_quota_usage_internal(
         return
 
     job_data = job_dict.get("job_data") or {}
+
+    # The usage report counts every provider job, with or without quota tracking.
+    await usage_report_service.record_job_usage(
+        session, job_dict, experiment_id, job_data.get("team_id") or get_organization_id()
+    )
     user_info = job_data.get("user_info") or {}
     user_email = user_info.get("email")
     if not user_email:
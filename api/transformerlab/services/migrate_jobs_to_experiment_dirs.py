@@ -20,7 +20,7 @@ import logging
 from typing import Any, Optional
 
 from lab.dirs import get_workspace_dir, set_organization_id as lab_set_org_id
-from lab import storage
+from lab import job_catalogue, storage
 
 from transformerlab.services import team_service
 
@@ -203,6 +203,9 @@ async def _migrate_org_jobs(org_id: str) -> dict[str, Any]:
                 logger.info(f"Jobs migration: org {org_id}: delete {jobs_json_path}")
                 await storage.rm_tree(jobs_json_path)
                 removed_jobs_json += 1
+            if moved_jobs:
+                # Moved job dirs never went through Job._set_json_data; re-scan so listings see them.
+                await job_catalogue.rebuild(exp_id)
 
         # Backward-compat: remove legacy top-level workspace/jobs.json if present.
         legacy_jobs_json = storage.join(workspace_dir, "jobs.json")
@@ -4,6 +4,7 @@ model_service.py
 Service layer for working with models.
 """
 
+import hashlib
 import shutil
 import posixpath
 import logging
@@ -17,6 +18,27 @@ from lab.dirs import get_models_dir
 logger = logging.getLogger(__name__)
 
 
+async def filesystem_etag() -> str:
+    """
+    Token for the filesystem state list_installed_models reads besides the model catalogue.
+
+    ``stored_in_filesystem`` and ``local_path`` depend on which model directories exist
+    and on the files directly inside them, so the token hashes the models directory
+    listing with each entry's modification time (where the backend reports one).
+    """
+    models_dir = await get_models_dir()
+    try:
+        entries = await storage.ls(models_dir, detail=True)
+    except FileNotFoundError:
+        entries = []
+    h = hashlib.sha256()
+    for entry in sorted((e for e in entries if isinstance(e, dict)), key=lambda e: str(e.get("name", ""))):
+        name = posixpath.basename(str(entry.get("name", "")).rstrip("/"))
+        mtime = entry.get("mtime") or entry.get("LastModified") or entry.get("last_modified") or ""
+        h.update(f"{name}\0{mtime}\n".encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
 async def list_installed_models() -> list:
     """Get a list of installed models with filesystem metadata attached."""
 
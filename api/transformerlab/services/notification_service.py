@@ -2,13 +2,15 @@
 
 Follows the same pattern as remote_job_status_service.py.
 
-Runs every NOTIFICATION_WORKER_INTERVAL_SECONDS (default 30s). For each org,
-iterates experiments, finds COMPLETE/FAILED/STOPPED jobs that have
-created_by_user_id in job_data but no notification_sent flag, and POSTs a
-rich JSON payload to the user's configured webhook URL.
-
-Key design note: jobs_get_all reads from a cached jobs.json and will NOT
-reflect freshly-written job_data fields. We always re-read each candidate job
+Subscribes to COMPLETE/FAILED/STOPPED transitions on lab.job_events and, for
+jobs that have created_by_user_id in job_data but no notification_sent flag,
+POSTs a rich JSON payload to the user's configured webhook URL. A full scan of
+every org/experiment runs at startup and every JOB_EVENT_RECONCILE_SECONDS
+(default 10 min) to catch anything the event feed missed.
+NOTIFICATION_WORKER_INTERVAL_SECONDS is the back-off after an unexpected error.
+
+Key design note: jobs_get_all reads from the experiment's job catalogue and
+may lag freshly-written job_data fields. We always re-read each candidate job
 via job_service.job_get (uncached individual file read) before checking
 notification_sent, so we never double-send.
 """
@@ -16,11 +18,12 @@ notification_sent, so we never double-send.
 import asyncio
 import os
 import logging
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import httpx
-from lab import Experiment
+from lab import Experiment, job_events
 from lab.dirs import set_organization_id as lab_set_org_id
 from lab.job_status import JobStatus
 from urllib.parse import urlparse
@@ -28,6 +31,7 @@ from urllib.parse import urlparse
 
 import transformerlab.db.db as db
 from transformerlab.services import job_service, team_service
+from transformerlab.services.job_event_service import JOB_EVENT_RECONCILE_SECONDS
 
 logger = logging.getLogger(__name__)
 
@@ -244,9 +248,37 @@ async def _process_notification(job: Dict[str, Any], experiment_id: str, org_id:
 # ---------------------------------------------------------------------------
 
 
+async def _notify_if_pending(job_id: str, experiment_id: str, org_id: str, stats: Dict[str, int]) -> bool:
+    """Send the notification for one terminal job unless it was already sent. Org context must be set.
+
+    Returns True once the job needs no further attention this cycle.
+    """
+    # IMPORTANT: listings and events may lag freshly-written job_data fields.
+    # Always re-read uncached so we see the current notification_sent.
+    job = await job_service.job_get(job_id, experiment_id=experiment_id)
+    if not job:
+        return False
+
+    job_data = job.get("job_data") or {}
+    if job_data.get("notification_sent"):
+        return True  # already notified
+
+    stats["jobs_seen"] += 1
+    try:
+        await _process_notification(job, experiment_id, org_id)
+        stats["jobs_notified"] += 1
+        return True
+    except Exception as exc:  # noqa: BLE001
+        logger.warning(f"Notification worker: error processing job {job_id}: {exc}")
+        stats["errors"] += 1
+        return False
+
+
 async def process_pending_notifications_once() -> Dict[str, int]:
-    """Single cycle: find terminal jobs missing notification_sent and notify.
+    """Full reconcile: find terminal jobs missing notification_sent and notify.
 
+    Runs at startup and every JOB_EVENT_RECONCILE_SECONDS as a safety net; in
+    between, the worker reacts to job events (see process_job_events).
     Returns cycle statistics for logging.
     """
     stats: Dict[str, int] = {
@@ -261,59 +293,27 @@ async def process_pending_notifications_once() -> Dict[str, int]:
     for org_id in org_ids:
         _set_org_context(org_id)
         try:
-            # Track jobs we've already evaluated in this cycle for the current org/experiment.
-            # This ensures we don't call _process_notification multiple times for the same job
-            # when iterating over multiple terminal statuses. In production, jobs_get_all is
-            # typically disjoint per-status, but tests may return the same job for each status.
-            processed_job_ids_for_org: Dict[str, set[str]] = {}
-
             stats["orgs"] += 1
             experiment_ids = await _list_experiment_ids_for_current_org()
 
             for experiment_id in experiment_ids:
-                processed_job_ids = processed_job_ids_for_org.setdefault(experiment_id, set())
-
-                for status in TERMINAL_STATUSES:
-                    try:
-                        job_summaries = await job_service.jobs_get_all(experiment_id, status=status)
-                    except Exception as exc:  # noqa: BLE001
-                        logger.warning(
-                            f"Notification worker: failed listing jobs for exp {experiment_id} status {status}: {exc}",
-                        )
-                        stats["errors"] += 1
+                # One listing per experiment; terminal statuses are filtered here.
+                try:
+                    job_summaries = await job_service.jobs_get_all(experiment_id)
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning(f"Notification worker: failed listing jobs for exp {experiment_id}: {exc}")
+                    stats["errors"] += 1
+                    continue
+
+                processed_job_ids: set[str] = set()
+                for job_summary in job_summaries:
+                    job_id = str(job_summary.get("id", ""))
+                    if not job_id or job_id in processed_job_ids:
                         continue
-
-                    for job_summary in job_summaries:
-                        job_id = str(job_summary.get("id", ""))
-                        if not job_id:
-                            continue
-
-                        # Skip jobs we've already handled for this experiment in this cycle,
-                        # regardless of status. This makes the worker idempotent across the
-                        # TERMINAL_STATUSES loop and matches test expectations.
-                        if job_id in processed_job_ids:
-                            continue
-
-                        # IMPORTANT: jobs_get_all reads from a cached jobs.json that
-                        # does NOT reflect freshly-written job_data fields.
-                        # Always re-read uncached so we see the current notification_sent.
-                        job = await job_service.job_get(job_id, experiment_id=experiment_id)
-                        if not job:
-                            continue
-
-                        job_data = job.get("job_data") or {}
-                        if job_data.get("notification_sent"):
-                            processed_job_ids.add(job_id)
-                            continue  # already notified
-
-                        stats["jobs_seen"] += 1
-                        try:
-                            await _process_notification(job, experiment_id, org_id)
-                            processed_job_ids.add(job_id)
-                            stats["jobs_notified"] += 1
-                        except Exception as exc:  # noqa: BLE001
-                            logger.warning(f"Notification worker: error processing job {job_id}: {exc}")
-                            stats["errors"] += 1
+                    if job_summary.get("status") not in TERMINAL_STATUSES:
+                        continue
+                    if await _notify_if_pending(job_id, experiment_id, org_id, stats):
+                        processed_job_ids.add(job_id)
 
         finally:
             _clear_org_context()
@@ -321,34 +321,69 @@ async def process_pending_notifications_once() -> Dict[str, int]:
     return stats
 
 
+async def process_job_events(events: List[job_events.JobEvent]) -> Dict[str, int]:
+    """Notify for jobs that just reached a terminal status. Work scales with the number of events."""
+    stats: Dict[str, int] = {"orgs": 0, "jobs_seen": 0, "jobs_notified": 0, "errors": 0}
+    seen: set[tuple] = set()
+    for event in events:
+        key = (event.org_id, event.experiment_id, event.job_id)
+        if event.status not in TERMINAL_STATUSES or key in seen:
+            continue
+        seen.add(key)
+        _set_org_context(event.org_id)
+        try:
+            await _notify_if_pending(event.job_id, event.experiment_id, event.org_id or "", stats)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"Notification worker: error handling event for job {event.job_id}: {exc}")
+            stats["errors"] += 1
+        finally:
+            _clear_org_context()
+    return stats
+
+
 # ---------------------------------------------------------------------------
 # Worker lifecycle
 # ---------------------------------------------------------------------------
 
 
+def _log_cycle(stats: Dict[str, int]) -> None:
+    if stats["jobs_seen"] > 0 or stats["errors"] > 0:
+        logger.debug(
+            "Notification worker: cycle done — "
+            f"orgs={stats['orgs']} "
+            f"jobs_seen={stats['jobs_seen']} "
+            f"jobs_notified={stats['jobs_notified']} "
+            f"errors={stats['errors']}",
+        )
+
+
 async def _notification_worker_loop() -> None:
     logger.info("Notification worker: started")
+    subscription = job_events.subscribe(statuses=TERMINAL_STATUSES)
+    last_reconcile: Optional[float] = None
     try:
         while True:
             try:
-                stats = await process_pending_notifications_once()
-                if stats["jobs_seen"] > 0 or stats["errors"] > 0:
-                    logger.debug(
-                        "Notification worker: cycle done — "
-                        f"orgs={stats['orgs']} "
-                        f"jobs_seen={stats['jobs_seen']} "
-                        f"jobs_notified={stats['jobs_notified']} "
-                        f"errors={stats['errors']}",
-                    )
+                now = time.monotonic()
+                if last_reconcile is None or now - last_reconcile >= JOB_EVENT_RECONCILE_SECONDS:
+                    last_reconcile = now
+                    subscription.drain()
+                    _log_cycle(await process_pending_notifications_once())
+                else:
+                    remaining = JOB_EVENT_RECONCILE_SECONDS - (now - last_reconcile)
+                    event = await subscription.get(timeout=remaining)
+                    if event is not None:
+                        _log_cycle(await process_job_events([event, *subscription.drain()]))
             except asyncio.CancelledError:
                 raise
             except Exception as exc:  # noqa: BLE001
                 logger.debug(f"Notification worker: unhandled error in cycle, continuing: {exc}")
-            await asyncio.sleep(NOTIFICATION_WORKER_INTERVAL_SECONDS)
+                await asyncio.sleep(NOTIFICATION_WORKER_INTERVAL_SECONDS)
     except asyncio.CancelledError:
         logger.info("Notification worker: stopping")
         raise
     finally:
+        subscription.close()
         # Ensure org context is always cleared when the worker stops
         _clear_org_context()
 
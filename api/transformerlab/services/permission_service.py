@@ -10,8 +10,18 @@ Lookup priority (most specific wins):
   3. Type wildcard  (user, team, resource_type, "*")
   4. Global wildcard(user, team, "*",           "*")
   5. No record      → allow
+
+To evaluate many resources at once (e.g. filtering a listing), load a
+PermissionMatcher with get_permission_matcher(): it reads all of the user's
+ACL rows for the team in one query and applies the same rules in memory. When
+given the request, the matcher is cached on ``request.state`` so every
+dependency and handler in that request shares it.
 """
 
+import hashlib
+import json
+from typing import Any, Iterable
+
 from fastapi import Depends, HTTPException, Request
 from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -88,6 +98,87 @@ async def check_permission(
     return True
 
 
+class PermissionMatcher:
+    """A user's ACL rows for one team, evaluated with the same rules as check_permission()."""
+
+    def __init__(self, user_team: UserTeam | None, rows: Iterable[ResourcePermission] = ()):
+        self.is_member = user_team is not None
+        self.is_owner = user_team is not None and user_team.role == TeamRole.OWNER.value
+        self._actions = {(row.resource_type, row.resource_id): frozenset(row.actions or ()) for row in rows}
+
+    def allows(self, resource_type: str, resource_id: str, action: str) -> bool:
+        """Return True if the user may perform `action` on the given resource."""
+        if action not in VALID_ACTIONS or not self.is_member:
+            return False
+        if self.is_owner or not self._actions:
+            return True
+        for key in ((resource_type, resource_id), (resource_type, "*"), ("*", "*")):
+            actions = self._actions.get(key)
+            if actions is not None:
+                return action in actions
+        return True
+
+    def fingerprint(self) -> str:
+        """Short digest of the role and ACL rows, for keying responses filtered by this matcher."""
+        rows = sorted([rtype, rid, sorted(actions)] for (rtype, rid), actions in self._actions.items())
+        payload = json.dumps([self.is_member, self.is_owner, rows])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def filter(
+        self, resources: Iterable[dict[str, Any]], resource_type: str, action: str, id_key: str = "id"
+    ) -> list[dict[str, Any]]:
+        """Return the resources (dicts with an `id_key` field) the user may perform `action` on."""
+        if action not in VALID_ACTIONS or not self.is_member:
+            return []
+        permitted = []
+        for resource in resources:
+            resource_id = str(resource.get(id_key))
+            if resource_id and (self.is_owner or self.allows(resource_type, resource_id, action)):
+                permitted.append(resource)
+        return permitted
+
+
+async def get_permission_matcher(
+    session: AsyncSession,
+    user_id: str,
+    team_id: str,
+    user_team: UserTeam | None = None,
+    request: Request | None = None,
+) -> PermissionMatcher:
+    """
+    Load a PermissionMatcher for (user, team): the membership lookup (skipped if
+    `user_team` is given) plus one query for all of the user's ACL rows.
+
+    With `request`, the matcher is cached on request.state for the rest of the request.
+    """
+    cache: dict | None = None
+    key = (str(user_id), str(team_id))
+    if request is not None:
+        cache = getattr(request.state, "permission_matchers", None)
+        if cache is None:
+            cache = {}
+            request.state.permission_matchers = cache
+        if key in cache:
+            return cache[key]
+
+    if user_team is None:
+        user_team = await get_user_team(session, user_id, team_id)
+    rows: list[ResourcePermission] = []
+    if user_team is not None and user_team.role != TeamRole.OWNER.value:
+        result = await session.execute(
+            select(ResourcePermission).where(
+                ResourcePermission.user_id == user_id,
+                ResourcePermission.team_id == team_id,
+            )
+        )
+        rows = list(result.scalars().all())
+
+    matcher = PermissionMatcher(user_team, rows)
+    if cache is not None:
+        cache[key] = matcher
+    return matcher
+
+
 def require_permission(resource_type: str, action: str, id_param: str = "id"):
     """
     FastAPI dependency factory. Injects a permission check into a route.
@@ -133,15 +224,8 @@ def require_permission(resource_type: str, action: str, id_param: str = "id"):
         else:
             resource_id = "*"
 
-        allowed = await check_permission(
-            session=session,
-            user_id=str(user.id),
-            team_id=team_id,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            action=action,
-        )
-        if not allowed:
+        matcher = await get_permission_matcher(session, str(user.id), team_id, request=request)
+        if not matcher.allows(resource_type, resource_id, action):
             raise HTTPException(
                 status_code=403,
                 detail=f"Permission denied: cannot {action} this {resource_type}",
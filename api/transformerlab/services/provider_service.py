@@ -1,12 +1,16 @@
 """Service layer for bridging database provider records to ProviderConfig."""
 
 import asyncio
+import hashlib
+import json
 import logging
 import os
 import platform
 import re
 import sys
-from typing import Any, List, Optional
+import time
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
 
 from fastapi import HTTPException
 from sqlalchemy import select
@@ -21,6 +25,12 @@ from transformerlab.shared.models.models import AcceleratorType, ProviderType, T
 
 logger = logging.getLogger(__name__)
 
+# Provider instances are kept warm (pooled HTTP sessions, resolved SLURM user settings) between requests.
+PROVIDER_INSTANCE_TTL_SECONDS = float(os.getenv("TFL_PROVIDER_INSTANCE_TTL_SECONDS", "600"))
+PROVIDER_INSTANCE_MAX_ENTRIES = int(os.getenv("TFL_PROVIDER_INSTANCE_MAX_ENTRIES", "256"))
+
+_provider_instances: "OrderedDict[tuple, Tuple[ComputeProvider, float]]" = OrderedDict()
+
 
 def normalize_provider_check_result(check_result: Any) -> tuple[bool, str | None]:
     """Normalize provider.check() output to (status, reason).
@@ -326,6 +336,44 @@ def db_record_to_provider_config(
     return provider_config
 
 
+def _provider_config_version(record: TeamComputeProvider) -> Optional[str]:
+    try:
+        payload = json.dumps([record.type, record.name, record.config], sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _provider_registry_key(
+    record: TeamComputeProvider, user_id: Optional[str], team_id: Optional[str]
+) -> Optional[tuple]:
+    # Local provider instances are not shared: callers set a per-job extra_config["workspace_dir"] on them.
+    if PROVIDER_INSTANCE_TTL_SECONDS <= 0 or record.type == ProviderType.LOCAL.value:
+        return None
+    version = _provider_config_version(record)
+    if version is None:
+        return None
+    # SLURM instances carry the user's own ssh user, SSH key and sbatch flags.
+    user_scope = (user_id, team_id) if record.type == ProviderType.SLURM.value and user_id and team_id else None
+    return (record.id, user_scope, version)
+
+
+def _close_provider_instance(instance: ComputeProvider) -> None:
+    try:
+        instance.close()
+    except Exception:
+        logger.debug("Failed to close provider instance", exc_info=True)
+
+
+def invalidate_provider_instances(provider_id: Optional[str] = None) -> None:
+    """Drop cached provider instances for one provider (or all of them) and close their connections."""
+    for key in list(_provider_instances):
+        if provider_id is None or key[0] == provider_id:
+            entry = _provider_instances.pop(key, None)
+            if entry is not None:
+                _close_provider_instance(entry[0])
+
+
 async def get_provider_instance(
     record: TeamComputeProvider,
     user_id: Optional[str] = None,
@@ -347,9 +395,20 @@ async def get_provider_instance(
         user_id: Optional user ID; if set with team_id and provider is SLURM, user's slurm_user and SSH key are used
         team_id: Optional team ID; required with user_id for slurm_user and SSH key lookup
 
+    Instances are cached per (provider, SLURM user, config version) for
+    PROVIDER_INSTANCE_TTL_SECONDS so repeated status polls and log fetches reuse
+    the same pooled connections; update_team_provider / delete_team_provider
+    invalidate them.
+
     Returns:
         Instantiated ComputeProvider object
     """
+    registry_key = _provider_registry_key(record, user_id, team_id)
+    if registry_key is not None:
+        cached = _provider_instances.get(registry_key)
+        if cached is not None and time.monotonic() - cached[1] <= PROVIDER_INSTANCE_TTL_SECONDS:
+            _provider_instances.move_to_end(registry_key)
+            return cached[0]
 
     user_slurm_user = None
     user_ssh_key_path = None
@@ -384,7 +443,16 @@ async def get_provider_instance(
         user_ssh_key_path=user_ssh_key_path,
         user_sbatch_flags=user_sbatch_flags,
     )
-    return create_compute_provider(config)
+    instance = create_compute_provider(config)
+    if registry_key is not None:
+        stale = _provider_instances.pop(registry_key, None)
+        if stale is not None and stale[0] is not instance:
+            _close_provider_instance(stale[0])
+        _provider_instances[registry_key] = (instance, time.monotonic())
+        while len(_provider_instances) > PROVIDER_INSTANCE_MAX_ENTRIES:
+            _, (evicted, _) = _provider_instances.popitem(last=False)
+            _close_provider_instance(evicted)
+    return instance
 
 
 async def create_team_provider(
@@ -535,6 +603,7 @@ async def update_team_provider(
         provider.is_default = is_default
     await session.commit()
     await session.refresh(provider)
+    invalidate_provider_instances(provider.id)
     return provider
 
 
@@ -569,3 +638,4 @@ async def delete_team_provider(session: AsyncSession, provider: TeamComputeProvi
     """Delete a team provider record."""
     await session.delete(provider)
     await session.commit()
+    invalidate_provider_instances(provider.id)
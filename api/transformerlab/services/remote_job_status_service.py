@@ -2,11 +2,20 @@
 
 Follows the same pattern as sweep_status_service.py.
 
-Runs every REMOTE_JOB_STATUS_INTERVAL_SECONDS, iterates all REMOTE jobs that are
-LAUNCHING, RUNNING, STOPPING, or INTERACTIVE across all orgs, and transitions them
-to COMPLETE/FAILED/STOPPED when the provider reports done or the process has died
+Every REMOTE_JOB_STATUS_INTERVAL_SECONDS it polls the providers of REMOTE jobs that
+are LAUNCHING, RUNNING, STOPPING, or INTERACTIVE, and transitions them to
+COMPLETE/FAILED/STOPPED when the provider reports done or the process has died
 (e.g. interactive jobs that exit due to setup failure).
 
+The set of active jobs is kept current from lab.job_events rather than by rescanning
+every org and experiment each cycle; live_status writes from tfl-remote-trap are
+handled as soon as their event arrives. A full scan of all orgs runs at startup and
+every JOB_EVENT_RECONCILE_SECONDS to re-seed the set.
+
+Providers whose cluster state is the job state (local, RunPod, Lambda, Nebius, ...)
+are asked about all of their active clusters with one get_cluster_statuses call per
+cycle instead of one get_cluster_status call per job.
+
 This decouples provider polling from the check-status HTTP endpoint, which becomes
 a cheap read-only operation unaffected by provider latency or downtime.
 """
@@ -15,13 +24,14 @@ import asyncio
 import os
 import logging
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from lab import Experiment
+from lab import Experiment, job_events
 from lab.dirs import set_organization_id as lab_set_org_id
 from lab.job_status import JobStatus
 
 from transformerlab.services import job_service, team_service
+from transformerlab.services.job_event_service import JOB_EVENT_RECONCILE_SECONDS
 
 
 REMOTE_JOB_STATUS_INTERVAL_SECONDS = int(os.getenv("REMOTE_JOB_STATUS_INTERVAL_SECONDS", "15"))
@@ -35,6 +45,17 @@ _PROVIDER_BACKOFF_CYCLES = 3
 # Per-provider failure tracking: { provider_id: { "failures": int, "skip_cycles": int } }
 _provider_failures: Dict[str, Dict[str, int]] = {}
 
+_ACTIVE_REMOTE_STATUSES = (
+    JobStatus.LAUNCHING.value,
+    JobStatus.RUNNING.value,
+    JobStatus.STOPPING.value,
+    JobStatus.INTERACTIVE.value,
+)
+
+# Active REMOTE jobs polled between full cycles: { (org_id, experiment_id, job_id): None }.
+# Seeded by each full cycle and kept current from job events.
+_tracked_jobs: Dict[Tuple[Optional[str], str, str], None] = {}
+
 _remote_job_status_worker_task: Optional[asyncio.Task] = None
 
 logger = logging.getLogger(__name__)
@@ -264,18 +285,109 @@ async def _handle_live_status(job: Dict[str, Any], experiment_id: str) -> bool:
     return True
 
 
+def _uses_cluster_state(provider_type: str) -> bool:
+    """Whether the provider runs one cluster per job, so its cluster state is the job state."""
+    from transformerlab.shared.models.models import ProviderType
+
+    return provider_type in (
+        ProviderType.LOCAL.value,
+        ProviderType.RUNPOD.value,
+        ProviderType.AWS.value,
+        ProviderType.NEBIUS.value,
+        ProviderType.AZURE.value,
+        ProviderType.GCP.value,
+        ProviderType.VASTAI.value,
+        ProviderType.LAMBDA.value,
+    )
+
+
+class _ClusterStatusBatch:
+    """Cluster statuses for one cycle, fetched with one get_cluster_statuses call per provider.
+
+    Every active job is registered up front; the first job of a provider that needs
+    its cluster state triggers the bulk call for all of that provider's clusters. If
+    the bulk call fails, get() returns None and the job falls back to its own lookup.
+    SLURM job states are batched the same way through get_job_states (job_state()),
+    so jobs that left the queue cost one sacct per provider per cycle.
+    """
+
+    def __init__(self) -> None:
+        # { provider_id: { cluster_name: workspace_dir or None } }
+        self._clusters: Dict[str, Dict[str, Optional[str]]] = {}
+        self._statuses: Dict[str, Optional[Dict[str, Any]]] = {}
+        # { provider_id: [scheduler job id, ...] }
+        self._job_ids: Dict[str, List[str]] = {}
+        self._job_states: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    def add(self, job: Dict[str, Any]) -> None:
+        job_data = job.get("job_data") or {}
+        provider_id = job_data.get("provider_id")
+        cluster_name = job_data.get("cluster_name")
+        if provider_id and cluster_name:
+            self._clusters.setdefault(provider_id, {})[cluster_name] = job_data.get("workspace_dir")
+        launch_result = job_data.get("provider_launch_result")
+        scheduler_job_id = launch_result.get("job_id") if isinstance(launch_result, dict) else None
+        if provider_id and scheduler_job_id:
+            self._job_ids.setdefault(provider_id, []).append(str(scheduler_job_id))
+
+    async def job_state(self, provider_id: str, provider_instance: Any, scheduler_job_id: Any) -> Any:
+        """Return the scheduler's state for one job, looked up with every registered job of the provider."""
+        if not scheduler_job_id or not hasattr(provider_instance, "get_job_states"):
+            return None
+        if provider_id not in self._job_states:
+            job_ids = self._job_ids.get(provider_id) or [str(scheduler_job_id)]
+            try:
+                states = await asyncio.to_thread(provider_instance.get_job_states, job_ids)
+            except Exception as exc:
+                logger.warning(
+                    f"Remote job status worker: bulk job state lookup failed for provider {provider_id}: {exc}"
+                )
+                states = None
+            self._job_states[provider_id] = states if isinstance(states, dict) else None
+        states = self._job_states[provider_id]
+        if not states or str(scheduler_job_id) not in states:
+            return None
+        return states[str(scheduler_job_id)]
+
+    async def get(self, provider_id: str, provider_record: Any, provider_instance: Any, cluster_name: str) -> Any:
+        from transformerlab.shared.models.models import ProviderType
+
+        if not _uses_cluster_state(provider_record.type):
+            return None
+        if provider_id not in self._statuses:
+            clusters = self._clusters.get(provider_id) or {cluster_name: None}
+            if provider_record.type == ProviderType.LOCAL.value and hasattr(provider_instance, "extra_config"):
+                provider_instance.extra_config["workspace_dirs"] = {
+                    name: job_dir for name, job_dir in clusters.items() if job_dir
+                }
+            try:
+                statuses = await asyncio.to_thread(provider_instance.get_cluster_statuses, list(clusters))
+            except Exception as exc:
+                logger.warning(f"Remote job status worker: bulk status lookup failed for provider {provider_id}: {exc}")
+                statuses = None
+            self._statuses[provider_id] = statuses if isinstance(statuses, dict) else None
+        statuses = self._statuses[provider_id]
+        return statuses.get(cluster_name) if statuses else None
+
+
 async def _check_job_via_provider(
     job: Dict[str, Any],
     experiment_id: str,
     provider_record: Any,
     provider_instance: Any,
+    cluster_status: Any = None,
+    job_state: Any = None,
 ) -> bool:
     """Query the provider and update the job status if it has reached a terminal state.
 
+    ``cluster_status`` is this job's entry from a bulk get_cluster_statuses call
+    made earlier in the cycle, and ``job_state`` its SLURM state from a bulk
+    get_job_states call; without them the provider is queried for this job alone.
+
     Returns True if the job was transitioned to a terminal status.
     Raises ConnectionError or Exception on provider failure (caller handles circuit breaker).
     """
-    from transformerlab.compute_providers.models import ClusterState, JobState
+    from transformerlab.compute_providers.models import ClusterState, JobInfo, JobState
     from transformerlab.shared.models.models import ProviderType
 
     job_id = str(job.get("id", ""))
@@ -286,22 +398,14 @@ async def _check_job_via_provider(
 
     is_interactive = _is_interactive_subtype_job(job)
 
-    if provider_type in (
-        ProviderType.LOCAL.value,
-        ProviderType.RUNPOD.value,
-        ProviderType.AWS.value,
-        ProviderType.NEBIUS.value,
-        ProviderType.AZURE.value,
-        ProviderType.GCP.value,
-        ProviderType.VASTAI.value,
-        ProviderType.LAMBDA.value,
-    ):
+    if _uses_cluster_state(provider_type):
         # LOCAL/RUNPOD/AWS/GCP/Azure/Nebius/Vast.ai/Lambda: cluster state directly represents job lifecycle.
-        if provider_type == ProviderType.LOCAL.value and job_data.get("workspace_dir"):
-            if hasattr(provider_instance, "extra_config"):
-                provider_instance.extra_config["workspace_dir"] = job_data["workspace_dir"]
+        if cluster_status is None:
+            if provider_type == ProviderType.LOCAL.value and job_data.get("workspace_dir"):
+                if hasattr(provider_instance, "extra_config"):
+                    provider_instance.extra_config["workspace_dir"] = job_data["workspace_dir"]
 
-        cluster_status = await asyncio.to_thread(provider_instance.get_cluster_status, cluster_name)
+            cluster_status = await asyncio.to_thread(provider_instance.get_cluster_status, cluster_name)
         cluster_state = cluster_status.state
         status_message = getattr(cluster_status, "status_message", "")
         if provider_type == ProviderType.AZURE.value and job_status == JobStatus.STOPPING.value:
@@ -487,11 +591,25 @@ async def _check_job_via_provider(
 
     else:
         # SkyPilot, SLURM, etc.: check the job queue on the cluster.
-        try:
-            provider_jobs = await asyncio.to_thread(provider_instance.list_jobs, cluster_name)
-        except NotImplementedError:
-            # Provider does not support job queue listing — nothing we can do here.
-            return False
+        launch_result = job_data.get("provider_launch_result") if isinstance(job_data, dict) else None
+        slurm_job_id = launch_result.get("job_id") if isinstance(launch_result, dict) else None
+        if provider_type == ProviderType.SLURM.value and slurm_job_id and hasattr(provider_instance, "get_job_states"):
+            if job_state is not None:
+                state = job_state
+            else:
+                states = await asyncio.to_thread(provider_instance.get_job_states, [slurm_job_id])
+                state = states.get(str(slurm_job_id), JobState.UNKNOWN)
+            provider_jobs = (
+                []
+                if state == JobState.UNKNOWN
+                else [JobInfo(job_id=str(slurm_job_id), job_name=cluster_name, state=state, cluster_name=cluster_name)]
+            )
+        else:
+            try:
+                provider_jobs = await asyncio.to_thread(provider_instance.list_jobs, cluster_name)
+            except NotImplementedError:
+                # Provider does not support job queue listing — nothing we can do here.
+                return False
 
         terminal_job_states = {JobState.COMPLETED, JobState.FAILED, JobState.CANCELLED}
         jobs_finished = False
@@ -575,14 +693,119 @@ async def _check_job_via_provider(
 # ---------------------------------------------------------------------------
 
 
-async def refresh_launching_remote_jobs_once() -> Dict[str, int]:
-    """Single refresh cycle: check all LAUNCHING REMOTE jobs and update status.
+def _is_active_remote_job(job: Dict[str, Any]) -> bool:
+    # Only check provider status for jobs that are still launching, running,
+    # stopping, or interactive (so we can detect when an interactive job has died).
+    return job.get("status", "") in _ACTIVE_REMOTE_STATUSES
 
-    Returns cycle statistics for logging.
-    """
+
+async def _refresh_remote_job(
+    job: Dict[str, Any],
+    experiment_id: str,
+    provider_record_cache: Dict[str, Any],
+    provider_instance_cache: Dict[str, Any],
+    cycle_stats: Dict[str, int],
+    cluster_status_batch: Optional[_ClusterStatusBatch] = None,
+) -> None:
+    """Check one active REMOTE job (live_status first, then the provider). Org context must be set."""
     from transformerlab.db.session import async_session
     from transformerlab.services.provider_service import get_provider_by_id, get_provider_instance
+    from transformerlab.shared.models.models import ProviderType
 
+    cycle_stats["jobs_seen"] += 1
+    job_id = str(job.get("id", ""))
+    job_data = job.get("job_data") or {}
+    provider_id = job_data.get("provider_id")
+    cluster_name = job_data.get("cluster_name")
+
+    if not provider_id or not cluster_name:
+        return
+
+    # --- Fast path: live_status written by tfl-remote-trap ---
+    try:
+        transitioned = await _handle_live_status(job, experiment_id)
+        if transitioned:
+            cycle_stats["jobs_updated"] += 1
+            return
+    except Exception as exc:
+        logger.warning(f"Remote job status worker: live_status check failed for job {job_id}: {exc}")
+        cycle_stats["errors"] += 1
+        return
+
+    # --- Circuit breaker check ---
+    if _is_provider_backed_off(provider_id):
+        return
+
+    # --- Get provider record (cached per cycle) ---
+    if provider_id not in provider_record_cache:
+        try:
+            async with async_session() as session:
+                record = await get_provider_by_id(session, provider_id)
+            provider_record_cache[provider_id] = record
+        except Exception as exc:
+            logger.warning(f"Remote job status worker: failed to fetch provider record {provider_id}: {exc}")
+            cycle_stats["errors"] += 1
+            return
+
+    provider_record = provider_record_cache.get(provider_id)
+    if not provider_record:
+        return
+
+    # --- Get provider instance (cached per cycle) ---
+    if provider_id not in provider_instance_cache:
+        try:
+            provider_instance_cache[provider_id] = await get_provider_instance(provider_record)
+        except Exception as exc:
+            logger.warning(f"Remote job status worker: failed to instantiate provider {provider_id}: {exc}")
+            cycle_stats["errors"] += 1
+            return
+
+    provider_instance = provider_instance_cache.get(provider_id)
+    if not provider_instance:
+        return
+
+    # --- Query provider and update status ---
+    try:
+        cluster_status = None
+        job_state = None
+        if cluster_status_batch is not None:
+            cluster_status = await cluster_status_batch.get(
+                provider_id, provider_record, provider_instance, cluster_name
+            )
+            if provider_record.type == ProviderType.SLURM.value:
+                launch_result = job_data.get("provider_launch_result")
+                job_state = await cluster_status_batch.job_state(
+                    provider_id,
+                    provider_instance,
+                    launch_result.get("job_id") if isinstance(launch_result, dict) else None,
+                )
+        updated = await _check_job_via_provider(
+            job,
+            experiment_id,
+            provider_record,
+            provider_instance,
+            cluster_status=cluster_status,
+            job_state=job_state,
+        )
+        _record_provider_success(provider_id)
+        if updated:
+            cycle_stats["jobs_updated"] += 1
+    except ConnectionError as exc:
+        logger.warning(f"Remote job status worker: provider {provider_id} unreachable for job {job_id}: {exc}")
+        _record_provider_failure(provider_id)
+        cycle_stats["errors"] += 1
+    except Exception as exc:
+        logger.warning(f"Remote job status worker: error checking job {job_id} on provider {provider_id}: {exc}")
+        _record_provider_failure(provider_id)
+        cycle_stats["errors"] += 1
+
+
+async def refresh_launching_remote_jobs_once() -> Dict[str, int]:
+    """Full refresh cycle: check all active REMOTE jobs in every org and update status.
+
+    Also re-seeds the set of tracked jobs that refresh_tracked_remote_jobs_once
+    polls between full cycles. Returns cycle statistics for logging.
+    """
     cycle_stats: Dict[str, int] = {
         "orgs": 0,
         "experiments": 0,
@@ -597,6 +820,9 @@ async def refresh_launching_remote_jobs_once() -> Dict[str, int]:
     # and repeated instantiation for the same provider.
     provider_record_cache: Dict[str, Any] = {}
     provider_instance_cache: Dict[str, Any] = {}
+    cluster_status_batch = _ClusterStatusBatch()
+    tracked: Dict[Tuple[Optional[str], str, str], None] = {}
+    active_jobs: List[Tuple[Optional[str], str, Dict[str, Any]]] = []
 
     for org_id in org_ids:
         try:
@@ -618,92 +844,101 @@ async def refresh_launching_remote_jobs_once() -> Dict[str, int]:
                     continue
 
                 for job in all_remote_jobs:
-                    job_status = job.get("status", "")
-                    # Only check provider status for jobs that are still launching, running,
-                    # stopping, or interactive (so we can detect when an interactive job has died).
-                    if job_status not in (
-                        JobStatus.LAUNCHING.value,
-                        JobStatus.RUNNING.value,
-                        JobStatus.STOPPING.value,
-                        JobStatus.INTERACTIVE.value,
-                    ):
+                    if not _is_active_remote_job(job):
                         continue
+                    tracked[(org_id, experiment_id, str(job.get("id", "")))] = None
+                    active_jobs.append((org_id, experiment_id, job))
+                    cluster_status_batch.add(job)
 
-                    cycle_stats["jobs_seen"] += 1
-                    job_id = str(job.get("id", ""))
-                    job_data = job.get("job_data") or {}
-                    provider_id = job_data.get("provider_id")
-                    cluster_name = job_data.get("cluster_name")
+        finally:
+            _clear_org_context()
 
-                    if not provider_id or not cluster_name:
-                        continue
+    # Jobs are checked once every org has been listed, so each provider's bulk
+    # status call covers all of its active clusters.
+    for org_id, experiment_id, job in active_jobs:
+        _set_org_context(org_id)
+        try:
+            await _refresh_remote_job(
+                job, experiment_id, provider_record_cache, provider_instance_cache, cycle_stats, cluster_status_batch
+            )
+        finally:
+            _clear_org_context()
 
-                    # --- Fast path: live_status written by tfl-remote-trap ---
-                    try:
-                        transitioned = await _handle_live_status(job, experiment_id)
-                        if transitioned:
-                            cycle_stats["jobs_updated"] += 1
-                            continue
-                    except Exception as exc:
-                        logger.warning(f"Remote job status worker: live_status check failed for job {job_id}: {exc}")
-                        cycle_stats["errors"] += 1
-                        continue
+    _tracked_jobs.clear()
+    _tracked_jobs.update(tracked)
+    return cycle_stats
 
-                    # --- Circuit breaker check ---
-                    if _is_provider_backed_off(provider_id):
-                        continue
 
-                    # --- Get provider record (cached per cycle) ---
-                    if provider_id not in provider_record_cache:
-                        try:
-                            async with async_session() as session:
-                                record = await get_provider_by_id(session, provider_id)
-                            provider_record_cache[provider_id] = record
-                        except Exception as exc:
-                            logger.warning(
-                                f"Remote job status worker: failed to fetch provider record {provider_id}: {exc}"
-                            )
-                            cycle_stats["errors"] += 1
-                            continue
-
-                    provider_record = provider_record_cache.get(provider_id)
-                    if not provider_record:
-                        continue
+async def refresh_tracked_remote_jobs_once() -> Dict[str, int]:
+    """Poll providers only for the active REMOTE jobs known from the last full cycle and job events."""
+    cycle_stats: Dict[str, int] = {
+        "orgs": 0,
+        "experiments": 0,
+        "jobs_seen": 0,
+        "jobs_updated": 0,
+        "errors": 0,
+    }
+    provider_record_cache: Dict[str, Any] = {}
+    provider_instance_cache: Dict[str, Any] = {}
+    cluster_status_batch = _ClusterStatusBatch()
+    active_jobs: List[Tuple[Optional[str], str, Dict[str, Any]]] = []
 
-                    # --- Get provider instance (cached per cycle) ---
-                    if provider_id not in provider_instance_cache:
-                        try:
-                            provider_instance_cache[provider_id] = await get_provider_instance(provider_record)
-                        except Exception as exc:
-                            logger.warning(
-                                f"Remote job status worker: failed to instantiate provider {provider_id}: {exc}"
-                            )
-                            cycle_stats["errors"] += 1
-                            continue
-
-                    provider_instance = provider_instance_cache.get(provider_id)
-                    if not provider_instance:
-                        continue
+    for key in list(_tracked_jobs):
+        org_id, experiment_id, job_id = key
+        _set_org_context(org_id)
+        try:
+            job = await job_service.job_get(job_id, experiment_id=experiment_id)
+            if not job or not _is_active_remote_job(job):
+                _tracked_jobs.pop(key, None)
+                continue
+            active_jobs.append((org_id, experiment_id, job))
+            cluster_status_batch.add(job)
+        except Exception as exc:
+            logger.warning(f"Remote job status worker: failed refreshing tracked job {job_id}: {exc}")
+            cycle_stats["errors"] += 1
+        finally:
+            _clear_org_context()
+
+    for org_id, experiment_id, job in active_jobs:
+        _set_org_context(org_id)
+        try:
+            await _refresh_remote_job(
+                job, experiment_id, provider_record_cache, provider_instance_cache, cycle_stats, cluster_status_batch
+            )
+        except Exception as exc:
+            logger.warning(f"Remote job status worker: failed refreshing tracked job {job.get('id')}: {exc}")
+            cycle_stats["errors"] += 1
+        finally:
+            _clear_org_context()
 
-                    # --- Query provider and update status ---
-                    try:
-                        updated = await _check_job_via_provider(job, experiment_id, provider_record, provider_instance)
-                        _record_provider_success(provider_id)
-                        if updated:
-                            cycle_stats["jobs_updated"] += 1
-                    except ConnectionError as exc:
-                        logger.warning(
-                            f"Remote job status worker: provider {provider_id} unreachable for job {job_id}: {exc}"
-                        )
-                        _record_provider_failure(provider_id)
-                        cycle_stats["errors"] += 1
-                    except Exception as exc:
-                        logger.warning(
-                            f"Remote job status worker: error checking job {job_id} on provider {provider_id}: {exc}"
-                        )
-                        _record_provider_failure(provider_id)
-                        cycle_stats["errors"] += 1
+    return cycle_stats
 
+
+async def handle_remote_job_events(events: List[job_events.JobEvent]) -> Dict[str, int]:
+    """Track REMOTE jobs as they start or finish, and act on live_status writes right away."""
+    cycle_stats: Dict[str, int] = {"jobs_seen": 0, "jobs_updated": 0, "errors": 0}
+
+    # Only the latest write per job matters.
+    latest: Dict[Tuple[Optional[str], str, str], job_events.JobEvent] = {}
+    for event in events:
+        latest[(event.org_id, event.experiment_id, event.job_id)] = event
+
+    for key, event in latest.items():
+        if not _is_active_remote_job(event.job):
+            _tracked_jobs.pop(key, None)
+            continue
+        _tracked_jobs[key] = None
+        job_data = event.job.get("job_data") or {}
+        if not job_data.get("live_status"):
+            continue
+        cycle_stats["jobs_seen"] += 1
+        _set_org_context(event.org_id)
+        try:
+            if await _handle_live_status({**event.job, "id": event.job_id}, event.experiment_id):
+                cycle_stats["jobs_updated"] += 1
+        except Exception as exc:
+            logger.warning(f"Remote job status worker: live_status check failed for job {event.job_id}: {exc}")
+            cycle_stats["errors"] += 1
         finally:
             _clear_org_context()
 
@@ -715,33 +950,52 @@ async def refresh_launching_remote_jobs_once() -> Dict[str, int]:
 # ---------------------------------------------------------------------------
 
 
+def _log_cycle(kind: str, cycle_stats: Dict[str, int], elapsed: float) -> None:
+    # Only log if there was actual work or errors (avoid noise during quiet periods).
+    if cycle_stats["jobs_seen"] > 0 or cycle_stats["errors"] > 0:
+        logger.debug(
+            f"Remote job status worker: {kind} cycle done in {elapsed:.3f}s — "
+            f"orgs={cycle_stats.get('orgs', 0)} experiments={cycle_stats.get('experiments', 0)} "
+            f"jobs_seen={cycle_stats['jobs_seen']} "
+            f"jobs_updated={cycle_stats['jobs_updated']} "
+            f"errors={cycle_stats['errors']}"
+        )
+
+
 async def _remote_job_status_worker_loop() -> None:
     logger.info("Remote job status worker: started")
+    subscription = job_events.subscribe(types=["REMOTE"], status_changes_only=False)
+    last_reconcile: Optional[float] = None
+    next_poll = time.monotonic()
     try:
         while True:
             try:
                 _cycle_start = time.monotonic()
-                cycle_stats = await refresh_launching_remote_jobs_once()
-                _cycle_elapsed = time.monotonic() - _cycle_start
-
-                # Only log if there was actual work or errors (avoid noise during quiet periods).
-                if cycle_stats["jobs_seen"] > 0 or cycle_stats["errors"] > 0:
-                    logger.debug(
-                        f"Remote job status worker: cycle done in {_cycle_elapsed:.3f}s — "
-                        f"orgs={cycle_stats['orgs']} experiments={cycle_stats['experiments']} "
-                        f"jobs_seen={cycle_stats['jobs_seen']} "
-                        f"jobs_updated={cycle_stats['jobs_updated']} "
-                        f"errors={cycle_stats['errors']}"
-                    )
+                if last_reconcile is None or _cycle_start - last_reconcile >= JOB_EVENT_RECONCILE_SECONDS:
+                    last_reconcile = _cycle_start
+                    next_poll = _cycle_start + REMOTE_JOB_STATUS_INTERVAL_SECONDS
+                    subscription.drain()
+                    cycle_stats = await refresh_launching_remote_jobs_once()
+                    _log_cycle("full", cycle_stats, time.monotonic() - _cycle_start)
+                elif _cycle_start >= next_poll:
+                    next_poll = _cycle_start + REMOTE_JOB_STATUS_INTERVAL_SECONDS
+                    cycle_stats = await refresh_tracked_remote_jobs_once()
+                    _log_cycle("tracked", cycle_stats, time.monotonic() - _cycle_start)
+                else:
+                    event = await subscription.get(timeout=next_poll - _cycle_start)
+                    if event is not None:
+                        cycle_stats = await handle_remote_job_events([event, *subscription.drain()])
+                        _log_cycle("event", cycle_stats, time.monotonic() - _cycle_start)
             except asyncio.CancelledError:
                 raise
             except Exception as exc:
                 logger.warning(f"Remote job status worker: unhandled error in cycle, continuing: {exc}")
-            await asyncio.sleep(REMOTE_JOB_STATUS_INTERVAL_SECONDS)
+                await asyncio.sleep(REMOTE_JOB_STATUS_INTERVAL_SECONDS)
     except asyncio.CancelledError:
         logger.info("Remote job status worker: stopping")
         raise
     finally:
+        subscription.close()
         _clear_org_context()
 
 
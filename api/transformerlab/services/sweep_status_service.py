@@ -4,17 +4,20 @@ import os
 import time
 from typing import Any, Dict, List, Optional
 
-from lab import Experiment
+from lab import Experiment, job_events
 from lab.dirs import set_organization_id as lab_set_org_id
 from lab.job_status import JobStatus
 
 from transformerlab.services import job_service, team_service
+from transformerlab.services.job_event_service import JOB_EVENT_RECONCILE_SECONDS
 
 logger = logging.getLogger(__name__)
 
 ACTIVE_SWEEP_PARENT_STATUSES = {JobStatus.RUNNING, JobStatus.LAUNCHING}
 RUNNING_CHILD_STATUSES = {JobStatus.RUNNING, JobStatus.LAUNCHING}
+# Back-off after an unexpected error; regular work is driven by job events.
 SWEEP_STATUS_INTERVAL_SECONDS = int(os.getenv("SWEEP_STATUS_INTERVAL_SECONDS", "30"))
+SWEEP_EVENT_DEBOUNCE_SECONDS = float(os.getenv("TFL_SWEEP_EVENT_DEBOUNCE_SECONDS", "1"))
 
 # Cap concurrent S3 reads when fetching child jobs within a single sweep refresh.
 # Without a bound, a large sweep fires N simultaneous requests, which can spike
@@ -205,33 +208,99 @@ async def refresh_active_sweeps_once() -> Dict[str, int]:
     return cycle_stats
 
 
+def _sweep_parent_for_event(event: job_events.JobEvent) -> Optional[str]:
+    """Sweep parent job id whose counts may be affected by this job event."""
+    job_data = event.job.get("job_data") or {}
+    if event.type == "SWEEP" and job_data.get("sweep_parent"):
+        return event.job_id
+    parent_id = job_data.get("parent_sweep_job_id")
+    return str(parent_id) if parent_id else None
+
+
+async def refresh_sweeps_for_events(events: List[job_events.JobEvent]) -> Dict[str, int]:
+    """Refresh only the active sweep parents touched by these job events."""
+    cycle_stats = {"sweeps_seen": 0, "sweeps_refreshed": 0, "errors": 0}
+
+    parents: Dict[tuple, None] = {}
+    for event in events:
+        parent_id = _sweep_parent_for_event(event)
+        if parent_id:
+            parents[(event.org_id, event.experiment_id, parent_id)] = None
+
+    for org_id, experiment_id, parent_id in parents:
+        _set_org_context(org_id)
+        try:
+            parent_job = await job_service.job_get(parent_id, experiment_id=experiment_id)
+            if not parent_job:
+                continue
+            cycle_stats["sweeps_seen"] += 1
+            if parent_job.get("status") not in ACTIVE_SWEEP_PARENT_STATUSES:
+                continue
+            if await refresh_sweep_parent(parent_job, experiment_id):
+                cycle_stats["sweeps_refreshed"] += 1
+        except Exception as exc:
+            logger.warning(
+                "Sweep status worker: failed refreshing sweep job %s in experiment %s: %s",
+                parent_id,
+                experiment_id,
+                exc,
+            )
+            cycle_stats["errors"] += 1
+        finally:
+            _clear_org_context()
+
+    return cycle_stats
+
+
 async def _sweep_status_worker_loop() -> None:
     logger.info("Sweep status worker: started")
+    # Any status change can move a sweep's counts: children finishing or the parent itself launching.
+    subscription = job_events.subscribe()
+    last_reconcile: Optional[float] = None
     try:
         while True:
             try:
                 _cycle_start = time.monotonic()
-                cycle_stats = await refresh_active_sweeps_once()
-                _cycle_elapsed = time.monotonic() - _cycle_start
-                logger.debug(
-                    "Sweep status worker: cycle done in %.3fs — "
-                    "orgs=%d experiments=%d sweeps_seen=%d sweeps_refreshed=%d errors=%d",
-                    _cycle_elapsed,
-                    cycle_stats["orgs"],
-                    cycle_stats["experiments"],
-                    cycle_stats["sweeps_seen"],
-                    cycle_stats["sweeps_refreshed"],
-                    cycle_stats["errors"],
-                )
+                if last_reconcile is None or _cycle_start - last_reconcile >= JOB_EVENT_RECONCILE_SECONDS:
+                    last_reconcile = _cycle_start
+                    subscription.drain()
+                    cycle_stats = await refresh_active_sweeps_once()
+                    logger.debug(
+                        "Sweep status worker: full cycle done in %.3fs — "
+                        "orgs=%d experiments=%d sweeps_seen=%d sweeps_refreshed=%d errors=%d",
+                        time.monotonic() - _cycle_start,
+                        cycle_stats["orgs"],
+                        cycle_stats["experiments"],
+                        cycle_stats["sweeps_seen"],
+                        cycle_stats["sweeps_refreshed"],
+                        cycle_stats["errors"],
+                    )
+                    continue
+
+                remaining = JOB_EVENT_RECONCILE_SECONDS - (_cycle_start - last_reconcile)
+                event = await subscription.get(timeout=remaining)
+                if event is None:
+                    continue
+                # Let a burst of child transitions settle into one refresh per parent.
+                await asyncio.sleep(SWEEP_EVENT_DEBOUNCE_SECONDS)
+                cycle_stats = await refresh_sweeps_for_events([event, *subscription.drain()])
+                if cycle_stats["sweeps_refreshed"] or cycle_stats["errors"]:
+                    logger.debug(
+                        "Sweep status worker: event cycle done — sweeps_seen=%d sweeps_refreshed=%d errors=%d",
+                        cycle_stats["sweeps_seen"],
+                        cycle_stats["sweeps_refreshed"],
+                        cycle_stats["errors"],
+                    )
             except asyncio.CancelledError:
                 raise
             except Exception as exc:
                 logger.warning("Sweep status worker: unhandled error in cycle, continuing: %s", exc)
-            await asyncio.sleep(SWEEP_STATUS_INTERVAL_SECONDS)
+                await asyncio.sleep(SWEEP_STATUS_INTERVAL_SECONDS)
     except asyncio.CancelledError:
         logger.info("Sweep status worker: stopping")
         raise
     finally:
+        subscription.close()
         _clear_org_context()
 
 
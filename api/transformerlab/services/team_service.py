@@ -248,12 +248,20 @@ async def delete_team(session: AsyncSession, team_id: str, user: User, team: Tea
     await session.execute(delete(UserTeam).where(UserTeam.team_id == team_id))
     await session.execute(delete(TeamInvitation).where(TeamInvitation.team_id == team_id))
     await session.commit()
+    _invalidate_auth_cache(team_id)
     return {"message": "Team deleted"}
 
 
 # ==================== Members ====================
 
 
+def _invalidate_auth_cache(team_id: str, user_id: Optional[str] = None) -> None:
+    # Imported lazily: api_key_auth imports this module.
+    from transformerlab.services.api_key_auth import invalidate_team_memberships
+
+    invalidate_team_memberships(team_id, user_id)
+
+
 async def get_team_members(session: AsyncSession, team_id: str) -> dict:
     user_teams = await db_team.get_team_members(session, team_id)
 
@@ -279,6 +287,7 @@ async def leave_team(session: AsyncSession, team_id: str, user: User, team: Team
     if role != TeamRole.OWNER.value:
         await session.execute(delete(UserTeam).where(UserTeam.user_id == str(user.id), UserTeam.team_id == team_id))
         await session.commit()
+        _invalidate_auth_cache(team_id, str(user.id))
         return {"message": "Left team"}
 
     result = await session.execute(
@@ -291,6 +300,7 @@ async def leave_team(session: AsyncSession, team_id: str, user: User, team: Team
     if owner_count > 1:
         await session.execute(delete(UserTeam).where(UserTeam.user_id == str(user.id), UserTeam.team_id == team_id))
         await session.commit()
+        _invalidate_auth_cache(team_id, str(user.id))
         return {"message": "Left team"}
 
     # kept inline: != filter + order_by not covered by a helper
@@ -308,6 +318,8 @@ async def leave_team(session: AsyncSession, team_id: str, user: User, team: Team
 
     await session.execute(delete(UserTeam).where(UserTeam.user_id == str(user.id), UserTeam.team_id == team_id))
     await session.commit()
+    # The next owner's role changed too.
+    _invalidate_auth_cache(team_id)
     return {"message": "Left team"}
 
 
@@ -327,6 +339,7 @@ async def remove_member(session: AsyncSession, team_id: str, user_id: str) -> di
 
     await session.execute(delete(UserTeam).where(UserTeam.user_id == user_id, UserTeam.team_id == team_id))
     await session.commit()
+    _invalidate_auth_cache(team_id, user_id)
     return {"message": "Member removed successfully"}
 
 
@@ -351,6 +364,7 @@ async def update_member_role(session: AsyncSession, team_id: str, user_id: str,
         update(UserTeam).where(UserTeam.user_id == user_id, UserTeam.team_id == team_id).values(role=role)
     )
     await session.commit()
+    _invalidate_auth_cache(team_id, user_id)
     return {"message": "Role updated successfully", "user_id": user_id, "new_role": role}
 
 
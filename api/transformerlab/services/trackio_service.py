@@ -1,9 +1,34 @@
+"""
+Trackio dashboards for jobs.
+
+A dashboard runs Trackio against a local mirror of the job's metrics directory,
+kept under HOME_DIR/temp/trackio/mirrors/ and keyed by org, experiment and
+project. The mirror persists across dashboard restarts: starting a dashboard
+downloads only the files whose size or ETag (mtime for local storage) changed
+since the mirror's manifest was written, TRACKIO_MIRROR_DOWNLOAD_WORKERS at a
+time (TFL_TRACKIO_MIRROR_DOWNLOAD_WORKERS, default 8), and removes files that
+are gone from the source. Jobs of one shared project share a mirror. A job
+whose mirror is already being served reuses that dashboard while the mirror is
+current; if the source has changed, the dashboard is stopped, the mirror
+refreshed and one dashboard relaunched for every job that used it, since files
+must not be replaced under a running dashboard. Mirrors not used by a running dashboard are evicted,
+least recently used first, once all mirrors together exceed
+TRACKIO_MIRROR_MAX_BYTES (TFL_TRACKIO_MIRROR_MAX_BYTES, default 10 GiB).
+"""
+
 import asyncio
+import hashlib
+import json
 import os
+import posixpath
 import shutil
 import subprocess
 import sys
-from typing import Any, Dict, List
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Tuple
 
 from fastapi import HTTPException
 
@@ -18,6 +43,230 @@ from werkzeug.utils import secure_filename
 
 _TRACKIO_META: Dict[str, Dict[str, Any]] = {}
 
+TRACKIO_MIRROR_MAX_BYTES = max(0, int(os.getenv("TFL_TRACKIO_MIRROR_MAX_BYTES", str(10 * 1024**3))))
+TRACKIO_MIRROR_DOWNLOAD_WORKERS = max(1, int(os.getenv("TFL_TRACKIO_MIRROR_DOWNLOAD_WORKERS", "8")))
+# SQLite files a dashboard creates next to a database; stale ones must not outlive a replaced database.
+_SQLITE_SIDECAR_SUFFIXES = ("-wal", "-shm")
+
+# One refresh at a time per mirror directory in this process; an entry lives only
+# while a start holds or waits for it.
+_mirror_locks: Dict[str, Tuple[asyncio.Lock, int]] = {}
+
+
+@asynccontextmanager
+async def _mirror_lock(mirror_dir: str) -> AsyncIterator[None]:
+    lock, users = _mirror_locks.get(mirror_dir, (None, 0))
+    if lock is None:
+        lock = asyncio.Lock()
+    _mirror_locks[mirror_dir] = (lock, users + 1)
+    try:
+        async with lock:
+            yield
+    finally:
+        lock, users = _mirror_locks[mirror_dir]
+        if users > 1:
+            _mirror_locks[mirror_dir] = (lock, users - 1)
+        else:
+            del _mirror_locks[mirror_dir]
+
+
+def _manifest_path(mirror_dir: str) -> str:
+    # Kept beside the mirror so Trackio never sees it in TRACKIO_DIR.
+    return mirror_dir + ".json"
+
+
+def _read_manifest(mirror_dir: str) -> Dict[str, Any]:
+    try:
+        with open(_manifest_path(mirror_dir), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _write_manifest(mirror_dir: str, manifest: Dict[str, Any]) -> None:
+    path = _manifest_path(mirror_dir)
+    tmp = f"{path}.tmp-{uuid.uuid4().hex}"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp, path)
+
+
+def _entry_signature(info: Dict[str, Any]) -> List[Any]:
+    stamp = None
+    for key in ("ETag", "etag", "md5", "mtime", "LastModified", "last_modified"):
+        if info.get(key) is not None:
+            stamp = str(info[key])
+            break
+    return [info.get("size"), stamp]
+
+
+def _list_source_sync(src_fs, source_path: str) -> Dict[str, Dict[str, Any]]:
+    """Return {relative path: fsspec info with a full "name"} for every file under source_path."""
+    # fsspec find()/walk() often return paths without the protocol prefix; normalize
+    # to a full URI so rel_path is computed correctly (otherwise e.g. alpha.db -> a.db).
+    src_protocol = source_path.split("://", 1)[0] if "://" in source_path else None
+    if src_fs.isfile(source_path):
+        info = dict(src_fs.info(source_path))
+        info["name"] = source_path
+        return {posixpath.basename(source_path.rstrip("/")): info}
+    try:
+        found = src_fs.find(source_path, detail=True)
+    except Exception:
+        found = {}
+        for dirpath, _dirs, files in src_fs.walk(source_path, detail=True):
+            for name, info in files.items():
+                found[posixpath.join(dirpath, name)] = info
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    for raw_src_file, info in found.items():
+        if info.get("type", "file") == "directory":
+            continue
+        src_file = raw_src_file
+        if src_protocol and not storage.is_remote_path(raw_src_file):
+            src_file = f"{src_protocol}://{raw_src_file.lstrip('/')}"
+        rel_path = src_file[len(source_path) :].lstrip("/").lstrip("\\")
+        if rel_path:
+            entries[rel_path] = {**info, "name": src_file}
+    return entries
+
+
+def _mirror_file(mirror_dir: str, rel_path: str) -> str | None:
+    """Local path of rel_path inside the mirror, or None if it would escape it."""
+    dest = os.path.realpath(os.path.join(mirror_dir, rel_path))
+    if not dest.startswith(os.path.realpath(mirror_dir) + os.sep):
+        return None
+    return dest
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _sync_mirror_sync(src_fs, source_path: str, mirror_dir: str) -> int:
+    """
+    Bring mirror_dir up to date with source_path and return how many files were downloaded.
+
+    Files are downloaded to a temporary name and renamed into place, so a
+    dashboard reading the mirror never sees a partial file.
+    """
+    os.makedirs(mirror_dir, exist_ok=True)
+    known: Dict[str, Any] = dict(_read_manifest(mirror_dir).get("files") or {})
+    entries = _list_source_sync(src_fs, source_path)
+
+    changed = []
+    for rel_path, info in entries.items():
+        dest = _mirror_file(mirror_dir, rel_path)
+        if dest is None:
+            continue
+        if known.get(rel_path) != _entry_signature(info) or not os.path.exists(dest):
+            changed.append((rel_path, info, dest))
+
+    def _download(rel_path: str, info: Dict[str, Any], dest: str) -> None:
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        tmp = f"{dest}.tmp-{uuid.uuid4().hex}"
+        try:
+            with src_fs.open(info["name"], "rb") as r, open(tmp, "wb") as w:
+                shutil.copyfileobj(r, w, 1024 * 1024)
+            os.replace(tmp, dest)
+        finally:
+            _remove_file(tmp)
+        for suffix in _SQLITE_SIDECAR_SUFFIXES:
+            if rel_path + suffix not in entries:
+                _remove_file(dest + suffix)
+
+    errors: List[Exception] = []
+    if changed:
+        with ThreadPoolExecutor(max_workers=min(TRACKIO_MIRROR_DOWNLOAD_WORKERS, len(changed))) as pool:
+            futures = {pool.submit(_download, rel_path, info, dest): rel_path for rel_path, info, dest in changed}
+            for future, rel_path in futures.items():
+                try:
+                    future.result()
+                    known[rel_path] = _entry_signature(entries[rel_path])
+                except Exception as e:
+                    # Forget the file so the next refresh downloads it again.
+                    known.pop(rel_path, None)
+                    errors.append(e)
+
+    for rel_path in [r for r in known if r not in entries]:
+        dest = _mirror_file(mirror_dir, rel_path)
+        if dest is not None:
+            _remove_file(dest)
+        known.pop(rel_path, None)
+
+    _write_manifest(mirror_dir, {"source": source_path, "files": known, "last_used": time.time()})
+    if errors:
+        raise errors[0]
+    return len(changed)
+
+
+def _mirror_is_stale_sync(src_fs, source_path: str, mirror_dir: str) -> bool:
+    """True if a refresh of mirror_dir would download or remove any file."""
+    known: Dict[str, Any] = dict(_read_manifest(mirror_dir).get("files") or {})
+    entries = _list_source_sync(src_fs, source_path)
+    for rel_path, info in entries.items():
+        dest = _mirror_file(mirror_dir, rel_path)
+        if dest is None:
+            continue
+        if known.get(rel_path) != _entry_signature(info) or not os.path.exists(dest):
+            return True
+    return any(rel_path not in entries for rel_path in known)
+
+
+def _dir_size(path: str) -> int:
+    total = 0
+    for dirpath, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, name))
+            except OSError:
+                pass
+    return total
+
+
+def _evict_mirrors_sync(mirror_root: str, keep: set[str], max_bytes: int) -> None:
+    """Remove least recently used mirrors, other than those in keep, until the total fits max_bytes."""
+    mirrors = []
+    for name in os.listdir(mirror_root):
+        path = os.path.realpath(os.path.join(mirror_root, name))
+        if os.path.isdir(path):
+            last_used = _read_manifest(path).get("last_used") or 0
+            mirrors.append((float(last_used), path, _dir_size(path)))
+    total = sum(size for _, _, size in mirrors)
+    for _, path, size in sorted(mirrors):
+        if total <= max_bytes:
+            break
+        if path in keep:
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        _remove_file(_manifest_path(path))
+        total -= size
+
+
+def _dashboard_for_mirror(mirror_dir: str) -> Dict[str, Any] | None:
+    """Return the running dashboard serving mirror_dir, if any."""
+    for info in _TRACKIO_META.values():
+        if isinstance(info.get("cache_dir"), str) and os.path.realpath(info["cache_dir"]) == mirror_dir:
+            return info
+    return None
+
+
+async def _refresh_mirror(src_fs, source_path: str, mirror_root: str, mirror_dir: str) -> None:
+    """Sync mirror_dir and evict other mirrors over budget. The caller holds the mirror's lock."""
+    await asyncio.to_thread(_sync_mirror_sync, src_fs, source_path, mirror_dir)
+    keep = {mirror_dir}
+    for info in list(_TRACKIO_META.values()):
+        if isinstance(info.get("cache_dir"), str):
+            keep.add(os.path.realpath(info["cache_dir"]))
+    try:
+        await asyncio.to_thread(_evict_mirrors_sync, mirror_root, keep, TRACKIO_MIRROR_MAX_BYTES)
+    except Exception:
+        # Eviction is housekeeping; never fail a dashboard start over it.
+        pass
+
 
 async def start_trackio_for_job(job_id: str, org_id: str | None, experiment_id: str | None) -> Dict[str, str]:
     """
@@ -76,12 +325,14 @@ async def start_trackio_for_job(job_id: str, org_id: str | None, experiment_id:
 
     project = job_data.get("trackio_project") or job_data.get("trackio_project_name")
 
-    # Always run Trackio from a local temporary copy of the metrics directory.
+    # Always run Trackio from a local mirror of the metrics directory.
     # This works for both local and remote storage backends. Use HOME_DIR so the
-    # cache is guaranteed to be on the local filesystem (even when workspace_dir
-    # points to remote storage).
-    cache_root = os.path.join(HOME_DIR, "temp", "trackio")
-    cache_dir = os.path.join(cache_root, f"{safe_org_id}_{safe_experiment_id}_{safe_job_id}")
+    # mirror is guaranteed to be on the local filesystem (even when workspace_dir
+    # points to remote storage). Jobs in the same shared project use one mirror.
+    cache_root = os.path.join(HOME_DIR, "temp", "trackio", "mirrors")
+    safe_project = secure_filename(str(project).strip()) if project else ""
+    source_key = hashlib.sha256(str(source_path).encode("utf-8")).hexdigest()[:12]
+    cache_dir = os.path.join(cache_root, f"{safe_org_id}_{safe_experiment_id}_{safe_project}_{source_key}")
 
     # Normalize and validate the cache directory to ensure it stays under cache_root.
     cache_root_real = os.path.realpath(cache_root)
@@ -92,44 +343,11 @@ async def start_trackio_for_job(job_id: str, org_id: str | None, experiment_id:
     # Ensure cache root exists
     os.makedirs(cache_root_real, exist_ok=True)
 
-    # Refresh cache for this job: remove any previous copy
-    if os.path.exists(cache_dir_safe):
-        await storage.rm_tree(cache_dir_safe)
-
-    # Copy directory or file into the local cache directory without going through
-    # the global storage backend for the destination (which may be remote).
     if storage.is_remote_path(source_path):
-        # Remote path (e.g., s3://...) - stream from remote FS into local files
+        # Remote path (e.g., s3://...) - mirror from the remote FS into local files
         src_fs, _ = storage._get_fs_for_path(source_path)  # type: ignore[attr-defined]
-        # fsspec find()/walk() often return paths without the protocol prefix; normalize
-        # to a full URI so rel_path is computed correctly (otherwise e.g. alpha.db -> a.db).
-        src_protocol = source_path.split("://", 1)[0] if "://" in source_path else None
-
-        def _copy_remote_tree() -> None:
-            os.makedirs(cache_dir_safe, exist_ok=True)
-            try:
-                src_files = src_fs.find(source_path)
-            except Exception:
-                src_files = []
-                for _dirpath, _dirs, files in src_fs.walk(source_path):
-                    for f in files:
-                        src_files.append(os.path.join(_dirpath, f))
-
-            for raw_src_file in src_files:
-                src_file = raw_src_file
-                if src_protocol and not storage.is_remote_path(raw_src_file):
-                    src_file = f"{src_protocol}://{raw_src_file.lstrip('/')}"
-                rel_path = src_file[len(source_path) :].lstrip("/").lstrip("\\")
-                dest_file = os.path.join(cache_dir_safe, rel_path)
-                dest_parent = os.path.dirname(dest_file)
-                if dest_parent:
-                    os.makedirs(dest_parent, exist_ok=True)
-                with src_fs.open(src_file, "rb") as r, open(dest_file, "wb") as w:
-                    shutil.copyfileobj(r, w)
-
-        await asyncio.to_thread(_copy_remote_tree)
     else:
-        # Local filesystem path -> local cache dir
+        # Local filesystem path -> local mirror
         # Constrain local source paths to live under the lab HOME_DIR to avoid
         # copying from arbitrary locations on the filesystem.
         safe_root = os.path.realpath(HOME_DIR)
@@ -153,82 +371,101 @@ async def start_trackio_for_job(job_id: str, org_id: str | None, experiment_id:
                 status_code=404,
                 detail=f"Trackio directory not found on server: {source_path}",
             )
-        if os.path.isdir(normalized_source_path):
-            # shutil.copytree with dirs_exist_ok to merge into an existing cache_dir
-            shutil.copytree(normalized_source_path, cache_dir_safe, dirs_exist_ok=True)
-        else:
-            os.makedirs(cache_dir_safe, exist_ok=True)
-            dest_file = os.path.join(cache_dir_safe, os.path.basename(normalized_source_path))
-            shutil.copy2(normalized_source_path, dest_file)
-
-    def _launch_trackio_subprocess() -> Dict[str, Any]:
-        """
-        Launch a small Python subprocess that:
-        - Sets TRACKIO_DIR so Trackio reads metrics from the job's artifact path.
-        - Calls trackio.show(open_browser=False, block_thread=False, host='127.0.0.1', project=...)
-        - Prints the local URL to stdout, then sleeps to keep the server alive.
-
-        Returns a dict with the subprocess handle and the discovered URL.
-        """
-        env = os.environ.copy()
-        env["TRACKIO_DIR"] = cache_dir
-        if isinstance(project, str) and project.strip():
-            env["_TRACKIO_PROJECT"] = project.strip()
-
-        script_lines = [
-            "import os, sys, time",
-            "import trackio",
-            "kwargs = {'open_browser': False, 'block_thread': False, 'host': '0.0.0.0'}",
-            "trackio.show(**kwargs)",
-            "while True:",
-            "    time.sleep(3600)",
-        ]
-        # Use newlines so the while loop has proper Python syntax
-        script = "\n".join(script_lines)
-
-        proc = subprocess.Popen(
-            [sys.executable, "-c", script],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            env=env,
-        )
+        source_path = normalized_source_path
+        src_fs, _ = storage._get_fs_for_path(source_path)  # type: ignore[attr-defined]
 
-        if proc.stdout is None:
-            raise RuntimeError("Failed to read Trackio output from subprocess stdout")
-
-        # Read stdout until we find the line where Trackio announces the UI URL.
-        url: str | None = None
-        marker = "Trackio UI launched at:"
-        while True:
-            line = proc.stdout.readline()
-            if not line:
-                break
-            if marker in line:
-                # Extract the URL portion after the marker
-                url = line.split(marker, 1)[1].strip()
-                break
-
-        if not url:
-            # If we couldn't read a URL, terminate the process and raise
-            proc.terminate()
-            raise RuntimeError("Trackio subprocess did not output a dashboard URL")
-
-        return {"proc": proc, "url": url, "cache_dir": cache_dir}
-
-    loop = asyncio.get_running_loop()
-    try:
-        result = await loop.run_in_executor(None, _launch_trackio_subprocess)
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to start Trackio dashboard: {e}",
-        ) from e
+    # Jobs of one shared project share a mirror. A dashboard already serving a current
+    # mirror is reused. A stale one is stopped first: refreshing would replace
+    # project.db under its open SQLite connection. The jobs it served move to the
+    # relaunched dashboard. The lock keeps two starts from refreshing the mirror
+    # under each other.
+    async with _mirror_lock(cache_dir_safe):
+        sharing_jobs: List[str] = []
+        shared = _dashboard_for_mirror(cache_dir_safe)
+        if shared is not None:
+            if not await asyncio.to_thread(_mirror_is_stale_sync, src_fs, source_path, cache_dir_safe):
+                _TRACKIO_META[safe_job_id] = dict(shared)
+                return {"url": shared["url"]}
+            shared_reg_key = shared.get("reg_key")
+            sharing_jobs = [jid for jid, info in _TRACKIO_META.items() if info.get("reg_key") == shared_reg_key]
+            for jid in sharing_jobs:
+                _TRACKIO_META.pop(jid, None)
+            if shared_reg_key:
+                get_registry().kill(shared_reg_key)
+
+        # Download only what changed since this mirror was last refreshed.
+        await _refresh_mirror(src_fs, source_path, cache_root_real, cache_dir_safe)
+
+        def _launch_trackio_subprocess() -> Dict[str, Any]:
+            """
+            Launch a small Python subprocess that:
+            - Sets TRACKIO_DIR so Trackio reads metrics from the job's artifact path.
+            - Calls trackio.show(open_browser=False, block_thread=False, host='127.0.0.1', project=...)
+            - Prints the local URL to stdout, then sleeps to keep the server alive.
+
+            Returns a dict with the subprocess handle and the discovered URL.
+            """
+            env = os.environ.copy()
+            env["TRACKIO_DIR"] = cache_dir
+            if isinstance(project, str) and project.strip():
+                env["_TRACKIO_PROJECT"] = project.strip()
+
+            script_lines = [
+                "import os, sys, time",
+                "import trackio",
+                "kwargs = {'open_browser': False, 'block_thread': False, 'host': '0.0.0.0'}",
+                "trackio.show(**kwargs)",
+                "while True:",
+                "    time.sleep(3600)",
+            ]
+            # Use newlines so the while loop has proper Python syntax
+            script = "\n".join(script_lines)
+
+            proc = subprocess.Popen(
+                [sys.executable, "-c", script],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                env=env,
+            )
 
-    _reg_key = f"trackio:{safe_org_id}:{safe_experiment_id}:{safe_job_id}"
-    get_registry().register(_reg_key, result["proc"], workspace_dir=None)
-    _TRACKIO_META[safe_job_id] = {"url": result["url"], "cache_dir": result["cache_dir"], "reg_key": _reg_key}
-    return {"url": result["url"]}
+            if proc.stdout is None:
+                raise RuntimeError("Failed to read Trackio output from subprocess stdout")
+
+            # Read stdout until we find the line where Trackio announces the UI URL.
+            url: str | None = None
+            marker = "Trackio UI launched at:"
+            while True:
+                line = proc.stdout.readline()
+                if not line:
+                    break
+                if marker in line:
+                    # Extract the URL portion after the marker
+                    url = line.split(marker, 1)[1].strip()
+                    break
+
+            if not url:
+                # If we couldn't read a URL, terminate the process and raise
+                proc.terminate()
+                raise RuntimeError("Trackio subprocess did not output a dashboard URL")
+
+            return {"proc": proc, "url": url, "cache_dir": cache_dir}
+
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(None, _launch_trackio_subprocess)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to start Trackio dashboard: {e}",
+            ) from e
+
+        _reg_key = f"trackio:{safe_org_id}:{safe_experiment_id}:{safe_job_id}"
+        get_registry().register(_reg_key, result["proc"], workspace_dir=None)
+        _TRACKIO_META[safe_job_id] = {"url": result["url"], "cache_dir": result["cache_dir"], "reg_key": _reg_key}
+        for jid in sharing_jobs:
+            _TRACKIO_META[jid] = dict(_TRACKIO_META[safe_job_id])
+        return {"url": result["url"]}
 
 
 async def stop_trackio_for_job(job_id: str) -> None:
@@ -241,18 +478,13 @@ async def stop_trackio_for_job(job_id: str) -> None:
         return
 
     reg_key = info.get("reg_key")
-    cache_dir = info.get("cache_dir")
+    if reg_key and any(other.get("reg_key") == reg_key for other in _TRACKIO_META.values()):
+        # Another job of the same project still uses this dashboard.
+        return
 
     if reg_key:
         get_registry().kill(reg_key)
-
-    if isinstance(cache_dir, str) and cache_dir:
-        try:
-            if os.path.exists(cache_dir):
-                shutil.rmtree(cache_dir, ignore_errors=True)
-        except Exception:
-            # Ignore cleanup errors
-            pass
+    # The local mirror is kept for the next dashboard; LRU eviction bounds its disk use.
 
 
 async def list_trackio_projects(experiment_id: str) -> List[str]:
@@ -1,15 +1,38 @@
+"""
+Staging for chunked uploads (/upload/init, /chunk, /status, /complete).
+
+Chunks that sit on the CHUNK_SIZE grid (every client chunk is CHUNK_SIZE bytes
+except the last) are written straight into a ``data`` file created at init with
+the upload's full size, at offset ``chunk_index * CHUNK_SIZE``. An ``<index>.done``
+marker holding the chunk length records each one, and completing the upload is
+a rename of ``data`` rather than a second full copy. Chunks that do not fit the
+grid (clients using another chunk size) are kept as ``<index>`` files and
+stitched together at completion. Chunk writes run in worker threads, so several
+chunks of one upload can be written at once without blocking the event loop.
+
+``total_size`` is capped at MAX_UPLOAD_SIZE (TFL_MAX_UPLOAD_BYTES, default 1 TiB)
+before the data file is sized.
+"""
+
+import asyncio
 import json
 import logging
+import math
 import os
 import re
 import shutil
 import uuid
 from datetime import datetime, timezone
+from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
 STAGING_ROOT = os.path.join(os.path.expanduser("~"), ".transformerlab", "uploads", "staging")
 CHUNK_SIZE = 64 * 1024 * 1024  # 64 MB
+_COPY_BUFFER_SIZE = 8 * 1024 * 1024
+MAX_UPLOAD_SIZE = int(os.getenv("TFL_MAX_UPLOAD_BYTES", str(1024**4)))  # 1 TiB
+# Uploads older than this are abandoned: sweep_expired_uploads' default and the cache lifetime.
+UPLOAD_MAX_AGE_HOURS = 24
 
 # upload_id is always uuid4().hex — 32 lowercase hex chars, no separators.
 _UPLOAD_ID_RE = re.compile(r"^[0-9a-f]{32}$")
@@ -51,38 +74,147 @@ def _assembled_path(upload_id: str) -> str:
     return os.path.join(_staging_dir(upload_id), "assembled")
 
 
+def _data_path(upload_id: str) -> str:
+    return os.path.join(_staging_dir(upload_id), "data")
+
+
+def _marker_path(upload_id: str, chunk_index: int) -> str:
+    return _chunk_path(upload_id, chunk_index) + ".done"
+
+
+# Per-process caches: metadata never changes after init, and the received set
+# saves listing the staging directory on every chunk. /status and /complete
+# still list the directory, since other API workers may have received chunks.
+_metas: Dict[str, dict] = {}
+_received: Dict[str, set[int]] = {}
+
+
+def _forget(upload_id: str) -> None:
+    _metas.pop(upload_id, None)
+    _received.pop(upload_id, None)
+
+
+def _prune_caches(max_age_hours: int = UPLOAD_MAX_AGE_HOURS) -> None:
+    """Forget uploads that were removed (possibly by another worker) or abandoned."""
+    cutoff = datetime.now(timezone.utc).timestamp() - max_age_hours * 3600
+    for upload_id in list(_metas.keys() | _received.keys()):
+        meta = _metas.get(upload_id)
+        try:
+            expired = meta is not None and datetime.fromisoformat(meta["created_at"]).timestamp() < cutoff
+        except (KeyError, TypeError, ValueError):
+            expired = True
+        if expired or not os.path.isdir(os.path.join(STAGING_ROOT, upload_id)):
+            _forget(upload_id)
+
+
+def _read_meta(upload_id: str) -> dict:
+    meta = _metas.get(upload_id)
+    if meta is None:
+        with open(_meta_path(upload_id)) as f:
+            meta = json.load(f)
+        _metas[upload_id] = meta
+    return meta
+
+
 def _received_chunks(upload_id: str) -> list[int]:
     staging = _staging_dir(upload_id)
-    return sorted(int(n) for n in os.listdir(staging) if n.isdigit())
+    received = set()
+    for name in os.listdir(staging):
+        index = name[: -len(".done")] if name.endswith(".done") else name
+        if index.isdigit():
+            received.add(int(index))
+    return sorted(received)
+
+
+def _in_place_length(upload_id: str, chunk_index: int) -> Optional[int]:
+    """Length of a chunk written into the data file, or None if it is stored as its own file."""
+    try:
+        with open(_marker_path(upload_id, chunk_index)) as f:
+            return int(f.read().strip())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _remove_if_exists(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _write_chunk_sync(upload_id: str, chunk_index: int, data: bytes) -> None:
+    meta = _read_meta(upload_id)
+    chunk_size = meta.get("chunk_size")
+    total_size = int(meta.get("total_size") or 0)
+    chunk_path = _chunk_path(upload_id, chunk_index)
+    marker_path = chunk_path + ".done"
+    end = chunk_index * chunk_size + len(data) if chunk_size else None
+    on_grid = (
+        chunk_size
+        and data
+        and end <= total_size
+        and (len(data) == chunk_size or end == total_size)
+        and os.path.isfile(_data_path(upload_id))
+    )
+    if on_grid:
+        with open(_data_path(upload_id), "r+b") as f:
+            f.seek(chunk_index * chunk_size)
+            f.write(data)
+        _remove_if_exists(chunk_path)
+        # The marker is written last: its presence means the bytes are in place.
+        with open(marker_path, "w") as f:
+            f.write(str(len(data)))
+    else:
+        with open(chunk_path, "wb") as f:
+            f.write(data)
+        _remove_if_exists(marker_path)
 
 
 async def init_upload(filename: str, total_size: int) -> dict:
+    """Create a staging directory for an upload. Raises ValueError if total_size is negative or too large."""
+    total_size = int(total_size or 0)
+    if total_size < 0:
+        raise ValueError(f"total_size must be non-negative, got {total_size}")
+    if total_size > MAX_UPLOAD_SIZE:
+        raise ValueError(f"total_size {total_size} exceeds the upload limit of {MAX_UPLOAD_SIZE} bytes")
+    _prune_caches()
     upload_id = uuid.uuid4().hex
     os.makedirs(_staging_dir(upload_id), exist_ok=True)
     meta = {
         "filename": filename,
         "total_size": total_size,
+        "chunk_size": CHUNK_SIZE,
         "created_at": datetime.now(timezone.utc).isoformat(),
     }
     with open(_meta_path(upload_id), "w") as f:
         json.dump(meta, f)
+    # Sized up front (sparse where the filesystem allows) so chunks can land at their offsets.
+    with open(_data_path(upload_id), "wb") as f:
+        f.truncate(total_size)
     return {"upload_id": upload_id, "chunk_size": CHUNK_SIZE}
 
 
 async def save_chunk(upload_id: str, chunk_index: int, data: bytes) -> list[int]:
+    """Store one chunk and return the chunk indices this process knows have arrived."""
     if not os.path.isdir(_staging_dir(upload_id)):
         raise ValueError(f"Upload {upload_id!r} not found")
-    with open(_chunk_path(upload_id, chunk_index), "wb") as f:
-        f.write(data)
-    return _received_chunks(upload_id)
+    _chunk_path(upload_id, chunk_index)  # validate the index before touching disk
+    await asyncio.to_thread(_write_chunk_sync, upload_id, chunk_index, data)
+    received = _received.get(upload_id)
+    if received is None:
+        received = _received[upload_id] = set(await asyncio.to_thread(_received_chunks, upload_id))
+    received.add(chunk_index)
+    return sorted(received)
 
 
 async def get_status(upload_id: str) -> dict:
     if not os.path.isdir(_staging_dir(upload_id)):
         raise ValueError(f"Upload {upload_id!r} not found")
+    received = await asyncio.to_thread(_received_chunks, upload_id)
+    _received[upload_id] = set(received)
     return {
         "upload_id": upload_id,
-        "received": _received_chunks(upload_id),
+        "received": received,
         "complete": os.path.isfile(_assembled_path(upload_id)),
     }
 
@@ -96,14 +228,41 @@ def assemble_upload_sync(upload_id: str, total_chunks: int) -> str:
     if missing:
         raise ValueError(f"Missing chunks: {missing}")
     out_path = _assembled_path(upload_id)
-    with open(out_path, "wb") as out_f:
-        for i in range(total_chunks):
-            with open(_chunk_path(upload_id, i), "rb") as chunk_f:
-                while True:
-                    buf = chunk_f.read(8 * 1024 * 1024)
+    data_path = _data_path(upload_id)
+    meta = _read_meta(upload_id)
+    chunk_size = meta.get("chunk_size")
+    total_size = int(meta.get("total_size") or 0)
+    lengths = [_in_place_length(upload_id, i) for i in range(total_chunks)]
+
+    # Every chunk already sits at its offset in the data file: the upload is the data file.
+    if (
+        chunk_size
+        and total_size > 0
+        and total_chunks == math.ceil(total_size / chunk_size)
+        and all(length is not None for length in lengths)
+    ):
+        if not os.path.isfile(data_path) and os.path.isfile(out_path):
+            return out_path  # already completed
+        os.replace(data_path, out_path)
+        return out_path
+
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as out_f:
+        for i, length in enumerate(lengths):
+            if length is None:
+                with open(_chunk_path(upload_id, i), "rb") as chunk_f:
+                    shutil.copyfileobj(chunk_f, out_f, _COPY_BUFFER_SIZE)
+                continue
+            with open(data_path, "rb") as data_f:
+                data_f.seek(i * chunk_size)
+                remaining = length
+                while remaining > 0:
+                    buf = data_f.read(min(_COPY_BUFFER_SIZE, remaining))
                     if not buf:
                         break
                     out_f.write(buf)
+                    remaining -= len(buf)
+    os.replace(tmp_path, out_path)
     return out_path
 
 
@@ -128,11 +287,12 @@ async def get_filename(upload_id: str) -> str:
 async def delete_upload(upload_id: str) -> None:
     """Remove the staging directory for this upload. Idempotent — safe to call for unknown IDs."""
     staging = _staging_dir(upload_id)
+    _forget(upload_id)
     if os.path.isdir(staging):
         shutil.rmtree(staging)
 
 
-def sweep_expired_uploads(max_age_hours: int = 24) -> int:
+def sweep_expired_uploads(max_age_hours: int = UPLOAD_MAX_AGE_HOURS) -> int:
     if not os.path.isdir(STAGING_ROOT):
         return 0
     cutoff = datetime.now(timezone.utc).timestamp() - max_age_hours * 3600
@@ -147,6 +307,7 @@ def sweep_expired_uploads(max_age_hours: int = 24) -> int:
                 meta = json.load(f)
             created_at = datetime.fromisoformat(meta["created_at"]).timestamp()
             if created_at < cutoff:
+                _forget(name)
                 shutil.rmtree(staging)
                 count += 1
         except Exception as exc:
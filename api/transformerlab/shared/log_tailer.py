@@ -0,0 +1,218 @@
+"""
+Shared, incremental tailing of remote log files for SSE streams.
+
+Each watched path gets one ``RemoteFileTailer`` no matter how many browser tabs
+follow it. A poll costs one ``info`` call (size + ETag); when the object grew
+only the new byte range is fetched with a ranged read, and segmented logs
+(lab.segmented_log) are followed from a cursor. New lines are broadcast to
+every subscriber's queue. Idle files are polled less often (up to
+LOG_TAIL_MAX_INTERVAL_MS); the interval drops back to the fastest subscriber's
+rate as soon as something changes. The tailer stops when its last subscriber
+leaves.
+
+Subscribers that want the whole log first read a backlog up to the tailer's
+position at the moment they subscribed, so they see every line exactly once.
+"""
+
+import asyncio
+import codecs
+import logging
+import os
+from typing import AsyncGenerator, Dict, List, Optional, Tuple
+
+from lab import segmented_log, storage
+
+logger = logging.getLogger(__name__)
+
+LOG_TAIL_MAX_INTERVAL_MS = int(os.getenv("TFL_LOG_TAIL_MAX_INTERVAL_MS", "5000"))
+LOG_TAIL_BACKOFF_FACTOR = 1.5
+
+
+def _etag(info: dict):
+    return info.get("ETag") or info.get("etag") or info.get("mtime") or info.get("LastModified")
+
+
+class RemoteFileTailer:
+    """Polls one file and fans new lines out to subscriber queues."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.interval_ms: float = 0
+        self.polls = 0
+        self.bytes_read = 0
+        self._subscribers: Dict[asyncio.Queue, int] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._init_lock = asyncio.Lock()
+        self._initialized = False
+        self._wake = asyncio.Event()
+        self._offset = 0
+        self._etag = None
+        self._segment_cursor: Optional[segmented_log.LogCursor] = None
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    async def _fs(self):
+        # Uncached so fsspec's listing cache never hides growth.
+        return await storage._get_uncached_filesystem(self.path)
+
+    async def _info(self) -> Tuple[int, object]:
+        fs = await self._fs()
+        info = await asyncio.to_thread(fs.info, self.path)
+        return int(info.get("size") or 0), _etag(info)
+
+    async def _read_range(self, start: int, end: Optional[int]) -> bytes:
+        fs = await self._fs()
+        data = await asyncio.to_thread(fs.cat_file, self.path, start=start or None, end=end)
+        self.bytes_read += len(data)
+        return data
+
+    async def _initialize(self) -> None:
+        async with self._init_lock:
+            if self._initialized:
+                return
+            try:
+                self._offset, self._etag = await self._info()
+            except FileNotFoundError:
+                self._offset, self._etag = 0, None
+            if await segmented_log.is_segmented(self.path):
+                _, self._segment_cursor = await segmented_log.read_log_since(self.path)
+            self._initialized = True
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def _base_interval_ms(self) -> float:
+        return min(self._subscribers.values(), default=500)
+
+    async def subscribe(
+        self, poll_interval_ms: int
+    ) -> Tuple[asyncio.Queue, Tuple[int, Optional[segmented_log.LogCursor]]]:
+        """Register a subscriber. Returns its queue and the position its backlog ends at."""
+        await self._initialize()
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers[queue] = poll_interval_ms
+        snapshot = (self._offset, self._segment_cursor)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"log-tailer:{self.path}")
+        else:
+            # Poll at the new subscriber's rate right away.
+            self._wake.set()
+        return queue, snapshot
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.pop(queue, None)
+        if not self._subscribers:
+            if _tailers.get(self.path) is self:
+                _tailers.pop(self.path, None)
+            if self._task is not None and not self._task.done():
+                self._task.cancel()
+            self._task = None
+
+    async def read_backlog(self, snapshot: Tuple[int, Optional[segmented_log.LogCursor]]) -> str:
+        """Content of the log up to ``snapshot`` (base file, then any segments)."""
+        offset, cursor = snapshot
+        text = ""
+        if offset:
+            text = (await self._read_range(0, offset)).decode("utf-8", errors="replace")
+        if cursor is not None:
+            segment_text = await segmented_log.read_log_until(self.path, cursor)
+            if segment_text and text and not text.endswith("\n"):
+                text += "\n"
+            text += segment_text
+        return text
+
+    def _publish(self, text: str) -> None:
+        lines = text.splitlines(keepends=True)
+        if not lines:
+            return
+        for queue in list(self._subscribers):
+            queue.put_nowait(lines)
+
+    async def poll_once(self) -> bool:
+        """Fetch anything new and broadcast it. Returns True if the log changed."""
+        self.polls += 1
+        if self._segment_cursor is not None:
+            text, self._segment_cursor = await segmented_log.read_log_since(self.path, self._segment_cursor)
+            self._publish(text)
+            return bool(text)
+
+        size, etag = await self._info()
+        if size > self._offset:
+            data = await self._read_range(self._offset, size)
+            self._offset += len(data)
+            self._etag = etag
+            self._publish(self._decoder.decode(data))
+            return True
+        if size < self._offset or (size == self._offset and etag != self._etag and self._etag is not None):
+            # Truncated or rewritten in place: send the whole current content again.
+            data = await self._read_range(0, None)
+            self._offset, self._etag = len(data), etag
+            self._decoder.reset()
+            self._publish(self._decoder.decode(data))
+            return True
+        self._etag = etag
+        # Writers that switch to a segmented log stop growing the base file, so only check when idle.
+        if await segmented_log.is_segmented(self.path):
+            self._segment_cursor = segmented_log.LogCursor()
+            return await self.poll_once()
+        return False
+
+    async def _run(self) -> None:
+        self.interval_ms = self._base_interval_ms()
+        try:
+            while self._subscribers:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=self.interval_ms / 1000.0)
+                except asyncio.TimeoutError:
+                    pass
+                try:
+                    changed = await self.poll_once()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:  # noqa: BLE001
+                    logger.debug(f"Log tailer: poll failed for {self.path}: {exc}")
+                    changed = False
+                base = self._base_interval_ms()
+                if changed or self._wake.is_set():
+                    self.interval_ms = base
+                else:
+                    self.interval_ms = min(
+                        self.interval_ms * LOG_TAIL_BACKOFF_FACTOR, max(LOG_TAIL_MAX_INTERVAL_MS, base)
+                    )
+        except asyncio.CancelledError:
+            pass
+
+
+_tailers: Dict[str, RemoteFileTailer] = {}
+
+
+def get_tailer(path: str) -> RemoteFileTailer:
+    """Return the shared tailer for ``path``, creating it if nobody is following the file yet."""
+    tailer = _tailers.get(path)
+    if tailer is None:
+        tailer = RemoteFileTailer(path)
+        _tailers[path] = tailer
+    return tailer
+
+
+async def follow_lines(
+    path: str, start_from_beginning: bool = False, poll_interval_ms: int = 500
+) -> AsyncGenerator[List[str], None]:
+    """Yield batches of new lines of ``path`` from the shared tailer until the caller stops iterating."""
+    tailer = get_tailer(path)
+    queue, snapshot = await tailer.subscribe(poll_interval_ms)
+    try:
+        if start_from_beginning:
+            try:
+                backlog = await tailer.read_backlog(snapshot)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(f"Log tailer: failed reading {path} from the beginning: {exc}")
+                backlog = ""
+            lines = backlog.splitlines(keepends=True)
+            if lines:
+                yield lines
+        while True:
+            yield await queue.get()
+    finally:
+        tailer.unsubscribe(queue)
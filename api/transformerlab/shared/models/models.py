@@ -393,3 +393,42 @@ class PublicShareLink(Base):
             "revoked_at",
         ),
     )
+
+
+class ComputeUsage(Base):
+    """
+    One row per REMOTE job that ran on a compute provider, for the usage report.
+
+    Written when the job reaches a terminal state (and by a one-time backfill of
+    existing jobs), so the report is answered with indexed queries instead of
+    scanning every experiment's jobs. usage_date is the job's start date.
+    """
+
+    __tablename__ = "compute_usage"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    team_id: Mapped[str] = mapped_column(String, nullable=False)
+    job_id: Mapped[str] = mapped_column(String, nullable=False)
+    experiment_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    status: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    user_email: Mapped[str] = mapped_column(String, nullable=False)
+    user_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    provider_key: Mapped[str] = mapped_column(String, nullable=False)  # provider_id, or provider_name if unset
+    provider_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    provider_name: Mapped[str] = mapped_column(String, nullable=False)
+    provider_type: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    usage_date: Mapped[Date] = mapped_column(Date, nullable=False)
+    start_time: Mapped[str] = mapped_column(String, nullable=False)
+    end_time: Mapped[str] = mapped_column(String, nullable=False)
+    duration_seconds: Mapped[float] = mapped_column(Float, nullable=False)
+    details: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)  # resources, cluster/task names
+    updated_at: Mapped[DateTime] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        Index("idx_compute_usage_team_job", "team_id", "job_id", unique=True),
+        Index("idx_compute_usage_team_date", "team_id", "usage_date"),
+        Index("idx_compute_usage_team_user", "team_id", "user_email"),
+        Index("idx_compute_usage_team_provider", "team_id", "provider_key"),
+    )
@@ -141,6 +141,31 @@ def get_media_type(filename: str) -> str:
     return media_type_map.get(ext, "application/octet-stream")
 
 
+def catalogue_etag(*tokens) -> str | None:
+    """
+    Build a strong ETag from catalogue head tokens (see lab.asset_catalogue) and
+    any request parameters the response depends on. Returns None if any token
+    is missing, in which case the response is sent without an ETag.
+    """
+    if not tokens or any(not token for token in tokens):
+        return None
+    return '"' + ".".join(str(token) for token in tokens) + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str | None) -> bool:
+    """Return True if an If-None-Match header value matches ``etag`` (weak comparison)."""
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    def _opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return any(_opaque(candidate) == _opaque(etag) for candidate in if_none_match.split(","))
+
+
 def print_in_rainbow(text):
     # Generate rainbow colors for the text
     rainbow_colors = generate_rainbow_colors(text, time_step=0.1)
@@ -0,0 +1,207 @@
+"""
+Pooled SSH connections for providers that drive a remote host over SSH (SLURM).
+
+One paramiko transport is kept per (host, port, user, key file) and shared by
+every caller: commands run as separate channels multiplexed over it, so a
+status cycle does one handshake instead of one per command. At most
+SSH_MAX_CHANNELS commands share a connection at once (sshd's MaxSessions
+defaults to 10). Transports send keep-alives every SSH_KEEPALIVE_SECONDS and are
+closed after SSH_IDLE_TIMEOUT_SECONDS without use. If a channel cannot be
+opened on a pooled connection, it is dropped and the command is retried once
+on a fresh one (the command has not started at that point).
+"""
+
+import contextlib
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterator, Optional, Tuple
+
+from transformerlab.shared.ssh_policy import get_add_if_verified_policy
+
+logger = logging.getLogger(__name__)
+
+SSH_CONNECT_TIMEOUT_SECONDS = float(os.getenv("TFL_SSH_CONNECT_TIMEOUT_SECONDS", "30"))
+SSH_KEEPALIVE_SECONDS = int(os.getenv("TFL_SSH_KEEPALIVE_SECONDS", "30"))
+SSH_IDLE_TIMEOUT_SECONDS = float(os.getenv("TFL_SSH_IDLE_TIMEOUT_SECONDS", "300"))
+SSH_MAX_CHANNELS = max(1, int(os.getenv("TFL_SSH_MAX_CHANNELS", "8")))
+
+PoolKey = Tuple[str, int, str, Optional[str], Optional[int]]
+
+
+class _PooledConnection:
+    def __init__(self, client) -> None:
+        self.client = client
+        self.channels = threading.BoundedSemaphore(SSH_MAX_CHANNELS)
+        self.last_used = time.monotonic()
+        self.in_use = 0
+
+    def is_alive(self) -> bool:
+        transport = self.client.get_transport()
+        return transport is not None and transport.is_active()
+
+    def close(self) -> None:
+        try:
+            self.client.close()
+        except Exception:
+            pass
+
+
+_connections: Dict[PoolKey, _PooledConnection] = {}
+_lock = threading.Lock()
+
+
+def _resolve_key_path(key_path: Optional[str]) -> Optional[str]:
+    if not key_path:
+        return None
+    resolved = os.path.expanduser(key_path)
+    if not os.path.exists(resolved):
+        raise FileNotFoundError(f"SSH key file not found: {resolved}")
+    return resolved
+
+
+def pool_key(host: str, port: int, user: str, key_path: Optional[str]) -> PoolKey:
+    """Connection identity. The key file's mtime is part of it, so replacing a key opens a new connection."""
+    resolved = _resolve_key_path(key_path)
+    key_mtime = os.stat(resolved).st_mtime_ns if resolved else None
+    return (host, int(port or 22), user, resolved, key_mtime)
+
+
+def _connect(key: PoolKey) -> _PooledConnection:
+    try:
+        import paramiko
+    except ImportError:
+        raise ImportError("paramiko is required for SSH mode. Install with: pip install paramiko")
+
+    host, port, user, key_path, _ = key
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(get_add_if_verified_policy())
+    connect_kwargs = {"hostname": host, "port": port, "username": user}
+    if key_path:
+        connect_kwargs["key_filename"] = key_path
+    client.connect(**connect_kwargs, timeout=SSH_CONNECT_TIMEOUT_SECONDS)
+    transport = client.get_transport()
+    if transport is not None and SSH_KEEPALIVE_SECONDS > 0:
+        transport.set_keepalive(SSH_KEEPALIVE_SECONDS)
+    return _PooledConnection(client)
+
+
+def _close_idle_locked(now: float) -> None:
+    for key, conn in list(_connections.items()):
+        if conn.in_use == 0 and (now - conn.last_used > SSH_IDLE_TIMEOUT_SECONDS or not conn.is_alive()):
+            _connections.pop(key, None)
+            conn.close()
+
+
+def _get_connection(key: PoolKey) -> _PooledConnection:
+    """Check out the pooled connection for ``key``; pair with _release()."""
+    with _lock:
+        _close_idle_locked(time.monotonic())
+        conn = _connections.get(key)
+        if conn is not None:
+            conn.in_use += 1
+            return conn
+    # Connect outside the lock so one slow host does not block the others.
+    new_conn = _connect(key)
+    with _lock:
+        conn = _connections.get(key)
+        if conn is not None and conn.is_alive():
+            new_conn.close()
+        else:
+            _connections[key] = conn = new_conn
+        conn.in_use += 1
+        return conn
+
+
+def _release(conn: _PooledConnection) -> None:
+    with _lock:
+        conn.in_use -= 1
+        conn.last_used = time.monotonic()
+
+
+def _discard(key: PoolKey, conn: _PooledConnection) -> None:
+    with _lock:
+        if _connections.get(key) is conn:
+            _connections.pop(key, None)
+    conn.close()
+
+
+def _is_connection_error(exc: Exception) -> bool:
+    try:
+        import paramiko
+    except ImportError:
+        return False
+    return isinstance(exc, (paramiko.SSHException, EOFError, ConnectionError, OSError)) and not isinstance(
+        exc, FileNotFoundError
+    )
+
+
+def execute(host: str, port: int, user: str, key_path: Optional[str], command: str) -> Tuple[str, str]:
+    """Run ``command`` on a pooled connection and return (stdout, stderr)."""
+    key = pool_key(host, port, user, key_path)
+    attempt = 0
+    while True:
+        conn = _get_connection(key)
+        try:
+            with conn.channels:
+                try:
+                    _stdin, stdout, stderr = conn.client.exec_command(command)
+                except Exception as exc:
+                    # Only a failure to open the channel is retried: the command has not run yet.
+                    if attempt == 0 and _is_connection_error(exc):
+                        logger.debug(f"SSH pool: dropping dead connection to {host}: {exc}")
+                        _discard(key, conn)
+                        attempt += 1
+                        continue
+                    raise
+                output = stdout.read().decode("utf-8")
+                error = stderr.read().decode("utf-8")
+            return output, error
+        finally:
+            _release(conn)
+
+
+@contextlib.contextmanager
+def open_sftp(host: str, port: int, user: str, key_path: Optional[str]) -> Iterator:
+    """
+    Open an SFTP session as a channel on the pooled connection and close it on exit.
+
+    The connection stays checked out, and the session holds one of its
+    SSH_MAX_CHANNELS slots, until the block exits, so an idle sweep cannot close
+    the transport under a long upload.
+    """
+    key = pool_key(host, port, user, key_path)
+    attempt = 0
+    while True:
+        conn = _get_connection(key)
+        try:
+            with conn.channels:
+                try:
+                    sftp = conn.client.open_sftp()
+                except Exception as exc:
+                    if attempt == 0 and _is_connection_error(exc):
+                        logger.debug(f"SSH pool: dropping dead connection to {host}: {exc}")
+                        _discard(key, conn)
+                        attempt += 1
+                        continue
+                    raise
+                try:
+                    yield sftp
+                finally:
+                    try:
+                        sftp.close()
+                    except Exception:
+                        pass
+            return
+        finally:
+            _release(conn)
+
+
+def close_all() -> None:
+    """Close every pooled connection."""
+    with _lock:
+        connections = list(_connections.values())
+        _connections.clear()
+    for conn in connections:
+        conn.close()
@@ -1,40 +1,234 @@
+"""
+Zip archives of storage files and directories.
+
+``stream_zip_from_storage`` / ``stream_zip_from_directory`` are async generators
+that yield the archive as it is produced, so responses can stream multi-GB job
+outputs without holding them in memory. Files are read in ZIP_READ_CHUNK_SIZE
+pieces, compressed on a worker thread, and written with data descriptors and
+ZIP64 headers (sizes are not known up front). A reader task stays up to
+ZIP_PREFETCH_CHUNKS chunks ahead of the compressor, so the next file is already
+being fetched while the current one is compressed; peak memory is bounded by
+those chunks regardless of archive size.
+
+``create_zip_from_storage`` / ``create_zip_from_directory`` collect the same
+stream into a BytesIO for callers that need the whole archive.
+"""
+
+import asyncio
 import io
+import os
 import posixpath
+import time
 import zipfile
-from typing import List
-
-
-async def _add_file_to_zip(zip_file: zipfile.ZipFile, file_path: str, arcname: str, storage) -> None:
-    async with await storage.open(file_path, "rb") as f:
-        file_content = await f.read()
-        zip_file.writestr(arcname, file_content)
-
-
-async def _add_directory_to_zip(zip_file: zipfile.ZipFile, directory_path: str, root_prefix: str, storage) -> None:
+from typing import AsyncIterator, List, Optional, Tuple
+
+ZIP_READ_CHUNK_SIZE = int(os.getenv("TFL_ZIP_READ_CHUNK_SIZE", str(1024 * 1024)))
+ZIP_PREFETCH_CHUNKS = max(1, int(os.getenv("TFL_ZIP_PREFETCH_CHUNKS", "4")))
+
+# Formats that are already compressed; deflating them again only costs CPU.
+STORE_ONLY_EXTENSIONS = frozenset(
+    {
+        ".zip",
+        ".gz",
+        ".tgz",
+        ".bz2",
+        ".xz",
+        ".zst",
+        ".7z",
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".webp",
+        ".mp3",
+        ".mp4",
+        ".webm",
+        ".parquet",
+    }
+)
+
+_END = object()
+
+
+class _ZipSink:
+    """Write-only, unseekable file object that hands written bytes to the generator."""
+
+    def __init__(self) -> None:
+        self._parts: List[bytes] = []
+
+    def write(self, data) -> int:
+        if data:
+            self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def _compress_type_for(arcname: str, store_only: bool) -> int:
+    if store_only or posixpath.splitext(arcname.lower())[1] in STORE_ONLY_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+async def _iter_directory_files(directory_path: str, root_prefix: str, storage) -> List[Tuple[str, str]]:
     try:
         walk_entries = await storage.walk(directory_path)
     except Exception as e:
         print(f"Error walking directory during zipping: {directory_path}: {e}")
-        return
+        return []
+
+    # fsspec reports remote roots without their scheme (e.g. "bucket/key").
+    protocol = directory_path.split("://", 1)[0] if "://" in directory_path else None
 
+    # walk() only reports files, so no per-file exists()/isfile() round trips are needed.
+    entries = []
     for root, _dirs, files in walk_entries:
+        if protocol and "://" not in root:
+            root = f"{protocol}://{root.lstrip('/')}"
         for file_name in files:
             file_path = storage.join(root, file_name)
+            rel_from_dir = posixpath.relpath(file_path, directory_path)
+            entries.append((file_path, posixpath.join(root_prefix, rel_from_dir)))
+    return entries
+
+
+async def _collect_storage_entries(file_paths: List[str], storage) -> List[Tuple[str, str]]:
+    entries = []
+    for file_path in file_paths:
+        try:
+            # Determine a relative name for the file inside the zip
+            # If it looks like a path, take the basename
+            filename = file_path.split("/")[-1] if "/" in file_path else file_path
+            if await storage.isdir(file_path):
+                entries.extend(await _iter_directory_files(file_path, filename, storage))
+            else:
+                # Missing files are skipped when they fail to open.
+                entries.append((file_path, filename))
+        except Exception as e:
+            print(f"Error adding file {file_path} to zip: {e}")
+    return entries
+
+
+async def _read_entries(entries: List[Tuple[str, str]], storage, queue: asyncio.Queue) -> None:
+    """Producer: push (arcname, chunk) items per file, (arcname, None) at its end, then _END."""
+    try:
+        for file_path, arcname in entries:
+            started = False
             try:
-                if not await storage.exists(file_path) or not await storage.isfile(file_path):
-                    continue
-                rel_from_dir = posixpath.relpath(file_path, directory_path)
-                arcname = posixpath.join(root_prefix, rel_from_dir)
-                await _add_file_to_zip(zip_file, file_path, arcname, storage)
+                async with await storage.open(file_path, "rb") as f:
+                    started = True
+                    while True:
+                        chunk = await f.read(ZIP_READ_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        await queue.put((arcname, chunk))
+            except FileNotFoundError:
+                print(f"File not found during zipping: {file_path}")
+            except IsADirectoryError:
+                pass
             except Exception as e:
-                print(f"Error adding nested file {file_path} to zip: {e}")
-                continue
+                print(f"Error adding file {file_path} to zip: {e}")
+            # Files that could not be opened are left out; a failure mid-read truncates the entry.
+            if started:
+                await queue.put((arcname, None))
+    finally:
+        await queue.put(_END)
+
+
+async def _stream_entries(entries: List[Tuple[str, str]], storage, store_only: bool = False) -> AsyncIterator[bytes]:
+    sink = _ZipSink()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=ZIP_PREFETCH_CHUNKS)
+    reader = asyncio.create_task(_read_entries(entries, storage, queue))
+    zip_file = zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED)
+    writer = None
+    try:
+        while True:
+            item = await queue.get()
+            if item is _END:
+                break
+            arcname, chunk = item
+            if chunk is None:
+                if writer is None:
+                    # Empty file: still gets an entry.
+                    writer = zip_file.open(_new_zipinfo(arcname, store_only), "w", force_zip64=True)
+                await asyncio.to_thread(writer.close)
+                writer = None
+            else:
+                if writer is None:
+                    writer = zip_file.open(_new_zipinfo(arcname, store_only), "w", force_zip64=True)
+                await asyncio.to_thread(writer.write, chunk)
+            data = sink.drain()
+            if data:
+                yield data
+        zip_file.close()
+        data = sink.drain()
+        if data:
+            yield data
+    finally:
+        reader.cancel()
+        try:
+            await reader
+        except (asyncio.CancelledError, Exception):
+            pass
+
+
+def _new_zipinfo(arcname: str, store_only: bool) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(arcname, date_time=time.localtime(time.time())[:6])
+    info.compress_type = _compress_type_for(arcname, store_only)
+    info.external_attr = 0o644 << 16
+    return info
+
+
+async def stream_zip_from_storage(file_paths: List[str], storage, store_only: bool = False) -> AsyncIterator[bytes]:
+    """
+    Stream a zip archive of a list of storage file or directory paths.
+
+    Args:
+        file_paths: List of absolute file paths to include in the zip. Directories
+            are added recursively under their basename.
+        storage: The storage backend to use for reading files.
+        store_only: Store every file uncompressed (already-compressed formats are always stored).
+
+    Yields:
+        bytes: Consecutive pieces of the zip file.
+    """
+    entries = await _collect_storage_entries(file_paths, storage)
+    async for data in _stream_entries(entries, storage, store_only=store_only):
+        yield data
+
+
+async def stream_zip_from_directory(
+    directory_path: str, storage, root_prefix: Optional[str] = None, store_only: bool = False
+) -> AsyncIterator[bytes]:
+    """
+    Stream a zip archive of a single directory path.
+    """
+    prefix = root_prefix or (directory_path.split("/")[-1] if "/" in directory_path else directory_path)
+    entries = await _iter_directory_files(directory_path, prefix, storage)
+    async for data in _stream_entries(entries, storage, store_only=store_only):
+        yield data
+
+
+async def _collect(stream: AsyncIterator[bytes]) -> io.BytesIO:
+    zip_buffer = io.BytesIO()
+    async for data in stream:
+        zip_buffer.write(data)
+    zip_buffer.seek(0)
+    return zip_buffer
 
 
 async def create_zip_from_storage(file_paths: List[str], storage) -> io.BytesIO:
     """
     Create a zip file in an in-memory buffer from a list of storage file paths.
 
+    Prefer stream_zip_from_storage() for responses; this holds the whole archive in memory.
+
     Args:
         file_paths: List of absolute file paths to include in the zip.
         storage: The storage backend to use for reading files.
@@ -42,47 +236,11 @@ async def create_zip_from_storage(file_paths: List[str], storage) -> io.BytesIO:
     Returns:
         io.BytesIO: Buffer containing the zip file data.
     """
-    zip_buffer = io.BytesIO()
-
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-        for file_path in file_paths:
-            try:
-                # Determine a relative name for the file inside the zip
-                # If it looks like a path, take the basename
-                filename = file_path.split("/")[-1] if "/" in file_path else file_path
-
-                # Check if file exists to avoid errors
-                if not await storage.exists(file_path):
-                    print(f"File not found during zipping: {file_path}")
-                    continue
-
-                if await storage.isdir(file_path):
-                    await _add_directory_to_zip(zip_file, file_path, filename, storage)
-                    continue
-
-                if not await storage.isfile(file_path):
-                    continue
-
-                # Read file content from storage
-                await _add_file_to_zip(zip_file, file_path, filename, storage)
-            except Exception as e:
-                print(f"Error adding file {file_path} to zip: {e}")
-                # Continue with other files even if one fails
-                continue
-
-    zip_buffer.seek(0)
-    return zip_buffer
+    return await _collect(stream_zip_from_storage(file_paths, storage))
 
 
 async def create_zip_from_directory(directory_path: str, storage, root_prefix: str | None = None) -> io.BytesIO:
     """
     Create a zip file from a single directory path.
     """
-    zip_buffer = io.BytesIO()
-    prefix = root_prefix or (directory_path.split("/")[-1] if "/" in directory_path else directory_path)
-
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-        await _add_directory_to_zip(zip_file, directory_path, prefix, storage)
-
-    zip_buffer.seek(0)
-    return zip_buffer
+    return await _collect(stream_zip_from_directory(directory_path, storage, root_prefix=root_prefix))
@@ -348,20 +348,18 @@ def command_model_download(
         console=console,
     ) as progress:
         bar = progress.add_task(f"Downloading {model_id}", total=total_bytes)
-        for f in files:
-            relpath = f["relpath"]
-            size = f["size"]
-            target = os.path.join(base, *relpath.split("/"))
-            try:
-                chunked_download.download_one_file(
-                    f"/model/file?model_id={model_id}&relpath={relpath}",
-                    target_path=target,
-                    server_size=size,
-                    progress=progress,
-                    progress_task=bar,
-                )
-            except Exception as exc:
-                console.print(f"[error]Failed to download {relpath}: {exc}")
-                raise typer.Exit(1)
+        items = [
+            chunked_download.DownloadItem(
+                path=f"/model/file?model_id={model_id}&relpath={f['relpath']}",
+                target_path=os.path.join(base, *f["relpath"].split("/")),
+                size=f["size"],
+            )
+            for f in files
+        ]
+        try:
+            chunked_download.download_files(items, progress=progress, progress_task=bar)
+        except Exception as exc:
+            console.print(f"[error]Failed to download {exc}")
+            raise typer.Exit(1)
 
     console.print(f"[success]✓[/success] Downloaded {len(files)} file(s) to {base}.")
@@ -1,7 +1,24 @@
-"""Streaming download helper with HTTP Range-based resume."""
+"""Streaming download helpers with HTTP Range-based resume.
 
+`download_one_file` fetches one file over a single streaming GET. `download_files`
+is the engine behind `lab model/dataset download`: it downloads many files at once
+on a shared pool of DOWNLOAD_CONCURRENCY workers (LAB_DOWNLOAD_CONCURRENCY,
+default 8), and splits files larger than DOWNLOAD_RANGE_SIZE (LAB_DOWNLOAD_RANGE_SIZE,
+default 64 MB) into ranges fetched concurrently into a preallocated file.
+
+A ranged download keeps a `<target>.ranges` sidecar listing the finished ranges,
+so an interrupted download only refetches the ranges that were not complete. The
+sidecar is written before the file is preallocated and removed once every range
+has landed, so a full-size target without a sidecar is a finished download.
+"""
+
+import hashlib
+import json
 import os
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Iterable, Optional
 
 import httpx
 from rich.progress import Progress, TaskID
@@ -9,12 +26,42 @@ from rich.progress import Progress, TaskID
 from transformerlab_cli.util.api import _request_headers
 from transformerlab_cli.util.shared import BASE_URL
 
+DOWNLOAD_CONCURRENCY = max(1, int(os.environ.get("LAB_DOWNLOAD_CONCURRENCY", "8")))
+DOWNLOAD_RANGE_SIZE = max(1024 * 1024, int(os.environ.get("LAB_DOWNLOAD_RANGE_SIZE", str(64 * 1024 * 1024))))
+
+
+@dataclass
+class DownloadItem:
+    """One file to fetch: an API path (URL is BASE_URL+path), where to put it, and its size."""
+
+    path: str
+    target_path: str
+    size: int
+    sha256: Optional[str] = None
+
 
 def _build_client() -> httpx.Client:
     """Return a configured httpx.Client. Indirected so tests can patch it."""
     return httpx.Client(timeout=None)
 
 
+def _advance(progress: Optional[Progress], progress_task: Optional[TaskID], amount: int) -> None:
+    if progress is not None and progress_task is not None and amount:
+        progress.advance(progress_task, amount)
+
+
+def _verify_sha256(target_path: str, expected: Optional[str]) -> None:
+    if not expected:
+        return
+    digest = hashlib.sha256()
+    with open(target_path, "rb") as fh:
+        for block in iter(lambda: fh.read(8 * 1024 * 1024), b""):
+            digest.update(block)
+    if digest.hexdigest() != expected.lower():
+        os.remove(target_path)
+        raise RuntimeError(f"checksum mismatch: expected sha256 {expected}, got {digest.hexdigest()}")
+
+
 def download_one_file(
     path: str,
     *,
@@ -23,6 +70,8 @@ def download_one_file(
     progress: Optional[Progress] = None,
     progress_task: Optional[TaskID] = None,
     chunk_bytes: int = 1024 * 1024,
+    client: Optional[httpx.Client] = None,
+    sha256: Optional[str] = None,
 ) -> None:
     """Download `path` (an API path; URL is BASE_URL+path) to `target_path`.
 
@@ -30,13 +79,15 @@ def download_one_file(
     - If target exists and its size matches `server_size`: skip (and advance progress).
     - If target exists with size < server_size: resume via Range: bytes=<size>-.
     - If target exists with size > server_size: delete and start over.
+    - If `sha256` is given, the finished file is checked against it (and removed on mismatch).
     - On any other error: raise RuntimeError.
+
+    `client` lets callers share one connection pool; it is not closed here.
     """
     existing = os.path.getsize(target_path) if os.path.isfile(target_path) else 0
 
     if existing == server_size:
-        if progress is not None and progress_task is not None:
-            progress.advance(progress_task, server_size)
+        _advance(progress, progress_task, server_size)
         return
 
     if existing > server_size:
@@ -47,14 +98,15 @@ def download_one_file(
     if existing > 0:
         headers["Range"] = f"bytes={existing}-"
 
-    if progress is not None and progress_task is not None and existing:
-        progress.advance(progress_task, existing)
+    _advance(progress, progress_task, existing)
 
     os.makedirs(os.path.dirname(target_path) or ".", exist_ok=True)
     mode = "ab" if existing > 0 else "wb"
 
     url = f"{BASE_URL()}{path}"
-    client = _build_client()
+    own_client = client is None
+    if own_client:
+        client = _build_client()
     try:
         with client.stream("GET", url, headers=headers) as resp:
             if resp.status_code not in (200, 206):
@@ -64,11 +116,165 @@ def download_one_file(
                     if not chunk:
                         continue
                     out.write(chunk)
-                    if progress is not None and progress_task is not None:
-                        progress.advance(progress_task, len(chunk))
+                    _advance(progress, progress_task, len(chunk))
     finally:
-        client.close()
+        if own_client:
+            client.close()
 
     final_size = os.path.getsize(target_path)
     if final_size != server_size:
         raise RuntimeError(f"size mismatch after download: expected {server_size}, got {final_size}")
+    _verify_sha256(target_path, sha256)
+
+
+class _RangedDownload:
+    """One large file fetched as independent byte ranges written at their offsets."""
+
+    def __init__(self, item: DownloadItem, range_size: int):
+        self.item = item
+        self.sidecar = item.target_path + ".ranges"
+        self.range_size = range_size
+        self.count = max(1, -(-item.size // range_size))
+        self.done: set[int] = set()
+        self._lock = threading.Lock()
+
+    def _save(self) -> None:
+        tmp = self.sidecar + ".tmp"
+        with open(tmp, "w") as fh:
+            json.dump({"size": self.item.size, "range_size": self.range_size, "done": sorted(self.done)}, fh)
+        os.replace(tmp, self.sidecar)
+
+    def prepare(self) -> list[int]:
+        """Set up the target file and return the range indices still to fetch."""
+        target = self.item.target_path
+        os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+        existing = os.path.getsize(target) if os.path.isfile(target) else 0
+        state = None
+        if os.path.isfile(self.sidecar):
+            try:
+                with open(self.sidecar) as fh:
+                    state = json.load(fh)
+            except (OSError, ValueError):
+                state = {}
+        if state is None and existing == self.item.size:
+            # Finished by an earlier run.
+            self.done = set(range(self.count))
+            return []
+        if state and state.get("size") == self.item.size and existing == self.item.size:
+            self.range_size = int(state["range_size"])
+            self.count = max(1, -(-self.item.size // self.range_size))
+            self.done = {int(i) for i in state.get("done", []) if 0 <= int(i) < self.count}
+        elif 0 < existing < self.item.size and state is None:
+            # A partial file from a plain streaming download: its prefix is valid.
+            self.done = {i for i in range(self.count) if min((i + 1) * self.range_size, self.item.size) <= existing}
+        else:
+            self.done = set()
+            if existing:
+                os.remove(target)
+        self._save()
+        mode = "r+b" if os.path.isfile(target) else "wb"
+        with open(target, mode) as fh:
+            fh.truncate(self.item.size)
+        return [i for i in range(self.count) if i not in self.done]
+
+    def finished_bytes(self) -> int:
+        return sum(min(self.range_size, self.item.size - i * self.range_size) for i in self.done)
+
+    def fetch(
+        self,
+        client: httpx.Client,
+        index: int,
+        progress: Optional[Progress],
+        progress_task: Optional[TaskID],
+        chunk_bytes: int = 1024 * 1024,
+    ) -> None:
+        start = index * self.range_size
+        end = min(start + self.range_size, self.item.size) - 1
+        headers = dict(_request_headers())
+        headers["Range"] = f"bytes={start}-{end}"
+        written = 0
+        with client.stream("GET", f"{BASE_URL()}{self.item.path}", headers=headers) as resp:
+            if resp.status_code != 206:
+                raise RuntimeError(f"range {start}-{end} failed ({resp.status_code}): {resp.read()!r}")
+            with open(self.item.target_path, "r+b") as out:
+                out.seek(start)
+                for chunk in resp.iter_bytes(chunk_size=chunk_bytes):
+                    if not chunk:
+                        continue
+                    if written + len(chunk) > end - start + 1:
+                        raise RuntimeError(f"range {start}-{end}: server sent more bytes than requested")
+                    out.write(chunk)
+                    written += len(chunk)
+                    _advance(progress, progress_task, len(chunk))
+        if written != end - start + 1:
+            raise RuntimeError(f"range {start}-{end}: expected {end - start + 1} bytes, got {written}")
+        with self._lock:
+            self.done.add(index)
+            if len(self.done) < self.count:
+                self._save()
+                return
+        self.finish()
+
+    def finish(self) -> None:
+        """Drop the sidecar once every range is in place, then check the checksum if one was given."""
+        if not os.path.isfile(self.sidecar):
+            return
+        os.remove(self.sidecar)
+        _verify_sha256(self.item.target_path, self.item.sha256)
+
+
+def download_files(
+    items: Iterable[DownloadItem],
+    *,
+    progress: Optional[Progress] = None,
+    progress_task: Optional[TaskID] = None,
+    concurrency: Optional[int] = None,
+    range_size: Optional[int] = None,
+) -> None:
+    """Download every item, `concurrency` requests at a time (default DOWNLOAD_CONCURRENCY).
+
+    Files larger than `range_size` (default DOWNLOAD_RANGE_SIZE), or with a
+    `.ranges` sidecar left by an interrupted run, are fetched as concurrent byte
+    ranges; smaller files go through download_one_file. The first failure cancels
+    work that has not started and is raised as RuntimeError naming the file.
+    """
+    range_size = range_size or DOWNLOAD_RANGE_SIZE
+    window = max(1, concurrency or DOWNLOAD_CONCURRENCY)
+    client = _build_client()
+    try:
+        with ThreadPoolExecutor(max_workers=window) as pool:
+            futures = {}
+            for item in items:
+                if item.size > range_size or os.path.isfile(item.target_path + ".ranges"):
+                    ranged = _RangedDownload(item, range_size)
+                    pending = ranged.prepare()
+                    _advance(progress, progress_task, ranged.finished_bytes())
+                    if not pending:
+                        ranged.finish()
+                    for index in pending:
+                        future = pool.submit(ranged.fetch, client, index, progress, progress_task)
+                        futures[future] = item
+                else:
+                    future = pool.submit(
+                        download_one_file,
+                        item.path,
+                        target_path=item.target_path,
+                        server_size=item.size,
+                        progress=progress,
+                        progress_task=progress_task,
+                        client=client,
+                        sha256=item.sha256,
+                    )
+                    futures[future] = item
+            try:
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as exc:
+                        raise RuntimeError(f"{futures[future].target_path}: {exc}") from exc
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+    finally:
+        client.close()
@@ -3,16 +3,36 @@
 Uses the generic /upload/{init,chunk,status,complete} endpoints in the API. Returns the
 upload_id of the assembled file so callers can plumb it through to a domain-specific
 endpoint (e.g. /model/fileupload?upload_id=...).
+
+Chunks are sent UPLOAD_CONCURRENCY at a time (LAB_UPLOAD_CONCURRENCY, default 4) so a
+large file keeps several requests on the wire; each worker reads its own chunk, so at
+most that many chunks are held in memory.
 """
 
 import math
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
 from rich.progress import Progress, TaskID
 
 import transformerlab_cli.util.api as api
 
+UPLOAD_CONCURRENCY = max(1, int(os.environ.get("LAB_UPLOAD_CONCURRENCY", "4")))
+
+
+def _put_chunk(upload_id: str, local_path: str, index: int, chunk_size: int) -> None:
+    with open(local_path, "rb") as fh:
+        fh.seek(index * chunk_size)
+        chunk = fh.read(chunk_size)
+    put_resp = api.put(
+        f"/upload/{upload_id}/chunk?chunk_index={index}",
+        content=chunk,
+        headers={"Content-Type": "application/octet-stream"},
+    )
+    if put_resp.status_code != 200:
+        raise RuntimeError(f"chunk {index} failed ({put_resp.status_code}): {put_resp.text}")
+
 
 def upload_one_file(
     local_path: str,
@@ -20,6 +40,7 @@ def upload_one_file(
     server_filename: Optional[str] = None,
     progress: Optional[Progress] = None,
     progress_task: Optional[TaskID] = None,
+    concurrency: Optional[int] = None,
 ) -> str:
     """Upload one file via /upload/init → /chunk → /complete and return upload_id.
 
@@ -32,6 +53,10 @@ def upload_one_file(
 
     `progress` and `progress_task` are optional: when set, the helper advances
     the rich progress task by one per uploaded chunk.
+
+    `concurrency` is how many chunks are in flight at once (default
+    UPLOAD_CONCURRENCY). The first failed chunk cancels the ones not yet started
+    and is raised once the in-flight ones finish; a rerun resumes from there.
     """
     size = os.path.getsize(local_path)
     filename = server_filename or os.path.basename(local_path)
@@ -52,21 +77,20 @@ def upload_one_file(
     if progress is not None and progress_task is not None:
         progress.advance(progress_task, len(received))
 
-    with open(local_path, "rb") as fh:
-        for i in range(total_chunks):
-            if i in received:
-                continue
-            fh.seek(i * chunk_size)
-            chunk = fh.read(chunk_size)
-            put_resp = api.put(
-                f"/upload/{upload_id}/chunk?chunk_index={i}",
-                content=chunk,
-                headers={"Content-Type": "application/octet-stream"},
-            )
-            if put_resp.status_code != 200:
-                raise RuntimeError(f"chunk {i} failed ({put_resp.status_code}): {put_resp.text}")
-            if progress is not None and progress_task is not None:
-                progress.advance(progress_task, 1)
+    pending = [i for i in range(total_chunks) if i not in received]
+    if pending:
+        window = max(1, min(concurrency or UPLOAD_CONCURRENCY, len(pending)))
+        with ThreadPoolExecutor(max_workers=window) as pool:
+            futures = [pool.submit(_put_chunk, upload_id, local_path, i, chunk_size) for i in pending]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+                    if progress is not None and progress_task is not None:
+                        progress.advance(progress_task, 1)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
 
     complete_resp = api.post_json(
         f"/upload/{upload_id}/complete",
@@ -1,9 +1,12 @@
+import hashlib
+import json
 from pathlib import Path
 from unittest.mock import patch
 
 import httpx
+import pytest
 
-from transformerlab_cli.util.chunked_download import download_one_file
+from transformerlab_cli.util.chunked_download import DownloadItem, download_files, download_one_file
 
 
 def _build_handler(server_bytes: bytes):
@@ -77,3 +80,82 @@ def test_download_one_file_oversized_local_restarts(build_client, tmp_path: Path
     download_one_file("/x", target_path=str(target), server_size=len(body))
 
     assert target.read_bytes() == body
+
+
+def _ranged_handler(files: dict, requests: list):
+    """Serve {path: bytes}, honoring Range: bytes=a-b, and record every request's (path, range)."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = files[request.url.params["relpath"]]
+        rng = request.headers.get("range")
+        requests.append((request.url.params["relpath"], rng))
+        if not rng:
+            return httpx.Response(200, content=body)
+        start_s, end_s = rng.split("=")[1].split("-")
+        start = int(start_s)
+        end = int(end_s) if end_s else len(body) - 1
+        return httpx.Response(
+            206,
+            content=body[start : end + 1],
+            headers={"Content-Range": f"bytes {start}-{end}/{len(body)}"},
+        )
+
+    return handler
+
+
+def _items(tmp_path: Path, files: dict, **extra):
+    return [
+        DownloadItem(path=f"/model/file?relpath={name}", target_path=str(tmp_path / name), size=len(body), **extra)
+        for name, body in files.items()
+    ]
+
+
+@patch("transformerlab_cli.util.chunked_download._build_client")
+def test_download_files_splits_large_files_into_ranges(build_client, tmp_path: Path):
+    files = {"big.bin": bytes(range(256)) * 20_000, "small.json": b"{}"}  # ~5 MB and 2 bytes
+    requests = []
+    build_client.return_value = httpx.Client(transport=httpx.MockTransport(_ranged_handler(files, requests)))
+
+    download_files(_items(tmp_path, files), concurrency=4, range_size=1024 * 1024)
+
+    for name, body in files.items():
+        assert (tmp_path / name).read_bytes() == body
+    big_ranges = [rng for name, rng in requests if name == "big.bin"]
+    assert len(big_ranges) == 5
+    assert "bytes=0-1048575" in big_ranges
+    assert not (tmp_path / "big.bin.ranges").exists()
+
+
+@patch("transformerlab_cli.util.chunked_download._build_client")
+def test_download_files_resumes_only_unfinished_ranges(build_client, tmp_path: Path):
+    body = bytes(range(256)) * 16_384  # 4 MB
+    files = {"big.bin": body}
+    target = tmp_path / "big.bin"
+    range_size = 1024 * 1024
+    # An interrupted run: ranges 0 and 2 landed, the rest of the file is still preallocated zeros.
+    partial = bytearray(len(body))
+    partial[0:range_size] = body[0:range_size]
+    partial[2 * range_size : 3 * range_size] = body[2 * range_size : 3 * range_size]
+    target.write_bytes(bytes(partial))
+    (tmp_path / "big.bin.ranges").write_text(json.dumps({"size": len(body), "range_size": range_size, "done": [0, 2]}))
+    requests = []
+    build_client.return_value = httpx.Client(transport=httpx.MockTransport(_ranged_handler(files, requests)))
+
+    download_files(_items(tmp_path, files), range_size=range_size)
+
+    assert target.read_bytes() == body
+    assert sorted(rng for _, rng in requests) == ["bytes=1048576-2097151", "bytes=3145728-4194303"]
+    assert not (tmp_path / "big.bin.ranges").exists()
+
+
+@patch("transformerlab_cli.util.chunked_download._build_client")
+def test_download_files_checksum_mismatch_raises(build_client, tmp_path: Path):
+    files = {"weights.bin": b"payload"}
+    build_client.side_effect = lambda: httpx.Client(transport=httpx.MockTransport(_ranged_handler(files, [])))
+
+    with pytest.raises(RuntimeError, match="checksum mismatch"):
+        download_files(_items(tmp_path, files, sha256=hashlib.sha256(b"other").hexdigest()))
+    assert not (tmp_path / "weights.bin").exists()
+
+    download_files(_items(tmp_path, files, sha256=hashlib.sha256(b"payload").hexdigest()))
+    assert (tmp_path / "weights.bin").read_bytes() == b"payload"
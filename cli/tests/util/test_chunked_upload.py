@@ -92,3 +92,44 @@ def test_upload_one_file_zero_bytes_sends_no_chunks(post_json, get, put, tmp_pat
     assert put.call_count == 0
     complete_call = post_json.call_args_list[1]
     assert complete_call.kwargs["json_data"] == {"total_chunks": 0}
+
+
+@patch("transformerlab_cli.util.chunked_upload.api.put")
+@patch("transformerlab_cli.util.chunked_upload.api.get")
+@patch("transformerlab_cli.util.chunked_upload.api.post_json")
+def test_upload_one_file_sends_chunks_concurrently(post_json, get, put, tmp_path: Path):
+    import threading
+
+    f = tmp_path / "blob.bin"
+    data = bytes(range(256)) * (4 * 1024)  # 1 MB
+    f.write_bytes(data)
+    chunk_size = 128 * 1024
+    post_json.side_effect = [
+        _resp(200, {"upload_id": "abc", "chunk_size": chunk_size}),
+        _resp(200, {"temp_path": "/tmp/abc/assembled"}),
+    ]
+    get.return_value = _resp(200, {"received": []})
+
+    lock = threading.Lock()
+    state = {"in_flight": 0, "peak": 0}
+    sent = {}
+    all_started = threading.Barrier(4, timeout=5)
+
+    def fake_put(path, content, headers):
+        with lock:
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+        if int(path.rsplit("=", 1)[1]) < 4:
+            all_started.wait()  # the first four chunks are only released once all four are in flight
+        sent[int(path.rsplit("=", 1)[1])] = content
+        with lock:
+            state["in_flight"] -= 1
+        return _resp(200, {})
+
+    put.side_effect = fake_put
+
+    upload_one_file(str(f), concurrency=4)
+
+    assert state["peak"] == 4
+    assert b"".join(sent[i] for i in sorted(sent)) == data
+    assert post_json.call_args_list[1].kwargs["json_data"] == {"total_chunks": 8}
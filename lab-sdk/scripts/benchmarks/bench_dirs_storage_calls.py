@@ -0,0 +1,90 @@
+"""
+Storage-call benchmark: filesystem calls per job listing, with and without the
+lab.dirs path resolution cache.
+
+Creates an experiment with N jobs in a throwaway local workspace, then lists
+them the two ways the API does (``job_service.jobs_get_all``): from the job
+catalogue, and by hydrating every job (``Job.get`` + ``get_json_data``), which
+is the catalogue fallback. Every call into lab.storage is counted by name, so
+the numbers carry over to object stores where each one is a round trip.
+
+Usage:
+    python scripts/benchmarks/bench_dirs_storage_calls.py [--jobs 50] [--rounds 3]
+"""
+
+import argparse
+import asyncio
+import collections
+import os
+import tempfile
+
+_COUNTED = ("makedirs", "exists", "isdir", "isfile", "ls", "open", "root_uri", "find", "walk", "rm", "rm_tree")
+
+
+def _install_counters(storage) -> collections.Counter:
+    counts: collections.Counter = collections.Counter()
+    for name in _COUNTED:
+        original = getattr(storage, name)
+
+        def _wrap(fn, label):
+            async def counted(*args, **kwargs):
+                counts[label] += 1
+                return await fn(*args, **kwargs)
+
+            return counted
+
+        setattr(storage, name, _wrap(original, name))
+    return counts
+
+
+async def _run(args) -> None:
+    from lab import dirs, job_catalogue, storage
+    from lab.experiment import Experiment
+    from lab.job import Job
+
+    experiment = await Experiment.create("bench_dirs")
+    job_ids = [str((await experiment.create_job()).id) for _ in range(args.jobs)]
+    counts = _install_counters(storage)
+
+    async def _catalogue_listing():
+        await job_catalogue.load_jobs(experiment.id)
+
+    async def _hydrated_listing():
+        for job_id in job_ids:
+            job = await Job.get(job_id, experiment.id)
+            await job.get_json_data()
+
+    rows = []
+    for label, fn in (("catalogue listing", _catalogue_listing), ("hydrated listing", _hydrated_listing)):
+        for enabled in (False, True):
+            dirs.set_path_cache_enabled(enabled)
+            await fn()  # warm-up: the cache fills here
+            counts.clear()
+            for _ in range(args.rounds):
+                await fn()
+            per_listing = {name: count / args.rounds for name, count in counts.items()}
+            rows.append((label, "on" if enabled else "off", per_listing))
+
+    print(f"{args.jobs} jobs, {args.rounds} rounds; storage calls per listing")
+    print(f"{'case':<20} {'cache':<6} {'total':>8}  breakdown")
+    for label, enabled, per_listing in rows:
+        breakdown = ", ".join(f"{name}={value:g}" for name, value in sorted(per_listing.items()))
+        print(f"{label:<20} {enabled:<6} {sum(per_listing.values()):>8g}  {breakdown}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="tfl_bench_dirs_")
+    os.environ["TFL_HOME_DIR"] = os.path.join(tmp, "home")
+    os.environ["TFL_WORKSPACE_DIR"] = os.path.join(tmp, "workspace")
+    os.makedirs(os.environ["TFL_HOME_DIR"])
+    os.makedirs(os.environ["TFL_WORKSPACE_DIR"])
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Micro-benchmark: per-call overhead of the sync Lab facade.
+
+Compares running coroutines the old way (a fresh ``asyncio.run`` per call)
+with the shared background loop in ``lab.async_runtime``, first for an empty
+coroutine, then for a storage call that hops through ``asyncio.to_thread``,
+and finally for real ``Lab.set_job_data_field`` / ``Lab.log`` calls in
+blocking and background mode.
+
+Usage:
+    python scripts/benchmarks/bench_lab_runtime.py [--calls 2000]
+
+Runs against a throwaway local workspace unless TFL_WORKSPACE_DIR /
+TFL_STORAGE_URI are already set, in which case it uses that storage.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+
+def _per_call_us(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    if not os.environ.get("TFL_WORKSPACE_DIR") and not os.environ.get("TFL_STORAGE_URI"):
+        tmp = tempfile.mkdtemp(prefix="tfl_bench_")
+        os.environ["TFL_HOME_DIR"] = os.path.join(tmp, "home")
+        os.environ["TFL_WORKSPACE_DIR"] = os.path.join(tmp, "workspace")
+        os.makedirs(os.environ["TFL_HOME_DIR"])
+        os.makedirs(os.environ["TFL_WORKSPACE_DIR"])
+
+    from lab import storage
+    from lab.async_runtime import get_runtime
+    from lab.lab_facade import Lab
+
+    runtime = get_runtime()
+    probe_path = os.environ["TFL_WORKSPACE_DIR"]
+
+    async def _noop():
+        return None
+
+    async def _storage_call():
+        return await storage.exists(probe_path)
+
+    rows = [
+        ("empty coroutine, asyncio.run per call", _per_call_us(lambda: asyncio.run(_noop()), args.calls)),
+        ("empty coroutine, shared runtime", _per_call_us(lambda: runtime.run(_noop()), args.calls)),
+        ("storage.exists, asyncio.run per call", _per_call_us(lambda: asyncio.run(_storage_call()), args.calls)),
+        ("storage.exists, shared runtime", _per_call_us(lambda: runtime.run(_storage_call()), args.calls)),
+    ]
+
+    lab = Lab()
+    lab.init(experiment_id="bench_runtime")
+    rows.append(("Lab.set_job_data_field (blocking)", _per_call_us(lambda: lab.set_job_data_field("k", 1), args.calls)))
+    rows.append(("Lab.log (blocking)", _per_call_us(lambda: lab.log("bench"), args.calls)))
+
+    background = Lab(background_writes=True)
+    background.init(experiment_id="bench_runtime")
+    rows.append(
+        (
+            "Lab.set_job_data_field (background, submit only)",
+            _per_call_us(lambda: background.set_job_data_field("k", 1), args.calls),
+        )
+    )
+    start = time.perf_counter()
+    background.flush()
+    rows.append(("  ...drain of the background queue (total ms)", (time.perf_counter() - start) * 1e3))
+
+    width = max(len(name) for name, _ in rows)
+    print(f"{'case':<{width}}  per call (us)")
+    for name, value in rows:
+        print(f"{name:<{width}}  {value:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Workspace-level catalogues for listings that would otherwise walk a directory tree.
+
+Listing models, datasets or experiments used to mean an ``isdir``/``exists``/
+``ls`` per entry (and per version folder) plus one ``index.json`` read each. A
+catalogue keeps the latest JSON of every entry in the job catalogue's layout (see
+lab.change_log), one per catalogue name:
+
+    {workspace}/catalogues/{name}/snapshot.json      {"applied": [<change>...], "entries": {...}}
+    {workspace}/catalogues/{name}/changes/<ns>-<rand>.json
+    {workspace}/catalogues/{name}/head.json          {"etag": <token>}
+
+Writers append one change (``None`` removes an entry) and then rewrite the
+small ``head.json`` with a fresh token. ``etag`` reads only the head, so a
+caller can answer a conditional request without loading the catalogue. The
+head is always written after the data it describes and must be read before
+the data it is sent with; an unchanged token then means nothing was recorded
+in between.
+
+A catalogue without a snapshot is rebuilt on first use from the ``scan``
+coroutine the caller passes to ``load_entries``. Changes made behind the
+catalogue's back (files copied, restored or removed directly, or written by an
+SDK that predates the catalogue) are picked up by ``reconcile``, which
+``load_entries`` starts in the background at most once per
+``TFL_ASSET_CATALOGUE_RESCAN_SECONDS`` per process, and by ``rebuild``.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Awaitable, Callable
+
+from . import change_log
+from . import dirs
+from . import storage
+from .change_log import CHANGES_DIRNAME, basename
+from .job_catalogue import COMPACT_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+MODELS = "models"
+DATASETS = "datasets"
+EXPERIMENTS = "experiments"
+
+HEAD_NAME = "head.json"
+ENTRIES_KEY = "entries"
+
+RESCAN_SECONDS = float(os.getenv("TFL_ASSET_CATALOGUE_RESCAN_SECONDS", "120"))
+
+Scan = Callable[[], Awaitable[dict[str, dict]]]
+
+# Last reconcile per catalogue dir (monotonic time), and the running reconcile tasks.
+_last_reconcile: dict[str, float] = {}
+_reconcile_tasks: set[asyncio.Task] = set()
+
+
+async def _paths(name: str) -> tuple[str, str]:
+    catalogue_dir = await dirs.get_catalogue_dir(name)
+    return catalogue_dir, storage.join(catalogue_dir, CHANGES_DIRNAME)
+
+
+def _read_head_sync(fs, catalogue_dir: str) -> str | None:
+    try:
+        head = json.loads(fs.cat_file(storage.join(catalogue_dir, HEAD_NAME)))
+    except FileNotFoundError:
+        return None
+    except (ValueError, TypeError):
+        return None
+    token = head.get("etag") if isinstance(head, dict) else None
+    return str(token) if token else None
+
+
+def _write_head_sync(fs, catalogue_dir: str, token: str) -> None:
+    fs.pipe_file(storage.join(catalogue_dir, HEAD_NAME), json.dumps({"etag": token}).encode("utf-8"))
+
+
+async def record_entries(name: str, entries: dict[str, dict | None]) -> str | None:
+    """
+    Append one change to catalogue ``name`` ({entry_id: json, or None to remove it}).
+
+    Returns the new head token, or None if the write failed. Best-effort like
+    job_catalogue.record_jobs: the entries' own files stay the source of truth.
+    """
+    if not entries:
+        return None
+    try:
+        catalogue_dir, changes_dir = await _paths(name)
+        fs = await storage._get_uncached_filesystem(catalogue_dir)
+        payload = {str(k): v for k, v in entries.items()}
+
+        def _write() -> str:
+            token = change_log.write_change_sync(fs, changes_dir, payload, ENTRIES_KEY)
+            _write_head_sync(fs, catalogue_dir, token)
+            return token
+
+        return await asyncio.to_thread(_write)
+    except Exception:
+        logger.debug("Failed to record %s catalogue change", name, exc_info=True)
+        return None
+
+
+async def record_entry(name: str, entry_id: str, data: dict | None) -> str | None:
+    """Record the current JSON of one entry, or its removal when ``data`` is None."""
+    return await record_entries(name, {str(entry_id): data})
+
+
+async def etag(name: str) -> str | None:
+    """Return the head token of catalogue ``name`` (one small read), or None if it has none yet."""
+    try:
+        catalogue_dir, _ = await _paths(name)
+        fs = await storage._get_uncached_filesystem(catalogue_dir)
+        return await asyncio.to_thread(_read_head_sync, fs, catalogue_dir)
+    except Exception:
+        logger.debug("Failed to read %s catalogue head", name, exc_info=True)
+        return None
+
+
+async def load_entries(name: str, scan: Scan) -> dict[str, dict]:
+    """
+    Return {entry_id: json} for catalogue ``name``.
+
+    Builds the snapshot with ``scan`` on first use and compacts the change log
+    like the job catalogue does. Also starts a background ``reconcile`` when
+    the last one in this process is more than ``RESCAN_SECONDS`` old.
+    """
+    entries = await _load_entries(name, scan)
+    catalogue_dir, _ = await _paths(name)
+    last = _last_reconcile.get(catalogue_dir)
+    if last is None or time.monotonic() - last >= RESCAN_SECONDS:
+        _last_reconcile[catalogue_dir] = time.monotonic()
+        task = asyncio.get_running_loop().create_task(_reconcile_quietly(name, scan))
+        _reconcile_tasks.add(task)
+        task.add_done_callback(_reconcile_tasks.discard)
+    return entries
+
+
+async def _load_entries(name: str, scan: Scan) -> dict[str, dict]:
+    catalogue_dir, changes_dir = await _paths(name)
+    fs = await storage._get_uncached_filesystem(catalogue_dir)
+
+    snapshot, changes = await asyncio.gather(
+        asyncio.to_thread(change_log.read_snapshot_sync, fs, catalogue_dir),
+        asyncio.to_thread(change_log.list_changes_sync, fs, changes_dir),
+    )
+    if snapshot is None:
+        entries = await rebuild(name, scan)
+        # A fresh scan needs no reconcile right away.
+        _last_reconcile[catalogue_dir] = time.monotonic()
+        return entries
+
+    entries = dict(snapshot.get(ENTRIES_KEY) or {})
+    pending = change_log.pending_changes(snapshot, changes)
+    await asyncio.to_thread(change_log.apply_changes_sync, fs, changes_dir, entries, pending, ENTRIES_KEY)
+
+    change_log.forget_unlisted(changes_dir, changes)
+
+    if len(pending) >= COMPACT_THRESHOLD:
+        try:
+            await asyncio.to_thread(change_log.compact_sync, fs, catalogue_dir, changes_dir, ENTRIES_KEY)
+        except Exception:
+            logger.warning("Failed to compact %s catalogue", name, exc_info=True)
+    return entries
+
+
+async def rebuild(name: str, scan: Scan) -> dict[str, dict]:
+    """
+    Rebuild catalogue ``name`` from ``scan()`` and move its head to a new token.
+
+    Changes written before the scan started are superseded by the scanned
+    data; later ones stay in the log and are applied on top.
+    """
+    catalogue_dir, changes_dir = await _paths(name)
+    fs = await storage._get_uncached_filesystem(catalogue_dir)
+
+    changes = await asyncio.to_thread(change_log.list_changes_sync, fs, changes_dir)
+    applied = [basename(p) for p in changes]
+    entries = {str(k): v for k, v in (await scan()).items() if isinstance(v, dict)}
+
+    def _write() -> None:
+        change_log.write_snapshot_sync(fs, catalogue_dir, entries, applied, ENTRIES_KEY)
+        _write_head_sync(fs, catalogue_dir, change_log.change_name())
+
+    try:
+        await asyncio.to_thread(_write)
+    except Exception:
+        logger.warning("Failed to write %s catalogue snapshot", name, exc_info=True)
+
+    latest = await asyncio.to_thread(change_log.list_changes_sync, fs, changes_dir)
+    pending = change_log.pending_changes({"applied": applied}, latest)
+    await asyncio.to_thread(change_log.apply_changes_sync, fs, changes_dir, entries, pending, ENTRIES_KEY)
+    return entries
+
+
+async def reconcile(name: str, scan: Scan) -> int:
+    """
+    Record entries of catalogue ``name`` that changed without going through it.
+
+    Compares ``scan()`` with the catalogue and appends one change holding the
+    differences (``None`` for entries whose files are gone), so the head only
+    moves when something actually changed. An entry recorded by a writer while
+    the scan ran is left to that writer. Returns the number of entries recorded.
+    """
+    # Load before scanning: a write landing after this load is then either seen by the scan or skipped below.
+    before = await _load_entries(name, scan)
+    scanned = {str(k): v for k, v in (await scan()).items() if isinstance(v, dict)}
+    diff: dict[str, dict | None] = {k: v for k, v in scanned.items() if before.get(k) != v}
+    diff.update({k: None for k in before if k not in scanned})
+    if not diff:
+        return 0
+    current = await _load_entries(name, scan)
+    diff = {k: v for k, v in diff.items() if current.get(k) == before.get(k)}
+    if diff:
+        logger.info("Reconciled %d %s catalogue entries changed outside the catalogue", len(diff), name)
+        await record_entries(name, diff)
+    return len(diff)
+
+
+async def _reconcile_quietly(name: str, scan: Scan) -> None:
+    try:
+        await reconcile(name, scan)
+    except Exception:
+        logger.warning("Failed to reconcile %s catalogue", name, exc_info=True)
@@ -0,0 +1,149 @@
+"""
+Long-lived background event loop for the sync Lab facade.
+
+The sync Lab methods used to drive every call through ``asyncio.run`` (or
+``run_until_complete`` on a throwaway loop). Besides the loop setup itself,
+each new loop brings a new default executor, so every ``asyncio.to_thread``
+storage call landed on a fresh thread; fsspec caches filesystem instances per
+thread, which meant new S3/GCS sessions and connection pools on most calls.
+
+``AsyncRuntime`` runs one loop on a daemon thread for the life of the process.
+Sync callers submit coroutines to it and block on the result, or submit them in
+the background (fire-and-forget) for telemetry-style writes. The loop's
+executor threads, and therefore the filesystem clients cached on them, stay warm.
+
+Ordering: background calls run one after another in submission order, and any
+call waits for the background calls submitted before it, so a blocking call
+always observes earlier fire-and-forget writes.
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import os
+import threading
+from typing import Any, Awaitable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DRAIN_TIMEOUT_SECONDS = max(0.0, float(os.getenv("TFL_LAB_RUNTIME_DRAIN_TIMEOUT_SECONDS", "30")))
+
+
+class AsyncRuntime:
+    """A background event loop thread that sync code can submit coroutines to."""
+
+    def __init__(self, name: str = "tfl-lab-runtime"):
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        # Last background task; only touched from the loop thread.
+        self._tail: Optional[asyncio.Task] = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None and not self._loop.is_closed() and self._thread and self._thread.is_alive():
+                return self._loop
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def _run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                try:
+                    loop.run_forever()
+                finally:
+                    loop.close()
+
+            thread = threading.Thread(target=_run, name=self.name, daemon=True)
+            thread.start()
+            ready.wait()
+            self._loop, self._thread = loop, thread
+            return loop
+
+    def in_runtime_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    async def _run_ordered(self, coro: Awaitable[Any], background: bool) -> Any:
+        previous = self._tail
+        if background:
+            self._tail = asyncio.current_task()
+        if previous is not None and not previous.done():
+            # Wait for earlier background calls without inheriting their errors.
+            await asyncio.wait([previous])
+        return await coro
+
+    def submit(self, coro: Awaitable[Any], background: bool = False) -> concurrent.futures.Future:
+        """
+        Schedule ``coro`` on the runtime loop and return a concurrent future.
+
+        The caller's context variables (organization, storage URI, ...) are
+        carried over to the coroutine.
+        """
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self._run_ordered(coro, background), loop)
+        if background:
+            future.add_done_callback(_log_background_failure)
+        return future
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """Run ``coro`` on the runtime loop and block until it returns (or raises)."""
+        if self.in_runtime_thread():
+            raise RuntimeError("AsyncRuntime.run() cannot be called from the runtime's own loop thread")
+        return self.submit(coro).result(timeout=timeout)
+
+    def run_in_background(self, coro: Awaitable[Any]) -> concurrent.futures.Future:
+        """Run ``coro`` without waiting. Failures are logged, not raised."""
+        return self.submit(coro, background=True)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait for every background call submitted so far. Returns False if the timeout expired."""
+        if self._loop is None or self.in_runtime_thread():
+            return True
+
+        async def _noop() -> None:
+            return None
+
+        try:
+            self.submit(_noop()).result(timeout=timeout)
+            return True
+        except concurrent.futures.TimeoutError:
+            return False
+
+    def close(self, timeout: Optional[float] = DEFAULT_DRAIN_TIMEOUT_SECONDS) -> None:
+        """Drain background calls and stop the loop thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+        if loop is None or loop.is_closed():
+            return
+        if not self.drain(timeout=timeout):
+            logger.warning("Timed out waiting for background Lab writes to finish")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+        with self._lock:
+            if self._loop is loop:
+                self._loop, self._thread = None, None
+
+
+def _log_background_failure(future: concurrent.futures.Future) -> None:
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.warning("Background Lab call failed: %s", exc, exc_info=exc)
+
+
+_runtime: Optional[AsyncRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_runtime() -> AsyncRuntime:
+    """Return the process-wide runtime, creating it on first use."""
+    global _runtime
+    with _runtime_lock:
+        if _runtime is None:
+            _runtime = AsyncRuntime()
+            atexit.register(_runtime.close)
+        return _runtime
@@ -0,0 +1,232 @@
+"""
+Snapshot plus append-only change log, shared by the job and asset catalogues.
+
+A catalogue directory holds a compacted snapshot and a directory of change
+objects, each keyed by a payload name (``"jobs"``, ``"entries"``):
+
+    {catalogue}/snapshot.json            {"applied": [<change>...], <key>: {...}}
+    {catalogue}/changes/<ns>-<rand>.json {<key>: {id: json, or None to remove it}}
+
+Writers append one uniquely named change (no read-modify-write, so concurrent
+writers never conflict). Readers apply the listed changes the snapshot's
+``applied`` list does not name. Change objects are immutable, so their raw
+bytes are cached in-process per changes directory.
+
+Change names start with the writer's wall clock, so a change uploaded slowly
+or from a machine with a skewed clock can appear with a name older than
+changes already folded in. Tracking applied names rather than a high-water
+mark means such a change is still applied when it shows up.
+
+``compact_sync`` folds pending changes into a new snapshot. Change objects are
+only deleted once the snapshot the compactor started from lists them as
+applied, so neither a slow concurrent compactor nor a late change can drop an
+update. Each compaction leaves a ``gc-<newest deleted change>`` marker so
+cursor-based readers can tell they missed changes.
+
+All functions here block; callers run them in worker threads.
+"""
+
+import json
+import logging
+import secrets
+import time
+from datetime import datetime, timezone
+
+from . import storage
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_NAME = "snapshot.json"
+CHANGES_DIRNAME = "changes"
+LOCK_NAME = "compact.lock"
+GC_MARKER_PREFIX = "gc-"
+SNAPSHOT_VERSION = 1
+
+COMPACT_LOCK_TTL_SECONDS = 60.0
+
+# Raw change objects per changes dir, keyed by object name. Change objects are never
+# rewritten, so entries stay valid until the object disappears from the listing.
+_change_cache: dict[str, dict[str, bytes]] = {}
+_local_dirs_ready: set[str] = set()
+
+
+def change_name() -> str:
+    """Return a new change object name; names sort by the writer's clock."""
+    return f"{time.time_ns():020d}-{secrets.token_hex(4)}.json"
+
+
+def basename(path: str) -> str:
+    return str(path).rstrip("/").split("/")[-1]
+
+
+def write_change_sync(fs, changes_dir: str, payload: dict[str, dict | None], key: str) -> str:
+    """Write one change object holding ``{key: payload}`` and return its name."""
+    if not storage.is_remote_path(changes_dir) and changes_dir not in _local_dirs_ready:
+        fs.makedirs(changes_dir, exist_ok=True)
+        _local_dirs_ready.add(changes_dir)
+    name = change_name()
+    data = json.dumps({key: payload}, ensure_ascii=False).encode("utf-8")
+    fs.pipe_file(storage.join(changes_dir, name), data)
+    return name
+
+
+def read_snapshot_sync(fs, catalogue_dir: str) -> dict | None:
+    """Return the snapshot in ``catalogue_dir``, or None if it is missing, corrupt or outdated."""
+    try:
+        raw = fs.cat_file(storage.join(catalogue_dir, SNAPSHOT_NAME))
+    except FileNotFoundError:
+        return None
+    try:
+        snapshot = json.loads(raw)
+    except (ValueError, TypeError):
+        logger.warning("Corrupt catalogue snapshot in %s; rebuilding.", catalogue_dir)
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def write_snapshot_sync(fs, catalogue_dir: str, entries: dict[str, dict], applied: list[str], key: str) -> None:
+    applied = sorted(applied)
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "through": applied[-1] if applied else "",
+        "applied": applied,
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+        key: entries,
+    }
+    fs.pipe_file(storage.join(catalogue_dir, SNAPSHOT_NAME), json.dumps(snapshot, ensure_ascii=False).encode("utf-8"))
+
+
+def list_changes_sync(fs, changes_dir: str) -> list[str]:
+    """Return the change object paths in ``changes_dir``, oldest name first."""
+    return list_changes_and_gc_sync(fs, changes_dir)[0]
+
+
+def list_changes_and_gc_sync(fs, changes_dir: str) -> tuple[list[str], str]:
+    """Return (sorted change paths, newest change name removed by compaction)."""
+    try:
+        entries = fs.ls(changes_dir, detail=False)
+    except FileNotFoundError:
+        return [], ""
+    changes = sorted(e for e in entries if basename(e).endswith(".json"))
+    markers = sorted(basename(e) for e in entries if basename(e).startswith(GC_MARKER_PREFIX))
+    gc_through = markers[-1][len(GC_MARKER_PREFIX) :] if markers else ""
+    return changes, gc_through
+
+
+def read_change_sync(fs, changes_dir: str, path: str) -> dict | None:
+    """Return one parsed change object, or None if it is gone or corrupt."""
+    # Cache the raw bytes and parse per call so callers can mutate what they get back.
+    cache = _change_cache.setdefault(changes_dir, {})
+    raw = cache.get(basename(path))
+    if raw is None:
+        try:
+            raw = fs.cat_file(path)
+        except FileNotFoundError:
+            # Deleted by a compaction that already folded it into the snapshot.
+            return None
+        cache[basename(path)] = raw
+    try:
+        change = json.loads(raw)
+    except (ValueError, TypeError):
+        logger.warning("Ignoring corrupt catalogue change %s", path)
+        return None
+    return change if isinstance(change, dict) else None
+
+
+def forget_unlisted(changes_dir: str, change_paths: list[str]) -> None:
+    """Drop cached change objects that are no longer listed (compacted away)."""
+    listed = {basename(p) for p in change_paths}
+    cache = _change_cache.get(changes_dir, {})
+    for name in [n for n in cache if n not in listed]:
+        cache.pop(name, None)
+
+
+def pending_changes(snapshot: dict, change_paths: list[str]) -> list[str]:
+    """Return the listed changes the snapshot has not folded in yet, oldest first."""
+    # Snapshots written before "applied" existed replay the whole log; applying in order is idempotent.
+    applied = set(snapshot.get("applied") or ())
+    return [p for p in change_paths if basename(p) not in applied]
+
+
+def apply_changes_sync(fs, changes_dir: str, entries: dict[str, dict], change_paths: list[str], key: str) -> None:
+    """Apply ``change_paths`` to ``entries`` in place; a None value removes an entry."""
+    for path in change_paths:
+        change = read_change_sync(fs, changes_dir, path)
+        if not change:
+            continue
+        for entry_id, data in (change.get(key) or {}).items():
+            if isinstance(data, dict):
+                entries[str(entry_id)] = data
+            elif data is None:
+                # Tombstone: the entry was removed.
+                entries.pop(str(entry_id), None)
+
+
+def _try_lock_sync(fs, catalogue_dir: str) -> str | None:
+    """Best-effort compaction lease. Returns the owner token if acquired."""
+    lock_path = storage.join(catalogue_dir, LOCK_NAME)
+    try:
+        current = json.loads(fs.cat_file(lock_path))
+        if float(current.get("expires", 0)) > time.time():
+            return None
+    except FileNotFoundError:
+        pass
+    except Exception:
+        # Unreadable lock: treat as expired.
+        pass
+    token = secrets.token_hex(16)
+    fs.pipe_file(lock_path, json.dumps({"owner": token, "expires": time.time() + COMPACT_LOCK_TTL_SECONDS}).encode())
+    try:
+        if json.loads(fs.cat_file(lock_path)).get("owner") != token:
+            return None
+    except Exception:
+        return None
+    return token
+
+
+def _release_lock_sync(fs, catalogue_dir: str) -> None:
+    try:
+        fs.rm(storage.join(catalogue_dir, LOCK_NAME))
+    except Exception:
+        logger.debug("Failed to release catalogue lock in %s", catalogue_dir, exc_info=True)
+
+
+def compact_sync(fs, catalogue_dir: str, changes_dir: str, key: str) -> None:
+    """Fold pending changes into a new snapshot and delete changes the previous one applied."""
+    if _try_lock_sync(fs, catalogue_dir) is None:
+        return
+    try:
+        snapshot = read_snapshot_sync(fs, catalogue_dir)
+        if snapshot is None:
+            return
+        base_applied = set(snapshot.get("applied") or ())
+        entries = dict(snapshot.get(key) or {})
+        changes = list_changes_sync(fs, changes_dir)
+        pending = pending_changes(snapshot, changes)
+        if not pending:
+            return
+        apply_changes_sync(fs, changes_dir, entries, pending, key)
+        # Names that are no longer listed were deleted by an earlier compaction and drop out here.
+        write_snapshot_sync(fs, catalogue_dir, entries, [basename(p) for p in changes], key)
+
+        # Only drop changes the snapshot we started from already applied; the ones just
+        # folded in are removed by the next compaction.
+        covered = [p for p in changes if basename(p) in base_applied]
+        if covered:
+            # Leave a marker in the listing so cursor readers can tell they missed changes.
+            fs.pipe_file(storage.join(changes_dir, GC_MARKER_PREFIX + basename(covered[-1])), b"")
+            fs.rm(covered)
+            old_markers = [
+                e
+                for e in fs.ls(changes_dir, detail=False)
+                if basename(e).startswith(GC_MARKER_PREFIX) and basename(e) != GC_MARKER_PREFIX + basename(covered[-1])
+            ]
+            if old_markers:
+                fs.rm(old_markers)
+            cache = _change_cache.get(changes_dir, {})
+            for path in covered:
+                cache.pop(basename(path), None)
+    finally:
+        _release_lock_sync(fs, catalogue_dir)
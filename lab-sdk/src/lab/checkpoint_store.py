@@ -0,0 +1,389 @@
+"""
+Content-addressed, deduplicating checkpoint store.
+
+Consecutive checkpoints of a run usually share most of their files (tokenizer,
+config, frozen base shards). With dedup enabled, ``Lab.save_checkpoint`` does not
+copy a checkpoint into ``checkpoints/<name>``; it hashes every file, uploads only
+the contents the store does not have yet, and writes a small manifest next to
+where the checkpoint would have been:
+
+    {workspace}/checkpoint_store/blobs/<sha[:2]>/<sha>      file contents, shared by all jobs
+    {workspace}/checkpoint_store/refs/<sha>/<ref_id>        one marker per checkpoint using the blob
+    {checkpoints_dir}/<name>.tflckpt.json                   manifest: relative path -> sha256, size
+
+A blob's refcount is the number of markers under its refs directory. Deleting or
+overwriting a checkpoint removes its markers and deletes blobs nobody references
+any more. A save writes its markers before checking whether a blob exists. A
+release moves an unreferenced blob aside, lists the markers again and moves the
+blob back if a save referenced it in between; only then is it deleted. A save
+that checked before the move therefore finds its blob restored, and one that
+checked after it uploads the blob again. Refs directories are removed only when
+empty, so a marker written during a release is never deleted with them.
+
+Hashes of local files are cached on (size, mtime), so re-saving a file that has not
+changed costs a stat call. Blob existence is checked on every save, after the
+markers are written: another process may have deleted a blob since this one last
+saw it.
+
+Readers use ``checkpoint_exists`` / ``materialize`` (resume) and
+``checkpoint_path_for`` (listing) so manifests and plain checkpoint directories
+look the same to callers.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import secrets
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+from . import storage
+from .dirs import get_workspace_dir
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_SUFFIX = ".tflckpt.json"
+MANIFEST_VERSION = 1
+HASH_CONCURRENCY = max(1, int(os.getenv("TFL_CHECKPOINT_HASH_CONCURRENCY", "4")))
+# Where manifests are materialized for resume (local disk).
+MATERIALIZE_DIR = os.getenv("TFL_CHECKPOINT_MATERIALIZE_DIR") or os.path.join(tempfile.gettempdir(), "tfl_checkpoints")
+_HASH_BLOCK_SIZE = 8 * 1024 * 1024
+
+# path -> (size, mtime_ns, sha256) for local source files.
+_hash_cache: Dict[str, Tuple[int, int, str]] = {}
+
+
+def dedup_enabled_by_default() -> bool:
+    return os.environ.get("TFL_CHECKPOINT_DEDUP", "false").lower() == "true"
+
+
+def manifest_path(checkpoint_path: str) -> str:
+    """Return the manifest path standing in for ``checkpoint_path``."""
+    return checkpoint_path.rstrip("/") + MANIFEST_SUFFIX
+
+
+def checkpoint_path_for(item_path: str) -> str:
+    """Map a checkpoints-dir entry to its checkpoint path (manifests lose their suffix)."""
+    if item_path.endswith(MANIFEST_SUFFIX):
+        return item_path[: -len(MANIFEST_SUFFIX)]
+    return item_path
+
+
+async def get_store_dir() -> str:
+    return storage.join(await get_workspace_dir(), "checkpoint_store")
+
+
+def _blob_path(store_dir: str, digest: str) -> str:
+    return storage.join(store_dir, "blobs", digest[:2], digest)
+
+
+def _refs_dir(store_dir: str, digest: str) -> str:
+    return storage.join(store_dir, "refs", digest)
+
+
+def _ref_id(checkpoint_path: str) -> str:
+    return hashlib.sha256(manifest_path(checkpoint_path).encode("utf-8")).hexdigest()[:32]
+
+
+def _hash_local_file(path: str) -> str:
+    st = os.stat(path)
+    cached = _hash_cache.get(path)
+    if cached is not None and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+        return cached[2]
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+            h.update(block)
+    digest = h.hexdigest()
+    _hash_cache[path] = (st.st_size, st.st_mtime_ns, digest)
+    return digest
+
+
+def _hash_remote_file(path: str) -> Tuple[str, int]:
+    fs, _ = storage._get_fs_for_path(path)
+    h = hashlib.sha256()
+    size = 0
+    with fs.open(path, "rb") as f:
+        for block in storage.iter_chunks(f, _HASH_BLOCK_SIZE):
+            h.update(block)
+            size += len(block)
+    return h.hexdigest(), size
+
+
+async def _list_source_files(src: str) -> Tuple[str, List[Tuple[str, str]]]:
+    """Return (kind, [(relative_path, absolute_path)]) for a checkpoint file or directory."""
+    if storage.is_remote_path(src):
+        if not await storage.isdir(src):
+            return "file", [(src.rstrip("/").rsplit("/", 1)[-1], src)]
+        protocol = src.split("://", 1)[0]
+        files = []
+        for raw in await storage.find(src):
+            full = raw if storage.is_remote_path(raw) else f"{protocol}://{raw.lstrip('/')}"
+            rel = full[len(src.rstrip("/")) :].lstrip("/")
+            if rel:
+                files.append((rel, full))
+        return "dir", sorted(files)
+
+    if not os.path.isdir(src):
+        return "file", [(os.path.basename(src), src)]
+
+    def _walk() -> List[Tuple[str, str]]:
+        out = []
+        for root, _, names in os.walk(src):
+            for name in names:
+                full = os.path.join(root, name)
+                out.append((os.path.relpath(full, src).replace(os.sep, "/"), full))
+        return sorted(out)
+
+    return "dir", await asyncio.to_thread(_walk)
+
+
+async def _hash_files(files: List[Tuple[str, str]]) -> List[Dict[str, object]]:
+    semaphore = asyncio.Semaphore(HASH_CONCURRENCY)
+
+    async def _one(rel: str, path: str) -> Dict[str, object]:
+        async with semaphore:
+            if storage.is_remote_path(path):
+                digest, size = await asyncio.to_thread(_hash_remote_file, path)
+            else:
+                digest = await asyncio.to_thread(_hash_local_file, path)
+                size = os.path.getsize(path)
+            return {"path": rel, "sha256": digest, "size": size}
+
+    return list(await asyncio.gather(*[_one(rel, path) for rel, path in files]))
+
+
+async def _write_text(path: str, text: str) -> None:
+    async with await storage.open(path, "w", encoding="utf-8") as f:
+        await f.write(text)
+
+
+async def _add_refs(store_dir: str, digests: List[str], ref_id: str, checkpoint_path: str) -> None:
+    semaphore = asyncio.Semaphore(storage.TRANSFER_CONCURRENCY)
+
+    async def _one(digest: str) -> None:
+        async with semaphore:
+            refs_dir = _refs_dir(store_dir, digest)
+            await storage.makedirs(refs_dir, exist_ok=True)
+            try:
+                await _write_text(storage.join(refs_dir, ref_id), checkpoint_path)
+            except FileNotFoundError:
+                # A release removed the (then empty) directory after makedirs.
+                await storage.makedirs(refs_dir, exist_ok=True)
+                await _write_text(storage.join(refs_dir, ref_id), checkpoint_path)
+
+    await asyncio.gather(*[_one(d) for d in digests])
+
+
+async def _upload_missing_blobs(store_dir: str, sources: Dict[str, str]) -> Tuple[int, int]:
+    """Upload blobs for ``{digest: source_path}`` that the store lacks. Returns (uploaded, bytes)."""
+    semaphore = asyncio.Semaphore(storage.TRANSFER_CONCURRENCY)
+
+    async def _missing(digest: str) -> bool:
+        async with semaphore:
+            return not await storage.exists(_blob_path(store_dir, digest))
+
+    digests = list(sources)
+    flags = await asyncio.gather(*[_missing(d) for d in digests])
+    missing = [d for d, flag in zip(digests, flags) if flag]
+    if not missing:
+        return 0, 0
+
+    local_store = not storage.is_remote_path(store_dir)
+    token = secrets.token_hex(4)
+    pairs = []
+    for digest in missing:
+        blob = _blob_path(store_dir, digest)
+        # Local blobs are written under a temporary name and renamed, so a crashed
+        # upload never leaves a truncated blob; object-store puts are atomic already.
+        pairs.append((sources[digest], f"{blob}.partial-{token}" if local_store else blob))
+    await storage.copy_files(pairs)
+
+    uploaded_bytes = 0
+    for digest, (src, dest) in zip(missing, pairs):
+        blob = _blob_path(store_dir, digest)
+        if local_store:
+            await asyncio.to_thread(os.replace, dest, blob)
+            uploaded_bytes += os.path.getsize(blob)
+        elif not storage.is_remote_path(src):
+            uploaded_bytes += os.path.getsize(src)
+    return len(missing), uploaded_bytes
+
+
+async def read_manifest(checkpoint_path: str) -> Optional[dict]:
+    """Return the manifest for ``checkpoint_path``, or None if it is not a dedup checkpoint."""
+    path = manifest_path(checkpoint_path)
+    try:
+        async with await storage.open(path, "r", encoding="utf-8") as f:
+            data = json.loads(await f.read())
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.warning("Unreadable checkpoint manifest %s", path, exc_info=True)
+        return None
+    return data if isinstance(data, dict) and isinstance(data.get("files"), list) else None
+
+
+async def checkpoint_exists(checkpoint_path: str) -> bool:
+    """True if ``checkpoint_path`` exists either as plain files or as a manifest."""
+    return await storage.exists(checkpoint_path) or await storage.exists(manifest_path(checkpoint_path))
+
+
+async def _list_refs(refs_dir: str) -> List[str]:
+    try:
+        return await storage.ls(refs_dir, detail=False) if await storage.exists(refs_dir) else []
+    except FileNotFoundError:
+        return []
+
+
+def _move_sync(path: str, dest: str) -> bool:
+    """Rename ``path`` to ``dest``; False if ``path`` does not exist."""
+    if not storage.is_remote_path(path):
+        try:
+            os.replace(path, dest)
+        except FileNotFoundError:
+            return False
+        return True
+    fs, _ = storage._get_fs_for_path(path)
+    if not fs.exists(path):
+        return False
+    fs.mv(path, dest)
+    return True
+
+
+def _remove_dir_if_empty_sync(path: str) -> None:
+    # Object stores have no directories: a prefix disappears with its last object.
+    if storage.is_remote_path(path):
+        return
+    try:
+        os.rmdir(path)
+    except OSError:
+        pass
+
+
+async def _release(store_dir: str, digests: List[str], ref_id: str) -> int:
+    """Drop ``ref_id``'s markers on ``digests`` and delete blobs left without references."""
+    deleted = 0
+    for digest in sorted(set(digests)):
+        refs_dir = _refs_dir(store_dir, digest)
+        try:
+            await storage.rm(storage.join(refs_dir, ref_id))
+            if await _list_refs(refs_dir):
+                continue
+            blob = _blob_path(store_dir, digest)
+            parked = f"{blob}.releasing-{secrets.token_hex(4)}"
+            if not await asyncio.to_thread(_move_sync, blob, parked):
+                await asyncio.to_thread(_remove_dir_if_empty_sync, refs_dir)
+                continue
+            if await _list_refs(refs_dir):
+                # A save referenced the blob after the first listing and may have seen it in place.
+                await asyncio.to_thread(_move_sync, parked, blob)
+                continue
+            await storage.rm(parked)
+            await asyncio.to_thread(_remove_dir_if_empty_sync, refs_dir)
+            deleted += 1
+        except Exception:
+            logger.warning("Failed to release checkpoint blob %s", digest, exc_info=True)
+    return deleted
+
+
+async def save_checkpoint(src: str, checkpoint_path: str) -> Dict[str, int]:
+    """
+    Store the file or directory ``src`` as a dedup checkpoint at ``checkpoint_path``.
+
+    Writes ``checkpoint_path + MANIFEST_SUFFIX`` and uploads only new contents. An
+    existing manifest for the same path is replaced and its unused blobs released.
+    Returns counts: files, uploaded, reused, bytes_uploaded, released.
+    """
+    store_dir = await get_store_dir()
+    kind, files = await _list_source_files(src)
+    entries = await _hash_files(files)
+    ref_id = _ref_id(checkpoint_path)
+
+    sources: Dict[str, str] = {}
+    for entry, (_, path) in zip(entries, files):
+        sources.setdefault(str(entry["sha256"]), path)
+
+    previous = await read_manifest(checkpoint_path)
+    previous_digests = {str(e.get("sha256")) for e in previous["files"]} if previous else set()
+
+    # Reference first, then check/upload, so a concurrent release cannot delete a blob we rely on.
+    # Blobs the replaced manifest already used are referenced under the same ref_id.
+    await _add_refs(store_dir, [d for d in sources if d not in previous_digests], ref_id, checkpoint_path)
+    uploaded, uploaded_bytes = await _upload_missing_blobs(store_dir, sources)
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "kind": kind,
+        "name": checkpoint_path.rstrip("/").rsplit("/", 1)[-1],
+        "store": store_dir,
+        "created_at": time.time(),
+        "files": entries,
+    }
+    await _write_text(manifest_path(checkpoint_path), json.dumps(manifest))
+
+    released = 0
+    if previous:
+        stale = previous_digests - set(sources)
+        if stale:
+            released = await _release(str(previous.get("store") or store_dir), list(stale), ref_id)
+
+    return {
+        "files": len(entries),
+        "uploaded": uploaded,
+        "reused": len(sources) - uploaded,
+        "bytes_uploaded": uploaded_bytes,
+        "released": released,
+    }
+
+
+async def delete_checkpoint(checkpoint_path: str) -> bool:
+    """Remove a dedup checkpoint's manifest and release its blobs. Returns False if there was none."""
+    manifest = await read_manifest(checkpoint_path)
+    if manifest is None:
+        return False
+    store_dir = str(manifest.get("store") or await get_store_dir())
+    await storage.rm(manifest_path(checkpoint_path))
+    await _release(store_dir, [str(e.get("sha256")) for e in manifest["files"]], _ref_id(checkpoint_path))
+    return True
+
+
+async def materialize(checkpoint_path: str, target_dir: Optional[str] = None) -> Optional[str]:
+    """
+    Rebuild a dedup checkpoint on local disk and return its path (directory, or file for
+    single-file checkpoints). Returns None if ``checkpoint_path`` has no manifest.
+
+    The default target is keyed on the manifest contents under TFL_CHECKPOINT_MATERIALIZE_DIR,
+    so repeated resumes of the same checkpoint reuse the files already on disk.
+    """
+    manifest = await read_manifest(checkpoint_path)
+    if manifest is None:
+        return None
+    store_dir = str(manifest.get("store") or await get_store_dir())
+    name = str(manifest.get("name") or checkpoint_path.rstrip("/").rsplit("/", 1)[-1])
+    if target_dir is None:
+        key = hashlib.sha256(json.dumps(manifest["files"], sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        target_dir = os.path.join(MATERIALIZE_DIR, key)
+
+    if manifest.get("kind") == "file":
+        root = target_dir
+        result = os.path.join(target_dir, name)
+    else:
+        root = result = os.path.join(target_dir, name)
+
+    pairs = []
+    for entry in manifest["files"]:
+        rel = str(entry["path"])
+        dest = os.path.normpath(os.path.join(root, rel))
+        if not dest.startswith(os.path.normpath(root) + os.sep):
+            raise ValueError(f"Checkpoint manifest entry escapes target directory: {rel}")
+        if os.path.isfile(dest) and entry.get("size") is not None and os.path.getsize(dest) == entry["size"]:
+            continue
+        pairs.append((_blob_path(store_dir, str(entry["sha256"])), dest))
+    await storage.copy_files(pairs)
+    if manifest.get("kind") != "file":
+        os.makedirs(result, exist_ok=True)
+    return result
@@ -3,6 +3,7 @@ from typing import Optional
 
 from .dirs import get_datasets_dir, get_experiments_dir, get_job_datasets_dir
 from .labresource import BaseLabResource
+from . import asset_catalogue
 from . import storage
 
 
@@ -38,6 +39,7 @@ class Dataset(BaseLabResource):
 
             async with await storage.open(json_file, "w", encoding="utf-8") as f:
                 await f.write(json.dumps(newobj._default_json()))
+            await newobj._on_json_written(newobj._default_json())
         return newobj
 
     async def get_dir(self):
@@ -112,9 +114,30 @@ class Dataset(BaseLabResource):
     async def get_metadata(self):
         return await self.get_json_data()
 
+    def _catalogue_key(self) -> str:
+        return secure_filename(str(self.id))
+
+    async def _on_json_written(self, json_data: dict):
+        if not self.job_id:
+            await asset_catalogue.record_entry(asset_catalogue.DATASETS, self._catalogue_key(), json_data)
+
+    async def _on_deleted(self):
+        if not self.job_id:
+            await asset_catalogue.record_entry(asset_catalogue.DATASETS, self._catalogue_key(), None)
+
+    async def refresh_catalogue_entry(self):
+        """Re-record this dataset in the workspace catalogue after its files were written directly."""
+        await self._on_json_written(await self.get_json_data(uncached=True))
+
     @staticmethod
     async def list_all():
-        results = []
+        """List all datasets from the workspace catalogue (built from a directory scan on first use)."""
+        entries = await asset_catalogue.load_entries(asset_catalogue.DATASETS, Dataset._scan_all)
+        return list(entries.values())
+
+    @staticmethod
+    async def _scan_all() -> dict[str, dict]:
+        results = {}
         datasets_dir = await get_datasets_dir()
         if not await storage.isdir(datasets_dir):
             return results
@@ -129,7 +152,7 @@ class Dataset(BaseLabResource):
             try:
                 entry = full.rstrip("/").split("/")[-1]
                 ds = Dataset(entry)
-                results.append(await ds.get_metadata())
+                results[entry] = await ds.get_metadata()
             except Exception:
                 continue
         return results
@@ -1,6 +1,7 @@
 # Root dir is the parent of the parent of this current directory:
 
 import os
+import time
 import contextvars
 from werkzeug.utils import secure_filename
 from . import storage
@@ -88,7 +89,91 @@ def require_organization_id() -> str:
     return org_id
 
 
+# ---------------------------------------------------------------------------
+# Path resolution cache
+#
+# Every get_*_dir() helper used to call storage.makedirs(exist_ok=True) on each
+# call, and get_workspace_dir() could resolve root_uri() as well, so a Job.get()
+# made several filesystem/object-store round trips before reading anything.
+# Directories ensured once are remembered per storage context (org, storage URI)
+# and the workspace path is memoized on the inputs that decide it. Entries
+# expire after TFL_DIRS_CACHE_TTL_SECONDS so directories removed by another
+# process are eventually recreated; deletes in this process must call
+# invalidate_path_cache().
+# ---------------------------------------------------------------------------
+
+PATH_CACHE_TTL_SECONDS = float(os.getenv("TFL_DIRS_CACHE_TTL_SECONDS", "300"))
+_path_cache_enabled = os.getenv("TFL_DIRS_CACHE_ENABLED", "true").lower() == "true"
+# (org_id, storage_uri, path) -> time the directory was ensured
+_ensured_dirs: dict[tuple[str | None, str | None, str], float] = {}
+# workspace inputs -> (workspace path, time resolved)
+_workspace_cache: dict[tuple, tuple[str, float]] = {}
+
+
+def set_path_cache_enabled(enabled: bool) -> None:
+    """Turn the path resolution cache on or off (clears it either way)."""
+    global _path_cache_enabled
+    _path_cache_enabled = enabled
+    invalidate_path_cache()
+
+
+def _context_key() -> tuple[str | None, str | None]:
+    return _current_org_id.get(), _current_tfl_storage_uri.get()
+
+
+def _fresh(timestamp: float) -> bool:
+    return time.monotonic() - timestamp < PATH_CACHE_TTL_SECONDS
+
+
+def invalidate_path_cache(path: str | None = None) -> None:
+    """
+    Forget ensured directories at or below ``path`` (all of them when None).
+
+    Call after deleting a directory tree so the next get_*_dir() recreates it.
+    """
+    if path is None:
+        _ensured_dirs.clear()
+        _workspace_cache.clear()
+        return
+    prefix = path.rstrip("/")
+    for key in [k for k in _ensured_dirs if k[2] == prefix or k[2].startswith(prefix + "/")]:
+        _ensured_dirs.pop(key, None)
+    for key in [k for k, (ws, _) in _workspace_cache.items() if ws == prefix or ws.startswith(prefix + "/")]:
+        _workspace_cache.pop(key, None)
+
+
+async def _ensure_dir(path: str) -> None:
+    """storage.makedirs(path, exist_ok=True), skipped when this context already ensured ``path``."""
+    if not _path_cache_enabled:
+        await storage.makedirs(path, exist_ok=True)
+        return
+    org_id, storage_uri = _context_key()
+    key = (org_id, storage_uri, path)
+    ensured_at = _ensured_dirs.get(key)
+    if ensured_at is not None and _fresh(ensured_at):
+        return
+    await storage.makedirs(path, exist_ok=True)
+    _ensured_dirs[key] = time.monotonic()
+
+
 async def get_workspace_dir() -> str:
+    if not _path_cache_enabled:
+        return await _resolve_workspace_dir()
+    key = (
+        *_context_key(),
+        os.getenv("TFL_STORAGE_URI"),
+        os.getenv("TFL_WORKSPACE_DIR"),
+        STORAGE_PROVIDER,
+    )
+    cached = _workspace_cache.get(key)
+    if cached is not None and _fresh(cached[1]):
+        return cached[0]
+    path = await _resolve_workspace_dir()
+    _workspace_cache[key] = (path, time.monotonic())
+    return path
+
+
+async def _resolve_workspace_dir() -> str:
     # Remote SkyPilot workspace override (highest precedence)
     # Only return container workspace path when value is exactly "true"
     # In localfs mode, workspace is TFL_STORAGE_URI/orgs/<org_id>/workspace; HOME_DIR stays app home
@@ -117,7 +202,7 @@ async def get_workspace_dir() -> str:
             path = storage.join(os.getenv("TFL_STORAGE_URI", ""), "orgs", org_id, "workspace")
         else:
             path = storage.join(HOME_DIR, "orgs", org_id, "workspace")
-        await storage.makedirs(path, exist_ok=True)
+        await _ensure_dir(path)
         return path
 
     if os.getenv("TFL_STORAGE_URI") and STORAGE_PROVIDER != "localfs":
@@ -125,7 +210,7 @@ async def get_workspace_dir() -> str:
         return root
 
     path = storage.join(HOME_DIR, "workspace")
-    await storage.makedirs(path, exist_ok=True)
+    await _ensure_dir(path)
     return path
 
 
@@ -157,7 +242,7 @@ os.environ["LOGDIR"] = os.getenv("TFL_HOME_DIR", os.path.join(str(os.path.expand
 async def get_experiments_dir() -> str:
     workspace = await get_workspace_dir()
     path = storage.join(workspace, "experiments")
-    await storage.makedirs(path, exist_ok=True)
+    await _ensure_dir(path)
     return path
 
 
@@ -171,7 +256,21 @@ async def get_jobs_dir(experiment_id: str) -> str:
     experiments_dir = await get_experiments_dir()
     experiment_id_safe = secure_filename(str(experiment_id))
     path = storage.join(experiments_dir, experiment_id_safe, "jobs")
-    await storage.makedirs(path, exist_ok=True)
+    await _ensure_dir(path)
+    return path
+
+
+async def get_job_catalogue_dir(experiment_id: str) -> str:
+    """
+    Return the directory holding the job catalogue (snapshot + change log) for an experiment.
+
+    Layout:
+        {workspace}/experiments/{experiment_id}/job_catalogue/
+    """
+    experiments_dir = await get_experiments_dir()
+    experiment_id_safe = secure_filename(str(experiment_id))
+    path = storage.join(experiments_dir, experiment_id_safe, "job_catalogue")
+    await _ensure_dir(path)
     return path
 
 
@@ -185,7 +284,7 @@ async def get_experiment_tasks_dir(experiment_id: str) -> str:
     experiments_dir = await get_experiments_dir()
     experiment_id_safe = secure_filename(str(experiment_id))
     path = storage.join(experiments_dir, experiment_id_safe, "tasks")
-    await storage.makedirs(path, exist_ok=True)
+    await _ensure_dir(path)
     return path
 
 
@@ -231,7 +330,7 @@ async def get_global_log_path() -> str:
 
 async def get_logs_dir() -> str:
     path = storage.join(HOME_DIR, "logs")
-    await storage.makedirs(path, exist_ok=True)
+    await _ensure_dir(path)
     return path
 
 
@@ -244,14 +343,27 @@ async def experiment_dir_by_name(experiment_name: str) -> str:
 async def get_models_dir() -> str:
     workspace = await get_workspace_dir()
     path = storage.join(workspace, "models")
-    await storage.makedirs(path, exist_ok=True)
+    await _ensure_dir(path)
     return path
 
 
 async def get_datasets_dir() -> str:
     workspace = await get_workspace_dir()
     path = storage.join(workspace, "datasets")
-    await storage.makedirs(path, exist_ok=True)
+    await _ensure_dir(path)
+    return path
+
+
+async def get_catalogue_dir(name: str) -> str:
+    """
+    Return the directory holding a workspace-level catalogue (see lab.asset_catalogue).
+
+    Layout:
+        {workspace}/catalogues/{name}/
+    """
+    workspace = await get_workspace_dir()
+    path = storage.join(workspace, "catalogues", secure_filename(str(name)))
+    await _ensure_dir(path)
     return path
 
 
@@ -262,7 +374,7 @@ async def get_tasks_dir() -> str:
 
     workspace = await get_workspace_dir()
     path = storage.join(workspace, "tasks")
-    await storage.makedirs(path, exist_ok=True)
+    await _ensure_dir(path)
     return path
 
 
@@ -278,35 +390,35 @@ async def get_task_dir() -> str:
 
     workspace = await get_workspace_dir()
     path = storage.join(workspace, "task")
-    await storage.makedirs(path, exist_ok=True)
+    await _ensure_dir(path)
     return path
 
 
 async def get_temp_dir() -> str:
     workspace = await get_workspace_dir()
     path = storage.join(workspace, "temp")
-    await storage.makedirs(path, exist_ok=True)
+    await _ensure_dir(path)
     return path
 
 
 async def get_prompt_templates_dir() -> str:
     workspace = await get_workspace_dir()
     path = storage.join(workspace, "prompt_templates")
-    await storage.makedirs(path, exist_ok=True)
+    await _ensure_dir(path)
     return path
 
 
 async def get_tools_dir() -> str:
     workspace = await get_workspace_dir()
     path = storage.join(workspace, "tools")
-    await storage.makedirs(path, exist_ok=True)
+    await _ensure_dir(path)
     return path
 
 
 async def get_batched_prompts_dir() -> str:
     workspace = await get_workspace_dir()
     path = storage.join(workspace, "batched_prompts")
-    await storage.makedirs(path, exist_ok=True)
+    await _ensure_dir(path)
     return path
 
 
@@ -347,7 +459,7 @@ async def get_job_artifacts_dir(job_id: str | int, experiment_id: str) -> str:
     """
     job_dir = await get_job_dir(job_id, experiment_id)
     path = storage.join(job_dir, "artifacts")
-    await storage.makedirs(path, exist_ok=True)
+    await _ensure_dir(path)
     return path
 
 
@@ -368,7 +480,7 @@ async def get_job_profiling_dir(job_id: str | int, experiment_id: str | None = N
 
     job_dir = await get_job_dir(job_id, experiment_id)
     path = storage.join(job_dir, "profiling")
-    await storage.makedirs(path, exist_ok=True)
+    await _ensure_dir(path)
     return path
 
 
@@ -379,7 +491,7 @@ async def get_job_checkpoints_dir(job_id: str | int, experiment_id: str) -> str:
     """
     job_dir = await get_job_dir(job_id, experiment_id)
     path = storage.join(job_dir, "checkpoints")
-    await storage.makedirs(path, exist_ok=True)
+    await _ensure_dir(path)
     return path
 
 
@@ -390,7 +502,7 @@ async def get_job_eval_results_dir(job_id: str | int, experiment_id: str) -> str
     """
     job_dir = await get_job_dir(job_id, experiment_id)
     path = storage.join(job_dir, "eval_results")
-    await storage.makedirs(path, exist_ok=True)
+    await _ensure_dir(path)
     return path
 
 
@@ -401,7 +513,7 @@ async def get_job_models_dir(job_id: str | int, experiment_id: str) -> str:
     """
     job_dir = await get_job_dir(job_id, experiment_id)
     path = storage.join(job_dir, "models")
-    await storage.makedirs(path, exist_ok=True)
+    await _ensure_dir(path)
     return path
 
 
@@ -412,7 +524,7 @@ async def get_job_datasets_dir(job_id: str | int, experiment_id: str) -> str:
     """
     job_dir = await get_job_dir(job_id, experiment_id)
     path = storage.join(job_dir, "datasets")
-    await storage.makedirs(path, exist_ok=True)
+    await _ensure_dir(path)
     return path
 
 
@@ -424,7 +536,7 @@ async def eval_output_file(experiment_name: str, eval_name: str) -> str:
     experiment_dir = await experiment_dir_by_name(experiment_name)
     eval_name = secure_filename(eval_name)
     p = storage.join(experiment_dir, "evals", eval_name)
-    await storage.makedirs(p, exist_ok=True)
+    await _ensure_dir(p)
     return storage.join(p, "output.txt")
 
 
@@ -432,7 +544,7 @@ async def generation_output_file(experiment_name: str, generation_name: str) ->
     experiment_dir = await experiment_dir_by_name(experiment_name)
     generation_name = secure_filename(generation_name)
     p = storage.join(experiment_dir, "generations", generation_name)
-    await storage.makedirs(p, exist_ok=True)
+    await _ensure_dir(p)
     return storage.join(p, "output.txt")
 
 
@@ -1,9 +1,14 @@
+import asyncio
 import json
 from datetime import datetime, timezone
 import posixpath
 
+from . import checkpoint_store
 from . import dirs
+from . import job_catalogue
+from . import job_events
 from .labresource import BaseLabResource
+from . import segmented_log
 from . import storage
 from .job_status import JobStatus
 import logging
@@ -55,6 +60,7 @@ class Job(BaseLabResource):
         self.id = job_id
         self.experiment_id = experiment_id
         self.should_stop = False
+        self._log_writer: segmented_log.SegmentedLogWriter | None = None
 
     @classmethod
     async def create(cls, job_id: str, experiment_id: str):
@@ -78,6 +84,11 @@ class Job(BaseLabResource):
         """Abstract method on BaseLabResource"""
         return await dirs.get_job_dir(self.id, self.experiment_id)
 
+    async def _on_json_written(self, json_data: dict):
+        """Record every index.json write in the job catalogue and on the in-process event bus."""
+        cursor = await job_catalogue.record_job(self.experiment_id, self.id, json_data)
+        job_events.publish_job_json(self.experiment_id, self.id, json_data, cursor=cursor)
+
     async def get_log_path(self):
         """
         Returns the path where this job should write logs.
@@ -137,34 +148,56 @@ class Job(BaseLabResource):
                   in the job directory for the full history.
         step:     optional integer step counter associated with this row.
         """
-        await self._update_json_data_field("progress", progress)
-        if metrics is not None:
-            await self.update_job_data_field("current_metrics", metrics)
-        await self._append_metrics_row(progress=progress, metrics=metrics, step=step)
+        row = self.build_metrics_row(progress=progress, metrics=metrics, step=step)
+        await self.write_progress_batch(progress, metrics, [row])
 
-    async def _append_metrics_row(
-        self,
-        *,
-        progress: int,
-        metrics: dict | None,
-        step: int | None,
-    ) -> None:
-        """Append one event to {job_dir}/metrics.jsonl. Best-effort; never raises."""
+    @staticmethod
+    def build_metrics_row(*, progress: int, metrics: dict | None, step: int | None) -> dict:
+        """Build one metrics.jsonl row, timestamped now."""
+        row: dict = {
+            "t": datetime.now(timezone.utc).isoformat(),
+            "progress": progress,
+        }
+        if step is not None:
+            row["step"] = step
+        if metrics:
+            row["metrics"] = metrics
+        return row
+
+    async def write_progress_batch(self, progress: int, metrics: dict | None, rows: list[dict]):
+        """
+        Persist a batch of progress updates with one index.json write and one
+        metrics.jsonl append.
+
+        progress: latest percent complete.
+        metrics:  latest metrics dict (becomes job_data.current_metrics), or None
+                  to leave current_metrics untouched.
+        rows:     metrics.jsonl rows (see build_metrics_row) in submission order.
+        """
+        async with self._json_update_lock():
+            json_data = await self.get_json_data(uncached=True)
+            json_data["progress"] = progress
+            if metrics is not None:
+                job_data = json_data.get("job_data")
+                if not isinstance(job_data, dict):
+                    job_data = {}
+                job_data["current_metrics"] = metrics
+                json_data["job_data"] = job_data
+            await self._set_json_data(json_data)
+        await self._append_metrics_rows(rows)
+
+    async def _append_metrics_rows(self, rows: list[dict]) -> None:
+        """Append events to {job_dir}/metrics.jsonl in one write. Best-effort; never raises."""
+        if not rows:
+            return
         try:
             job_dir = await self.get_dir()
             path = storage.join(job_dir, "metrics.jsonl")
-            row: dict = {
-                "t": datetime.now(timezone.utc).isoformat(),
-                "progress": progress,
-            }
-            if step is not None:
-                row["step"] = step
-            if metrics:
-                row["metrics"] = metrics
+            payload = "".join(json.dumps(row) + "\n" for row in rows)
             async with await storage.open(path, "a", encoding="utf-8") as f:
-                await f.write(json.dumps(row) + "\n")
+                await f.write(payload)
         except Exception:
-            logger.debug("Failed to append metrics.jsonl row", exc_info=True)
+            logger.debug("Failed to append metrics.jsonl rows", exc_info=True)
 
     async def update_status(self, status: str):
         await self._update_json_data_field("status", status)
@@ -206,17 +239,18 @@ class Job(BaseLabResource):
         if not isinstance(updates, dict):
             raise TypeError("updates must be a dict of job_data updates")
 
-        # Fetch current job JSON (use uncached to avoid stale data)
-        json_data = await self.get_json_data(uncached=True)
+        async with self._json_update_lock():
+            # Fetch current job JSON (use uncached to avoid stale data)
+            json_data = await self.get_json_data(uncached=True)
 
-        # If there isn't a job_data property then make one
-        job_data = json_data.get("job_data")
-        if not isinstance(job_data, dict):
-            job_data = {}
+            # If there isn't a job_data property then make one
+            job_data = json_data.get("job_data")
+            if not isinstance(job_data, dict):
+                job_data = {}
 
-        job_data.update(updates)
-        json_data["job_data"] = job_data
-        await self._set_json_data(json_data)
+            job_data.update(updates)
+            json_data["job_data"] = job_data
+            await self._set_json_data(json_data)
 
     async def update_job_data_field(self, key, value=None, multiple: bool = False):
         """
@@ -243,8 +277,10 @@ class Job(BaseLabResource):
     async def log_info(self, message):
         """
         Save info message to output log file and display to terminal.
-        Uses append mode for local files (prevents flickering) and read-modify-write
-        for remote files (S3/GCS don't support true append efficiently).
+        Uses append mode for local files (prevents flickering). Remote files
+        (S3/GCS/Azure) can't be appended to, so they are written as a segmented
+        log (see lab.segmented_log): lines are buffered and uploaded as bounded
+        part objects, so each call costs O(new bytes) instead of O(log size).
         """
         # Always print to console
         logger.info(message)
@@ -259,37 +295,39 @@ class Job(BaseLabResource):
             message_str = message_str + "\n"
 
         try:
+            if self._log_writer is not None:
+                await asyncio.to_thread(self._log_writer.write, message_str)
+                return
+
             log_path = await self.get_log_path()
-            await storage.makedirs(posixpath.dirname(log_path), exist_ok=True)
-
-            # Check if this is a remote path (S3, GCS, etc.)
-            is_remote = storage.is_remote_path(log_path)
-
-            if is_remote:
-                # For remote storage, use read-modify-write since true append
-                # may not work efficiently with S3/GCS filesystems
-                existing_content = ""
-                if await storage.exists(log_path):
-                    async with await storage.open(log_path, "r", encoding="utf-8") as f:
-                        existing_content = await f.read()
-
-                # Append new message to existing content on a new line
-                if existing_content and not existing_content.endswith("\n"):
-                    existing_content += "\n"
-                new_content = existing_content + message_str
-
-                # Write back the complete content
-                async with await storage.open(log_path, "w", encoding="utf-8") as f:
-                    await f.write(new_content)
+
+            if storage.is_remote_path(log_path):
+                # Writers are shared per path so buffered lines from several Job
+                # objects for the same job land in the same open part.
+                self._log_writer = segmented_log.get_writer(log_path)
+                await asyncio.to_thread(self._log_writer.write, message_str)
             else:
                 # For local files, use append mode - this is much more efficient
                 # and prevents flickering in the frontend when viewing output
+                await storage.makedirs(posixpath.dirname(log_path), exist_ok=True)
                 async with await storage.open(log_path, "a", encoding="utf-8") as f:
                     await f.write(message_str)
         except Exception:
             # Best-effort file logging; ignore file errors to avoid crashing job
             pass
 
+    async def flush_logs(self):
+        """
+        Upload any log lines still buffered for a remote (segmented) log.
+        Called when a job finishes so the tail of the output is never lost.
+        """
+        if self._log_writer is None:
+            return
+        try:
+            await asyncio.to_thread(self._log_writer.flush)
+        except Exception:
+            logger.debug("Failed to flush job log", exc_info=True)
+
     async def set_type(self, job_type: str):
         """
         Set the type of this job.
@@ -377,6 +415,7 @@ class Job(BaseLabResource):
         """
         Get list of checkpoint paths for this job.
         Returns list of all items (files and dirs) in the checkpoints directory.
+        Dedup checkpoints are listed under their checkpoint path, not their manifest.
         """
         try:
             # Scan the checkpoints directory for all items (files and dirs)
@@ -388,8 +427,8 @@ class Job(BaseLabResource):
                 except Exception:
                     items = []
                 for item_path in items:
-                    checkpoint_files.append(item_path)
-                return sorted(checkpoint_files)
+                    checkpoint_files.append(checkpoint_store.checkpoint_path_for(item_path))
+                return sorted(set(checkpoint_files))
 
             return []
         except Exception:
@@ -0,0 +1,200 @@
+"""
+Per-experiment job catalogue: a compacted snapshot plus an append-only change log.
+
+Listing an experiment's jobs used to mean one ``index.json`` read per job. The
+catalogue keeps the latest JSON of every job in an experiment in two places:
+
+    {experiment}/job_catalogue/snapshot.json         {"applied": [<change>...], "jobs": {...}}
+    {experiment}/job_catalogue/changes/<ns>-<rand>.json
+
+Every ``Job._set_json_data`` writes one small, uniquely named change object.
+Readers fetch the snapshot, list the change directory and apply the changes
+the snapshot's ``applied`` list does not name; a steady-state poll costs one
+snapshot read, one listing and a read per new change. When enough changes
+pile up a reader folds them into a new snapshot. The snapshot and change-log
+mechanics are shared with lab.asset_catalogue and live in lab.change_log.
+
+If no snapshot exists yet (new experiment, or data written before the
+catalogue existed) ``load_jobs`` rebuilds it with one full scan of the jobs
+directory; ``rebuild`` can also be called explicitly.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+
+from . import change_log
+from . import dirs
+from . import storage
+from .change_log import CHANGES_DIRNAME, basename
+
+logger = logging.getLogger(__name__)
+
+JOBS_KEY = "jobs"
+
+COMPACT_THRESHOLD = max(1, int(os.getenv("TFL_JOB_CATALOGUE_COMPACT_THRESHOLD", "64")))
+# changes_since() keeps its cursor this far behind the newest change so late-arriving changes are still read.
+CHANGE_GRACE_SECONDS = float(os.getenv("TFL_JOB_CATALOGUE_GRACE_SECONDS", "300"))
+REBUILD_CONCURRENCY = 20
+
+# Sorts before every change name: the cursor for a log that was empty when first seen.
+START_CURSOR = "0" * 20
+
+
+async def _paths(experiment_id: str) -> tuple[str, str]:
+    catalogue_dir = await dirs.get_job_catalogue_dir(experiment_id)
+    return catalogue_dir, storage.join(catalogue_dir, CHANGES_DIRNAME)
+
+
+async def record_jobs(experiment_id: str, jobs: dict[str, dict]) -> str | None:
+    """
+    Append one change recording the current JSON of ``jobs`` ({job_id: job_json}).
+
+    Returns the change name (usable as a ``changes_since`` cursor), or None if
+    the write failed. Best-effort: a failure is logged and otherwise ignored,
+    since the job's own index.json is still the source of truth and
+    ``rebuild`` can always recover the catalogue.
+    """
+    if not experiment_id or not jobs:
+        return None
+    try:
+        _, changes_dir = await _paths(experiment_id)
+        fs = await storage._get_uncached_filesystem(changes_dir)
+        payload = {str(k): v for k, v in jobs.items()}
+        return await asyncio.to_thread(change_log.write_change_sync, fs, changes_dir, payload, JOBS_KEY)
+    except Exception:
+        logger.debug("Failed to record job catalogue change for experiment %s", experiment_id, exc_info=True)
+        return None
+
+
+async def record_job(experiment_id: str, job_id: str, job_json: dict) -> str | None:
+    """Append the current JSON of a single job to the catalogue."""
+    return await record_jobs(experiment_id, {str(job_id): job_json})
+
+
+async def load_jobs(experiment_id: str) -> dict[str, dict]:
+    """
+    Return {job_id: job_json} for every job in the experiment, including DELETED ones.
+
+    Builds the snapshot on first use and compacts the change log when it has
+    grown past ``TFL_JOB_CATALOGUE_COMPACT_THRESHOLD`` entries.
+    """
+    catalogue_dir, changes_dir = await _paths(experiment_id)
+    fs = await storage._get_uncached_filesystem(catalogue_dir)
+
+    snapshot, changes = await asyncio.gather(
+        asyncio.to_thread(change_log.read_snapshot_sync, fs, catalogue_dir),
+        asyncio.to_thread(change_log.list_changes_sync, fs, changes_dir),
+    )
+    if snapshot is None:
+        return await rebuild(experiment_id)
+
+    jobs = dict(snapshot.get(JOBS_KEY) or {})
+    pending = change_log.pending_changes(snapshot, changes)
+    await asyncio.to_thread(change_log.apply_changes_sync, fs, changes_dir, jobs, pending, JOBS_KEY)
+
+    # Forget cached changes that have been compacted away.
+    change_log.forget_unlisted(changes_dir, changes)
+
+    if len(pending) >= COMPACT_THRESHOLD:
+        try:
+            await asyncio.to_thread(change_log.compact_sync, fs, catalogue_dir, changes_dir, JOBS_KEY)
+        except Exception:
+            logger.warning("Failed to compact job catalogue for experiment %s", experiment_id, exc_info=True)
+    return jobs
+
+
+async def rebuild(experiment_id: str) -> dict[str, dict]:
+    """
+    Rebuild the catalogue snapshot from the jobs directory.
+
+    Reads every job's index.json once (concurrently) and writes a fresh
+    snapshot. Changes written before the scan started are superseded by the
+    scanned data; later ones stay in the log and are applied on top.
+    """
+    catalogue_dir, changes_dir = await _paths(experiment_id)
+    jobs_dir = await dirs.get_jobs_dir(experiment_id)
+    fs = await storage._get_uncached_filesystem(catalogue_dir)
+
+    changes = await asyncio.to_thread(change_log.list_changes_sync, fs, changes_dir)
+    applied = [basename(p) for p in changes]
+
+    try:
+        entries = await asyncio.to_thread(lambda: fs.ls(jobs_dir, detail=False))
+    except FileNotFoundError:
+        entries = []
+
+    semaphore = asyncio.Semaphore(REBUILD_CONCURRENCY)
+
+    async def _read(entry: str) -> tuple[str, dict | None]:
+        job_id = basename(entry)
+        async with semaphore:
+            try:
+                raw = await asyncio.to_thread(fs.cat_file, storage.join(jobs_dir, job_id, "index.json"))
+                data = json.loads(raw)
+            except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+                return job_id, None
+            except Exception:
+                logger.warning("Job catalogue rebuild: failed to read job %s", entry, exc_info=True)
+                return job_id, None
+        return job_id, data if isinstance(data, dict) else None
+
+    results = await asyncio.gather(*(_read(e) for e in entries if basename(e) and not basename(e).startswith("._")))
+    jobs = {job_id: data for job_id, data in results if data is not None}
+
+    try:
+        await asyncio.to_thread(change_log.write_snapshot_sync, fs, catalogue_dir, jobs, applied, JOBS_KEY)
+    except Exception:
+        logger.warning("Failed to write job catalogue snapshot for experiment %s", experiment_id, exc_info=True)
+
+    # Pick up anything written while we were scanning.
+    latest = await asyncio.to_thread(change_log.list_changes_sync, fs, changes_dir)
+    pending = change_log.pending_changes({"applied": applied}, latest)
+    await asyncio.to_thread(change_log.apply_changes_sync, fs, changes_dir, jobs, pending, JOBS_KEY)
+    return jobs
+
+
+async def changes_since(experiment_id: str, cursor: str | None) -> tuple[list[tuple[str, dict[str, dict]]], str]:
+    """
+    Return catalogue changes written after ``cursor`` and the advanced cursor.
+
+    Each change is ``(change_name, {job_id: job_json})``. ``cursor=None``
+    starts at the current end of the log (``START_CURSOR`` if it is empty, so
+    the first change written later is still returned). If compaction already removed
+    changes the caller has not seen, the snapshot is returned first as one
+    synthetic ``snapshot:<marker>`` change so no job's latest state is lost.
+
+    The returned cursor trails the newest change by ``CHANGE_GRACE_SECONDS``,
+    so a change that shows up late with an older name is still returned;
+    changes inside that window come back on every call and callers
+    de-duplicate them by name (``job_events.publish_job_json`` does).
+    Costs one listing plus a read per uncached change.
+    """
+    catalogue_dir, changes_dir = await _paths(experiment_id)
+    fs = await storage._get_uncached_filesystem(catalogue_dir)
+    changes, gc_through = await asyncio.to_thread(change_log.list_changes_and_gc_sync, fs, changes_dir)
+    latest = basename(changes[-1]) if changes else ""
+    if cursor is None:
+        return [], max(latest, gc_through) or START_CURSOR
+
+    result: list[tuple[str, dict[str, dict]]] = []
+    if gc_through and cursor < gc_through:
+        snapshot = await asyncio.to_thread(change_log.read_snapshot_sync, fs, catalogue_dir)
+        if snapshot is not None:
+            result.append((f"snapshot:{snapshot.get('through') or ''}", dict(snapshot.get(JOBS_KEY) or {})))
+
+    def _read_pending() -> list[tuple[str, dict[str, dict]]]:
+        pending = []
+        for path in changes:
+            if basename(path) <= cursor:
+                continue
+            change = change_log.read_change_sync(fs, changes_dir, path)
+            if change and isinstance(change.get(JOBS_KEY), dict):
+                pending.append((basename(path), change[JOBS_KEY]))
+        return pending
+
+    result.extend(await asyncio.to_thread(_read_pending))
+    floor = f"{max(0, int((time.time() - CHANGE_GRACE_SECONDS) * 1e9)):020d}"
+    return result, max(cursor, min(latest, floor))
@@ -0,0 +1,211 @@
+"""
+In-process job event bus.
+
+``Job`` publishes an event every time its index.json is written (status,
+progress, job_data...). Writes made by other processes (remote machines
+running the SDK, e.g. ``tfl-remote-trap``) reach the bus through the job
+catalogue change log, which a host application can replay with
+``lab.job_catalogue.changes_since`` and feed into ``publish_job_json``.
+
+Subscribers pick the transitions they care about and receive events on an
+asyncio queue bound to the loop they subscribed from, so publishing is safe
+from any thread (the Lab facade writes progress from a background thread).
+"""
+
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+from . import dirs
+
+logger = logging.getLogger(__name__)
+
+# Last status seen per (org, experiment, job), used to tell status transitions from progress writes.
+_MAX_TRACKED_JOBS = 50_000
+# Change objects already published in this process, so replaying the change log does not repeat them.
+_MAX_TRACKED_CHANGES = 10_000
+
+
+@dataclass(frozen=True)
+class JobEvent:
+    """One write to a job's index.json."""
+
+    org_id: str | None
+    experiment_id: str
+    job_id: str
+    status: str | None
+    previous_status: str | None
+    type: str | None
+    job: dict = field(repr=False)
+    cursor: str | None = None
+
+    @property
+    def status_changed(self) -> bool:
+        return self.status != self.previous_status
+
+
+class Subscription:
+    """A filtered stream of job events delivered to the subscribing event loop."""
+
+    def __init__(self, bus: "JobEventBus", predicate: Callable[[JobEvent], bool], max_queue: int):
+        self._bus = bus
+        self._predicate = predicate
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue[JobEvent] = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def _offer(self, event: JobEvent) -> None:
+        if not self._predicate(event):
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # Subscriber's loop is closed; nothing left to deliver to.
+            self._bus.unsubscribe(self)
+
+    def _put(self, event: JobEvent) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Consumers reconcile periodically, so dropping is safe; count it so they can tell.
+            self.dropped += 1
+
+    async def get(self, timeout: float | None = None) -> JobEvent | None:
+        """Wait for the next event; returns None if ``timeout`` expires first."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def drain(self) -> list[JobEvent]:
+        """Return every event queued right now without waiting."""
+        events = []
+        while True:
+            try:
+                events.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                return events
+
+    def close(self) -> None:
+        self._bus.unsubscribe(self)
+
+
+class JobEventBus:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscriptions: list[Subscription] = []
+        self._last_status: OrderedDict[tuple, str | None] = OrderedDict()
+        self._seen_cursors: OrderedDict[str, None] = OrderedDict()
+
+    def subscribe(
+        self,
+        statuses: Iterable[str] | None = None,
+        types: Iterable[str] | None = None,
+        status_changes_only: bool = True,
+        max_queue: int = 10_000,
+    ) -> Subscription:
+        """
+        Subscribe from a running event loop.
+
+        ``statuses``/``types`` restrict events to jobs currently in those
+        states/types. With ``status_changes_only`` (the default) plain progress
+        or job_data writes that leave the status unchanged are skipped.
+        """
+        # Accept JobStatus members as well as plain strings; events carry plain values.
+        status_set = {str(getattr(s, "value", s)) for s in statuses} if statuses is not None else None
+        type_set = {str(getattr(t, "value", t)) for t in types} if types is not None else None
+
+        def _predicate(event: JobEvent) -> bool:
+            if status_changes_only and not event.status_changed:
+                return False
+            if status_set is not None and event.status not in status_set:
+                return False
+            if type_set is not None and event.type not in type_set:
+                return False
+            return True
+
+        subscription = Subscription(self, _predicate, max_queue)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def publish_job_json(
+        self,
+        experiment_id: str,
+        job_id: str,
+        job_json: dict[str, Any],
+        cursor: str | None = None,
+        org_id: str | None = None,
+    ) -> JobEvent | None:
+        """
+        Publish the freshly written JSON of a job. Returns the event, or None if
+        ``cursor`` (the catalogue change it came from) was already published.
+        """
+        if org_id is None:
+            org_id = dirs.get_organization_id()
+        key = (org_id, str(experiment_id), str(job_id))
+        # Job writes may still hold JobStatus members; compare and publish plain values.
+        status = getattr(job_json.get("status"), "value", job_json.get("status"))
+        status = str(status) if status is not None else None
+        job_type = getattr(job_json.get("type"), "value", job_json.get("type"))
+        with self._lock:
+            if cursor is not None:
+                if cursor in self._seen_cursors:
+                    return None
+                self._seen_cursors[cursor] = None
+                while len(self._seen_cursors) > _MAX_TRACKED_CHANGES:
+                    self._seen_cursors.popitem(last=False)
+            previous = self._last_status.pop(key, None)
+            self._last_status[key] = status
+            while len(self._last_status) > _MAX_TRACKED_JOBS:
+                self._last_status.popitem(last=False)
+            subscriptions = list(self._subscriptions)
+
+        event = JobEvent(
+            org_id=org_id,
+            experiment_id=str(experiment_id),
+            job_id=str(job_id),
+            status=status,
+            previous_status=previous,
+            type=job_type,
+            job=job_json,
+            cursor=cursor,
+        )
+        for subscription in subscriptions:
+            try:
+                subscription._offer(event)
+            except Exception:
+                logger.debug("Failed to deliver job event for %s", job_id, exc_info=True)
+        return event
+
+
+bus = JobEventBus()
+
+
+def subscribe(
+    statuses: Iterable[str] | None = None,
+    types: Iterable[str] | None = None,
+    status_changes_only: bool = True,
+    max_queue: int = 10_000,
+) -> Subscription:
+    """Subscribe to the process-wide bus. See ``JobEventBus.subscribe``."""
+    return bus.subscribe(statuses=statuses, types=types, status_changes_only=status_changes_only, max_queue=max_queue)
+
+
+def publish_job_json(
+    experiment_id: str,
+    job_id: str,
+    job_json: dict[str, Any],
+    cursor: str | None = None,
+    org_id: str | None = None,
+) -> JobEvent | None:
+    """Publish on the process-wide bus. See ``JobEventBus.publish_job_json``."""
+    return bus.publish_job_json(experiment_id, job_id, job_json, cursor=cursor, org_id=org_id)
@@ -13,11 +13,15 @@ from .job import Job
 from . import dirs
 from .model import Model as ModelService
 from . import storage
+from . import checkpoint_store
 from werkzeug.utils import secure_filename
 from .dataset import Dataset
 from .task_template import TaskTemplate
 from .generation import GenerationModel, load_generation_model as _load_generation_model
 from .job_status import JobStatus
+from .progress_writer import ProgressWriter
+from .trackio_sync import TrackioSync
+from .async_runtime import get_runtime
 
 
 logger = logging.getLogger(__name__)
@@ -28,42 +32,43 @@ def _launch_experiment_id_from_env() -> str | None:
     return os.environ.get("_TFL_EXPERIMENT_ID") or os.environ.get("TFL_EXPERIMENT_ID")
 
 
+def _ensure_not_in_async_context() -> None:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    # The sync wrapper should not be used from async contexts; blocking here
+    # would stall the caller's loop. Use the async version (a_* methods) instead.
+    raise RuntimeError(
+        "Cannot use sync method when already in async context. "
+        "Use the async version instead (e.g., await lab.async_save_artifact() instead of lab.save_artifact())."
+    )
+
+
 def _run_async(coro):
     """
     Helper to run async code from sync context.
-    Handles event loop detection intelligently:
-    - If there's a running event loop, we need to use the async version instead
-    - If no running loop, uses asyncio.run() or run_until_complete()
+
+    Coroutines run on the process-wide background loop (lab.async_runtime), so
+    there is no per-call loop setup and storage clients stay warm between calls.
+    Raises if called from a running event loop; use the async version instead.
     """
     try:
-        # Try to get the running event loop
-        loop = asyncio.get_running_loop()
-        # If we're in an async context, we can't use blocking calls
-        # The sync wrapper should not be used from async contexts
-        # Use the async version (a_* methods) instead
-        raise RuntimeError(
-            "Cannot use sync method when already in async context. "
-            "Use the async version instead (e.g., await lab.async_save_artifact() instead of lab.save_artifact())."
-        )
-    except RuntimeError as e:
-        # Check if this is our custom error or a "no running loop" error
-        if "Cannot use sync method" in str(e):
-            raise
-        # No running loop - we can safely create/use one.
-        # IMPORTANT: only catch get_event_loop() errors here; runtime errors raised
-        # by the coroutine itself must propagate and should not trigger a retry with
-        # the same coroutine object.
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            return asyncio.run(coro)
+        _ensure_not_in_async_context()
+    except RuntimeError:
+        coro.close()
+        raise
+    return get_runtime().run(coro)
 
-        if loop.is_closed():
-            # Loop is closed, create a new one
-            return asyncio.run(coro)
 
-        # Loop exists but not running, use it
-        return loop.run_until_complete(coro)
+def _run_async_background(coro) -> None:
+    """Like _run_async, but returns immediately; failures are logged. Ordering with later calls is kept."""
+    try:
+        _ensure_not_in_async_context()
+    except RuntimeError:
+        coro.close()
+        raise
+    get_runtime().run_in_background(coro)
 
 
 class Lab:
@@ -77,12 +82,48 @@ class Lab:
     lab.finish("success")
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        progress_flush_interval: Optional[float] = None,
+        progress_flush_rows: Optional[int] = None,
+        background_writes: Optional[bool] = None,
+        dedup_checkpoints: Optional[bool] = None,
+        trackio_sync_interval: Optional[float] = None,
+    ) -> None:
+        """
+        Args:
+            progress_flush_interval: seconds between batched update_progress() writes
+                (default: TFL_PROGRESS_FLUSH_INTERVAL_SECONDS or 2.0).
+            progress_flush_rows: flush as soon as this many progress rows are pending
+                (default: TFL_PROGRESS_FLUSH_MAX_ROWS or 200).
+            background_writes: if True, log() and set_job_data_field() return without
+                waiting for the write; failures are logged instead of raised. flush(),
+                finish() and error() still wait for them
+                (default: TFL_LAB_BACKGROUND_WRITES or False).
+            dedup_checkpoints: if True, save_checkpoint() stores checkpoints in the
+                content-addressed store (lab.checkpoint_store) and uploads only files
+                that changed (default: TFL_CHECKPOINT_DEDUP or False).
+            trackio_sync_interval: minimum seconds between the Trackio snapshots that
+                log() and update_progress() trigger (default: TFL_TRACKIO_SYNC_INTERVAL_SECONDS
+                or 10.0). See lab.trackio_sync.
+        """
         self._experiment: Optional[Experiment] = None
         self._job: Optional[Job] = None
+        self._progress_flush_interval = progress_flush_interval
+        self._progress_flush_rows = progress_flush_rows
+        if background_writes is None:
+            background_writes = os.environ.get("TFL_LAB_BACKGROUND_WRITES", "false").lower() == "true"
+        self._background_writes = background_writes
+        if dedup_checkpoints is None:
+            dedup_checkpoints = checkpoint_store.dedup_enabled_by_default()
+        self._dedup_checkpoints = dedup_checkpoints
+        self._progress_writer: Optional[ProgressWriter] = None
         # Trackio integration flags (best-effort; do not affect core behavior)
         self._trackio_available: bool = False
         self._trackio_managed: bool = False
+        self._trackio_sync_interval = trackio_sync_interval
+        # One TrackioSync per local Trackio directory, created on first capture.
+        self._trackio_syncs: Dict[str, TrackioSync] = {}
 
     # ------------- lifecycle -------------
     def init(self, experiment_id: str | None = None, config: Optional[Dict[str, Any]] = None) -> None:
@@ -129,6 +170,16 @@ class Lab:
         # Update status to RUNNING for both cases
         _run_async(self._job.update_status(JobStatus.RUNNING))
 
+        # Progress/metrics updates are batched and written off the training thread.
+        self._close_progress_writer()
+        self._close_trackio_syncs()
+        writer_kwargs: Dict[str, Any] = {}
+        if self._progress_flush_interval is not None:
+            writer_kwargs["flush_interval"] = self._progress_flush_interval
+        if self._progress_flush_rows is not None:
+            writer_kwargs["max_rows"] = self._progress_flush_rows
+        self._progress_writer = ProgressWriter(self._job, **writer_kwargs)
+
         # Best-effort marker so UIs can distinguish jobs where lab has been
         # explicitly initialized. This reuses the existing live_status field
         # that remote_trap also writes to. Depending on ordering, live_status
@@ -411,6 +462,7 @@ class Lab:
                 logger.error("Failed to read task directory for mounting.", exc_info=True)
                 return
 
+        transfers: list[tuple[str, str]] = []
         for path in files:
             # Normalize remote paths returned by storage.find()/walk() to full URIs
             full_path = path
@@ -439,30 +491,25 @@ class Lab:
             if not rel or rel == "." or rel.startswith(".."):
                 continue
 
-            local_path = os.path.join(dest_dir, rel)
-            try:
-                async with await storage.open(full_path, "rb") as f:
-                    data = await f.read()
-            except Exception:
-                logger.error(f"Error opening path: {full_path}", exc_info=True)
-                continue
+            transfers.append((full_path, os.path.join(dest_dir, rel)))
 
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
-            with open(local_path, "wb") as out:
-                out.write(data)
+        # Download concurrently; a file that cannot be copied is logged and skipped.
+        failures = await storage.copy_files(transfers, raise_errors=False)
+        for full_path, _local_path, exc in failures:
+            logger.error(f"Error copying path: {full_path}", exc_info=exc)
 
     # ------------- convenience logging -------------
     def log(self, message: str) -> None:
         self._ensure_initialized()
-        _run_async(self._job.log_info(message))  # type: ignore[union-attr]
+        self._write(self._job.log_info(message))  # type: ignore[union-attr]
         # Check for wandb URL on every log operation
         self._check_and_capture_wandb_url()
         # Best-effort: keep Trackio metrics snapshot in sync so dashboards can be
-        # opened mid-run. This will overwrite any previous Trackio artifacts for
-        # this job with the latest DB from TRACKIO_DIR when Trackio is available.
+        # opened mid-run. The snapshot is taken off-thread, at most once per
+        # trackio_sync_interval, and only changed files are uploaded.
         try:
             if self._trackio_available:
-                self._capture_existing_trackio_run()
+                self._capture_existing_trackio_run(wait=False)
         except Exception:
             logger.debug("Trackio snapshot failed during log()", exc_info=True)
 
@@ -485,18 +532,61 @@ class Lab:
         Note: `score` (set by lab.finish) is the final, comparable result and is
         separate from `current_metrics`. Use metrics for live training signal;
         use score for the final number(s) that downstream tools rank on.
+
+        Updates are buffered in memory and written by a background thread every
+        few seconds (see Lab(progress_flush_interval=..., progress_flush_rows=...)),
+        so this is cheap enough to call on every training step. Call flush() to
+        force pending updates out; finish() and error() do so automatically.
         """
         self._ensure_initialized()
-        _run_async(self._job.update_progress(progress, metrics=metrics, step=step))  # type: ignore[union-attr]
+        if self._progress_writer is not None:
+            self._progress_writer.submit(progress, metrics=metrics, step=step)
+        else:
+            _run_async(self._job.update_progress(progress, metrics=metrics, step=step))  # type: ignore[union-attr]
         # Check for wandb URL on every progress update
         self._check_and_capture_wandb_url()
         # Keep Trackio snapshot reasonably fresh on progress updates.
         try:
             if self._trackio_available:
-                self._capture_existing_trackio_run()
+                self._capture_existing_trackio_run(wait=False)
         except Exception:
             logger.debug("Trackio snapshot failed during update_progress()", exc_info=True)
 
+    def flush(self) -> None:
+        """
+        Write any buffered progress/metrics updates and log lines now.
+        """
+        self._ensure_initialized()
+        if self._progress_writer is not None:
+            self._progress_writer.flush()
+        # Waits for any background writes submitted before it, too.
+        _run_async(self._job.flush_logs())  # type: ignore[union-attr]
+
+    def _write(self, coro) -> None:
+        """Run a telemetry-style write, in the background when background_writes is enabled."""
+        if self._background_writes:
+            _run_async_background(coro)
+        else:
+            _run_async(coro)
+
+    def _close_trackio_syncs(self) -> None:
+        """Upload any requested Trackio snapshots and stop their background threads."""
+        syncs, self._trackio_syncs = self._trackio_syncs, {}
+        for syncer in syncs.values():
+            try:
+                syncer.close()
+            except Exception:
+                logger.warning("Failed to flush Trackio snapshot", exc_info=True)
+
+    def _close_progress_writer(self) -> None:
+        """Flush pending progress updates and stop the background writer, if any."""
+        if self._progress_writer is not None:
+            try:
+                self._progress_writer.close()
+            except Exception:
+                logger.warning("Failed to flush pending progress updates", exc_info=True)
+            self._progress_writer = None
+
     # ------------- checkpoint resume support -------------
     def get_checkpoint_to_resume(self) -> Optional[str]:
         """
@@ -561,7 +651,8 @@ class Lab:
             checkpoint_name (str): The name of the checkpoint file or directory
 
         Returns:
-            Optional[str]: The full path to the checkpoint, or None if it doesn't exist
+            Optional[str]: The full path to the checkpoint, or None if it doesn't exist.
+                Checkpoints saved with dedup are materialized locally and that path is returned.
         """
         try:
             checkpoints_dir = await dirs.get_job_checkpoints_dir(parent_job_id, self._experiment.id)
@@ -590,7 +681,8 @@ class Lab:
             if await storage.exists(checkpoint_path_normalized):
                 return checkpoint_path_normalized
 
-            return None
+            # Dedup checkpoints only exist as a manifest; rebuild them on local disk.
+            return await checkpoint_store.materialize(checkpoint_path_normalized)
         except Exception:
             logger.error("Error getting parent job checkpoint path", exc_info=True)
             return None
@@ -644,6 +736,7 @@ class Lab:
                 )
         except Exception:
             pass
+        self._close_progress_writer()
         _run_async(self._job.update_progress(100))  # type: ignore[union-attr]
 
         # Resolve score before the first write so it's included atomically with the
@@ -687,10 +780,14 @@ class Lab:
                     self._capture_existing_trackio_run()
                 except Exception:
                     pass
+            self._close_trackio_syncs()
         except Exception:
             # Never let optional Trackio integration break finish()
             logger.debug("Trackio integration failed during finish()", exc_info=True)
 
+        # Publish any buffered output before the job is seen as terminal.
+        _run_async(self._job.flush_logs())  # type: ignore[union-attr]
+
         # Important: update cached_jobs only when all completion fields are already written.
         _run_async(self._job.update_status(JobStatus.COMPLETE))  # type: ignore[union-attr]
 
@@ -1427,19 +1524,25 @@ class Lab:
         )
         return output_path
 
-    def save_checkpoint(self, source_path: str, name: Optional[str] = None) -> str:
+    def save_checkpoint(self, source_path: str, name: Optional[str] = None, dedup: Optional[bool] = None) -> str:
         """
         Save a checkpoint file or directory into this job's checkpoints folder (sync version).
 
         This is a sync wrapper around the async implementation.
         Use async_save_checkpoint() if you're already in an async context.
         """
-        return _run_async(self.async_save_checkpoint(source_path, name))
+        return _run_async(self.async_save_checkpoint(source_path, name, dedup))
 
-    async def async_save_checkpoint(self, source_path: str, name: Optional[str] = None) -> str:
+    async def async_save_checkpoint(
+        self, source_path: str, name: Optional[str] = None, dedup: Optional[bool] = None
+    ) -> str:
         """
         Save a checkpoint file or directory into this job's checkpoints folder.
         Returns the destination path on disk.
+
+        With ``dedup`` (default: the Lab's dedup_checkpoints setting) the checkpoint is
+        stored as a manifest over content-addressed blobs and only changed files are
+        uploaded; the returned path is then resolved through lab.checkpoint_store.
         """
         self._ensure_initialized()
         if not isinstance(source_path, str) or source_path.strip() == "":
@@ -1473,12 +1576,20 @@ class Lab:
         else:
             src_is_dir = os.path.isdir(src)
 
-        if src_is_dir:
+        if self._dedup_checkpoints if dedup is None else dedup:
             if await storage.exists(dest):
                 await storage.rm_tree(dest)
-            await storage.copy_dir(src, dest)
+            stats = await checkpoint_store.save_checkpoint(src, dest)
+            logger.debug("Saved dedup checkpoint %s: %s", dest, stats)
         else:
-            await storage.copy_file(src, dest)
+            # A plain copy replaces any dedup manifest saved under the same name.
+            await checkpoint_store.delete_checkpoint(dest)
+            if src_is_dir:
+                if await storage.exists(dest):
+                    await storage.rm_tree(dest)
+                await storage.copy_dir(src, dest)
+            else:
+                await storage.copy_file(src, dest)
 
         # Track in job_data and update latest pointer
         try:
@@ -1579,6 +1690,8 @@ class Lab:
                 )
         except Exception:
             pass
+        self._close_progress_writer()
+        self._close_trackio_syncs()
         _run_async(
             self._job.update_job_data_fields(  # type: ignore[union-attr]
                 {
@@ -1589,6 +1702,7 @@ class Lab:
                 }
             )
         )
+        _run_async(self._job.flush_logs())  # type: ignore[union-attr]
         _run_async(self._job.update_status(JobStatus.FAILED))  # type: ignore[union-attr]
 
     def _detect_and_capture_wandb_url(self) -> None:
@@ -1737,8 +1851,16 @@ class Lab:
         Async implementation of capture_trackio_metadata().
         Requires TLAB_TRACKIO_PROJECT_NAME (shared project); copies to
         trackio_runs/{experiment_id}/{project_name}/ and does not write
-        trackio_db_artifact_path (dashboard derives path).
+        trackio_db_artifact_path (dashboard derives path). Files unchanged since
+        the previous capture of the same path are not uploaded again.
         """
+        syncer = await self._trackio_syncer_async(db_path)
+        await asyncio.to_thread(syncer.sync)
+        logger.info(f"📊 Saved Trackio metrics to shared project: {syncer.dest}")
+        return syncer.dest
+
+    async def _trackio_syncer_async(self, db_path: str) -> TrackioSync:
+        """Return the TrackioSync for a local Trackio path, creating it on first use."""
         self._ensure_initialized()
 
         if not isinstance(db_path, str) or db_path.strip() == "":
@@ -1749,6 +1871,10 @@ class Lab:
         if not os.path.exists(src):
             raise FileNotFoundError(f"Trackio path does not exist: {src}")
 
+        syncer = self._trackio_syncs.get(src)
+        if syncer is not None:
+            return syncer
+
         trackio_project_name_env = (os.environ.get("TLAB_TRACKIO_PROJECT_NAME") or "").strip()
         if not (trackio_project_name_env and self._experiment is not None):
             raise RuntimeError(
@@ -1763,16 +1889,13 @@ class Lab:
             secure_filename(str(self._experiment.id)),
             secure_filename(trackio_project_name_env),
         )
-        await storage.makedirs(trackio_dir, exist_ok=True)
-        if os.path.isdir(src):
-            await storage.copy_dir(src, trackio_dir)
-        else:
-            base_name = posixpath.basename(src)
-            dest_file = storage.join(trackio_dir, base_name)
-            await storage.copy_file(src, dest_file)
-        # Do not write trackio_db_artifact_path; dashboard derives from trackio_project_name
-        logger.info(f"📊 Saved Trackio metrics to shared project: {trackio_dir}")
-        return trackio_dir
+        kwargs: Dict[str, Any] = {}
+        if self._trackio_sync_interval is not None:
+            kwargs["interval"] = self._trackio_sync_interval
+        # Merge into the shared directory (a directory source is mirrored file by file).
+        syncer = TrackioSync(src, trackio_dir, **kwargs)
+        self._trackio_syncs[src] = syncer
+        return syncer
 
     async def _seed_trackio_shared_path_async(self, experiment_id: str, project_name: str, dest_dir: str) -> None:
         """If shared project path exists, copy its contents into dest_dir (seed for new run)."""
@@ -1789,11 +1912,13 @@ class Lab:
         except Exception as e:
             logger.debug("Trackio shared path seed failed: %s", e)
 
-    def _capture_existing_trackio_run(self) -> None:
+    def _capture_existing_trackio_run(self, wait: bool = True) -> None:
         """
         If trackio is installed and there is an active project, capture its DB into this
         job's artifacts using capture_trackio_metadata().
 
+        With wait=False the capture is only requested: it runs on the TrackioSync
+        thread no sooner than trackio_sync_interval after the previous one.
         Safe to call even if trackio is not installed or no run is active.
         """
         try:
@@ -1803,7 +1928,13 @@ class Lab:
             current_project = context_vars.current_project.get()
             if current_project:
                 db_path = str(TRACKIO_DIR)
-                self.capture_trackio_metadata(db_path=db_path)
+                if wait:
+                    self.capture_trackio_metadata(db_path=db_path)
+                else:
+                    syncer = self._trackio_syncs.get(os.path.abspath(db_path))
+                    if syncer is None:
+                        syncer = _run_async(self._trackio_syncer_async(db_path))
+                    syncer.request()
         except Exception:
             # Completely best-effort; ignore all errors here
             return
@@ -2115,7 +2246,7 @@ class Lab:
         intended as a replacement for plugin SDK helpers like add_job_data().
         """
         self._ensure_initialized()
-        _run_async(self._job.update_job_data_field(key, value))  # type: ignore[union-attr]
+        self._write(self._job.update_job_data_field(key, value))  # type: ignore[union-attr]
 
     def get_job_data(self) -> Dict[str, Any]:
         """
@@ -2125,6 +2256,9 @@ class Lab:
         Use async_get_job_data() if you're already in an async context.
         """
         self._ensure_initialized()
+        # Read-your-writes: make buffered current_metrics visible first.
+        if self._progress_writer is not None:
+            self._progress_writer.flush()
         return _run_async(self._job.get_job_data())  # type: ignore[union-attr]
 
     async def async_get_job_data(self) -> Dict[str, Any]:
@@ -2132,6 +2266,8 @@ class Lab:
         Get the job data dictionary (async version).
         """
         self._ensure_initialized()
+        if self._progress_writer is not None:
+            await asyncio.to_thread(self._progress_writer.flush)
         return await self._job.get_job_data()  # type: ignore[union-attr]
 
     def get_hf_callback(self):
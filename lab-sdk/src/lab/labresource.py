@@ -1,13 +1,17 @@
 import asyncio
 from abc import ABC, abstractmethod
+import contextlib
 import json
 import math
+import threading
 from typing import Iterable, Union
 from . import storage
 import logging
 
 logger = logging.getLogger(__name__)
 
+_json_lock_guard = threading.Lock()
+
 
 def _sanitize_non_finite(value):
     """Recursively replace non-finite floats (NaN, Infinity, -Infinity) with None.
@@ -105,8 +109,10 @@ class BaseLabResource(ABC):
         json_file = await self._get_json_file()
         if await storage.exists(json_file):
             raise FileExistsError(f"{type(self).__name__} with id '{self.id}' already exists")
+        default_json = self._default_json()
         async with await storage.open(json_file, "w", encoding="utf-8") as f:
-            await f.write(json.dumps(self._default_json()))
+            await f.write(json.dumps(default_json))
+        await self._on_json_written(default_json)
 
     def _default_json(self):
         """Override in subclasses to support the initialize method."""
@@ -198,6 +204,35 @@ class BaseLabResource(ABC):
         json_file = await self._get_json_file()
         async with await storage.open(json_file, "w", encoding="utf-8") as f:
             await f.write(json.dumps(json_data, ensure_ascii=False))
+        await self._on_json_written(json_data)
+
+    async def _on_json_written(self, json_data: dict):
+        """Hook called after index.json has been written. Override to maintain derived indexes."""
+        pass
+
+    async def _on_deleted(self):
+        """Hook called after this resource's directory has been removed by delete()."""
+        pass
+
+    @contextlib.asynccontextmanager
+    async def _json_update_lock(self):
+        """
+        Serialize read-modify-write cycles on this object's index.json.
+
+        A thread lock (not an asyncio one) because the same resource object can be
+        written from a background writer thread with its own event loop, e.g. the
+        Lab facade's batched progress writer.
+        """
+        lock = self.__dict__.get("_json_lock")
+        if lock is None:
+            with _json_lock_guard:
+                lock = self.__dict__.setdefault("_json_lock", threading.Lock())
+        if not lock.acquire(blocking=False):
+            await asyncio.to_thread(lock.acquire)
+        try:
+            yield
+        finally:
+            lock.release()
 
     async def _get_json_data_field(self, key, default=""):
         """Gets the value of a single top-level field in a JSON object"""
@@ -206,9 +241,10 @@ class BaseLabResource(ABC):
 
     async def _update_json_data_field(self, key: str, value):
         """Sets the value of a single top-level field in a JSON object"""
-        json_data = await self.get_json_data(uncached=True)
-        json_data[key] = value
-        await self._set_json_data(json_data)
+        async with self._json_update_lock():
+            json_data = await self.get_json_data(uncached=True)
+            json_data[key] = value
+            await self._set_json_data(json_data)
 
     async def _update_json_data_fields(self, updates: dict):
         """
@@ -220,9 +256,10 @@ class BaseLabResource(ABC):
         if not isinstance(updates, dict):
             raise TypeError("updates must be a dict")
 
-        json_data = await self.get_json_data(uncached=True)
-        json_data.update(updates)
-        await self._set_json_data(json_data)
+        async with self._json_update_lock():
+            json_data = await self.get_json_data(uncached=True)
+            json_data.update(updates)
+            await self._set_json_data(json_data)
 
     def _sibling(self, new_id):
         """Build a same-class instance with `new_id`, inheriting context attrs (e.g. experiment_id)."""
@@ -242,10 +279,14 @@ class BaseLabResource(ABC):
 
         TODO: We should change to soft delete
         """
+        from . import dirs
+
         if id is None:
             resource_dir = await self.get_dir()
             if await storage.exists(resource_dir):
                 await storage.rm_tree(resource_dir)
+            dirs.invalidate_path_cache(resource_dir)
+            await self._on_deleted()
             return None
 
         if isinstance(id, str):
@@ -268,6 +309,8 @@ class BaseLabResource(ABC):
                 if not await storage.exists(resource_dir):
                     return rid, False, "not found"
                 await storage.rm_tree(resource_dir)
+                dirs.invalidate_path_cache(resource_dir)
+                await sibling._on_deleted()
                 return rid, True, None
             except Exception as exc:  # noqa: BLE001
                 logger.exception("delete: failed to delete %s", rid)
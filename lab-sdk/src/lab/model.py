@@ -4,6 +4,7 @@ from typing import Optional
 
 from .dirs import get_models_dir, get_job_models_dir
 from .labresource import BaseLabResource
+from . import asset_catalogue
 from . import storage
 import logging
 
@@ -41,6 +42,7 @@ class Model(BaseLabResource):
         if not await storage.exists(json_file):
             async with await storage.open(json_file, "w", encoding="utf-8") as f:
                 await f.write(json.dumps(newobj._default_json()))
+            await newobj._on_json_written(newobj._default_json())
         return newobj
 
     async def get_dir(self):
@@ -93,15 +95,36 @@ class Model(BaseLabResource):
         """Get model metadata"""
         return await self.get_json_data()
 
+    def _catalogue_key(self) -> str:
+        return "/".join(secure_filename(p) for p in str(self.id).split("/"))
+
+    async def _on_json_written(self, json_data: dict):
+        if not self.job_id:
+            await asset_catalogue.record_entry(asset_catalogue.MODELS, self._catalogue_key(), json_data)
+
+    async def _on_deleted(self):
+        if not self.job_id:
+            await asset_catalogue.record_entry(asset_catalogue.MODELS, self._catalogue_key(), None)
+
+    async def refresh_catalogue_entry(self):
+        """Re-record this model in the workspace catalogue after its files were written directly."""
+        await self._on_json_written(await self.get_json_data(uncached=True))
+
     @staticmethod
     async def list_all():
-        """List all models in the filesystem.
+        """List all models from the workspace catalogue (built from a directory scan on first use)."""
+        entries = await asset_catalogue.load_entries(asset_catalogue.MODELS, Model._scan_all)
+        return list(entries.values())
+
+    @staticmethod
+    async def _scan_all() -> dict[str, dict]:
+        """Read every model in the filesystem, keyed by model id.
 
         Handles two layouts:
         - Flat: /models/<model_id>/index.json  (downloaded or grandfathered)
         - Grouped: /models/<group>/<vN>/index.json  (registry-published)
         """
-        results = []
+        results = {}
         models_dir = await get_models_dir()
         if not await storage.isdir(models_dir):
             return results
@@ -118,7 +141,7 @@ class Model(BaseLabResource):
             if await storage.exists(index_path):
                 try:
                     model = Model(entry)
-                    results.append(await model.get_metadata())
+                    results[entry] = await model.get_metadata()
                 except Exception:
                     continue
             else:
@@ -137,7 +160,7 @@ class Model(BaseLabResource):
                             # Use relative path as model id: group/vN
                             model_id = f"{entry}/{version_name}"
                             model = Model(model_id)
-                            results.append(await model.get_metadata())
+                            results[model_id] = await model.get_metadata()
                         except Exception:
                             continue
         return results
@@ -343,5 +366,6 @@ class Model(BaseLabResource):
         model_dir = await self.get_dir()
         async with await storage.open(storage.join(model_dir, "index.json"), "w") as outfile:
             await outfile.write(json.dumps(model_description))
+        await self._on_json_written(model_description)
 
         return model_description
@@ -0,0 +1,141 @@
+"""
+Background writer that batches Lab.update_progress() calls.
+
+Each update_progress() used to cost an index.json read-modify-write for the
+progress, another for current_metrics and a separate metrics.jsonl append.
+On object storage that is several round trips per training step. The
+ProgressWriter keeps the latest progress/metrics and the pending metrics rows
+in memory and persists them from a daemon thread with a single
+``Job.write_progress_batch`` call every ``flush_interval`` seconds, or as soon
+as ``max_rows`` rows are pending.
+"""
+
+import asyncio
+import atexit
+import contextvars
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = max(0.0, float(os.getenv("TFL_PROGRESS_FLUSH_INTERVAL_SECONDS", "2.0")))
+DEFAULT_FLUSH_MAX_ROWS = max(1, int(os.getenv("TFL_PROGRESS_FLUSH_MAX_ROWS", "200")))
+
+_NOT_SET = object()
+
+
+class ProgressWriter:
+    """
+    Coalesces progress/metrics updates for one job and writes them off-thread.
+
+    submit() never does I/O. flush() blocks until everything submitted so far
+    has been written; close() flushes and stops the thread.
+    """
+
+    def __init__(
+        self,
+        job,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_rows: int = DEFAULT_FLUSH_MAX_ROWS,
+    ):
+        self.job = job
+        self.flush_interval = flush_interval
+        self.max_rows = max_rows
+
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._flush_requested = False
+
+        self._progress = _NOT_SET
+        self._metrics: dict | None = None
+        self._rows: list[dict] = []
+        self._first_pending = 0.0
+        # Sequence numbers let flush() wait for exactly what was submitted before it.
+        self._submitted = 0
+        self._written = 0
+
+    def submit(self, progress: int, metrics: dict | None = None, step: int | None = None) -> None:
+        """Record a progress update. Returns immediately."""
+        row = self.job.build_metrics_row(progress=progress, metrics=metrics, step=step)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("ProgressWriter is closed")
+            self._progress = progress
+            if metrics is not None:
+                self._metrics = metrics
+            if not self._rows:
+                self._first_pending = time.monotonic()
+            self._rows.append(row)
+            self._submitted += 1
+            self._ensure_thread_locked()
+            if len(self._rows) == 1 or len(self._rows) >= self.max_rows:
+                self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Write everything submitted so far. Returns False if the timeout expired."""
+        with self._cond:
+            target = self._submitted
+            if self._written >= target:
+                return True
+            self._flush_requested = True
+            self._ensure_thread_locked()
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._written >= target, timeout=timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Flush pending updates and stop the background thread."""
+        self.flush(timeout=timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        # Drop the exit hook so a closed writer is not kept alive until shutdown.
+        atexit.unregister(self.close)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+
+    def _ensure_thread_locked(self) -> None:
+        if self._thread is not None:
+            return
+        # Run in a copy of the caller's context so org/storage context vars still apply.
+        ctx = contextvars.copy_context()
+        self._thread = threading.Thread(target=ctx.run, args=(self._run,), name="tfl-progress-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        # One long-lived loop for this thread instead of a fresh loop per write.
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                with self._cond:
+                    while not (self._closed or self._flush_requested or len(self._rows) >= self.max_rows):
+                        if not self._rows:
+                            self._cond.wait()
+                            continue
+                        remaining = self._first_pending + self.flush_interval - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(timeout=remaining)
+                    if self._closed and not self._rows:
+                        return
+                    progress, metrics, rows = self._progress, self._metrics, self._rows
+                    batch_end = self._submitted
+                    self._metrics = None
+                    self._rows = []
+                    self._flush_requested = False
+
+                if rows and progress is not _NOT_SET:
+                    try:
+                        loop.run_until_complete(self.job.write_progress_batch(progress, metrics, rows))
+                    except Exception:
+                        logger.warning("Failed to write batched progress update", exc_info=True)
+
+                with self._cond:
+                    self._written = batch_end
+                    self._cond.notify_all()
+        finally:
+            loop.close()
@@ -7,14 +7,18 @@ import subprocess
 import sys
 import tempfile
 import time
-from typing import List, Optional
+from collections import deque
+from typing import Deque, List, Optional
 
-from lab import Job, storage
+from lab import Job, segmented_log, storage
 from lab.job_status import JobStatus
 from lab.profiling import copy_profiling_to_job, finalize_profiling, inject_torch_profiler, maybe_start_profiling
 
+# Lines kept for the crash message are clipped so a single huge line cannot pin memory.
+_TAIL_LINE_MAX_CHARS = 2000
 
-async def _set_live_status_async(job_id: str, status: str) -> None:
+
+async def _set_live_status_async(job_id: str, status: str, error_msg: Optional[str] = None) -> None:
     """Async helper to set live_status on a job and mirror failures to job status."""
     try:
         experiment_id = os.environ.get("_TFL_EXPERIMENT_ID")
@@ -24,7 +28,10 @@ async def _set_live_status_async(job_id: str, status: str) -> None:
         job = await Job.get(job_id, experiment_id)
         if job is None:
             return
-        await job.update_job_data_field("live_status", status)
+        updates = {"live_status": status}
+        if error_msg:
+            updates["error_msg"] = error_msg
+        await job.update_job_data_fields(updates)
 
         # If the remote command crashed, also mark the job as FAILED.
         if status == "Remote command crashed":
@@ -62,14 +69,14 @@ async def _set_status_async(job_id: str, status: str) -> None:
         return
 
 
-def _set_live_status(status: str) -> None:
+def _set_live_status(status: str, error_msg: Optional[str] = None) -> None:
     """Set live_status on the current remote job, if _TFL_JOB_ID is available."""
     job_id = os.environ.get("_TFL_JOB_ID")
     if not job_id:
         return
 
     try:
-        asyncio.run(_set_live_status_async(job_id, status))
+        asyncio.run(_set_live_status_async(job_id, status, error_msg))
     except RuntimeError:
         # Fallback in case an event loop already exists.
         try:
@@ -77,9 +84,9 @@ def _set_live_status(status: str) -> None:
             if loop.is_running():
                 # In the unlikely case we're already in an event loop, schedule the task
                 # but don't wait on it (best-effort update).
-                loop.create_task(_set_live_status_async(job_id, status))
+                loop.create_task(_set_live_status_async(job_id, status, error_msg))
             else:
-                loop.run_until_complete(_set_live_status_async(job_id, status))
+                loop.run_until_complete(_set_live_status_async(job_id, status, error_msg))
         except Exception:
             return
 
@@ -104,12 +111,13 @@ def _set_status(status: str) -> None:
             return
 
 
-async def _write_provider_logs_async(job_id: str, logs_text: str) -> None:
+async def _prepare_provider_log_async(job_id: str) -> Optional[str]:
     """
-    Best-effort helper to write combined stdout/stderr logs to the job directory.
+    Resolve provider_logs.txt in the job directory and start it fresh.
 
-    Uses _TFL_JOB_ID to resolve the job directory via lab.dirs.get_job_dir, then
-    writes provider_logs.txt using the storage abstraction.
+    Returns the log path, or None if it cannot be resolved. The log is written
+    as a segmented log (see lab.segmented_log), so output is uploaded in
+    bounded, append-only parts instead of rewriting one growing object.
     """
     try:
         # Import inside helper to avoid circular imports at module load time.
@@ -117,7 +125,7 @@ async def _write_provider_logs_async(job_id: str, logs_text: str) -> None:
 
         experiment_id = os.environ.get("_TFL_EXPERIMENT_ID")
         if not experiment_id:
-            return
+            return None
 
         job_dir = await get_job_dir(job_id, experiment_id)
         log_path = storage.join(job_dir, "provider_logs.txt")
@@ -129,89 +137,45 @@ async def _write_provider_logs_async(job_id: str, logs_text: str) -> None:
             # Some storage backends may not support makedirs for virtual paths; ignore.
             pass
 
-        async with await storage.open(log_path, "w", encoding="utf-8") as f:
-            await f.write(logs_text or "")
+        # Fresh log per run so repeated restarts don't duplicate stale content.
+        await segmented_log.reset_log(log_path)
+        return log_path
     except Exception:
         # Never let logging failures break the wrapped command.
-        return
-
-
-async def _append_provider_logs_async(job_id: str, logs_text: str) -> None:
-    """Best-effort helper to append stdout/stderr chunks to provider_logs.txt."""
-    try:
-        from lab.dirs import get_job_dir
-
-        experiment_id = os.environ.get("_TFL_EXPERIMENT_ID")
-        if not experiment_id:
-            return
-
-        job_dir = await get_job_dir(job_id, experiment_id)
-        log_path = storage.join(job_dir, "provider_logs.txt")
+        return None
 
-        try:
-            await storage.makedirs(job_dir, exist_ok=True)
-        except Exception:
-            pass
-
-        if not logs_text:
-            return
-
-        # Prefer append mode for local filesystems. If append is unsupported on a
-        # backend, fall back to read-modify-write.
-        try:
-            async with await storage.open(log_path, "a", encoding="utf-8") as f:
-                await f.write(logs_text)
-            return
-        except Exception:
-            pass
-
-        existing = ""
-        if await storage.exists(log_path):
-            async with await storage.open(log_path, "r", encoding="utf-8") as f:
-                existing = await f.read()
-        async with await storage.open(log_path, "w", encoding="utf-8") as f:
-            await f.write((existing or "") + logs_text)
-    except Exception:
-        return
 
-
-def _write_provider_logs(logs_text: str) -> None:
-    """Entry-point wrapper for writing provider logs for the current job."""
+def _open_provider_log(flush_interval: float) -> Optional[segmented_log.SegmentedLogWriter]:
+    """Open a streaming writer for the current job's provider_logs.txt, if _TFL_JOB_ID is available."""
     job_id = os.environ.get("_TFL_JOB_ID")
-    if not job_id or logs_text is None:
-        return
+    if not job_id:
+        return None
 
     try:
-        asyncio.run(_write_provider_logs_async(job_id, logs_text))
+        log_path = asyncio.run(_prepare_provider_log_async(job_id))
     except RuntimeError:
-        # Fallback in case an event loop already exists.
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                loop.create_task(_write_provider_logs_async(job_id, logs_text))
-            else:
-                loop.run_until_complete(_write_provider_logs_async(job_id, logs_text))
-        except Exception:
-            return
-
-
-def _append_provider_logs(logs_text: str) -> None:
-    """Entry-point wrapper for appending provider logs for the current job."""
-    job_id = os.environ.get("_TFL_JOB_ID")
-    if not job_id or not logs_text:
+        # An event loop is already running; skip provider log capture rather than block it.
+        return None
+    if not log_path:
+        return None
+
+    part_max_bytes = segmented_log.DEFAULT_PART_MAX_BYTES
+    return segmented_log.SegmentedLogWriter(
+        log_path,
+        flush_interval=flush_interval,
+        part_max_bytes=part_max_bytes,
+        max_pending_bytes=int(os.getenv("TFL_PROVIDER_LOG_MAX_PENDING_BYTES", str(16 * part_max_bytes))),
+    )
+
+
+def _write_provider_log(writer: Optional[segmented_log.SegmentedLogWriter], text: str) -> None:
+    if writer is None:
         return
-
     try:
-        asyncio.run(_append_provider_logs_async(job_id, logs_text))
-    except RuntimeError:
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                loop.create_task(_append_provider_logs_async(job_id, logs_text))
-            else:
-                loop.run_until_complete(_append_provider_logs_async(job_id, logs_text))
-        except Exception:
-            return
+        writer.write(text)
+    except Exception:
+        # Failed uploads keep the text buffered (bounded) for the next flush.
+        pass
 
 
 def main(argv: List[str] | None = None) -> int:
@@ -265,12 +229,12 @@ def main(argv: List[str] | None = None) -> int:
     # Stream output line-by-line to avoid buffering large logs in memory (training
     # jobs can produce GBs of output). stdout and stderr are merged into a single
     # stream (stderr redirected to stdout) so we can tee to both the console and
-    # the provider_logs.txt file.
-    log_lines: List[str] = []
-    pending_log_lines: List[str] = []
+    # the provider_logs.txt segmented log. Memory stays flat: the log writer holds
+    # at most one part plus a bounded backlog, and only the last few lines are kept
+    # here (for the crash message).
     periodic_flush_interval_s = max(0.5, float(os.getenv("TFL_PROVIDER_LOG_FLUSH_INTERVAL_SECONDS", "2.0")))
-    periodic_flush_min_lines = max(1, int(os.getenv("TFL_PROVIDER_LOG_FLUSH_MIN_LINES", "25")))
-    last_periodic_flush_ts = time.monotonic()
+    tail_lines: Deque[str] = deque(maxlen=max(1, int(os.getenv("TFL_PROVIDER_LOG_TAIL_LINES", "20"))))
+    log_writer: Optional[segmented_log.SegmentedLogWriter] = None
     start_time = time.monotonic()
     proc: Optional[subprocess.Popen] = None
     profiling_thread = None
@@ -298,8 +262,7 @@ def main(argv: List[str] | None = None) -> int:
     signal.signal(signal.SIGINT, _handle_stop_signal)
 
     try:
-        # Fresh file per run so repeated restarts don't duplicate stale content.
-        _write_provider_logs("")
+        log_writer = _open_provider_log(periodic_flush_interval_s)
 
         popen_kwargs = {
             "shell": True,
@@ -323,18 +286,9 @@ def main(argv: List[str] | None = None) -> int:
                 sys.stdout.flush()
             except Exception:
                 pass
-            log_lines.append(line)
-            pending_log_lines.append(line)
-
-            now = time.monotonic()
-            should_flush = (
-                len(pending_log_lines) >= periodic_flush_min_lines
-                or (now - last_periodic_flush_ts) >= periodic_flush_interval_s
-            )
-            if should_flush:
-                _append_provider_logs("".join(pending_log_lines))
-                pending_log_lines.clear()
-                last_periodic_flush_ts = now
+            tail_lines.append(line[-_TAIL_LINE_MAX_CHARS:])
+            # Uploads happen every flush interval or once a part's worth is buffered.
+            _write_provider_log(log_writer, line)
 
         exit_code = proc.wait()
     finally:
@@ -343,14 +297,12 @@ def main(argv: List[str] | None = None) -> int:
         signal.signal(signal.SIGINT, previous_sigint)
     wall_time = time.monotonic() - start_time
 
-    if pending_log_lines:
-        _append_provider_logs("".join(pending_log_lines))
-        pending_log_lines.clear()
-
-    combined_logs = "".join(log_lines)
-    # Final overwrite keeps backwards compatibility for consumers expecting the
-    # complete file content to exactly match captured output.
-    _write_provider_logs(combined_logs)
+    if log_writer is not None:
+        # Upload the open part and a final manifest; sealed parts are never rewritten.
+        try:
+            log_writer.close()
+        except Exception:
+            pass
 
     # Finalise profiling: stop sampler thread and write report to profiling temp dir.
     finalize_profiling(profiling_thread, profiling_temp_dir, wall_time)
@@ -382,7 +334,8 @@ def main(argv: List[str] | None = None) -> int:
     if exit_code == 0:
         _set_live_status("Remote command finished")
     else:
-        _set_live_status("Remote command crashed")
+        tail = "".join(tail_lines).strip()
+        _set_live_status("Remote command crashed", error_msg=tail or None)
 
     return exit_code
 
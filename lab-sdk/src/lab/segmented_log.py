@@ -0,0 +1,396 @@
+"""
+Append-only segmented logs for object storage.
+
+S3/GCS/Azure objects cannot be appended to, so growing a single log object
+means downloading and re-uploading the whole thing on every write. Instead,
+a segmented log keeps the original log path as the logical "handle" and
+stores the content in numbered part objects next to it:
+
+    {log_path}.segments/manifest.json
+    {log_path}.segments/000000.part
+    {log_path}.segments/000001.part
+    ...
+
+Only the newest ("open") part is ever rewritten, and it is bounded by
+``TFL_JOB_LOG_PART_MAX_BYTES``; once it is full (or older than
+``TFL_JOB_LOG_PART_MAX_SECONDS``) it is sealed and a new part is started.
+Each flush therefore costs at most one part upload plus a tiny manifest,
+independent of how long the job has been running.
+
+Readers should use ``read_log`` / ``read_log_since`` which present the base
+file followed by all parts as one logical file.
+"""
+
+import asyncio
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from . import storage
+
+logger = logging.getLogger(__name__)
+
+SEGMENTS_SUFFIX = ".segments"
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = max(0.1, float(os.getenv("TFL_JOB_LOG_FLUSH_INTERVAL_SECONDS", "2.0")))
+DEFAULT_PART_MAX_BYTES = max(1024, int(os.getenv("TFL_JOB_LOG_PART_MAX_BYTES", str(1024 * 1024))))
+DEFAULT_PART_MAX_SECONDS = max(1.0, float(os.getenv("TFL_JOB_LOG_PART_MAX_SECONDS", "300")))
+
+
+def segments_dir(log_path: str) -> str:
+    """Directory holding the parts and manifest for ``log_path``."""
+    return log_path.rstrip("/") + SEGMENTS_SUFFIX
+
+
+def manifest_path(log_path: str) -> str:
+    return storage.join(segments_dir(log_path), MANIFEST_NAME)
+
+
+def part_path(log_path: str, index: int) -> str:
+    return storage.join(segments_dir(log_path), f"{index:06d}.part")
+
+
+class SegmentedLogWriter:
+    """
+    Buffered, append-only writer for a segmented log.
+
+    The writer is synchronous and thread-safe so it can be flushed from a
+    background timer as well as from async code (via ``asyncio.to_thread``).
+    Lines are buffered in memory and uploaded when the flush interval has
+    elapsed; a daemon timer makes sure a quiet job never leaves buffered lines
+    unpublished for longer than one interval.
+
+    A new writer never rewrites parts written by a previous process: on its
+    first flush it reads the manifest and starts a fresh part after the
+    existing ones.
+    """
+
+    def __init__(
+        self,
+        log_path: str,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        part_max_bytes: int = DEFAULT_PART_MAX_BYTES,
+        part_max_seconds: float = DEFAULT_PART_MAX_SECONDS,
+        max_pending_bytes: int | None = None,
+    ):
+        self.log_path = log_path
+        self.flush_interval = flush_interval
+        self.part_max_bytes = part_max_bytes
+        self.part_max_seconds = part_max_seconds
+        # Cap on text buffered while uploads keep failing; oldest text is dropped past it.
+        self.max_pending_bytes = max_pending_bytes
+        self.dropped_bytes = 0
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._fs = None
+
+        # Pending text not yet uploaded.
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+        self._last_flush = time.monotonic()
+
+        # State of the open part (in-memory copy so it is never re-downloaded).
+        self._loaded = False
+        self._part_index = 0
+        self._part_data = bytearray()
+        self._part_dirty = False
+        self._part_started = time.monotonic()
+        self._sealed_bytes = 0
+
+    def write(self, text: str) -> None:
+        """Buffer ``text`` and flush if the flush interval has elapsed."""
+        if not text:
+            return
+        data = text.encode("utf-8")
+        with self._lock:
+            self._pending.append(data)
+            self._pending_bytes += len(data)
+            if self.max_pending_bytes is not None:
+                while self._pending_bytes > self.max_pending_bytes and len(self._pending) > 1:
+                    dropped = self._pending.pop(0)
+                    self._pending_bytes -= len(dropped)
+                    self.dropped_bytes += len(dropped)
+            due = (
+                time.monotonic() - self._last_flush >= self.flush_interval or self._pending_bytes >= self.part_max_bytes
+            )
+            if not due:
+                self._schedule_flush_locked()
+        if due:
+            self.flush()
+
+    def _schedule_flush_locked(self) -> None:
+        if self._timer is not None:
+            return
+        timer = threading.Timer(self.flush_interval, self._timer_flush)
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _timer_flush(self) -> None:
+        with self._lock:
+            self._timer = None
+        try:
+            self.flush()
+        except Exception:
+            logger.debug("Background flush of segmented log failed", exc_info=True)
+
+    def flush(self) -> None:
+        """Upload any buffered text. Cost is bounded by the part size, not the log size."""
+        with self._flush_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._pending:
+                    return
+
+            # Resolve the filesystem and resume state before taking the buffer so a
+            # failure here leaves the pending lines in place for the next attempt.
+            fs = self._filesystem()
+            if not self._loaded:
+                self._load_state(fs)
+
+            with self._lock:
+                pending = self._pending
+                self._pending = []
+                self._pending_bytes = 0
+                self._last_flush = time.monotonic()
+
+            for chunk in pending:
+                part_age = time.monotonic() - self._part_started
+                if self._part_data and (
+                    len(self._part_data) + len(chunk) > self.part_max_bytes or part_age >= self.part_max_seconds
+                ):
+                    # Seal the current part; upload it first if it has unpublished bytes.
+                    if self._part_dirty:
+                        fs.pipe_file(part_path(self.log_path, self._part_index), bytes(self._part_data))
+                    self._sealed_bytes += len(self._part_data)
+                    self._part_index += 1
+                    self._part_data = bytearray()
+                    self._part_started = time.monotonic()
+                self._part_data.extend(chunk)
+                self._part_dirty = True
+
+            fs.pipe_file(part_path(self.log_path, self._part_index), bytes(self._part_data))
+            self._part_dirty = False
+            self._write_manifest(fs)
+
+    def close(self) -> None:
+        """Flush remaining text and publish a final manifest marked ``complete``."""
+        self.flush()
+        with self._flush_lock:
+            fs = self._filesystem()
+            if not self._loaded:
+                self._load_state(fs)
+            self._write_manifest(fs, complete=True)
+
+    def _filesystem(self):
+        if self._fs is None:
+            self._fs, _ = storage._get_fs_for_path(self.log_path)
+            if not storage.is_remote_path(self.log_path):
+                self._fs.makedirs(segments_dir(self.log_path), exist_ok=True)
+        return self._fs
+
+    def _load_state(self, fs) -> None:
+        manifest = _read_manifest_sync(fs, self.log_path)
+        if manifest is not None:
+            self._part_index = int(manifest.get("parts", 0))
+            self._sealed_bytes = int(manifest.get("size", 0))
+        self._loaded = True
+
+    def _write_manifest(self, fs, complete: bool = False) -> None:
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "parts": self._part_index + 1,
+            "size": self._sealed_bytes + len(self._part_data),
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+        if complete:
+            manifest["complete"] = True
+        fs.pipe_file(manifest_path(self.log_path), json.dumps(manifest).encode("utf-8"))
+
+
+_writers: dict[str, SegmentedLogWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_writer(log_path: str) -> SegmentedLogWriter:
+    """Return the process-wide writer for ``log_path``, creating it on first use."""
+    with _writers_lock:
+        writer = _writers.get(log_path)
+        if writer is None:
+            writer = SegmentedLogWriter(log_path)
+            _writers[log_path] = writer
+        return writer
+
+
+def flush_all() -> None:
+    """Flush every writer in this process. Registered with ``atexit``."""
+    with _writers_lock:
+        writers = list(_writers.values())
+    for writer in writers:
+        try:
+            writer.flush()
+        except Exception:
+            logger.debug("Failed to flush segmented log %s", writer.log_path, exc_info=True)
+
+
+atexit.register(flush_all)
+
+
+async def reset_log(log_path: str) -> None:
+    """Truncate ``log_path`` and drop its segments, e.g. before a command is re-run into the same log."""
+    with _writers_lock:
+        _writers.pop(log_path, None)
+    fs = await storage._get_uncached_filesystem(log_path)
+
+    def _reset() -> None:
+        try:
+            fs.rm(segments_dir(log_path), recursive=True)
+        except FileNotFoundError:
+            pass
+        fs.pipe_file(log_path, b"")
+
+    await asyncio.to_thread(_reset)
+
+
+def _read_manifest_sync(fs, log_path: str) -> dict | None:
+    try:
+        raw = fs.cat_file(manifest_path(log_path))
+    except FileNotFoundError:
+        return None
+    try:
+        manifest = json.loads(raw)
+    except (ValueError, TypeError):
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+@dataclass
+class LogCursor:
+    """Position in a segmented log: part index and byte offset within that part."""
+
+    part: int = 0
+    offset: int = 0
+
+
+async def read_manifest(log_path: str) -> dict | None:
+    """Return the manifest for ``log_path`` or None if the log is not segmented."""
+    fs = await storage._get_uncached_filesystem(manifest_path(log_path))
+    return await asyncio.to_thread(_read_manifest_sync, fs, log_path)
+
+
+async def is_segmented(log_path: str) -> bool:
+    return await read_manifest(log_path) is not None
+
+
+async def read_log_since(log_path: str, cursor: LogCursor | None = None) -> tuple[str, LogCursor]:
+    """
+    Read segment content appended after ``cursor``.
+
+    Returns the new text and the advanced cursor. Sealed parts are read once;
+    the open part is fetched from the cursor offset with a ranged read, so a
+    poll costs one manifest read plus the new bytes.
+    """
+    cursor = cursor or LogCursor()
+    manifest = await read_manifest(log_path)
+    if manifest is None:
+        return "", cursor
+
+    part_count = int(manifest.get("parts", 0))
+    fs = await storage._get_uncached_filesystem(log_path)
+    chunks: list[bytes] = []
+    part, offset = cursor.part, cursor.offset
+    while part < part_count:
+        try:
+            data = await asyncio.to_thread(fs.cat_file, part_path(log_path, part), start=offset or None)
+        except FileNotFoundError:
+            # Manifest can briefly run ahead of a part upload; pick it up next poll.
+            break
+        chunks.append(data)
+        offset += len(data)
+        if part == part_count - 1:
+            break
+        part, offset = part + 1, 0
+
+    return b"".join(chunks).decode("utf-8", errors="replace"), LogCursor(part=part, offset=offset)
+
+
+async def read_log_until(log_path: str, cursor: LogCursor) -> str:
+    """Read segment content before ``cursor``: everything read_log_since() had returned when it produced it."""
+    fs = await storage._get_uncached_filesystem(log_path)
+    chunks: list[bytes] = []
+    for part in range(cursor.part + 1):
+        end = cursor.offset if part == cursor.part else None
+        if end == 0:
+            break
+        try:
+            data = await asyncio.to_thread(fs.cat_file, part_path(log_path, part), start=None, end=end)
+        except FileNotFoundError:
+            break
+        chunks.append(data)
+    return b"".join(chunks).decode("utf-8", errors="replace")
+
+
+async def read_log(log_path: str) -> str:
+    """
+    Read a log as one logical file: the base file content followed by any segments.
+
+    Works for plain (non-segmented) logs as well, so callers can use it for
+    every job output file regardless of where it lives.
+    """
+    content = ""
+    if await storage.exists(log_path) and not await storage.isdir(log_path):
+        async with await storage.open(log_path, "r", encoding="utf-8") as f:
+            content = await f.read()
+    segment_text, _ = await read_log_since(log_path)
+    if segment_text and content and not content.endswith("\n"):
+        content += "\n"
+    return content + segment_text
+
+
+async def read_log_tail(log_path: str, lines: int) -> str:
+    """
+    Return the last ``lines`` lines of a log.
+
+    Parts are read newest-first and reading stops once enough lines are
+    collected, so the cost follows the tail size rather than the log size.
+    """
+    if lines <= 0:
+        return ""
+    manifest = await read_manifest(log_path)
+    if manifest is None:
+        content = await read_log(log_path)
+        return "\n".join(content.splitlines()[-lines:])
+
+    fs = await storage._get_uncached_filesystem(log_path)
+    chunks: list[bytes] = []
+    newlines = 0
+    for part in range(int(manifest.get("parts", 0)) - 1, -1, -1):
+        try:
+            data = await asyncio.to_thread(fs.cat_file, part_path(log_path, part))
+        except FileNotFoundError:
+            continue
+        chunks.insert(0, data)
+        newlines += data.count(b"\n")
+        if newlines > lines:
+            break
+    else:
+        # Every part was needed; the base file comes first.
+        if await storage.exists(log_path) and not await storage.isdir(log_path):
+            async with await storage.open(log_path, "r", encoding="utf-8") as f:
+                base = await f.read()
+            if base:
+                chunks.insert(0, base.encode("utf-8") if base.endswith("\n") else (base + "\n").encode("utf-8"))
+
+    text = b"".join(chunks).decode("utf-8", errors="replace")
+    return "\n".join(text.splitlines()[-lines:])
@@ -1,8 +1,12 @@
 import asyncio
+import functools
+import inspect
 import os
 import posixpath
 import contextvars
+import shutil
 import threading
+import time
 from types import TracebackType
 from typing import Optional, Type
 
@@ -763,27 +767,155 @@ async def _close_filesystem(fs) -> None:
     pass
 
 
+# ---------------------------------------------------------------------------
+# Transfer engine
+#
+# copy_file/copy_dir/copy_files move files between any two filesystems with a
+# bounded pool of concurrent transfers. Each file picks the cheapest path:
+#   - local -> local: shutil copy
+#   - local -> remote: fs.put_file (native multipart upload on S3 with
+#     concurrent parts once the file is over TRANSFER_MULTIPART_THRESHOLD)
+#   - remote -> local: fs.get_file
+#   - same remote store: server-side fs.copy
+#   - anything else: chunked streaming copy
+# Object stores have no directories, so no makedirs calls are issued for
+# remote destinations; local parents are created once per directory.
+# ---------------------------------------------------------------------------
+
+TRANSFER_CONCURRENCY = max(1, int(os.getenv("TFL_STORAGE_TRANSFER_CONCURRENCY", "8")))
+TRANSFER_MULTIPART_THRESHOLD = max(5 * 2**20, int(os.getenv("TFL_STORAGE_MULTIPART_THRESHOLD", str(64 * 2**20))))
+TRANSFER_MULTIPART_CHUNK_SIZE = max(5 * 2**20, int(os.getenv("TFL_STORAGE_MULTIPART_CHUNK_SIZE", str(32 * 2**20))))
+TRANSFER_PART_CONCURRENCY = max(1, int(os.getenv("TFL_STORAGE_MULTIPART_CONCURRENCY", "8")))
+TRANSFER_RETRIES = max(0, int(os.getenv("TFL_STORAGE_TRANSFER_RETRIES", "3")))
+TRANSFER_RETRY_BACKOFF_SECONDS = 0.5
+
+# Errors that retrying cannot fix.
+_NON_RETRYABLE_TRANSFER_ERRORS = (FileNotFoundError, IsADirectoryError, NotADirectoryError, PermissionError)
+
+
+def _is_local_fs(fs) -> bool:
+    protocol = getattr(fs, "protocol", None)
+    protocols = protocol if isinstance(protocol, (tuple, list)) else (protocol,)
+    return "file" in protocols or "local" in protocols
+
+
+def _stream_copy_sync(src_fs, src: str, dest_fs, dest: str) -> None:
+    with src_fs.open(src, "rb") as r:
+        with dest_fs.open(dest, "wb") as w:
+            for chunk in iter_chunks(r):
+                w.write(chunk)
+
+
+@functools.lru_cache(maxsize=None)
+def _put_file_params(fs_class: type) -> frozenset:
+    """Keyword arguments fs_class's put_file implementation declares (empty if unknown)."""
+    method = getattr(fs_class, "_put_file", None) or getattr(fs_class, "put_file", None)
+    try:
+        return frozenset(inspect.signature(method).parameters)
+    except (TypeError, ValueError):
+        return frozenset()
+
+
+def _transfer_file_sync(src_fs, src: str, dest_fs, dest: str) -> None:
+    """Copy one file using the fastest mechanism the two filesystems support."""
+    src_local, dest_local = _is_local_fs(src_fs), _is_local_fs(dest_fs)
+    if src_local and dest_local:
+        shutil.copyfile(src, dest)
+    elif src_local:
+        kwargs = {}
+        if _resolve_protocol(dest, fs=dest_fs) == "s3":
+            # s3fs switches to a multipart upload at 2 * chunksize and sends parts concurrently.
+            # Older s3fs releases lack max_concurrency and would forward it to the S3 API calls,
+            # so only arguments put_file declares are passed.
+            params = _put_file_params(type(dest_fs))
+            if "chunksize" in params:
+                kwargs["chunksize"] = max(TRANSFER_MULTIPART_CHUNK_SIZE, TRANSFER_MULTIPART_THRESHOLD // 2)
+            if "max_concurrency" in params:
+                kwargs["max_concurrency"] = TRANSFER_PART_CONCURRENCY
+        dest_fs.put_file(src, dest, **kwargs)
+    elif dest_local:
+        src_fs.get_file(src, dest)
+    elif src_fs is dest_fs:
+        src_fs.copy(src, dest)
+    else:
+        _stream_copy_sync(src_fs, src, dest_fs, dest)
+
+
+def _transfer_with_retry_sync(src_fs, src: str, dest_fs, dest: str, retries: int) -> None:
+    attempt = 0
+    while True:
+        try:
+            _transfer_file_sync(src_fs, src, dest_fs, dest)
+            return
+        except _NON_RETRYABLE_TRANSFER_ERRORS:
+            raise
+        except Exception as exc:
+            if attempt >= retries:
+                raise
+            delay = TRANSFER_RETRY_BACKOFF_SECONDS * (2**attempt)
+            attempt += 1
+            logging.getLogger(__name__).warning(
+                "Copy %s -> %s failed (%s); retry %d/%d in %.1fs", src, dest, exc, attempt, retries, delay
+            )
+            time.sleep(delay)
+
+
 async def copy_file(src: str, dest: str) -> None:
     """Copy a single file from src to dest across arbitrary filesystems."""
-    # Run the entire streaming copy in a thread — src_fs.open() and dest_fs.open()
-    # both make blocking network calls for remote filesystems.
-    src_fs, _ = _get_fs_for_path(src)
-    dest_fs, _ = _get_fs_for_path(dest)
+    await copy_files([(src, dest)])
 
-    def _do_copy():
-        with src_fs.open(src, "rb") as r:
-            with dest_fs.open(dest, "wb") as w:
-                for chunk in iter_chunks(r):
-                    w.write(chunk)
 
-    try:
-        await asyncio.to_thread(_do_copy)
-    finally:
-        # Close filesystem even if exception raised.
-        await _close_filesystem(src_fs)
-        if dest_fs is not src_fs:
-            # Close filesystem even if exception raised.
-            await _close_filesystem(dest_fs)
+async def copy_files(
+    pairs: list[tuple[str, str]],
+    max_concurrency: Optional[int] = None,
+    retries: Optional[int] = None,
+    raise_errors: bool = True,
+) -> list[tuple[str, str, Exception]]:
+    """
+    Copy many (src, dest) files concurrently with a bounded worker pool.
+
+    Each file is retried up to ``retries`` times (default TFL_STORAGE_TRANSFER_RETRIES)
+    with exponential backoff. With ``raise_errors`` (default) the first failure is
+    raised once every transfer has settled; otherwise failures are returned as
+    ``(src, dest, exception)`` tuples.
+    """
+    if not pairs:
+        return []
+    limit = max(1, max_concurrency or TRANSFER_CONCURRENCY)
+    retries = TRANSFER_RETRIES if retries is None else max(0, retries)
+    semaphore = asyncio.Semaphore(limit)
+
+    # Resolve filesystems once (on this thread); sync fsspec instances are safe to share.
+    fs_by_path: dict[str, object] = {}
+
+    def _fs(path: str):
+        key = path.split("://", 1)[0] if is_remote_path(path) else ""
+        if key not in fs_by_path:
+            fs_by_path[key], _ = _get_fs_for_path(path)
+        return fs_by_path[key]
+
+    # Local destinations need their parent directories; object stores do not.
+    parents = set()
+    for _, dest in pairs:
+        if _is_local_fs(_fs(dest)):
+            parent = os.path.dirname(dest)
+            if parent:
+                parents.add(parent)
+    if parents:
+        await asyncio.to_thread(lambda: [os.makedirs(parent, exist_ok=True) for parent in sorted(parents)])
+
+    async def _one(src: str, dest: str) -> None:
+        async with semaphore:
+            await asyncio.to_thread(_transfer_with_retry_sync, _fs(src), src, _fs(dest), dest, retries)
+
+    results = await asyncio.gather(*[_one(src, dest) for src, dest in pairs], return_exceptions=True)
+    failures = [(src, dest, res) for (src, dest), res in zip(pairs, results) if isinstance(res, BaseException)]
+    for _, _, exc in failures:
+        if isinstance(exc, asyncio.CancelledError):
+            raise exc
+    if failures and raise_errors:
+        raise failures[0][2]
+    return failures
 
 
 def iter_chunks(file_obj, chunk_size: int = 8 * 1024 * 1024):
@@ -795,11 +927,14 @@ def iter_chunks(file_obj, chunk_size: int = 8 * 1024 * 1024):
         yield data
 
 
-async def copy_dir(src_dir: str, dest_dir: str) -> None:
-    """Recursively copy a directory tree across arbitrary filesystems."""
-    await makedirs(dest_dir, exist_ok=True)
+async def copy_dir(src_dir: str, dest_dir: str, max_concurrency: Optional[int] = None) -> None:
+    """Recursively copy a directory tree across arbitrary filesystems, several files at a time."""
     # Determine the source filesystem independently of destination
     src_fs, _ = _get_fs_for_path(src_dir)
+    dest_fs, _ = _get_fs_for_path(dest_dir)
+    if _is_local_fs(dest_fs):
+        # Keep empty source trees visible at the destination, as before.
+        await makedirs(dest_dir, exist_ok=True)
     # Remember protocol for remote paths so that we can reconstruct full URIs
     # from keys returned by fsspec (which may omit the protocol).
     src_protocol: Optional[str] = None
@@ -813,10 +948,11 @@ async def copy_dir(src_dir: str, dest_dir: str) -> None:
             # If find is not available, fall back to listing via walk
             src_files = []
             walk_result = await asyncio.to_thread(lambda: list(src_fs.walk(src_dir)))
-            for _, _, files in walk_result:
+            for root, _, files in walk_result:
                 for f in files:
-                    src_files.append(f)
+                    src_files.append(posixpath.join(root, f))
 
+        pairs: list[tuple[str, str]] = []
         for raw_src_file in src_files:
             # For remote filesystems, ensure we have a full URI (e.g., s3://bucket/...)
             src_file = raw_src_file
@@ -826,13 +962,11 @@ async def copy_dir(src_dir: str, dest_dir: str) -> None:
             # Compute relative path with respect to the source dir using the
             # normalized src_file URI/path.
             rel_path = src_file[len(src_dir) :].lstrip("/")
-            dest_file = join(dest_dir, rel_path)
-            # Ensure destination directory exists
-            dest_parent = posixpath.dirname(dest_file)
-            if dest_parent:
-                await makedirs(dest_parent, exist_ok=True)
-            # Copy the file using streaming (robust across FSes)
-            await copy_file(src_file, dest_file)
+            if not rel_path:
+                continue
+            pairs.append((src_file, join(dest_dir, rel_path)))
+
+        await copy_files(pairs, max_concurrency=max_concurrency)
     finally:
         # Close filesystem even if exception raised.
         await _close_filesystem(src_fs)
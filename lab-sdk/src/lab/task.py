@@ -1,7 +1,7 @@
 from datetime import datetime
 from werkzeug.utils import secure_filename
 
-from .dirs import get_tasks_dir
+from .dirs import get_tasks_dir, invalidate_path_cache
 from .labresource import BaseLabResource
 from . import storage
 import logging
@@ -157,3 +157,4 @@ class Task(BaseLabResource):
         for full in entries:
             if await storage.isdir(full):
                 await storage.rm_tree(full)
+                invalidate_path_cache(full)
@@ -8,6 +8,7 @@ from .dirs import (
     get_experiment_tasks_dir,
     get_experiments_dir,
     get_task_dir,
+    invalidate_path_cache,
 )
 from .labresource import BaseLabResource
 from . import storage
@@ -251,3 +252,4 @@ class TaskTemplate(BaseLabResource):
         for full in entries:
             if await storage.isdir(full):
                 await storage.rm_tree(full)
+                invalidate_path_cache(full)
@@ -0,0 +1,259 @@
+"""
+Incremental, throttled sync of a local Trackio directory into the workspace.
+
+Lab.log() and Lab.update_progress() used to copy the whole TRACKIO_DIR into
+trackio_runs/<experiment>/<project> on every call, re-uploading a growing
+SQLite database on every training step. A TrackioSync instead:
+
+* copies from a daemon thread, so request() never does I/O on the caller's thread;
+* starts at most one sync every ``interval`` seconds (TFL_TRACKIO_SYNC_INTERVAL_SECONDS,
+  default 10). A request that arrives after a quiet period is synced at once,
+  so the shared copy is never more than one interval (plus the copy) behind;
+* skips files whose size and mtime are unchanged since they were last uploaded;
+* copies SQLite databases with the online backup API, which gives a consistent
+  snapshot even while Trackio is writing and folds in the ``-wal`` file, and
+  uploads the snapshot only when its content hash changed.
+
+Object stores replace whole objects, so a database that did change is still
+uploaded as one file; what is saved is every upload in which nothing changed.
+"""
+
+import asyncio
+import atexit
+import contextvars
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+
+from . import storage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SYNC_INTERVAL_SECONDS = max(0.0, float(os.getenv("TFL_TRACKIO_SYNC_INTERVAL_SECONDS", "10.0")))
+
+SQLITE_HEADER = b"SQLite format 3\x00"
+# Files SQLite keeps next to a database; their contents are folded into the backup.
+SQLITE_SIDECAR_SUFFIXES = ("-wal", "-shm", "-journal")
+
+
+def _stat_key(path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+
+def _is_sqlite(path: str) -> bool:
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+    except OSError:
+        return False
+
+
+def _list_files(src: str) -> list[tuple[str, str]]:
+    """Return (local path, path relative to src) for every file under src, or for src itself."""
+    if os.path.isfile(src):
+        return [(src, os.path.basename(src))]
+    files = []
+    for root, _, names in os.walk(src):
+        for name in names:
+            path = os.path.join(root, name)
+            files.append((path, os.path.relpath(path, src).replace(os.sep, "/")))
+    return sorted(files, key=lambda item: item[1])
+
+
+def _is_sidecar(rel: str, present: set[str]) -> bool:
+    return any(rel.endswith(suffix) and rel[: -len(suffix)] in present for suffix in SQLITE_SIDECAR_SUFFIXES)
+
+
+def _backup_sqlite(path: str, dest: str) -> str:
+    """Write a consistent copy of the SQLite database at ``path`` to ``dest`` and return its sha256."""
+    if os.path.exists(dest):
+        os.remove(dest)
+    source = sqlite3.connect(path, timeout=30)
+    try:
+        target = sqlite3.connect(dest)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+    finally:
+        source.close()
+    digest = hashlib.sha256()
+    with open(dest, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class TrackioSync:
+    """
+    Mirrors one local Trackio directory (or database file) into ``dest``.
+
+    request() marks the source as changed and returns immediately. sync() blocks
+    until a sync that started after the call has finished; close() syncs
+    anything pending and stops the thread.
+    """
+
+    def __init__(self, src: str, dest: str, interval: float = DEFAULT_SYNC_INTERVAL_SECONDS):
+        self.src = src
+        self.dest = dest
+        self.interval = interval
+
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._urgent = False
+        self._last_start: float | None = None
+        self._last_error: Exception | None = None
+        # Sequence numbers let sync() wait for a pass that started after it was called.
+        self._requested = 0
+        self._synced = 0
+
+        # What was last uploaded per relative path: stat keys, and content hashes for databases.
+        self._stats: dict[str, tuple] = {}
+        self._digests: dict[str, str] = {}
+        self._staging: str | None = None
+
+    def request(self) -> None:
+        """Note that the source changed. Returns immediately."""
+        with self._cond:
+            if self._closed:
+                return
+            self._requested += 1
+            self._ensure_thread_locked()
+            self._cond.notify_all()
+
+    def sync(self, timeout: float | None = None) -> bool:
+        """
+        Sync now, ignoring the interval. Returns False if the timeout expired and
+        re-raises the error of the pass if it failed.
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("TrackioSync is closed")
+            self._requested += 1
+            target = self._requested
+            self._urgent = True
+            self._ensure_thread_locked()
+            self._cond.notify_all()
+            if not self._cond.wait_for(lambda: self._synced >= target, timeout=timeout):
+                return False
+            if self._last_error is not None:
+                raise self._last_error
+            return True
+
+    def close(self, timeout: float | None = None) -> None:
+        """Sync anything requested so far and stop the background thread."""
+        with self._cond:
+            if self._closed:
+                return
+            pending = self._requested > self._synced
+        if pending:
+            try:
+                self.sync(timeout=timeout)
+            except Exception:
+                logger.warning("Final Trackio sync to %s failed", self.dest, exc_info=True)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        # Drop the exit hook so a closed writer is not kept alive until shutdown.
+        atexit.unregister(self.close)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+        if self._staging is not None:
+            shutil.rmtree(self._staging, ignore_errors=True)
+            self._staging = None
+
+    async def sync_once(self) -> int:
+        """Upload the files that changed since the last pass and return how many were uploaded."""
+        files = await asyncio.to_thread(_list_files, self.src)
+        present = {rel for _, rel in files}
+
+        pairs: list[tuple[str, str]] = []
+        uploaded_stats: dict[str, tuple] = {}
+        uploaded_digests: dict[str, str] = {}
+        for path, rel in files:
+            if _is_sidecar(rel, present):
+                continue
+            stat = (_stat_key(path), _stat_key(path + "-wal"))
+            if stat[0] is None or self._stats.get(rel) == stat:
+                continue
+            dest_file = storage.join(self.dest, rel)
+            if not await asyncio.to_thread(_is_sqlite, path):
+                pairs.append((path, dest_file))
+                uploaded_stats[rel] = stat
+                continue
+            if self._staging is None:
+                self._staging = tempfile.mkdtemp(prefix="tfl-trackio-")
+            snapshot = os.path.join(self._staging, hashlib.sha256(rel.encode("utf-8")).hexdigest()[:16] + ".db")
+            digest = await asyncio.to_thread(_backup_sqlite, path, snapshot)
+            if self._digests.get(rel) == digest:
+                # Touched but not changed (e.g. a checkpoint); nothing to upload.
+                self._stats[rel] = stat
+                continue
+            pairs.append((snapshot, dest_file))
+            uploaded_stats[rel] = stat
+            uploaded_digests[rel] = digest
+
+        if not pairs:
+            return 0
+        await storage.makedirs(self.dest, exist_ok=True)
+        await storage.copy_files(pairs)
+        self._stats.update(uploaded_stats)
+        self._digests.update(uploaded_digests)
+        logger.debug("Synced %d Trackio file(s) to %s", len(pairs), self.dest)
+        return len(pairs)
+
+    def _ensure_thread_locked(self) -> None:
+        if self._thread is not None:
+            return
+        # Run in a copy of the caller's context so org/storage context vars still apply.
+        ctx = contextvars.copy_context()
+        self._thread = threading.Thread(target=ctx.run, args=(self._run,), name="tfl-trackio-sync", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                with self._cond:
+                    while True:
+                        pending = self._requested > self._synced
+                        if not pending:
+                            if self._closed:
+                                return
+                            self._cond.wait()
+                            continue
+                        if self._urgent or self._closed or self._last_start is None:
+                            break
+                        remaining = self._last_start + self.interval - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(timeout=remaining)
+                    target = self._requested
+                    self._urgent = False
+                    self._last_start = time.monotonic()
+
+                error = None
+                try:
+                    loop.run_until_complete(self.sync_once())
+                except Exception as e:
+                    error = e
+                    logger.warning("Failed to sync Trackio directory %s", self.src, exc_info=True)
+
+                with self._cond:
+                    self._last_error = error
+                    self._synced = target
+                    self._cond.notify_all()
+        finally:
+            loop.close()
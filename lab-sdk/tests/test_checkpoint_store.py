@@ -0,0 +1,166 @@
+import importlib
+import os
+
+import pytest
+
+
+def _fresh(monkeypatch, tmp_path):
+    for mod in ["lab.lab_facade", "lab.experiment", "lab.job", "lab.dirs", "lab.checkpoint_store"]:
+        if mod in importlib.sys.modules:
+            importlib.sys.modules.pop(mod)
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+    monkeypatch.setenv("TFL_CHECKPOINT_MATERIALIZE_DIR", str(tmp_path / "materialized"))
+    return ws
+
+
+def _make_checkpoint(path, step):
+    path.mkdir()
+    (path / "config.json").write_text('{"hidden": 8}')
+    (path / "tokenizer").mkdir()
+    (path / "tokenizer" / "vocab.txt").write_text("a\nb\nc\n")
+    (path / "adapter.bin").write_text(f"weights at step {step}")
+
+
+def _blob_count(ws):
+    blobs = ws / "checkpoint_store" / "blobs"
+    return sum(len(files) for _, _, files in os.walk(blobs)) if blobs.exists() else 0
+
+
+@pytest.mark.asyncio
+async def test_save_dedups_unchanged_files_and_releases_blobs(tmp_path, monkeypatch):
+    ws = _fresh(monkeypatch, tmp_path)
+    from lab import checkpoint_store
+
+    ckpt_dir = ws / "checkpoints"
+    ckpt_dir.mkdir()
+    _make_checkpoint(tmp_path / "step1", 1)
+    _make_checkpoint(tmp_path / "step2", 2)
+
+    first = await checkpoint_store.save_checkpoint(str(tmp_path / "step1"), str(ckpt_dir / "step1"))
+    assert first["files"] == 3 and first["uploaded"] == 3
+
+    # Only the adapter changed between steps.
+    second = await checkpoint_store.save_checkpoint(str(tmp_path / "step2"), str(ckpt_dir / "step2"))
+    assert second["uploaded"] == 1 and second["reused"] == 2
+    assert _blob_count(ws) == 4
+    assert sorted(os.listdir(ckpt_dir)) == ["step1.tflckpt.json", "step2.tflckpt.json"]
+
+    # Shared blobs survive deleting one checkpoint; its unique adapter does not.
+    assert await checkpoint_store.delete_checkpoint(str(ckpt_dir / "step1"))
+    assert _blob_count(ws) == 3
+    assert not await checkpoint_store.checkpoint_exists(str(ckpt_dir / "step1"))
+    assert await checkpoint_store.checkpoint_exists(str(ckpt_dir / "step2"))
+
+    restored = await checkpoint_store.materialize(str(ckpt_dir / "step2"))
+    assert restored.startswith(str(tmp_path / "materialized"))
+    with open(os.path.join(restored, "tokenizer", "vocab.txt")) as f:
+        assert f.read() == "a\nb\nc\n"
+    with open(os.path.join(restored, "adapter.bin")) as f:
+        assert f.read() == "weights at step 2"
+
+
+@pytest.mark.asyncio
+async def test_overwriting_a_checkpoint_releases_replaced_files(tmp_path, monkeypatch):
+    ws = _fresh(monkeypatch, tmp_path)
+    from lab import checkpoint_store
+
+    src = tmp_path / "latest"
+    _make_checkpoint(src, 1)
+    dest = str(ws / "checkpoints" / "latest")
+    (ws / "checkpoints").mkdir()
+
+    await checkpoint_store.save_checkpoint(str(src), dest)
+    again = await checkpoint_store.save_checkpoint(str(src), dest)
+    assert again["uploaded"] == 0 and again["released"] == 0
+
+    (src / "adapter.bin").write_text("weights at step 2")
+    replaced = await checkpoint_store.save_checkpoint(str(src), dest)
+    assert replaced["uploaded"] == 1 and replaced["released"] == 1
+    assert _blob_count(ws) == 3
+
+
+def test_lab_dedup_checkpoints_list_and_resume(tmp_path, monkeypatch):
+    _fresh(monkeypatch, tmp_path)
+    from lab.lab_facade import Lab, _run_async
+
+    lab = Lab(dedup_checkpoints=True)
+    lab.init(experiment_id="test_exp")
+    _make_checkpoint(tmp_path / "step1", 1)
+    (tmp_path / "final.pt").write_text("final weights")
+
+    dest = lab.save_checkpoint(str(tmp_path / "step1"))
+    file_dest = lab.save_checkpoint(str(tmp_path / "final.pt"))
+    assert not os.path.exists(dest)
+    assert lab.get_job_data()["latest_checkpoint"] == file_dest
+
+    paths = _run_async(lab._job.get_checkpoint_paths())
+    assert paths == sorted([dest, file_dest])
+
+    parent_id = lab.job.id
+    resumed = lab.get_parent_job_checkpoint_path(parent_id, "step1")
+    assert os.path.isfile(os.path.join(resumed, "adapter.bin"))
+    resumed_file = lab.get_parent_job_checkpoint_path(parent_id, "final.pt")
+    with open(resumed_file) as f:
+        assert f.read() == "final weights"
+
+    # A plain save under the same name replaces the manifest.
+    plain = lab.save_checkpoint(str(tmp_path / "step1"), dedup=False)
+    assert os.path.isdir(plain)
+    assert _run_async(lab._job.get_checkpoint_paths()) == sorted([dest, file_dest])
+    assert lab.get_parent_job_checkpoint_path(parent_id, "step1") == plain
+
+
+@pytest.mark.asyncio
+async def test_save_reuploads_blobs_deleted_by_another_process(tmp_path, monkeypatch):
+    import shutil
+
+    ws = _fresh(monkeypatch, tmp_path)
+    from lab import checkpoint_store
+
+    ckpt_dir = ws / "checkpoints"
+    ckpt_dir.mkdir()
+    _make_checkpoint(tmp_path / "step1", 1)
+
+    await checkpoint_store.save_checkpoint(str(tmp_path / "step1"), str(ckpt_dir / "a"))
+    # Another process released the last references and deleted the blobs.
+    os.remove(ckpt_dir / "a.tflckpt.json")
+    shutil.rmtree(ws / "checkpoint_store")
+
+    again = await checkpoint_store.save_checkpoint(str(tmp_path / "step1"), str(ckpt_dir / "b"))
+    assert again["uploaded"] == 3
+    assert _blob_count(ws) == 3
+
+
+@pytest.mark.asyncio
+async def test_save_racing_a_release_keeps_its_blobs(tmp_path, monkeypatch):
+    ws = _fresh(monkeypatch, tmp_path)
+    from lab import checkpoint_store
+
+    ckpt_dir = ws / "checkpoints"
+    ckpt_dir.mkdir()
+    _make_checkpoint(tmp_path / "step1", 1)
+    await checkpoint_store.save_checkpoint(str(tmp_path / "step1"), str(ckpt_dir / "a"))
+
+    real_list_refs = checkpoint_store._list_refs
+    raced = []
+
+    async def list_refs_then_save(refs_dir):
+        remaining = await real_list_refs(refs_dir)
+        if not raced:
+            # A save lands after the release saw no markers but before it deletes anything.
+            raced.append(await checkpoint_store.save_checkpoint(str(tmp_path / "step1"), str(ckpt_dir / "b")))
+        return remaining
+
+    monkeypatch.setattr(checkpoint_store, "_list_refs", list_refs_then_save)
+    assert await checkpoint_store.delete_checkpoint(str(ckpt_dir / "a"))
+
+    # The racing save reused the blobs, and the release left them in place.
+    assert raced[0]["uploaded"] == 0
+    assert _blob_count(ws) == 3
+    restored = await checkpoint_store.materialize(str(ckpt_dir / "b"))
+    assert (tmp_path / "step1" / "adapter.bin").read_text() == open(os.path.join(restored, "adapter.bin")).read()
@@ -159,6 +159,30 @@ async def test_dataset_list_all(tmp_path, monkeypatch):
     assert "dataset2" in dataset_ids
 
 
+@pytest.mark.asyncio
+async def test_dataset_list_all_tracks_deletes(tmp_path, monkeypatch):
+    _fresh(monkeypatch)
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab import asset_catalogue
+    from lab.dataset import Dataset
+
+    ds1 = await Dataset.create("dataset1")
+    await Dataset.create("dataset2")
+    assert sorted(d["dataset_id"] for d in await Dataset.list_all()) == ["dataset1", "dataset2"]
+    before = await asset_catalogue.etag(asset_catalogue.DATASETS)
+
+    result = await ds1.delete(["dataset1", "missing"])
+    assert result["succeeded"] == ["dataset1"]
+    assert [d["dataset_id"] for d in await Dataset.list_all()] == ["dataset2"]
+    assert await asset_catalogue.etag(asset_catalogue.DATASETS) != before
+
+
 @pytest.mark.asyncio
 async def test_dataset_list_all_empty_dir(tmp_path, monkeypatch):
     _fresh(monkeypatch)
@@ -1,5 +1,6 @@
 import os
 import importlib
+import shutil
 import pytest
 
 
@@ -33,3 +34,50 @@ async def test_dirs_structure_created(monkeypatch, tmp_path):
     assert os.path.isdir(await dirs.get_tools_dir())
     assert os.path.isdir(await dirs.get_batched_prompts_dir())
     assert os.path.isdir(dirs.get_galleries_cache_dir())
+
+
+@pytest.mark.asyncio
+async def test_dirs_cache_skips_repeat_makedirs_until_invalidated(monkeypatch, tmp_path):
+    ws = tmp_path / ".tfl_ws"
+    ws.mkdir()
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    dirs = _fresh_import_dirs(monkeypatch)
+    from lab import storage
+
+    calls = []
+    real_makedirs = storage.makedirs
+
+    async def counting_makedirs(path, exist_ok=True):
+        calls.append(path)
+        await real_makedirs(path, exist_ok=exist_ok)
+
+    monkeypatch.setattr(storage, "makedirs", counting_makedirs)
+
+    first = await dirs.get_job_artifacts_dir("1", "exp1")
+    first_calls = len(calls)
+    assert first_calls > 0
+    assert await dirs.get_job_artifacts_dir("1", "exp1") == first
+    assert await dirs.get_job_checkpoints_dir("1", "exp1")
+    # Only the checkpoints dir itself was new.
+    assert len(calls) == first_calls + 1
+
+    # Another org context resolves and ensures its own directories.
+    dirs.set_organization_id("org_b")
+    try:
+        await dirs.get_job_artifacts_dir("1", "exp1")
+        assert len(calls) > first_calls + 1
+    finally:
+        dirs.set_organization_id(None)
+
+    # Deleting a tree and invalidating it makes the next call recreate it.
+    experiment_dir = os.path.join(await dirs.get_experiments_dir(), "exp1")
+    shutil.rmtree(experiment_dir)
+    dirs.invalidate_path_cache(experiment_dir)
+    assert os.path.isdir(await dirs.get_job_artifacts_dir("1", "exp1"))
+
+    dirs.set_path_cache_enabled(False)
+    before = len(calls)
+    await dirs.get_jobs_dir("exp1")
+    await dirs.get_jobs_dir("exp1")
+    assert len(calls) - before == 4
@@ -6,7 +6,7 @@ import pytest
 
 
 def _fresh(monkeypatch):
-    for mod in ["lab.experiment", "lab.job", "lab.dirs"]:
+    for mod in ["lab.experiment", "lab.job", "lab.job_catalogue", "lab.dirs"]:
         if mod in importlib.sys.modules:
             importlib.sys.modules.pop(mod)
 
@@ -122,7 +122,7 @@ async def test_experiment_config_validation(tmp_path, monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_update_cached_job_is_safe_under_concurrent_writes(tmp_path, monkeypatch):
+async def test_job_catalogue_tracks_writes_and_compacts(tmp_path, monkeypatch):
     _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
@@ -131,38 +131,59 @@ async def test_update_cached_job_is_safe_under_concurrent_writes(tmp_path, monke
     monkeypatch.setenv("TFL_HOME_DIR", str(home))
     monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
 
+    from lab import change_log, job_catalogue
     from lab.experiment import Experiment
 
-    exp = await Experiment.create("exp-concurrent")
+    monkeypatch.setattr(job_catalogue, "COMPACT_THRESHOLD", 4)
+    exp = await Experiment.create("exp-catalogue")
 
-    original_read = Experiment._read_jobs_json_file
-    gate = asyncio.Event()
-    counter = {"count": 0}
+    # Concurrent writers each append their own change object.
+    jobs = await asyncio.gather(*(exp.create_job(type="TRAIN") for _ in range(3)))
+    await asyncio.gather(*(job.update_status("COMPLETE") for job in jobs))
 
-    async def delayed_read(self, jobs_json_path, max_retries=5):
-        result = await original_read(self, jobs_json_path, max_retries=max_retries)
-        counter["count"] += 1
-        if counter["count"] <= 2:
-            if counter["count"] == 2:
-                gate.set()
-            try:
-                await asyncio.wait_for(gate.wait(), timeout=0.2)
-            except TimeoutError:
-                pass
-        return result
+    catalogue = await job_catalogue.load_jobs(exp.id)
+    assert {str(job.id) for job in jobs} <= set(catalogue)
+    assert all(catalogue[str(job.id)]["status"] == "COMPLETE" for job in jobs)
 
-    monkeypatch.setattr(Experiment, "_read_jobs_json_file", delayed_read)
+    # The pending changes were folded into the snapshot.
+    catalogue_dir = await job_catalogue.dirs.get_job_catalogue_dir(exp.id)
+    with open(os.path.join(catalogue_dir, change_log.SNAPSHOT_NAME), encoding="utf-8") as f:
+        snapshot = json.load(f)
+    assert snapshot["jobs"][str(jobs[0].id)]["status"] == "COMPLETE"
 
-    await asyncio.gather(
-        exp._update_cached_job("job-1", {"id": "job-1", "status": "COMPLETE"}),
-        exp._update_cached_job("job-2", {"id": "job-2", "status": "COMPLETE"}),
-    )
+    await jobs[0].update_status("FAILED")
+    assert (await job_catalogue.load_jobs(exp.id))[str(jobs[0].id)]["status"] == "FAILED"
+    assert {j["id"] for j in await exp.get_jobs(status="COMPLETE")} == {str(jobs[1].id), str(jobs[2].id)}
 
-    jobs_json_path = await exp._jobs_json_file()
-    with open(jobs_json_path, encoding="utf-8") as f:
-        jobs_data = json.load(f)
-    cached_jobs = jobs_data.get("cached_jobs", {})
-    assert set(cached_jobs.keys()) >= {"job-1", "job-2"}
+
+@pytest.mark.asyncio
+async def test_rebuild_jobs_index_discovers_unrecorded_jobs(tmp_path, monkeypatch):
+    _fresh(monkeypatch)
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab.dirs import get_jobs_dir
+    from lab.experiment import Experiment
+
+    exp = await Experiment.create("exp-rebuild")
+    job = await exp.create_job()
+    # First listing builds the catalogue snapshot.
+    assert str(job.id) in {j["id"] for j in await exp.get_jobs()}
+
+    # A job copied in by hand never went through Job._set_json_data.
+    manual_dir = os.path.join(await get_jobs_dir(exp.id), "manual-job")
+    os.makedirs(manual_dir)
+    with open(os.path.join(manual_dir, "index.json"), "w", encoding="utf-8") as f:
+        json.dump({"id": "manual-job", "status": "COMPLETE", "type": "REMOTE", "job_data": {}}, f)
+
+    assert "manual-job" not in {j["id"] for j in await exp.get_jobs()}
+    rebuilt = await exp.rebuild_jobs_index()
+    assert {str(job.id), "manual-job"} <= set(rebuilt)
+    assert "manual-job" in {j["id"] for j in await exp.get_jobs()}
 
 
 @pytest.mark.asyncio
@@ -401,3 +422,85 @@ async def test_delete_all_jobs(tmp_path, monkeypatch):
 
     jobs_after = await exp.get_jobs()
     assert len(jobs_after) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_all_uses_catalogue_and_repairs_in_background(tmp_path, monkeypatch):
+    _fresh(monkeypatch)
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab import asset_catalogue, experiment as experiment_module
+    from lab.experiment import Experiment
+
+    # Written before the catalogue existed: one lacks a name, one has neither name nor id.
+    for exp_id, data in [("legacy", {"id": "legacy", "config": {}}), ("broken", {"config": {}})]:
+        (ws / "experiments" / exp_id).mkdir(parents=True)
+        (ws / "experiments" / exp_id / "index.json").write_text(json.dumps(data))
+
+    listed = await Experiment.get_all()
+    assert [(e["id"], e["name"]) for e in listed] == [("legacy", "legacy")]
+    await asyncio.gather(*experiment_module._repair_tasks)
+    with open(ws / "experiments" / "legacy" / "index.json", encoding="utf-8") as f:
+        assert json.load(f)["name"] == "legacy"
+
+    # Served from the catalogue from now on; writes and deletes move the head.
+    async def _no_scan():
+        raise AssertionError("catalogue should not rescan")
+
+    monkeypatch.setattr(Experiment, "_scan_all", classmethod(lambda cls: _no_scan()))
+    first_etag = await asset_catalogue.etag(asset_catalogue.EXPERIMENTS)
+    exp = await Experiment.create_with_config("fresh", {"tags": ["a"]})
+    assert await asset_catalogue.etag(asset_catalogue.EXPERIMENTS) != first_etag
+    listed = await Experiment.get_all()
+    assert [e["id"] for e in listed] == ["fresh", "legacy"]
+    assert listed[0]["config"] == {"tags": ["a"]}
+
+    # Callers may annotate the returned dicts without changing later listings.
+    listed[0]["last_opened_at"] = "now"
+    assert "last_opened_at" not in (await Experiment.get_all())[0]
+
+    await exp.delete()
+    assert [e["id"] for e in await Experiment.get_all()] == ["legacy"]
+
+
+@pytest.mark.asyncio
+async def test_get_all_reconciles_experiments_changed_outside_the_catalogue(tmp_path, monkeypatch):
+    _fresh(monkeypatch)
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    import shutil
+
+    from lab import asset_catalogue
+    from lab.experiment import Experiment
+
+    await Experiment.create_with_config("kept", {})
+    await Experiment.create_with_config("removed", {})
+    assert [e["id"] for e in await Experiment.get_all()] == ["kept", "removed"]
+
+    # Nothing changed behind the catalogue's back: reconciling leaves the head alone.
+    head = await asset_catalogue.etag(asset_catalogue.EXPERIMENTS)
+    assert await asset_catalogue.reconcile(asset_catalogue.EXPERIMENTS, Experiment._scan_all) == 0
+    assert await asset_catalogue.etag(asset_catalogue.EXPERIMENTS) == head
+
+    # A restored experiment and one removed by hand never went through the Experiment hooks.
+    (ws / "experiments" / "restored").mkdir()
+    (ws / "experiments" / "restored" / "index.json").write_text(json.dumps({"id": "restored", "name": "restored"}))
+    shutil.rmtree(ws / "experiments" / "removed")
+    assert [e["id"] for e in await Experiment.get_all()] == ["kept", "removed"]
+
+    monkeypatch.setattr(asset_catalogue, "RESCAN_SECONDS", 0)
+    await Experiment.get_all()
+    await asyncio.gather(*asset_catalogue._reconcile_tasks)
+    assert [e["id"] for e in await Experiment.get_all()] == ["kept", "restored"]
+    assert await asset_catalogue.etag(asset_catalogue.EXPERIMENTS) != head
+    await asyncio.gather(*asset_catalogue._reconcile_tasks)
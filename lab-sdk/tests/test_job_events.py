@@ -0,0 +1,154 @@
+import asyncio
+import importlib
+import json
+
+import pytest
+
+
+def _fresh(monkeypatch, tmp_path):
+    for mod in ["lab.experiment", "lab.job", "lab.job_catalogue", "lab.job_events", "lab.dirs"]:
+        if mod in importlib.sys.modules:
+            importlib.sys.modules.pop(mod)
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+
+@pytest.mark.asyncio
+async def test_job_writes_publish_status_transitions(tmp_path, monkeypatch):
+    _fresh(monkeypatch, tmp_path)
+    from lab import job_events
+    from lab.experiment import Experiment
+
+    transitions = job_events.subscribe()
+    everything = job_events.subscribe(status_changes_only=False)
+    completed = job_events.subscribe(statuses=["COMPLETE"], types=["REMOTE"])
+    other_type = job_events.subscribe(types=["TRAIN"])
+
+    exp = await Experiment.create("exp_events")
+    job = await exp.create_job()
+    await job.update_status("RUNNING")
+    await job.update_progress(50)
+    await job.update_status("COMPLETE")
+    await asyncio.sleep(0)
+
+    assert [(e.previous_status, e.status) for e in transitions.drain()] == [
+        (None, "NOT_STARTED"),
+        ("NOT_STARTED", "RUNNING"),
+        ("RUNNING", "COMPLETE"),
+    ]
+    # Progress and job_data writes only reach subscribers that asked for them.
+    assert len(everything.drain()) > 3
+    assert [e.status for e in completed.drain()] == ["COMPLETE"]
+    assert other_type.drain() == []
+
+    for sub in (transitions, everything, completed, other_type):
+        sub.close()
+
+
+@pytest.mark.asyncio
+async def test_publish_dedupes_by_cursor(tmp_path, monkeypatch):
+    _fresh(monkeypatch, tmp_path)
+    from lab import job_events
+
+    sub = job_events.subscribe(status_changes_only=False)
+    first = job_events.publish_job_json("exp", "1", {"status": "RUNNING"}, cursor="c1", org_id="org")
+    again = job_events.publish_job_json("exp", "1", {"status": "RUNNING"}, cursor="c1", org_id="org")
+
+    assert first is not None and first.status_changed
+    assert again is None
+    await asyncio.sleep(0)  # delivery is scheduled on the subscriber's loop
+    assert len(sub.drain()) == 1
+    assert await sub.get(timeout=0.01) is None
+    sub.close()
+
+
+@pytest.mark.asyncio
+async def test_changes_since_replays_from_cursor_and_snapshot(tmp_path, monkeypatch):
+    _fresh(monkeypatch, tmp_path)
+    from lab import job_catalogue
+    from lab.experiment import Experiment
+
+    monkeypatch.setattr(job_catalogue, "COMPACT_THRESHOLD", 3)
+    monkeypatch.setattr(job_catalogue, "CHANGE_GRACE_SECONDS", 0)
+    exp = await Experiment.create("exp_changes")
+
+    # No cursor starts at the end of the log.
+    changes, start = await job_catalogue.changes_since(exp.id, None)
+    assert changes == []
+    assert start == job_catalogue.START_CURSOR
+
+    job = await exp.create_job()
+    await job.update_status("RUNNING")
+    changes, cursor = await job_catalogue.changes_since(exp.id, start)
+    assert [jobs[str(job.id)]["status"] for _, jobs in changes][-1] == "RUNNING"
+    assert cursor == changes[-1][0]
+
+    changes, same = await job_catalogue.changes_since(exp.id, cursor)
+    assert changes == [] and same == cursor
+
+    # Compaction drops changes the old cursor had not read yet; the snapshot stands in for them.
+    await job.update_status("COMPLETE")
+    for _ in range(2):
+        for _ in range(3):
+            await job.update_progress(10)
+        await exp.get_jobs()
+    changes, _ = await job_catalogue.changes_since(exp.id, cursor)
+    assert changes[0][0].startswith("snapshot:")
+    assert changes[0][1][str(job.id)]["status"] == "COMPLETE"
+
+
+@pytest.mark.asyncio
+async def test_late_changes_are_applied_and_replayed(tmp_path, monkeypatch):
+    _fresh(monkeypatch, tmp_path)
+    import time
+
+    from lab import job_catalogue
+    from lab.experiment import Experiment
+
+    monkeypatch.setattr(job_catalogue, "COMPACT_THRESHOLD", 2)
+    exp = await Experiment.create("exp_late")
+    job = await exp.create_job()
+    for _ in range(3):
+        await job.update_progress(10)
+    await job_catalogue.load_jobs(exp.id)  # compacts
+    _, cursor = await job_catalogue.changes_since(exp.id, "")
+
+    # A change uploaded late by a node whose clock is behind sorts before changes already folded in.
+    _, changes_dir = await job_catalogue._paths(exp.id)
+    late_name = f"{time.time_ns() - 60 * 10**9:020d}-late.json"
+    with open(f"{changes_dir}/{late_name}", "w", encoding="utf-8") as f:
+        json.dump({"jobs": {"remote-1": {"id": "remote-1", "status": "COMPLETE"}}}, f)
+
+    assert (await job_catalogue.load_jobs(exp.id))["remote-1"]["status"] == "COMPLETE"
+    # Later compactions fold it into the snapshot before it is ever deleted.
+    for _ in range(3):
+        for _ in range(2):
+            await job.update_progress(20)
+        assert "remote-1" in await job_catalogue.load_jobs(exp.id)
+
+    # changes_since trails the newest change by the grace window, so the late change is still returned.
+    changes, _ = await job_catalogue.changes_since(exp.id, cursor)
+    assert any("remote-1" in jobs for _, jobs in changes)
+
+
+@pytest.mark.asyncio
+async def test_subscribe_accepts_job_status_members(tmp_path, monkeypatch):
+    _fresh(monkeypatch, tmp_path)
+    from lab import job_events
+    from lab.job_status import JobStatus
+
+    by_member = job_events.subscribe(statuses=[JobStatus.COMPLETE, JobStatus.FAILED])
+    by_value = job_events.subscribe(statuses=[JobStatus.COMPLETE.value])
+
+    job_events.publish_job_json("exp", "1", {"status": JobStatus.RUNNING}, org_id="org")
+    job_events.publish_job_json("exp", "1", {"status": JobStatus.COMPLETE}, org_id="org")
+    await asyncio.sleep(0)
+
+    assert [e.status for e in by_member.drain()] == ["COMPLETE"]
+    assert [e.status for e in by_value.drain()] == ["COMPLETE"]
+    by_member.close()
+    by_value.close()
@@ -1,5 +1,6 @@
 import os
 import asyncio
+import time
 import json
 import importlib
 import pytest
@@ -177,12 +178,83 @@ def test_lab_update_progress(tmp_path, monkeypatch):
     lab.init(experiment_id="test_exp")
 
     lab.update_progress(50)
+    lab.flush()
     assert asyncio.run(lab._job.get_progress()) == 50
 
     lab.update_progress(100)
+    lab.flush()
     assert asyncio.run(lab._job.get_progress()) == 100
 
 
+def test_lab_update_progress_is_batched(tmp_path, monkeypatch):
+    _fresh(monkeypatch)
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab.lab_facade import Lab
+
+    lab = Lab(progress_flush_interval=3600, progress_flush_rows=1000)
+    lab.init(experiment_id="test_exp")
+
+    batches = []
+    original = lab._job.write_progress_batch
+
+    async def _recording_write(progress, metrics, rows):
+        batches.append((progress, metrics, len(rows)))
+        await original(progress, metrics, rows)
+
+    monkeypatch.setattr(lab._job, "write_progress_batch", _recording_write)
+
+    for step in range(1, 11):
+        lab.update_progress(step * 5, metrics={"loss": 1.0 / step}, step=step)
+
+    # Nothing is written from the training thread until a flush is due.
+    assert batches == []
+
+    lab.finish()
+
+    # All ten updates coalesce into a single index.json write + metrics.jsonl append
+    # (followed by finish()'s own final progress=100 write).
+    assert batches == [(50, {"loss": 0.1}, 10), (100, None, 1)]
+    job_dir = asyncio.run(lab._job.get_dir())
+    with open(os.path.join(job_dir, "metrics.jsonl")) as f:
+        rows = [json.loads(line) for line in f if line.strip()]
+    assert [r["step"] for r in rows[:10]] == list(range(1, 11))
+    assert asyncio.run(lab._job.get_progress()) == 100
+
+
+def test_lab_update_progress_flushes_on_row_count(tmp_path, monkeypatch):
+    _fresh(monkeypatch)
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab.lab_facade import Lab
+
+    lab = Lab(progress_flush_interval=3600, progress_flush_rows=3)
+    lab.init(experiment_id="test_exp")
+
+    for step in range(3):
+        lab.update_progress(10 + step)
+
+    # Reaching the row threshold wakes the writer without an explicit flush.
+    job_dir = asyncio.run(lab._job.get_dir())
+    metrics_path = os.path.join(job_dir, "metrics.jsonl")
+    for _ in range(100):
+        if os.path.exists(metrics_path):
+            break
+        time.sleep(0.05)
+    lab._progress_writer.flush()
+    assert asyncio.run(lab._job.get_progress()) == 12
+
+
 def test_lab_update_progress_with_metrics(tmp_path, monkeypatch):
     _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
@@ -1335,3 +1407,71 @@ def test_download_registry_model(tmp_path, monkeypatch):
     expected_src = asyncio.run(_m.get_dir())
     assert copy_calls[0][0] == expected_src
     assert copy_calls[0][1] == expected_dest
+
+
+def test_lab_background_writes_are_ordered_before_blocking_calls(tmp_path, monkeypatch):
+    _fresh(monkeypatch)
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab.lab_facade import Lab
+
+    lab = Lab(background_writes=True)
+    lab.init(experiment_id="test_exp")
+
+    for i in range(20):
+        lab.set_job_data_field("step", i)
+        lab.log(f"message {i}")
+
+    # Blocking calls run after every background write submitted before them.
+    assert lab.get_job_data()["step"] == 19
+    lab.flush()
+    with open(asyncio.run(lab._job.get_log_path())) as f:
+        lines = [line for line in f.read().splitlines() if "message" in line]
+    assert [line.rsplit(" ", 1)[-1] for line in lines] == [str(i) for i in range(20)]
+
+
+def test_async_runtime_reuses_one_loop_and_carries_context():
+    import contextvars
+
+    from lab.async_runtime import AsyncRuntime
+
+    var = contextvars.ContextVar("org", default=None)
+    runtime = AsyncRuntime(name="test-runtime")
+
+    async def _loop_and_var():
+        return id(asyncio.get_running_loop()), var.get()
+
+    var.set("org-a")
+    first = runtime.run(_loop_and_var())
+    var.set("org-b")
+    second = runtime.run(_loop_and_var())
+    assert first[0] == second[0]
+    assert (first[1], second[1]) == ("org-a", "org-b")
+
+    async def _fail():
+        raise ValueError("boom")
+
+    # Background failures are logged, never raised into later calls.
+    runtime.run_in_background(_fail())
+    assert runtime.drain(timeout=5)
+    assert runtime.run(_loop_and_var())[1] == "org-b"
+    runtime.close()
+
+
+def test_run_async_rejects_running_event_loop():
+    from lab.lab_facade import _run_async
+
+    async def _inner():
+        return 1
+
+    async def _outer():
+        coro = _inner()
+        with pytest.raises(RuntimeError, match="Cannot use sync method"):
+            _run_async(coro)
+
+    asyncio.run(_outer())
@@ -21,3 +21,57 @@ async def test_model_get_dir(tmp_path, monkeypatch):
     m = Model("mixtral-8x7b")
     d = await m.get_dir()
     assert d.endswith(os.path.join("models", "mixtral-8x7b"))
+
+
+@pytest.mark.asyncio
+async def test_model_list_all_uses_catalogue(tmp_path, monkeypatch):
+    for mod in ["lab.model", "lab.dirs"]:
+        if mod in importlib.sys.modules:
+            importlib.sys.modules.pop(mod)
+
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab import asset_catalogue
+    from lab.model import Model
+
+    # A model written before the catalogue existed is found by the first (scanning) listing.
+    legacy_dir = ws / "models" / "legacy"
+    legacy_dir.mkdir(parents=True)
+    (legacy_dir / "index.json").write_text('{"model_id": "legacy", "name": "legacy", "json_data": {}}')
+    assert [m["model_id"] for m in await Model.list_all()] == ["legacy"]
+    first_etag = await asset_catalogue.etag(asset_catalogue.MODELS)
+    assert first_etag
+
+    # Reads leave the head alone; writes move it.
+    await Model.list_all()
+    assert await asset_catalogue.etag(asset_catalogue.MODELS) == first_etag
+
+    grouped = await Model.create("MyFineTune/v1")
+    await grouped.set_metadata(model_id="MyFineTune/v1", name="v1")
+    second_etag = await asset_catalogue.etag(asset_catalogue.MODELS)
+    assert second_etag != first_etag
+
+    # Served from the catalogue: the directory walk is not repeated.
+    async def _no_scan():
+        raise AssertionError("catalogue should not rescan")
+
+    monkeypatch.setattr(Model, "_scan_all", staticmethod(_no_scan))
+    assert sorted(m["model_id"] for m in await Model.list_all()) == ["MyFineTune/v1", "legacy"]
+
+    await (await Model.get("legacy")).delete()
+    assert [m["model_id"] for m in await Model.list_all()] == ["MyFineTune/v1"]
+    assert await asset_catalogue.etag(asset_catalogue.MODELS) != second_etag
+
+    # Job-scoped models are not part of the workspace catalogue.
+    monkeypatch.setattr("lab.model.get_job_models_dir", lambda job_id: _job_models_dir(tmp_path))
+    await Model.create("job-model", job_id="42")
+    assert [m["model_id"] for m in await Model.list_all()] == ["MyFineTune/v1"]
+
+
+async def _job_models_dir(tmp_path):
+    return str(tmp_path / "job_models")
@@ -0,0 +1,43 @@
+import asyncio
+import importlib
+import sys
+
+
+def test_remote_trap_streams_output_to_segmented_log(tmp_path, monkeypatch):
+    for mod in ["lab.experiment", "lab.job", "lab.job_catalogue", "lab.dirs", "lab.remote_trap"]:
+        if mod in importlib.sys.modules:
+            importlib.sys.modules.pop(mod)
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab import segmented_log
+    from lab.dirs import get_job_dir
+    from lab.experiment import Experiment
+
+    exp = asyncio.run(Experiment.create("trap_exp"))
+    job = asyncio.run(exp.create_job())
+    monkeypatch.setenv("_TFL_JOB_ID", str(job.id))
+    monkeypatch.setenv("_TFL_EXPERIMENT_ID", exp.id)
+    monkeypatch.setattr(segmented_log, "DEFAULT_PART_MAX_BYTES", 1024)
+
+    from lab import remote_trap
+
+    script = "import sys\nfor i in range(500): print(f'line {i}')\nsys.exit(3)"
+    command = [sys.executable, "-c", f'"{script}"']
+    # main() installs signal handlers and drives its own event loops, like the console entrypoint.
+    exit_code = remote_trap.main(["--", *command])
+    assert exit_code == 3
+
+    log_path = asyncio.run(get_job_dir(str(job.id), exp.id)) + "/provider_logs.txt"
+    content = asyncio.run(segmented_log.read_log(log_path))
+    assert content.splitlines() == [f"line {i}" for i in range(500)]
+    manifest = asyncio.run(segmented_log.read_manifest(log_path))
+    assert manifest["parts"] > 1 and manifest["complete"] is True
+
+    job_data = asyncio.run(job.get_job_data())
+    assert job_data["live_status"] == "Remote command crashed"
+    assert job_data["error_msg"].splitlines()[-1] == "line 499"
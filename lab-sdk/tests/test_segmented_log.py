@@ -0,0 +1,150 @@
+import json
+import os
+
+import pytest
+
+
+def _writer(log_path, **kwargs):
+    from lab.segmented_log import SegmentedLogWriter
+
+    kwargs.setdefault("flush_interval", 3600)
+    return SegmentedLogWriter(str(log_path), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_segmented_log_buffers_until_flush(tmp_path):
+    from lab import segmented_log
+
+    log_path = tmp_path / "output_1.txt"
+    writer = _writer(log_path)
+    writer.write("line 1\n")
+    writer.write("line 2\n")
+
+    assert not os.path.exists(segmented_log.manifest_path(str(log_path)))
+
+    writer.flush()
+    assert await segmented_log.read_log(str(log_path)) == "line 1\nline 2\n"
+
+    with open(segmented_log.manifest_path(str(log_path))) as f:
+        manifest = json.load(f)
+    assert manifest["parts"] == 1
+    assert manifest["size"] == len("line 1\nline 2\n")
+
+
+@pytest.mark.asyncio
+async def test_segmented_log_rolls_parts_by_size(tmp_path):
+    from lab import segmented_log
+
+    log_path = tmp_path / "output_2.txt"
+    writer = _writer(log_path, part_max_bytes=16)
+    lines = [f"line {i:04d}\n" for i in range(10)]
+    for line in lines:
+        writer.write(line)
+        writer.flush()
+
+    # Every part stays within the size budget (11 bytes per line, 16 byte parts).
+    parts = sorted(p for p in os.listdir(segmented_log.segments_dir(str(log_path))) if p.endswith(".part"))
+    assert len(parts) == 10
+    for name in parts:
+        assert os.path.getsize(os.path.join(segmented_log.segments_dir(str(log_path)), name)) <= 16
+
+    assert await segmented_log.read_log(str(log_path)) == "".join(lines)
+
+
+@pytest.mark.asyncio
+async def test_segmented_log_tails_from_cursor(tmp_path):
+    from lab import segmented_log
+
+    log_path = tmp_path / "output_3.txt"
+    writer = _writer(log_path, part_max_bytes=32)
+
+    writer.write("first\n")
+    writer.flush()
+    text, cursor = await segmented_log.read_log_since(str(log_path))
+    assert text == "first\n"
+
+    writer.write("second\n")
+    writer.flush()
+    text, cursor = await segmented_log.read_log_since(str(log_path), cursor)
+    assert text == "second\n"
+
+    # Force a roll into a new part and make sure nothing is repeated or lost.
+    writer.write("x" * 40 + "\n")
+    writer.write("third\n")
+    writer.flush()
+    text, cursor = await segmented_log.read_log_since(str(log_path), cursor)
+    assert text == "x" * 40 + "\nthird\n"
+
+    text, _ = await segmented_log.read_log_since(str(log_path), cursor)
+    assert text == ""
+
+    # Everything before the cursor, across parts, is what the reader has seen so far.
+    writer.write("fourth\n")
+    writer.flush()
+    assert await segmented_log.read_log_until(str(log_path), cursor) == "first\nsecond\n" + "x" * 40 + "\nthird\n"
+
+
+@pytest.mark.asyncio
+async def test_segmented_log_new_writer_appends_after_existing_parts(tmp_path):
+    from lab import segmented_log
+
+    log_path = tmp_path / "output_4.txt"
+    log_path.write_text("base content\n")
+
+    first = _writer(log_path)
+    first.write("from first process\n")
+    first.flush()
+
+    second = _writer(log_path)
+    second.write("from second process\n")
+    second.flush()
+
+    assert await segmented_log.read_log(str(log_path)) == "base content\nfrom first process\nfrom second process\n"
+
+
+@pytest.mark.asyncio
+async def test_read_log_plain_file(tmp_path):
+    from lab import segmented_log
+
+    log_path = tmp_path / "plain.txt"
+    log_path.write_text("a\nb\n")
+    assert await segmented_log.read_log(str(log_path)) == "a\nb\n"
+    assert not await segmented_log.is_segmented(str(log_path))
+
+
+@pytest.mark.asyncio
+async def test_read_log_tail_reads_newest_parts(tmp_path):
+    from lab import segmented_log
+
+    log_path = tmp_path / "tail.txt"
+    log_path.write_text("base\n")
+    writer = _writer(log_path, part_max_bytes=16)
+    for i in range(20):
+        writer.write(f"line {i:04d}\n")
+    writer.close()
+
+    assert await segmented_log.read_log_tail(str(log_path), 2) == "line 0018\nline 0019"
+    assert (await segmented_log.read_log_tail(str(log_path), 100)).splitlines()[0] == "base"
+    with open(segmented_log.manifest_path(str(log_path))) as f:
+        assert json.load(f)["complete"] is True
+
+
+@pytest.mark.asyncio
+async def test_reset_log_and_bounded_backlog(tmp_path):
+    from lab import segmented_log
+
+    log_path = tmp_path / "reset.txt"
+    writer = _writer(log_path)
+    writer.write("old run\n")
+    writer.flush()
+
+    await segmented_log.reset_log(str(log_path))
+    assert await segmented_log.read_log(str(log_path)) == ""
+    assert not await segmented_log.is_segmented(str(log_path))
+
+    bounded = _writer(log_path, max_pending_bytes=14)
+    for i in range(5):
+        bounded.write(f"{i}xxxxx\n")
+    assert bounded.dropped_bytes == 3 * len("0xxxxx\n")
+    bounded.flush()
+    assert await segmented_log.read_log(str(log_path)) == "3xxxxx\n4xxxxx\n"
@@ -0,0 +1,139 @@
+import threading
+import time
+
+import pytest
+
+
+def _make_tree(root, files):
+    for rel, content in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+
+@pytest.mark.asyncio
+async def test_copy_dir_copies_tree_concurrently(tmp_path, monkeypatch):
+    from lab import storage
+
+    src = tmp_path / "ckpt"
+    files = {f"shard-{i:02d}.bin": bytes([i]) * 1024 for i in range(12)}
+    files["nested/deeper/config.json"] = b"{}"
+    _make_tree(src, files)
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+    real_transfer = storage._transfer_file_sync
+
+    def _tracking_transfer(*args):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        try:
+            time.sleep(0.02)
+            real_transfer(*args)
+        finally:
+            with lock:
+                active -= 1
+
+    monkeypatch.setattr(storage, "_transfer_file_sync", _tracking_transfer)
+
+    dest = tmp_path / "out" / "ckpt"
+    await storage.copy_dir(str(src), str(dest), max_concurrency=4)
+
+    for rel, content in files.items():
+        assert (dest / rel).read_bytes() == content
+    assert 1 < peak <= 4
+
+
+@pytest.mark.asyncio
+async def test_copy_files_retries_then_reports_failures(tmp_path, monkeypatch):
+    from lab import storage
+
+    monkeypatch.setattr(storage, "TRANSFER_RETRY_BACKOFF_SECONDS", 0)
+    _make_tree(tmp_path, {"flaky.bin": b"data", "ok.bin": b"ok"})
+
+    calls = {"flaky": 0}
+    real_transfer = storage._transfer_file_sync
+
+    def _flaky_transfer(src_fs, src, dest_fs, dest):
+        if src.endswith("flaky.bin"):
+            calls["flaky"] += 1
+            if calls["flaky"] < 3:
+                raise ConnectionError("reset by peer")
+        real_transfer(src_fs, src, dest_fs, dest)
+
+    monkeypatch.setattr(storage, "_transfer_file_sync", _flaky_transfer)
+
+    pairs = [
+        (str(tmp_path / "flaky.bin"), str(tmp_path / "out" / "flaky.bin")),
+        (str(tmp_path / "ok.bin"), str(tmp_path / "out" / "ok.bin")),
+        (str(tmp_path / "missing.bin"), str(tmp_path / "out" / "missing.bin")),
+    ]
+    failures = await storage.copy_files(pairs, retries=2, raise_errors=False)
+
+    assert calls["flaky"] == 3
+    assert (tmp_path / "out" / "flaky.bin").read_bytes() == b"data"
+    # Missing sources are not retried and are reported back.
+    assert [(src, type(exc)) for src, _, exc in failures] == [(pairs[2][0], FileNotFoundError)]
+
+    with pytest.raises(FileNotFoundError):
+        await storage.copy_files(pairs[2:], retries=2)
+
+
+@pytest.mark.asyncio
+async def test_copy_files_skips_makedirs_for_object_store_destinations(tmp_path, monkeypatch):
+    from lab import storage
+
+    _make_tree(tmp_path, {"a.bin": b"a"})
+    uploaded = []
+
+    class _FakeS3:
+        protocol = ("s3", "s3a")
+
+        def put_file(self, src, dest, chunksize=None, max_concurrency=None, **kwargs):
+            uploaded.append((dest, {"chunksize": chunksize, "max_concurrency": max_concurrency, **kwargs}))
+
+        def makedirs(self, *args, **kwargs):
+            raise AssertionError("object stores have no directories to create")
+
+    fake = _FakeS3()
+    real_get_fs = storage._get_fs_for_path
+    monkeypatch.setattr(
+        storage, "_get_fs_for_path", lambda path: (fake, path) if path.startswith("s3://") else real_get_fs(path)
+    )
+
+    await storage.copy_files([(str(tmp_path / "a.bin"), "s3://bucket/ckpt/a.bin")])
+
+    assert uploaded[0][0] == "s3://bucket/ckpt/a.bin"
+    assert uploaded[0][1]["max_concurrency"] == storage.TRANSFER_PART_CONCURRENCY
+
+
+@pytest.mark.asyncio
+async def test_copy_files_omits_put_file_arguments_older_s3fs_lacks(tmp_path, monkeypatch):
+    from lab import storage
+
+    _make_tree(tmp_path, {"a.bin": b"a"})
+    uploaded = []
+
+    class _OldS3:
+        protocol = ("s3", "s3a")
+
+        # Like s3fs before max_concurrency: unknown kwargs are forwarded to the S3 API calls.
+        def _put_file(self, lpath, rpath, callback=None, chunksize=50 * 2**20, **kwargs):
+            pass
+
+        def put_file(self, src, dest, **kwargs):
+            uploaded.append(kwargs)
+
+    fake = _OldS3()
+    real_get_fs = storage._get_fs_for_path
+    monkeypatch.setattr(
+        storage, "_get_fs_for_path", lambda path: (fake, path) if path.startswith("s3://") else real_get_fs(path)
+    )
+
+    await storage.copy_files([(str(tmp_path / "a.bin"), "s3://bucket/ckpt/a.bin")])
+
+    assert "max_concurrency" not in uploaded[0]
+    assert "chunksize" in uploaded[0]
@@ -0,0 +1,93 @@
+import asyncio
+import os
+import sqlite3
+import time
+
+from lab.trackio_sync import TrackioSync
+
+
+def _write_db(path, rows):
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS metrics (step INTEGER, loss REAL)")
+        conn.executemany("INSERT INTO metrics VALUES (?, ?)", rows)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _rows(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT step, loss FROM metrics ORDER BY step").fetchall()
+    finally:
+        conn.close()
+
+
+def test_sync_uploads_only_changed_files(tmp_path):
+    src = tmp_path / "trackio"
+    dest = tmp_path / "shared"
+    src.mkdir()
+    _write_db(str(src / "project.db"), [(1, 0.5)])
+    (src / "media.txt").write_text("a")
+
+    syncer = TrackioSync(str(src), str(dest), interval=60)
+    try:
+        assert syncer.sync()
+        assert _rows(str(dest / "project.db")) == [(1, 0.5)]
+        assert (dest / "media.txt").read_text() == "a"
+        # WAL/SHM files are folded into the backup, not copied.
+        assert not (dest / "project.db-wal").exists()
+
+        # Nothing changed: the next pass uploads nothing.
+        assert asyncio.run(syncer.sync_once()) == 0
+
+        _write_db(str(src / "project.db"), [(2, 0.4)])
+        assert asyncio.run(syncer.sync_once()) == 1
+        assert _rows(str(dest / "project.db")) == [(1, 0.5), (2, 0.4)]
+        assert (dest / "media.txt").read_text() == "a"
+    finally:
+        syncer.close()
+
+
+def test_request_is_throttled_and_flushed_on_close(tmp_path):
+    src = tmp_path / "trackio"
+    dest = tmp_path / "shared"
+    src.mkdir()
+    _write_db(str(src / "project.db"), [(1, 0.5)])
+
+    syncer = TrackioSync(str(src), str(dest), interval=60)
+    syncer.request()
+    deadline = time.monotonic() + 5
+    while not (dest / "project.db").exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # The first request after a quiet period is synced right away.
+    assert _rows(str(dest / "project.db")) == [(1, 0.5)]
+
+    _write_db(str(src / "project.db"), [(2, 0.4)])
+    syncer.request()
+    time.sleep(0.2)
+    # Within the interval the shared copy is left alone...
+    assert _rows(str(dest / "project.db")) == [(1, 0.5)]
+
+    # ...and close() uploads whatever was requested.
+    syncer.close(timeout=10)
+    assert _rows(str(dest / "project.db")) == [(1, 0.5), (2, 0.4)]
+    assert not os.path.exists(str(dest / "project.db-wal"))
+
+
+def test_close_drops_the_exit_hook(tmp_path, monkeypatch):
+    from lab import trackio_sync
+
+    hooks = []
+    monkeypatch.setattr(trackio_sync.atexit, "register", hooks.append)
+    monkeypatch.setattr(trackio_sync.atexit, "unregister", hooks.remove)
+    src = tmp_path / "trackio"
+    src.mkdir()
+
+    syncer = TrackioSync(str(src), str(tmp_path / "shared"), interval=60)
+    syncer.request()
+    assert hooks == [syncer.close]
+    syncer.close(timeout=10)
+    assert hooks == []